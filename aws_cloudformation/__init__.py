@@ -21,13 +21,37 @@ try:
         remove_stack,
         deploy_stack_set,
         remove_stack_set,
+        plan_stack,
+        execute_stack_change_set,
+        apply_plan,
+    )
+    from .multi_deploy import (
+        StackSpec,
+        deploy_stacks,
+        StackRemoveSpec,
+        StackRemoveResult,
+        RemoveStacksResponse,
+        remove_stacks,
+        resume_stack_deployment,
+        StackPlanResult,
+        EnvironmentPlan,
+        plan_stacks,
+        apply_stacks,
+    )
+    from .journal import (
+        DeployPhaseEnum,
+        JournalEntry,
+        DeployJournal,
+        JournalReporter,
     )
     from .stack import (
         StackStatusEnum,
         Output,
+        Export,
         Parameter,
         DriftStatusEnum,
         Stack,
+        StackEvent,
         ChangeSetStatusEnum,
         ChangeSetTypeEnum,
         ChangeSetExecutionStatusEnum,
@@ -42,15 +66,74 @@ try:
         StackInstanceDetailedStatusEnum,
         StackInstanceDriftStatusEnum,
         StackInstance,
+        StackSetOperationStatusEnum,
+        StackSetOperation,
+        StackSetOperationResultStatusEnum,
+        StackSetOperationResult,
     )
-    from .change_set_visualizer import (
+    from .resource_change import (
         TargetAttributeEnum,
         Target,
         Detail,
         ChangeActionEnum,
         ResourceChange,
+    )
+    from .change_set_tree import (
+        ChangeSetTree,
+        load_change_set_tree,
+    )
+    from .plan import (
+        Plan,
+        PlanArtifact,
+    )
+    from .inventory import (
+        RefreshResult,
+        StackInventory,
+    )
+    from .exports import (
+        ExportsIndex,
+        get_exports_index,
+    )
+    from .scanner import (
+        ScanTarget,
+        TargetScanResult,
+        ScanStacksResponse,
+        scan_stacks,
+    )
+    from .change_set_visualizer import (
+        visualize_change_set_tree,
         visualize_change_set,
     )
+    from .waiter import (
+        DelayStrategy,
+        FixedDelay,
+        ExponentialBackoff,
+        DecorrelatedJitter,
+        ExpectedDuration,
+    )
+    from .reporter import (
+        BaseReporter,
+        NoOpReporter,
+        ConsoleReporter,
+        JsonLinesReporter,
+    )
+    from .context import (
+        UploadIndex,
+        Context,
+        get_context,
+    )
+    from .retry import (
+        ErrorKindEnum,
+        classify_error,
+        RetryPolicy,
+        call_with_retry,
+    )
+    from .rate_limiter import (
+        TokenBucket,
+        RateLimitStats,
+        RateLimiter,
+        get_rate_limiter,
+    )
     from .taggings import (
         to_tag_list,
         to_tag_dict,
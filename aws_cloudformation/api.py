@@ -12,11 +12,31 @@ from .deploy import deploy_stack
 from .deploy import remove_stack
 from .deploy import deploy_stack_set
 from .deploy import remove_stack_set
+from .deploy import plan_stack
+from .deploy import execute_stack_change_set
+from .deploy import apply_plan
+from .multi_deploy import StackSpec
+from .multi_deploy import deploy_stacks
+from .multi_deploy import StackRemoveSpec
+from .multi_deploy import StackRemoveResult
+from .multi_deploy import RemoveStacksResponse
+from .multi_deploy import remove_stacks
+from .multi_deploy import resume_stack_deployment
+from .multi_deploy import StackPlanResult
+from .multi_deploy import EnvironmentPlan
+from .multi_deploy import plan_stacks
+from .multi_deploy import apply_stacks
+from .journal import DeployPhaseEnum
+from .journal import JournalEntry
+from .journal import DeployJournal
+from .journal import JournalReporter
 from .stack import StackStatusEnum
 from .stack import Output
+from .stack import Export
 from .stack import Parameter
 from .stack import DriftStatusEnum
 from .stack import Stack
+from .stack import StackEvent
 from .stack import ChangeSetStatusEnum
 from .stack import ChangeSetTypeEnum
 from .stack import ChangeSetExecutionStatusEnum
@@ -29,11 +49,48 @@ from .stack_set import StackInstanceStatusEnum
 from .stack_set import StackInstanceDetailedStatusEnum
 from .stack_set import StackInstanceDriftStatusEnum
 from .stack_set import StackInstance
-from .change_set_visualizer import TargetAttributeEnum
-from .change_set_visualizer import Target
-from .change_set_visualizer import Detail
-from .change_set_visualizer import ChangeActionEnum
-from .change_set_visualizer import ResourceChange
+from .stack_set import StackSetOperationStatusEnum
+from .stack_set import StackSetOperation
+from .stack_set import StackSetOperationResultStatusEnum
+from .stack_set import StackSetOperationResult
+from .resource_change import TargetAttributeEnum
+from .resource_change import Target
+from .resource_change import Detail
+from .resource_change import ChangeActionEnum
+from .resource_change import ResourceChange
+from .change_set_tree import ChangeSetTree
+from .change_set_tree import load_change_set_tree
+from .plan import Plan
+from .plan import PlanArtifact
+from .inventory import RefreshResult
+from .inventory import StackInventory
+from .exports import ExportsIndex
+from .exports import get_exports_index
+from .scanner import ScanTarget
+from .scanner import TargetScanResult
+from .scanner import ScanStacksResponse
+from .scanner import scan_stacks
+from .change_set_visualizer import visualize_change_set_tree
 from .change_set_visualizer import visualize_change_set
+from .waiter import DelayStrategy
+from .waiter import FixedDelay
+from .waiter import ExponentialBackoff
+from .waiter import DecorrelatedJitter
+from .waiter import ExpectedDuration
+from .reporter import BaseReporter
+from .reporter import NoOpReporter
+from .reporter import ConsoleReporter
+from .reporter import JsonLinesReporter
+from .context import UploadIndex
+from .context import Context
+from .context import get_context
+from .retry import ErrorKindEnum
+from .retry import classify_error
+from .retry import RetryPolicy
+from .retry import call_with_retry
+from .rate_limiter import TokenBucket
+from .rate_limiter import RateLimitStats
+from .rate_limiter import RateLimiter
+from .rate_limiter import get_rate_limiter
 from .taggings import to_tag_list
 from .taggings import to_tag_dict
@@ -14,15 +14,29 @@ Design Principle:
 from .stacks import StackIterProxy
 from .stacks import describe_stacks
 from .stacks import describe_live_stack
+from .stacks import LIVE_STACK_STATUS_FILTER
+from .stacks import list_stacks
+from .stacks import ExportIterProxy
+from .stacks import list_exports
+from .stacks import list_imports
+from .stacks import StackEventIterProxy
+from .stacks import describe_stack_events
+from .stacks import StackEventStream
+from .stacks import find_root_cause_event
 from .stacks import create_stack
 from .stacks import update_stack
 from .stacks import create_change_set
 from .stacks import describe_change_set
 from .stacks import describe_change_set_with_paginator
+from .stacks import ResourceChangeIterProxy
+from .stacks import iter_resource_changes
+from .stacks import load_all_changes
 from .stacks import execute_change_set
 from .stacks import delete_stack
+from .stacks import MultiStackWaiter
 from .stacks import wait_create_or_update_stack_to_finish
 from .stacks import wait_delete_stack_to_finish
+from .stacks import stream_stack_events
 from .stacks import wait_create_change_set_to_finish
 from .stacksets import describe_stack_set
 from .stacksets import create_stack_set
@@ -32,6 +46,13 @@ from .stacksets import describe_stack_instance
 from .stacksets import create_stack_instances
 from .stacksets import update_stack_instances
 from .stacksets import delete_stack_instances
+from .stacksets import LIST_STACK_INSTANCES_MAX_PAGE_SIZE
+from .stacksets import build_stack_instance_filters
 from .stacksets import StackInstanceIterProxy
 from .stacksets import list_stack_instances
 from .stacksets import wait_deploy_stack_instances_to_stop
+from .stacksets import describe_stack_set_operation
+from .stacksets import StackSetOperationResultIterProxy
+from .stacksets import list_stack_set_operation_results
+from .stacksets import wait_stack_set_operation_to_stop
+from . import aio
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""
+The asyncio version of some :mod:`aws_cloudformation.better_boto` functions.
+The boto3 API calls run in the default executor of the event loop, and
+the waiters wait with ``asyncio.sleep``, so you can wait for many stacks
+concurrently without one thread per stack.
+
+Usage example::
+
+    import asyncio
+    from aws_cloudformation.better_boto import aio
+
+    async def main():
+        await asyncio.gather(
+            *[
+                aio.wait_create_or_update_stack_to_finish(
+                    bsm=bsm,
+                    stack_name=stack_name,
+                    wait_until_exec_stopped=True,
+                    delays=5,
+                    timeout=600,
+                    verbose=False,
+                )
+                for stack_name in stack_names
+            ]
+        )
+
+    asyncio.run(main())
+"""
+
+from .stacks import run_in_executor
+from .stacks import describe_stacks
+from .stacks import describe_live_stack
+from .stacks import create_change_set
+from .stacks import describe_change_set
+from .stacks import execute_change_set
+from .stacks import wait_delete_stack_to_finish
+from .stacks import wait_create_or_update_stack_to_finish
+from .stacks import wait_create_change_set_to_finish
+from .stacksets import describe_stack_set
+from .stacksets import list_stack_instances
+from .stacksets import wait_deploy_stack_instances_to_stop
+from .stacksets import wait_stack_set_operation_to_stop
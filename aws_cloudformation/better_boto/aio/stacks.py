@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+
+"""
+The asyncio version of :mod:`aws_cloudformation.better_boto.stacks`.
+"""
+
+import typing as T
+import asyncio
+import functools
+
+from boto_session_manager import BotoSesManager
+from func_args import NOTHING
+from colorama import Fore, Style
+
+from ... import exc
+from ...waiter import DelayStrategy, AsyncWaiter
+from ...reporter import BaseReporter, resolve_reporter
+from ...helper import is_throttling_error
+from ...context import get_context
+from ...stack import (
+    Stack,
+    ChangeSetStatusEnum,
+    ChangeSet,
+)
+from .. import stacks
+
+
+async def run_in_executor(func: T.Callable, *args, **kwargs):
+    """
+    Run a blocking function (usually a boto3 API call) in the default
+    executor of the running event loop.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+async def describe_stacks(
+    bsm: BotoSesManager,
+    name: T.Optional[str] = NOTHING,
+) -> T.List[Stack]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.describe_stacks`.
+
+    :return: list of :class:`~aws_cloudformation.stack.Stack`, all pages
+        are fetched.
+    """
+    return await run_in_executor(
+        lambda: stacks.describe_stacks(bsm=bsm, name=name).all(),
+    )
+
+
+async def describe_live_stack(
+    bsm: BotoSesManager,
+    name: str,
+) -> T.Optional[Stack]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.describe_live_stack`.
+    """
+    return await run_in_executor(stacks.describe_live_stack, bsm=bsm, name=name)
+
+
+async def create_change_set(
+    bsm: BotoSesManager,
+    stack_name: str,
+    change_set_name: str,
+    **kwargs,
+) -> T.Tuple[str, str]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.create_change_set`,
+    it takes the same arguments.
+
+    :return: the stack id and the change set id
+    """
+    return await run_in_executor(
+        stacks.create_change_set,
+        bsm=bsm,
+        stack_name=stack_name,
+        change_set_name=change_set_name,
+        **kwargs,
+    )
+
+
+async def describe_change_set(
+    bsm: BotoSesManager,
+    change_set_name: str,
+    stack_name: T.Optional[str] = NOTHING,
+) -> T.Optional[ChangeSet]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.describe_change_set`.
+    """
+    return await run_in_executor(
+        stacks.describe_change_set,
+        bsm=bsm,
+        change_set_name=change_set_name,
+        stack_name=stack_name,
+    )
+
+
+async def execute_change_set(
+    bsm: BotoSesManager,
+    change_set_name: str,
+    **kwargs,
+):
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.execute_change_set`,
+    it takes the same arguments.
+    """
+    return await run_in_executor(
+        stacks.execute_change_set,
+        bsm=bsm,
+        change_set_name=change_set_name,
+        **kwargs,
+    )
+
+
+async def _handle_failed_in_waiter(**kwargs):
+    # it may call describe_stack_events to find the root cause
+    return await run_in_executor(stacks._handle_failed_in_waiter, **kwargs)
+
+
+async def wait_delete_stack_to_finish(
+    bsm: BotoSesManager,
+    stack_id: str,
+    wait_until_exec_stopped: bool,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    reporter: T.Optional[BaseReporter] = None,
+):
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.wait_delete_stack_to_finish`.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_delete",
+        f"  {Fore.CYAN}wait for delete to finish{Style.RESET_ALL} ...",
+    )
+
+    failed_log_printed = False
+    has_error: bool = False
+    error: T.Optional[Exception] = None
+
+    aws_console = get_context(bsm).aws_console
+
+    waiter = AsyncWaiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    async for _ in waiter:
+        try:
+            stack_list = await describe_stacks(bsm, name=stack_id)
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+        if len(stack_list) == 0:
+            reporter.on_event(
+                "stack_deleted",
+                f"\n    🟢 already deleted.",
+                stack_id=stack_id,
+            )
+            waiter.done()
+            return
+
+        stack = stack_list[0]
+
+        if stack.is_failed():
+            failed_log_printed, has_error, error = await _handle_failed_in_waiter(
+                bsm=bsm,
+                aws_console=aws_console,
+                stack=stack,
+                failed_log_printed=failed_log_printed,
+                wait_until_exec_stopped=wait_until_exec_stopped,
+                error=error,
+                reporter=reporter,
+            )
+
+        if stack.is_stopped():
+            stacks._handle_stopped_in_waiter(
+                stack=stack,
+                has_error=has_error,
+                error=error,
+                reporter=reporter,
+            )
+            if stack.is_success():
+                waiter.done()
+            return
+
+
+async def wait_create_or_update_stack_to_finish(
+    bsm: BotoSesManager,
+    stack_name: str,
+    wait_until_exec_stopped: bool,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    reporter: T.Optional[BaseReporter] = None,
+) -> Stack:
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.wait_create_or_update_stack_to_finish`.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_deploy",
+        f"  {Fore.CYAN}wait for deploy to finish{Style.RESET_ALL} ...",
+    )
+
+    is_arn = stack_name.startswith("arn:")
+
+    failed_log_printed = False
+    has_error: bool = False
+    error: T.Optional[Exception] = None
+
+    aws_console = get_context(bsm).aws_console
+
+    waiter = AsyncWaiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    async for _ in waiter:
+        try:
+            if is_arn:
+                stack_list = await describe_stacks(bsm, stack_name)
+                stack = stack_list[0]
+            else:
+                stack = await describe_live_stack(bsm, stack_name)
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+
+        if stack.is_failed():
+            failed_log_printed, has_error, error = await _handle_failed_in_waiter(
+                bsm=bsm,
+                aws_console=aws_console,
+                stack=stack,
+                failed_log_printed=failed_log_printed,
+                wait_until_exec_stopped=wait_until_exec_stopped,
+                error=error,
+                reporter=reporter,
+            )
+
+        if stack.is_stopped():
+            stacks._handle_stopped_in_waiter(
+                stack=stack,
+                has_error=has_error,
+                error=error,
+                reporter=reporter,
+            )
+            if stack.is_success():
+                waiter.done()
+            return stack
+
+
+async def wait_create_change_set_to_finish(
+    bsm: BotoSesManager,
+    stack_name: str,
+    change_set_id: str,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    reporter: T.Optional[BaseReporter] = None,
+) -> T.Optional[ChangeSet]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacks.wait_create_change_set_to_finish`.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_change_set",
+        f"  {Fore.CYAN}wait for change set creation to finish{Style.RESET_ALL} ...",
+    )
+
+    waiter = AsyncWaiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    async for _ in waiter:
+        try:
+            change_set = await describe_change_set(
+                bsm=bsm,
+                change_set_name=change_set_id,
+                stack_name=stack_name,
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+        if change_set is None:
+            return None
+
+        if change_set.status in [
+            ChangeSetStatusEnum.CREATE_COMPLETE.value,
+            ChangeSetStatusEnum.FAILED.value,
+        ]:
+            reporter.on_event(
+                "change_set_stopped",
+                f"\n    reached status {Fore.CYAN}{change_set.status}{Style.RESET_ALL}",
+                stack_name=change_set.stack_name,
+                change_set_id=change_set.change_set_id,
+                status=change_set.status,
+            )
+
+            if (
+                change_set.status == ChangeSetStatusEnum.FAILED.value
+            ):  # pragma: no cover
+                if (
+                    "The submitted information didn't contain changes."
+                    in change_set.status_reason
+                ):
+                    raise exc.CreateStackChangeSetButNotChangeError(
+                        change_set.status_reason
+                    )
+                else:
+                    raise exc.CreateStackChangeSetFailedError(change_set.status_reason)
+            waiter.done()
+
+            # resume from the page we already have, don't fetch it again
+            await run_in_executor(
+                stacks.load_all_changes,
+                bsm=bsm,
+                change_set=change_set,
+            )
+
+            return change_set
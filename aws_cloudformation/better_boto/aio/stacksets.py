@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+The asyncio version of :mod:`aws_cloudformation.better_boto.stacksets`.
+"""
+
+import typing as T
+
+from boto_session_manager import BotoSesManager
+from func_args import NOTHING
+from colorama import Fore, Style
+
+from ...waiter import DelayStrategy, AsyncWaiter
+from ...reporter import BaseReporter, resolve_reporter
+from ...helper import is_throttling_error
+from ...context import get_context
+from ...stack_set import (
+    StackSet,
+    StackInstance,
+)
+from .. import stacksets
+from .stacks import run_in_executor
+
+
+async def describe_stack_set(
+    bsm: BotoSesManager,
+    name: str,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+) -> T.Optional[StackSet]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacksets.describe_stack_set`.
+    """
+    return await run_in_executor(
+        stacksets.describe_stack_set,
+        bsm=bsm,
+        name=name,
+        call_as_self=call_as_self,
+        call_as_delegated_admin=call_as_delegated_admin,
+    )
+
+
+async def list_stack_instances(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    **kwargs,
+) -> T.List[StackInstance]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacksets.list_stack_instances`,
+    it takes the same arguments.
+
+    :return: list of :class:`~aws_cloudformation.stack_set.StackInstance`,
+        all pages are fetched.
+    """
+    return await run_in_executor(
+        lambda: stacksets.list_stack_instances(
+            bsm=bsm,
+            stack_set_name=stack_set_name,
+            **kwargs,
+        ).all()
+    )
+
+
+async def wait_deploy_stack_instances_to_stop(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    raise_error_until_exec_stopped: bool,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+    reporter: T.Optional[BaseReporter] = None,
+) -> T.List[StackInstance]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacksets.wait_deploy_stack_instances_to_stop`.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_stack_instances",
+        f"  {Fore.CYAN}wait for deploy stack instances to stop{Style.RESET_ALL} ...",
+        stack_set_name=stack_set_name,
+    )
+
+    aws_console = get_context(bsm).aws_console
+
+    waiter = AsyncWaiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    async for _ in waiter:
+        try:
+            stack_instances = await list_stack_instances(
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+
+        if len(stack_instances) == 0:
+            reporter.on_event(
+                "stack_instances_stopped",
+                f"\n    there's no stack instances.",
+                n_stack_instances=0,
+            )
+            waiter.done()
+            return stack_instances
+
+        if stacksets._is_stack_instances_stopped(
+            aws_console=aws_console,
+            stack_instances=stack_instances,
+            raise_error_until_exec_stopped=raise_error_until_exec_stopped,
+            reporter=reporter,
+            call_as_self=call_as_self,
+            call_as_delegated_admin=call_as_delegated_admin,
+        ):
+            waiter.done()
+            return stack_instances
+
+
+async def wait_stack_set_operation_to_stop(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    operation_id: str,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+    reporter: T.Optional[BaseReporter] = None,
+) -> T.List[StackInstance]:
+    """
+    See :func:`aws_cloudformation.better_boto.stacksets.wait_stack_set_operation_to_stop`.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_stack_set_operation",
+        f"  {Fore.CYAN}wait for stack set operation {operation_id} to stop"
+        f"{Style.RESET_ALL} ...",
+        stack_set_name=stack_set_name,
+        operation_id=operation_id,
+    )
+    waiter = AsyncWaiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    async for _ in waiter:
+        try:
+            operation = await run_in_executor(
+                stacksets.describe_stack_set_operation,
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                operation_id=operation_id,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+        if operation.is_stopped():
+            stack_instances = await run_in_executor(
+                stacksets._handle_stack_set_operation_stopped,
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                operation=operation,
+                reporter=reporter,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+            waiter.done()
+            return stack_instances
@@ -5,21 +5,31 @@ AWS CloudFormation Stack related operations.
 """
 
 import typing as T
+import time
+import itertools
+import threading
 
-from boto_session_manager import BotoSesManager, AwsServiceEnum
+from boto_session_manager import BotoSesManager
 from iterproxy import IterProxy
 from func_args import NOTHING, resolve_kwargs
 from colorama import Fore, Style
 from aws_console_url.api import AWSConsole
 
 from .. import exc
-from ..waiter import Waiter
+from ..waiter import DelayStrategy, Waiter
+from ..reporter import BaseReporter, resolve_reporter
+from ..helper import is_throttling_error
+from ..context import get_context
 from ..stack import (
     Parameter,
+    StackStatusEnum,
     Stack,
+    Export,
+    StackEvent,
     ChangeSetStatusEnum,
     ChangeSet,
 )
+from ..resource_change import ResourceChange
 
 from .stacks_helpers import (
     resolve_on_failure,
@@ -30,12 +40,11 @@ from .stacks_helpers import (
 
 def _describe_stacks(
     bsm: BotoSesManager,
-    name: str,
+    name: T.Optional[str] = NOTHING,
 ) -> T.Iterable[Stack]:
-    cf_client = bsm.get_client(AwsServiceEnum.CloudFormation)
-    paginator = cf_client.get_paginator("describe_stacks")
+    paginator = get_context(bsm).get_paginator("describe_stacks")
     response_iterator = paginator.paginate(
-        StackName=name,
+        **resolve_kwargs(StackName=name),
     )
     try:
         for response in response_iterator:
@@ -58,9 +67,12 @@ class StackIterProxy(IterProxy[Stack]):
 
 def describe_stacks(
     bsm: BotoSesManager,
-    name: str,
+    name: T.Optional[str] = NOTHING,
 ) -> StackIterProxy:
     """
+    :param name: the stack name or unique stack id. If not given, describe
+        all the stacks (except the deleted ones) in the account and region.
+
     Ref:
 
     - https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation.html#CloudFormation.Client.describe_stacks
@@ -72,6 +84,107 @@ def describe_stacks(
     )
 
 
+def _list_stacks(
+    bsm: BotoSesManager,
+    status_filter: T.Optional[T.List[str]] = NOTHING,
+) -> T.Iterable[Stack]:
+    paginator = get_context(bsm).get_paginator("list_stacks")
+    response_iterator = paginator.paginate(
+        **resolve_kwargs(StackStatusFilter=status_filter),
+    )
+    for response in response_iterator:
+        for data in response.get("StackSummaries", []):
+            yield Stack.from_list_stacks_response(data)
+
+
+LIVE_STACK_STATUS_FILTER = [
+    status.value
+    for status in StackStatusEnum
+    if status is not StackStatusEnum.DELETE_COMPLETE
+]
+
+
+def list_stacks(
+    bsm: BotoSesManager,
+    status_filter: T.Optional[T.List[str]] = NOTHING,
+) -> StackIterProxy:
+    """
+    List the stack summaries, it is much cheaper than ``describe_stacks``
+    but the stack object doesn't have the outputs, parameters and tags.
+
+    Ref:
+
+    - https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_stacks.html
+
+    :param status_filter: only list the stacks in these status. The deleted
+        stacks are kept for 90 days, use :data:`LIVE_STACK_STATUS_FILTER` to
+        skip them.
+
+    :return: :class:`StackIterProxy`
+    """
+    return StackIterProxy(
+        _list_stacks(bsm=bsm, status_filter=status_filter),
+    )
+
+
+def _list_exports(
+    bsm: BotoSesManager,
+) -> T.Iterable[Export]:
+    paginator = get_context(bsm).get_paginator("list_exports")
+    for response in paginator.paginate():
+        for data in response.get("Exports", []):
+            yield Export.from_list_exports_response(data)
+
+
+class ExportIterProxy(IterProxy[Export]):
+    """
+    Reference:
+
+    - https://github.com/MacHu-GWU/iterproxy-project
+    """
+
+
+def list_exports(
+    bsm: BotoSesManager,
+) -> ExportIterProxy:
+    """
+    List all the exported output values in the account and region.
+
+    Ref:
+
+    - https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_exports.html
+
+    :return: :class:`ExportIterProxy`
+    """
+    return ExportIterProxy(_list_exports(bsm=bsm))
+
+
+def list_imports(
+    bsm: BotoSesManager,
+    export_name: str,
+) -> T.List[str]:
+    """
+    List the names of the stacks that import the given export.
+
+    Ref:
+
+    - https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_imports.html
+
+    :return: list of stack names, empty if it is not imported by any stack.
+    """
+    paginator = get_context(bsm).get_paginator("list_imports")
+    stack_names = list()
+    try:
+        for response in paginator.paginate(ExportName=export_name):
+            stack_names.extend(response.get("Imports", []))
+    except Exception as e:
+        if "is not imported by any stack" in str(e):
+            return []
+        else:
+            raise e
+    return stack_names
+
+
 def describe_live_stack(
     bsm: BotoSesManager,
     name: str,
@@ -94,6 +207,111 @@ def describe_live_stack(
         return None
 
 
+def _describe_stack_events(
+    bsm: BotoSesManager,
+    name: str,
+) -> T.Iterable[StackEvent]:
+    paginator = get_context(bsm).get_paginator("describe_stack_events")
+    response_iterator = paginator.paginate(StackName=name)
+    for response in response_iterator:
+        for data in response.get("StackEvents", []):
+            yield StackEvent.from_describe_stack_events_response(data)
+
+
+class StackEventIterProxy(IterProxy[StackEvent]):
+    """
+    Reference:
+
+    - https://github.com/MacHu-GWU/iterproxy-project
+    """
+
+
+def describe_stack_events(
+    bsm: BotoSesManager,
+    name: str,
+) -> StackEventIterProxy:
+    """
+    Ref:
+
+    - describe_stack_events: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/describe_stack_events.html
+
+    :param name: the stack name or unique stack id. You have to use the stack
+        id for deleted stack.
+
+    :return: :class:`StackEventIterProxy`, the newest event comes first. The
+        next page is fetched only when you iterate to it.
+    """
+    return StackEventIterProxy(
+        _describe_stack_events(bsm=bsm, name=name),
+    )
+
+
+class StackEventStream:
+    """
+    Read the stack events incrementally. It remembers the newest event id
+    it has seen, and stops paginating ``describe_stack_events`` once it reaches
+    that event, so each :meth:`poll` only fetches the new events.
+
+    The first :meth:`poll` returns the events of the current (or the latest)
+    stack operation, it stops at the stack event that starts the
+    create / update / delete / import operation.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param name: the stack name or unique stack id
+    :param last_event_id: start after this event id, if you already
+        have the events until this one.
+    """
+
+    def __init__(
+        self,
+        bsm: BotoSesManager,
+        name: str,
+        last_event_id: T.Optional[str] = None,
+    ):
+        self.bsm = bsm
+        self.name = name
+        self.last_event_id = last_event_id
+
+    def poll(self) -> T.List[StackEvent]:
+        """
+        :return: the new events since the last poll, in chronological order.
+        """
+        events = list()
+        for event in describe_stack_events(bsm=self.bsm, name=self.name):
+            if event.event_id == self.last_event_id:
+                break
+            events.append(event)
+            if (self.last_event_id is None) and event.is_stack_operation_start():
+                break
+        if len(events):
+            self.last_event_id = events[0].event_id
+        events.reverse()
+        return events
+
+
+def find_root_cause_event(
+    bsm: BotoSesManager,
+    name: str,
+) -> T.Optional[StackEvent]:
+    """
+    Find the first failed resource event in the current (or the latest) stack
+    operation, it usually tells why the stack failed. The resources failed
+    later are often just cancelled because of it.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param name: the stack name or unique stack id
+    """
+    failed_events = [
+        event for event in StackEventStream(bsm, name).poll() if event.is_failed()
+    ]
+    for event in failed_events:
+        if not event.is_stack_event():
+            return event
+    if len(failed_events):
+        return failed_events[0]
+    return None
+
+
 def create_stack(
     bsm: BotoSesManager,
     stack_name: str,
@@ -157,7 +375,7 @@ def create_stack(
         include_named_iam=include_named_iam,
         include_macro=include_macro,
     )
-    response = bsm.cloudformation_client.create_stack(**resolve_kwargs(**kwargs))
+    response = get_context(bsm).cf_client.create_stack(**resolve_kwargs(**kwargs))
     stack_id = response["StackId"]
     return stack_id
 
@@ -218,7 +436,7 @@ def update_stack(
         include_named_iam=include_named_iam,
         include_macro=include_macro,
     )
-    response = bsm.cloudformation_client.update_stack(**resolve_kwargs(**kwargs))
+    response = get_context(bsm).cf_client.update_stack(**resolve_kwargs(**kwargs))
     stack_id = response["StackId"]
     return stack_id
 
@@ -286,7 +504,7 @@ def create_change_set(
         include_named_iam=include_named_iam,
         include_macro=include_macro,
     )
-    response = bsm.cloudformation_client.create_change_set(**resolve_kwargs(**kwargs))
+    response = get_context(bsm).cf_client.create_change_set(**resolve_kwargs(**kwargs))
     stack_id = response["StackId"]
     change_set_id = response["Id"]
     return stack_id, change_set_id
@@ -312,7 +530,7 @@ def describe_change_set(
         NextToken=next_token,
     )
     try:
-        response = bsm.cloudformation_client.describe_change_set(
+        response = get_context(bsm).cf_client.describe_change_set(
             **resolve_kwargs(**kwargs)
         )
         change_set = ChangeSet.from_describe_change_set_response(response)
@@ -339,7 +557,7 @@ def describe_change_set_with_paginator(
 
     - DescribeChangeSet: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/paginator/DescribeChangeSet.html
     """
-    paginator = bsm.cloudformation_client.get_paginator("describe_change_set")
+    paginator = get_context(bsm).get_paginator("describe_change_set")
     pagination_config = dict()
     if max_items is not NOTHING:
         pagination_config["MaxItems"] = max_items
@@ -364,6 +582,81 @@ def describe_change_set_with_paginator(
         return None
 
 
+def _describe_rest_of_change_set(
+    bsm: "BotoSesManager",
+    change_set: ChangeSet,
+) -> T.Iterable[ChangeSet]:
+    """
+    Yield the pages after the given page, resume from its ``next_token``.
+    """
+    next_token = change_set.next_token
+    while next_token:
+        page = describe_change_set(
+            bsm=bsm,
+            change_set_name=change_set.change_set_id,
+            next_token=next_token,
+        )
+        if page is None:  # pragma: no cover
+            return
+        yield page
+        next_token = page.next_token
+
+
+class ResourceChangeIterProxy(IterProxy[ResourceChange]):
+    """
+    Reference:
+
+    - https://github.com/MacHu-GWU/iterproxy-project
+    """
+
+
+def _iter_resource_changes(
+    bsm: "BotoSesManager",
+    change_set: ChangeSet,
+) -> T.Iterable[ResourceChange]:
+    for page in itertools.chain(
+        [change_set],
+        _describe_rest_of_change_set(bsm=bsm, change_set=change_set),
+    ):
+        yield from page.resource_changes
+
+
+def iter_resource_changes(
+    bsm: "BotoSesManager",
+    change_set: ChangeSet,
+) -> ResourceChangeIterProxy:
+    """
+    Stream the :class:`~aws_cloudformation.resource_change.ResourceChange`
+    of a change set lazily. It starts from the changes already in the
+    ``change_set`` object, then fetches the next pages from its ``next_token``
+    only when needed. Each page is fetched only once.
+
+    :param change_set: the :class:`~aws_cloudformation.stack.ChangeSet`
+        returned by :func:`describe_change_set`
+    """
+    return ResourceChangeIterProxy(
+        _iter_resource_changes(bsm=bsm, change_set=change_set),
+    )
+
+
+def load_all_changes(
+    bsm: "BotoSesManager",
+    change_set: T.Optional[ChangeSet],
+) -> T.Optional[ChangeSet]:
+    """
+    Fetch the rest of the pages of the change set from its ``next_token``,
+    and append the changes to ``change_set.changes`` in place.
+
+    :return: the same change set object, its ``next_token`` is None.
+    """
+    if change_set is None:
+        return None
+    for page in _describe_rest_of_change_set(bsm=bsm, change_set=change_set):
+        change_set.changes.extend(page.changes)
+    change_set.next_token = None
+    return change_set
+
+
 def execute_change_set(
     bsm: "BotoSesManager",
     change_set_name: str,
@@ -385,7 +678,7 @@ def execute_change_set(
         ClientRequestToken=client_request_token,
         DisableRollback=disable_rollback,
     )
-    bsm.cloudformation_client.execute_change_set(**resolve_kwargs(**kwargs))
+    get_context(bsm).cf_client.execute_change_set(**resolve_kwargs(**kwargs))
 
 
 def delete_stack(
@@ -409,26 +702,55 @@ def delete_stack(
         RoleARN=role_arn,
         ClientRequestToken=client_request_token,
     )
-    bsm.cloudformation_client.delete_stack(**resolve_kwargs(**kwargs))
+    get_context(bsm).cf_client.delete_stack(**resolve_kwargs(**kwargs))
 
 
 # ------------------------------------------------------------------------------
 # Waiter
 # ------------------------------------------------------------------------------
+def _get_root_cause_message(
+    bsm: BotoSesManager,
+    stack: Stack,
+) -> T.Optional[str]:
+    # it is only for a better error message, don't hide the real failure
+    try:
+        event = find_root_cause_event(bsm, stack.id)
+    except Exception:  # pragma: no cover
+        return None
+    if event is None:  # pragma: no cover
+        return None
+    return (
+        f"{event.logical_resource_id} ({event.resource_type}) "
+        f"{event.resource_status}: {event.resource_status_reason}"
+    )
+
+
 def _handle_failed_in_waiter(
+    bsm: BotoSesManager,
     aws_console: AWSConsole,
     stack: Stack,
     failed_log_printed: bool,
     wait_until_exec_stopped: bool,
+    error: T.Optional[Exception],
+    reporter: BaseReporter,
 ) -> T.Tuple[bool, bool, Exception]:
     if failed_log_printed is False:
-        print(
-            f"\n    reached status 🔴 {Fore.CYAN}{stack.status.value!r}{Style.RESET_ALL}"
+        reporter.on_event(
+            "stack_failed",
+            f"\n    reached status 🔴 {Fore.CYAN}{stack.status.value!r}{Style.RESET_ALL}",
+            stack_name=stack.name,
+            stack_id=stack.id,
+            status=stack.status.value,
         )
         failed_log_printed = True
-    console_url = aws_console.cloudformation.get_stack_events(stack.id)
+    if error is None:
+        console_url = aws_console.cloudformation.get_stack_events(stack.id)
+        message = f"preview failed events: {console_url}"
+        root_cause = _get_root_cause_message(bsm, stack)
+        if root_cause is not None:
+            message = f"{root_cause}, {message}"
+        error = exc.DeployStackFailedError(message)
     has_error = True
-    error = exc.DeployStackFailedError(f"preview failed events: {console_url}")
     if wait_until_exec_stopped is False:
         raise error
     return failed_log_printed, has_error, error
@@ -438,27 +760,179 @@ def _handle_stopped_in_waiter(
     stack: "Stack",
     has_error: bool,
     error: T.Optional[Exception],
-    verbose: bool,
+    reporter: BaseReporter,
 ):
-    if verbose:
-        if stack.is_success():
-            icon = "🟢"
-        else:
-            icon = "🔴"
-        print(
-            f"\n    reached status {icon} {Fore.CYAN}{stack.status.value}{Style.RESET_ALL}"
-        )
+    if stack.is_success():
+        icon = "🟢"
+    else:
+        icon = "🔴"
+    reporter.on_event(
+        "stack_stopped",
+        f"\n    reached status {icon} {Fore.CYAN}{stack.status.value}{Style.RESET_ALL}",
+        stack_name=stack.name,
+        stack_id=stack.id,
+        status=stack.status.value,
+    )
     if has_error:
         raise error
 
 
+class MultiStackWaiter:
+    """
+    Share one ``describe_stacks`` sweep among many stacks waiting at the same
+    time in the same AWS account and region. Without it, N waiting stacks make
+    N ``describe_stacks`` calls every ``delays`` seconds.
+
+    It can be used in two ways:
+
+    1. Shared by many threads, each thread passes it to
+       :func:`wait_create_or_update_stack_to_finish` or
+       :func:`wait_delete_stack_to_finish` as ``multi_stack_waiter``. Only one
+       thread does the sweep when the snapshot is older than ``delays``
+       seconds, or it started before the caller started waiting, the others
+       read from the snapshot.
+    2. In one thread, call :meth:`wait` with all the stack ids.
+
+    Note that ``describe_stacks`` without stack name doesn't return the
+    deleted stacks, so a stack not in the snapshot is considered deleted.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param delays: the min interval (in seconds) between two sweeps
+    """
+
+    def __init__(
+        self,
+        bsm: "BotoSesManager",
+        delays: T.Union[int, float],
+    ):
+        self.bsm = bsm
+        self.delays = delays
+        self.n_sweep = 0
+        self._lock = threading.Lock()
+        self._last_sweep_time: T.Optional[float] = None
+        self._stacks_by_id: T.Dict[str, Stack] = dict()
+        self._stacks_by_name: T.Dict[str, Stack] = dict()
+
+    def _sweep(self):
+        # the pages may be read before the sweep finishes, the snapshot is
+        # only as new as the start of the sweep
+        started_at = time.time()
+        stacks = describe_stacks(self.bsm).all()
+        self._stacks_by_id = {stack.id: stack for stack in stacks}
+        self._stacks_by_name = {stack.name: stack for stack in stacks}
+        self._last_sweep_time = started_at
+        self.n_sweep += 1
+
+    def sweep(self) -> T.Dict[str, Stack]:
+        """
+        Describe all stacks in one paginated ``describe_stacks`` call, and
+        refresh the snapshot.
+
+        :return: stack id -> :class:`~aws_cloudformation.stack.Stack` mapper
+        """
+        with self._lock:
+            self._sweep()
+            return self._stacks_by_id
+
+    def _is_fresh(self, not_before: T.Optional[float] = None) -> bool:
+        if self._last_sweep_time is None:
+            return False
+        if (not_before is not None) and (self._last_sweep_time < not_before):
+            return False
+        return (time.time() - self._last_sweep_time) < self.delays
+
+    def get_stack(
+        self,
+        name_or_id: str,
+        not_before: T.Optional[float] = None,
+    ) -> T.Optional[Stack]:
+        """
+        Get the latest status of a stack, sweep if the snapshot is stale.
+
+        :param name_or_id: the stack name or unique stack id
+        :param not_before: if the snapshot is started before this timestamp,
+            sweep again. Usually it is the time the caller starts waiting,
+            an older snapshot may have the status before the caller's
+            ``execute_change_set`` / ``update_stack`` / ``delete_stack``.
+
+        :return: None if the stack is not in the snapshot.
+        """
+        # hold the lock while sweeping, other threads reuse the new snapshot
+        with self._lock:
+            if not self._is_fresh(not_before=not_before):
+                self._sweep()
+            if name_or_id.startswith("arn:"):
+                return self._stacks_by_id.get(name_or_id)
+            else:
+                return self._stacks_by_name.get(name_or_id)
+
+    def wait(
+        self,
+        stack_ids: T.Iterable[str],
+        timeout: T.Union[int, float],
+        verbose: bool = False,
+        reporter: T.Optional[BaseReporter] = None,
+    ) -> T.Dict[str, T.Optional[Stack]]:
+        """
+        Wait until all the given stacks reach a stopped status (or are deleted),
+        with one sweep per tick. It doesn't raise when a stack failed, the
+        caller should check the returned stack status.
+
+        :param stack_ids: the unique stack ids, you cannot use stack_name here
+        :param timeout: how long it will raise timeout error
+        :param verbose: whether you want to log information to console
+        :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+            ``verbose`` is ignored
+
+        :return: stack id -> :class:`~aws_cloudformation.stack.Stack` mapper,
+            the value is None if the stack is deleted.
+        """
+        reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+        waiting = set(stack_ids)
+        results: T.Dict[str, T.Optional[Stack]] = dict()
+        if len(waiting) == 0:
+            return results
+        waiter = Waiter(
+            delays=self.delays,
+            timeout=timeout,
+            indent=4,
+            reporter=reporter,
+        )
+        for _ in waiter:
+            try:
+                stacks = self.sweep()
+            except Exception as e:
+                if is_throttling_error(e):
+                    waiter.notify_throttled()
+                    continue
+                raise
+            for stack_id in list(waiting):
+                stack = stacks.get(stack_id)
+                if (stack is None) or stack.is_stopped():
+                    results[stack_id] = stack
+                    waiting.remove(stack_id)
+            if len(waiting) == 0:
+                reporter.on_event(
+                    "stacks_stopped",
+                    f"\n    all {len(results)} stacks are stopped.",
+                    stack_ids=list(results),
+                )
+                if all(
+                    (stack is None) or stack.is_success() for stack in results.values()
+                ):
+                    waiter.done()
+                return results
+
+
 def wait_delete_stack_to_finish(
     bsm: "BotoSesManager",
     stack_id: str,
     wait_until_exec_stopped: bool,
-    delays: T.Union[int, float],
+    delays: T.Union[int, float, DelayStrategy],
     timeout: T.Union[int, float],
     verbose: bool,
+    multi_stack_waiter: T.Optional[MultiStackWaiter] = None,
+    reporter: T.Optional[BaseReporter] = None,
 ):
     """
     You can run this function after you run :func:`delete_stack`. It will
@@ -473,50 +947,72 @@ def wait_delete_stack_to_finish(
         the stack will take some time to reach stopped status after it failed,
         you may not to run another deploy immediately. if True, it will raise
         the exception after the stack reaching ``stopped`` status.
-    :param delays: how long it waits (in seconds) between two "get status" api call
+    :param delays: how long it waits (in seconds) between two "get status" api call,
+        or a :class:`~aws_cloudformation.waiter.DelayStrategy` object
     :param timeout: how long it will raise timeout error
     :param verbose: whether you want to log information to console
+    :param multi_stack_waiter: if given, get the stack status from the shared
+        :class:`MultiStackWaiter` instead of calling ``describe_stacks``.
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
 
     :return: Nothing
     """
-    if verbose:  # pragma: no cover
-        if wait_until_exec_stopped:
-            print(
-                f"  {Fore.CYAN}wait for delete to finish{Style.RESET_ALL} , "
-                f"if failed, raise error immediately ..."
-            )
-        else:
-            print(
-                f"  {Fore.CYAN}wait for delete to finish{Style.RESET_ALL} , "
-                f"if failed, wait until rollback (if possible) is finished ..."
-            )
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    if wait_until_exec_stopped:
+        message = "if failed, wait until rollback (if possible) is finished ..."
+    else:
+        message = "if failed, raise error immediately ..."
+    reporter.on_event(
+        "wait_delete",
+        f"  {Fore.CYAN}wait for delete to finish{Style.RESET_ALL} , {message}",
+    )
 
     failed_log_printed = False
     has_error: bool = False
     error: T.Optional[Exception] = None
 
-    aws_console = AWSConsole(aws_region=bsm.aws_region)
+    aws_console = get_context(bsm).aws_console
+    wait_start = time.time()
 
-    for _ in Waiter(
+    waiter = Waiter(
         delays=delays,
         timeout=timeout,
         indent=4,
-        verbose=verbose,
-    ):
-        stacks = describe_stacks(bsm, name=stack_id).all()
+        reporter=reporter,
+    )
+    for _ in waiter:
+        try:
+            if multi_stack_waiter is None:
+                stacks = describe_stacks(bsm, name=stack_id).all()
+            else:
+                stack = multi_stack_waiter.get_stack(stack_id, not_before=wait_start)
+                stacks = [] if stack is None else [stack]
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
         if len(stacks) == 0:
-            if verbose:  # pragma: no cover
-                print(f"\n    🟢 already deleted.")
+            reporter.on_event(
+                "stack_deleted",
+                f"\n    🟢 already deleted.",
+                stack_id=stack_id,
+            )
+            waiter.done()
             return
 
         stack = stacks[0]
 
         if stack.is_failed():
             failed_log_printed, has_error, error = _handle_failed_in_waiter(
+                bsm=bsm,
                 aws_console=aws_console,
                 stack=stack,
                 failed_log_printed=failed_log_printed,
                 wait_until_exec_stopped=wait_until_exec_stopped,
+                error=error,
+                reporter=reporter,
             )
 
         if stack.is_stopped():
@@ -524,8 +1020,10 @@ def wait_delete_stack_to_finish(
                 stack=stack,
                 has_error=has_error,
                 error=error,
-                verbose=verbose,
+                reporter=reporter,
             )
+            if stack.is_success():
+                waiter.done()
             return
 
 
@@ -533,9 +1031,11 @@ def wait_create_or_update_stack_to_finish(
     bsm: "BotoSesManager",
     stack_name: str,
     wait_until_exec_stopped: bool,
-    delays: T.Union[int, float],
+    delays: T.Union[int, float, DelayStrategy],
     timeout: T.Union[int, float],
     verbose: bool,
+    multi_stack_waiter: T.Optional[MultiStackWaiter] = None,
+    reporter: T.Optional[BaseReporter] = None,
 ) -> Stack:
     """
     You can run this function after you run :func:`create_stack`,
@@ -555,23 +1055,26 @@ def wait_create_or_update_stack_to_finish(
         the stack will take some time to reach stopped status after it failed,
         you may not to run another deploy immediately. if True, it will raise
         the exception after the stack reaching ``stopped`` status.
-    :param delays: how long it waits (in seconds) between two "get status" api call
+    :param delays: how long it waits (in seconds) between two "get status" api call,
+        or a :class:`~aws_cloudformation.waiter.DelayStrategy` object
     :param timeout: how long it will raise timeout error
     :param verbose: whether you want to log information to console
+    :param multi_stack_waiter: if given, get the stack status from the shared
+        :class:`MultiStackWaiter` instead of calling ``describe_stacks``.
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
 
     :return: a :class:`~aws_cottonformation.stack.Stack` object.
     """
-    if verbose:  # pragma: no cover # pragma: no cover
-        if wait_until_exec_stopped:
-            print(
-                f"  {Fore.CYAN}wait for deploy to finish{Style.RESET_ALL} , "
-                f"if failed, raise error immediately ..."
-            )
-        else:
-            print(
-                f"  {Fore.CYAN}wait for deploy to finish{Style.RESET_ALL} , "
-                f"if failed, wait until rollback (if possible) is finished ..."
-            )
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    if wait_until_exec_stopped:
+        message = "if failed, wait until rollback (if possible) is finished ..."
+    else:
+        message = "if failed, raise error immediately ..."
+    reporter.on_event(
+        "wait_deploy",
+        f"  {Fore.CYAN}wait for deploy to finish{Style.RESET_ALL} , {message}",
+    )
 
     is_arn = stack_name.startswith("arn:")
 
@@ -579,26 +1082,45 @@ def wait_create_or_update_stack_to_finish(
     has_error: bool = False
     error: T.Optional[Exception] = None
 
-    aws_console = AWSConsole(aws_region=bsm.aws_region)
+    aws_console = get_context(bsm).aws_console
+    wait_start = time.time()
 
-    for _ in Waiter(
+    waiter = Waiter(
         delays=delays,
         timeout=timeout,
         indent=4,
-        verbose=verbose,
-    ):
-        if is_arn:
-            stacks = describe_stacks(bsm, stack_name).all()
-            stack = stacks[0]
-        else:
-            stack = describe_live_stack(bsm, stack_name)
+        reporter=reporter,
+    )
+    for _ in waiter:
+        try:
+            stack = None
+            if multi_stack_waiter is not None:
+                stack = multi_stack_waiter.get_stack(
+                    stack_name,
+                    not_before=wait_start,
+                )
+            # the stack may be created after the last sweep
+            if stack is None:
+                if is_arn:
+                    stacks = describe_stacks(bsm, stack_name).all()
+                    stack = stacks[0]
+                else:
+                    stack = describe_live_stack(bsm, stack_name)
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
 
         if stack.is_failed():
             failed_log_printed, has_error, error = _handle_failed_in_waiter(
+                bsm=bsm,
                 aws_console=aws_console,
                 stack=stack,
                 failed_log_printed=failed_log_printed,
                 wait_until_exec_stopped=wait_until_exec_stopped,
+                error=error,
+                reporter=reporter,
             )
 
         if stack.is_stopped():
@@ -606,18 +1128,107 @@ def wait_create_or_update_stack_to_finish(
                 stack=stack,
                 has_error=has_error,
                 error=error,
-                verbose=verbose,
+                reporter=reporter,
             )
+            if stack.is_success():
+                waiter.done()
             return stack
 
 
+def _report_stack_event(reporter: BaseReporter, event: StackEvent):
+    if event.is_failed():
+        icon = "🔴"
+    elif event.is_in_progress():
+        icon = "🟡"
+    else:
+        icon = "🟢"
+    reason = f" {event.resource_status_reason}" if event.resource_status_reason else ""
+    reporter.on_event(
+        "stack_event",
+        f"    {icon} {Fore.CYAN}{event.logical_resource_id}{Style.RESET_ALL} "
+        f"({event.resource_type}) {event.resource_status}{reason}",
+        stack_name=event.stack_name,
+        logical_resource_id=event.logical_resource_id,
+        resource_type=event.resource_type,
+        resource_status=event.resource_status,
+        resource_status_reason=event.resource_status_reason,
+    )
+
+
+def stream_stack_events(
+    bsm: "BotoSesManager",
+    stack_name: str,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    last_event_id: T.Optional[str] = None,
+    reporter: T.Optional[BaseReporter] = None,
+) -> T.Iterator[StackEvent]:
+    """
+    Another waiter mode, it yields the new :class:`~aws_cloudformation.stack.StackEvent`
+    of the current stack operation in chronological order as they happen,
+    until the stack reaches a stopped status. Each poll only fetches
+    the new events, see :class:`StackEventStream`.
+
+    It doesn't raise when the stack failed, you can check the failed events
+    from the yielded events, or use :func:`find_root_cause_event`.
+
+    Example::
+
+        for event in stream_stack_events(bsm, stack_id, delays=3, timeout=600, verbose=False):
+            if event.is_failed():
+                print(event.logical_resource_id, event.resource_status_reason)
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param stack_name: the stack name or unique stack id
+    :param delays: how long it waits (in seconds) between two
+        "describe_stack_events" api call, or a
+        :class:`~aws_cloudformation.waiter.DelayStrategy` object
+    :param timeout: how long it will raise timeout error
+    :param verbose: whether you want to log each event to console
+    :param last_event_id: see :class:`StackEventStream`
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    stream = StackEventStream(bsm, stack_name, last_event_id=last_event_id)
+    # the first poll happens immediately, the operation may be already done
+    for event in stream.poll():
+        _report_stack_event(reporter, event)
+        yield event
+        if event.is_stack_stopped():
+            return
+    waiter = Waiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    for _ in waiter:
+        try:
+            events = stream.poll()
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+        for event in events:
+            _report_stack_event(reporter, event)
+            yield event
+            if event.is_stack_stopped():
+                if event.stack_status.is_success():
+                    waiter.done()
+                return
+
+
 def wait_create_change_set_to_finish(
     bsm: "BotoSesManager",
     stack_name: str,
     change_set_id: str,
-    delays: T.Union[int, float],
+    delays: T.Union[int, float, DelayStrategy],
     timeout: T.Union[int, float],
     verbose: bool,
+    reporter: T.Optional[BaseReporter] = None,
 ) -> T.Optional[ChangeSet]:
     """
     You can run this function after you run :func:`create_change_set`. It will
@@ -626,28 +1237,39 @@ def wait_create_change_set_to_finish(
     :param bsm: ``boto_session_manager.BotoSesManager`` object
     :param stack_name: the stack name or unique stack id
     :param change_set_id: the change set id
-    :param delays: how long it waits (in seconds) between two "get status" api call
+    :param delays: how long it waits (in seconds) between two "get status" api call,
+        or a :class:`~aws_cloudformation.waiter.DelayStrategy` object
     :param timeout: how long it will raise timeout error
     :param verbose: whether you want to log information to console
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
 
     :return: ``ChangeSet`` object
     """
-    if verbose:  # pragma: no cover
-        print(
-            f"  {Fore.CYAN}wait for change set creation to finish{Style.RESET_ALL} ..."
-        )
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_change_set",
+        f"  {Fore.CYAN}wait for change set creation to finish{Style.RESET_ALL} ...",
+    )
 
-    for _ in Waiter(
+    waiter = Waiter(
         delays=delays,
         timeout=timeout,
         indent=4,
-        verbose=verbose,
-    ):
-        change_set = describe_change_set(
-            bsm=bsm,
-            change_set_name=change_set_id,
-            stack_name=stack_name,
-        )
+        reporter=reporter,
+    )
+    for _ in waiter:
+        try:
+            change_set = describe_change_set(
+                bsm=bsm,
+                change_set_name=change_set_id,
+                stack_name=stack_name,
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
         if change_set is None:
             return None
 
@@ -655,10 +1277,13 @@ def wait_create_change_set_to_finish(
             ChangeSetStatusEnum.CREATE_COMPLETE.value,
             ChangeSetStatusEnum.FAILED.value,
         ]:
-            if verbose:  # pragma: no cover
-                print(
-                    f"\n    reached status {Fore.CYAN}{change_set.status}{Style.RESET_ALL}"
-                )
+            reporter.on_event(
+                "change_set_stopped",
+                f"\n    reached status {Fore.CYAN}{change_set.status}{Style.RESET_ALL}",
+                stack_name=change_set.stack_name,
+                change_set_id=change_set.change_set_id,
+                status=change_set.status,
+            )
 
             if (
                 change_set.status == ChangeSetStatusEnum.FAILED.value
@@ -672,21 +1297,9 @@ def wait_create_change_set_to_finish(
                     )
                 else:
                     raise exc.CreateStackChangeSetFailedError(change_set.status_reason)
+            waiter.done()
 
-            if bool(change_set.next_token) and (
-                bool(len(change_set.changes))
-            ):  # pragma: no cover
-                describe_change_set_with_paginator(
-                    bsm=bsm,
-                    change_set_name=change_set_id,
-                    stack_name=stack_name,
-                    max_items=1000,
-                )
-                rest_of_change_set = describe_change_set_with_paginator(
-                    bsm=bsm,
-                    change_set_name=change_set_id,
-                    stack_name=stack_name,
-                )
-                change_set.changes.extend(rest_of_change_set.changes)
+            # resume from the page we already have, don't fetch it again
+            load_all_changes(bsm=bsm, change_set=change_set)
 
             return change_set
@@ -5,6 +5,7 @@ AWS CloudFormation StackSet related operations.
 """
 
 import typing as T
+import enum
 
 from boto_session_manager import BotoSesManager
 from iterproxy import IterProxy
@@ -20,7 +21,10 @@ from ..stack_set import (
     StackSet,
     StackInstanceStatusEnum,
     StackInstanceDetailedStatusEnum,
+    StackInstanceDriftStatusEnum,
     StackInstance,
+    StackSetOperation,
+    StackSetOperationResult,
 )
 from .stacksets_helpers import (
     resolve_callas_kwargs,
@@ -29,7 +33,10 @@ from .stacksets_helpers import (
     get_stack_set_info_console_url,
     get_stack_set_instances_console_url,
 )
-from ..waiter import Waiter
+from ..waiter import DelayStrategy, Waiter
+from ..reporter import BaseReporter, resolve_reporter
+from ..helper import is_throttling_error
+from ..context import get_context
 
 
 def describe_stack_set(
@@ -50,7 +57,7 @@ def describe_stack_set(
         call_as_delegated_admin=call_as_delegated_admin,
     )
     try:
-        res = bsm.cloudformation_client.describe_stack_set(**kwargs)
+        res = get_context(bsm).cf_client.describe_stack_set(**kwargs)
         stack_set = StackSet.from_describe_stack_set_response(res["StackSet"])
         return stack_set
     except Exception as e:
@@ -114,7 +121,7 @@ def create_stack_set(
         call_as_self=call_as_self,
         call_as_delegated_admin=call_as_delegated_admin,
     )
-    res = bsm.cloudformation_client.create_stack_set(**resolve_kwargs(**kwargs))
+    res = get_context(bsm).cf_client.create_stack_set(**resolve_kwargs(**kwargs))
     return res["StackSetId"]
 
 
@@ -181,7 +188,7 @@ def update_stack_set(
         call_as_delegated_admin=call_as_delegated_admin,
         managed_execution_active=managed_execution_active,
     )
-    res = bsm.cloudformation_client.update_stack_set(**resolve_kwargs(**kwargs))
+    res = get_context(bsm).cf_client.update_stack_set(**resolve_kwargs(**kwargs))
     return res["OperationId"]
 
 
@@ -204,7 +211,7 @@ def delete_stack_set(
         call_as_self=call_as_self,
         call_as_delegated_admin=call_as_delegated_admin,
     )
-    res = bsm.cloudformation_client.delete_stack_set(**resolve_kwargs(**kwargs))
+    res = get_context(bsm).cf_client.delete_stack_set(**resolve_kwargs(**kwargs))
 
 
 def describe_stack_instance(
@@ -231,7 +238,7 @@ def describe_stack_instance(
         call_as_delegated_admin=call_as_delegated_admin,
     )
     try:
-        res = bsm.cloudformation_client.describe_stack_instance(**kwargs)
+        res = get_context(bsm).cf_client.describe_stack_instance(**kwargs)
         return StackInstance.from_describe_stack_instance_response(res["StackInstance"])
     except Exception as e:
         if "StackInstanceNotFoundException" in str(e):  # pragma: no cover
@@ -276,7 +283,7 @@ def create_stack_instances(
         call_as_self=call_as_self,
         call_as_delegated_admin=call_as_delegated_admin,
     )
-    res = bsm.cloudformation_client.create_stack_instances(**resolve_kwargs(**kwargs))
+    res = get_context(bsm).cf_client.create_stack_instances(**resolve_kwargs(**kwargs))
     return res["OperationId"]
 
 
@@ -311,7 +318,7 @@ def update_stack_instances(
         call_as_self=call_as_self,
         call_as_delegated_admin=call_as_delegated_admin,
     )
-    res = bsm.cloudformation_client.update_stack_instances(**resolve_kwargs(**kwargs))
+    res = get_context(bsm).cf_client.update_stack_instances(**resolve_kwargs(**kwargs))
     return res["OperationId"]
 
 
@@ -348,10 +355,55 @@ def delete_stack_instances(
         call_as_self=call_as_self,
         call_as_delegated_admin=call_as_delegated_admin,
     )
-    res = bsm.cloudformation_client.delete_stack_instances(**resolve_kwargs(**kwargs))
+    res = get_context(bsm).cf_client.delete_stack_instances(**resolve_kwargs(**kwargs))
     return res["OperationId"]
 
 
+LIST_STACK_INSTANCES_MAX_PAGE_SIZE = 100
+
+
+def build_stack_instance_filters(
+    detailed_status: T.Optional[
+        T.Union[str, StackInstanceDetailedStatusEnum]
+    ] = NOTHING,
+    last_operation_id: T.Optional[str] = NOTHING,
+    drift_status: T.Optional[T.Union[str, StackInstanceDriftStatusEnum]] = NOTHING,
+) -> T.List[dict]:
+    """
+    Build the server side ``Filters`` argument of :func:`list_stack_instances`.
+
+    Example::
+
+        filters = build_stack_instance_filters(
+            detailed_status=StackInstanceDetailedStatusEnum.FAILED,
+            last_operation_id=operation_id,
+        )
+        for stack_instance in list_stack_instances(
+            bsm=bsm,
+            stack_set_name=stack_set_name,
+            filters=filters,
+        ):
+            ...
+
+    :param detailed_status: only the stack instances in this detailed status
+    :param last_operation_id: only the stack instances touched by this stack
+        set operation last time
+    :param drift_status: only the stack instances in this drift status
+    """
+    filters = list()
+    for name, value in [
+        ("DETAILED_STATUS", detailed_status),
+        ("LAST_OPERATION_ID", last_operation_id),
+        ("DRIFT_STATUS", drift_status),
+    ]:
+        if value is NOTHING or value is None:
+            continue
+        if isinstance(value, enum.Enum):
+            value = value.value
+        filters.append(dict(Name=name, Values=value))
+    return filters
+
+
 def _list_stack_instances(
     bsm: BotoSesManager,
     stack_set_name: str,
@@ -360,19 +412,19 @@ def _list_stack_instances(
     stack_instance_region: T.Optional[str] = NOTHING,
     call_as_self: T.Optional[bool] = NOTHING,
     call_as_delegated_admin: T.Optional[bool] = NOTHING,
-    page_size: int = 20,
-    max_results: int = 1000,
+    page_size: int = LIST_STACK_INSTANCES_MAX_PAGE_SIZE,
+    max_results: T.Optional[int] = NOTHING,
 ) -> T.Iterable[StackInstance]:
-    paginator = bsm.cloudformation_client.get_paginator("list_stack_instances")
+    paginator = get_context(bsm).get_paginator("list_stack_instances")
+    pagination_config = dict(PageSize=page_size)
+    if max_results is not NOTHING and max_results is not None:
+        pagination_config["MaxItems"] = max_results
     kwargs = dict(
         StackSetName=stack_set_name,
         Filters=filters,
         StackInstanceAccount=stack_instance_account,
         StackInstanceRegion=stack_instance_region,
-        PaginationConfig=dict(
-            PageSize=page_size,
-            MaxItems=max_results,
-        ),
+        PaginationConfig=pagination_config,
     )
     resolve_callas_kwargs(
         kwargs,
@@ -400,14 +452,26 @@ def list_stack_instances(
     stack_instance_region: T.Optional[str] = NOTHING,
     call_as_self: T.Optional[bool] = NOTHING,
     call_as_delegated_admin: T.Optional[bool] = NOTHING,
-    page_size: int = 20,
-    max_results: int = 1000,
+    page_size: int = LIST_STACK_INSTANCES_MAX_PAGE_SIZE,
+    max_results: T.Optional[int] = NOTHING,
 ) -> StackInstanceIterProxy:
     """
     Ref:
 
     - list_stack_instances: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_stack_instances.html
 
+    The stack instances are streamed page by page, the next page is only
+    fetched when the previous one is consumed. Stop iterating (``break``,
+    ``.one()``, ``.many(n)``) to stop the pagination, or use
+    ``.iter_chunks(n)`` to process a large stack set with constant memory.
+
+    :param filters: the server side filters, see
+        :func:`build_stack_instance_filters`
+    :param page_size: the number of stack instances per API call, default to
+        the max value the API allows
+    :param max_results: the max number of stack instances to return,
+        default no limit
+
     :return: :class:`StackInstanceIterProxy`
     """
     return StackInstanceIterProxy(
@@ -425,15 +489,60 @@ def list_stack_instances(
     )
 
 
+def _is_stack_instances_stopped(
+    aws_console: AWSConsole,
+    stack_instances: T.List[StackInstance],
+    raise_error_until_exec_stopped: bool,
+    reporter: BaseReporter,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+) -> bool:
+    is_stopped_flag_list: T.List[bool] = list()
+    error: T.Optional[exc.DeployStackInstanceFailedError] = None
+    for stack_instance in stack_instances:
+        if stack_instance.is_logical_failed():
+            console_url = get_stack_set_instances_console_url(
+                aws_console=aws_console,
+                name_or_id_or_arn=stack_instance.stack_set_id,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+            if error is None:
+                error = exc.DeployStackInstanceFailedError(
+                    f"stack instance on {stack_instance.aws_account_id} {stack_instance.aws_region} "
+                    f"is failed. reason: {stack_instance.status_reason}, "
+                    f"and it may have more stack instances also failed, "
+                    f"please check in the console: {console_url}."
+                )
+            if raise_error_until_exec_stopped is True:
+                raise error
+
+        is_stopped_flag_list.append(stack_instance.is_logical_stopped())
+
+    if error is not None:
+        raise error
+
+    if all(is_stopped_flag_list):
+        reporter.on_event(
+            "stack_instances_stopped",
+            f"\n    all stack instances are stopped.",
+            n_stack_instances=len(stack_instances),
+        )
+
+        return True
+    return False
+
+
 def wait_deploy_stack_instances_to_stop(
     bsm: BotoSesManager,
     stack_set_name: str,
     raise_error_until_exec_stopped: bool,
-    delays: T.Union[int, float],
+    delays: T.Union[int, float, DelayStrategy],
     timeout: T.Union[int, float],
     verbose: bool,
     call_as_self: T.Optional[bool] = NOTHING,
     call_as_delegated_admin: T.Optional[bool] = NOTHING,
+    reporter: T.Optional[BaseReporter] = None,
 ) -> T.List[StackInstance]:
     """
     This function can be called after you did a ``create_stack_instances``,
@@ -451,60 +560,277 @@ def wait_deploy_stack_instances_to_stop(
     :param verbose:
     :param call_as_self:
     :param call_as_delegated_admin:
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
     :return:
     """
-    if verbose:  # pragma: no cover
-        print(
-            f"  {Fore.CYAN}wait for deploy stack instances to stop{Style.RESET_ALL} ..."
-        )
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_stack_instances",
+        f"  {Fore.CYAN}wait for deploy stack instances to stop{Style.RESET_ALL} ...",
+        stack_set_name=stack_set_name,
+    )
 
-    aws_console = AWSConsole(aws_region=bsm.aws_region, bsm=bsm)
+    aws_console = get_context(bsm).aws_console
 
-    for _ in Waiter(
+    waiter = Waiter(
         delays=delays,
         timeout=timeout,
         indent=4,
-        verbose=verbose,
-    ):
-        stack_instances = list_stack_instances(
+        reporter=reporter,
+    )
+    for _ in waiter:
+        try:
+            stack_instances = list_stack_instances(
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            ).all()
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+
+        if len(stack_instances) == 0:
+            reporter.on_event(
+                "stack_instances_stopped",
+                f"\n    there's no stack instances.",
+                n_stack_instances=0,
+            )
+            waiter.done()
+            return stack_instances
+
+        if _is_stack_instances_stopped(
+            aws_console=aws_console,
+            stack_instances=stack_instances,
+            raise_error_until_exec_stopped=raise_error_until_exec_stopped,
+            reporter=reporter,
+            call_as_self=call_as_self,
+            call_as_delegated_admin=call_as_delegated_admin,
+        ):
+            waiter.done()
+            return stack_instances
+
+
+def describe_stack_set_operation(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    operation_id: str,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+) -> StackSetOperation:
+    """
+    Ref:
+
+    - describe_stack_set_operation: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/describe_stack_set_operation.html
+    """
+    kwargs = dict(
+        StackSetName=stack_set_name,
+        OperationId=operation_id,
+    )
+    resolve_callas_kwargs(
+        kwargs,
+        call_as_self=call_as_self,
+        call_as_delegated_admin=call_as_delegated_admin,
+    )
+    res = get_context(bsm).cf_client.describe_stack_set_operation(
+        **resolve_kwargs(**kwargs)
+    )
+    return StackSetOperation.from_describe_stack_set_operation_response(
+        res["StackSetOperation"]
+    )
+
+
+def _list_stack_set_operation_results(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    operation_id: str,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+) -> T.Iterable[StackSetOperationResult]:
+    paginator = get_context(bsm).get_paginator("list_stack_set_operation_results")
+    kwargs = dict(
+        StackSetName=stack_set_name,
+        OperationId=operation_id,
+    )
+    resolve_callas_kwargs(
+        kwargs,
+        call_as_self=call_as_self,
+        call_as_delegated_admin=call_as_delegated_admin,
+    )
+    for response in paginator.paginate(**resolve_kwargs(**kwargs)):
+        for data in response.get("Summaries", []):
+            yield StackSetOperationResult.from_list_stack_set_operation_results_response(
+                data
+            )
+
+
+class StackSetOperationResultIterProxy(IterProxy[StackSetOperationResult]):
+    """
+    Reference:
+
+    - https://github.com/MacHu-GWU/iterproxy-project
+    """
+
+
+def list_stack_set_operation_results(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    operation_id: str,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+) -> StackSetOperationResultIterProxy:
+    """
+    Ref:
+
+    - list_stack_set_operation_results: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_stack_set_operation_results.html
+
+    :return: :class:`StackSetOperationResultIterProxy`, one result per
+        account and region touched by the operation.
+    """
+    return StackSetOperationResultIterProxy(
+        _list_stack_set_operation_results(
             bsm=bsm,
             stack_set_name=stack_set_name,
+            operation_id=operation_id,
             call_as_self=call_as_self,
             call_as_delegated_admin=call_as_delegated_admin,
-        ).all()
-
-        if len(stack_instances) == 0:
-            if verbose:  # pragma: no cover
-                print(f"\n    there's no stack instances.")
-                return stack_instances
-
-        is_stopped_flag_list: T.List[bool] = list()
-        error: T.Optional[exc.DeployStackInstanceFailedError] = None
-        for stack_instance in stack_instances:
-            if stack_instance.is_logical_failed():
-                console_url = get_stack_set_instances_console_url(
-                    aws_console=aws_console,
-                    name_or_id_or_arn=stack_instance.stack_set_id,
-                    call_as_self=call_as_self,
-                    call_as_delegated_admin=call_as_delegated_admin,
-                )
-                if error is None:
-                    error = exc.DeployStackInstanceFailedError(
-                        f"stack instance on {stack_instance.aws_account_id} {stack_instance.aws_region} "
-                        f"is failed. reason: {stack_instance.status_reason}, "
-                        f"and it may have more stack instances also failed, "
-                        f"please check in the console: {console_url}."
-                    )
-                if raise_error_until_exec_stopped is True:
-                    raise error
+        )
+    )
 
-            is_stopped_flag_list.append(stack_instance.is_logical_stopped())
 
-        if error is not None:
-            raise error
+def _handle_stack_set_operation_stopped(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    operation: StackSetOperation,
+    reporter: BaseReporter,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+) -> T.List[StackInstance]:
+    reporter.on_event(
+        "stack_set_operation_stopped",
+        f"\n    operation reached status "
+        f"{Fore.CYAN}{operation.status.value}{Style.RESET_ALL}",
+        operation_id=operation.operation_id,
+        status=operation.status.value,
+    )
+    if operation.is_succeeded() is False:
+        failed_results = [
+            result
+            for result in list_stack_set_operation_results(
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                operation_id=operation.operation_id,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+            if result.is_failed()
+        ]
+        console_url = get_stack_set_instances_console_url(
+            aws_console=get_context(bsm).aws_console,
+            name_or_id_or_arn=operation.stack_set_id,
+            call_as_self=call_as_self,
+            call_as_delegated_admin=call_as_delegated_admin,
+        )
+        reasons = "; ".join(
+            f"{result.aws_account_id} {result.aws_region}: {result.status_reason}"
+            for result in failed_results
+        )
+        raise exc.DeployStackInstanceFailedError(
+            f"stack set operation {operation.operation_id} is "
+            f"{operation.status.value}, {len(failed_results)} stack instances "
+            f"failed. reason: {reasons or operation.status_reason}, "
+            f"please check in the console: {console_url}."
+        )
+    # only the instances touched by this operation
+    return list_stack_instances(
+        bsm=bsm,
+        stack_set_name=stack_set_name,
+        filters=build_stack_instance_filters(
+            last_operation_id=operation.operation_id
+        ),
+        call_as_self=call_as_self,
+        call_as_delegated_admin=call_as_delegated_admin,
+    ).all()
 
-        if all(is_stopped_flag_list):
-            if verbose:  # pragma: no cover
-                print(f"\n    all stack instances are stopped.")
 
+def wait_stack_set_operation_to_stop(
+    bsm: BotoSesManager,
+    stack_set_name: str,
+    operation_id: str,
+    delays: T.Union[int, float, DelayStrategy],
+    timeout: T.Union[int, float],
+    verbose: bool,
+    call_as_self: T.Optional[bool] = NOTHING,
+    call_as_delegated_admin: T.Optional[bool] = NOTHING,
+    reporter: T.Optional[BaseReporter] = None,
+) -> T.List[StackInstance]:
+    """
+    Wait a stack set operation to stop, it is the operation id returned by
+    ``create_stack_instances``, ``update_stack_instances``,
+    ``delete_stack_instances`` or ``update_stack_set``.
+
+    Unlike :func:`wait_deploy_stack_instances_to_stop`, each poll is one
+    ``describe_stack_set_operation`` call, no matter how many stack instances
+    the stack set has. The failed accounts / regions are fetched by
+    ``list_stack_set_operation_results`` and the stack instances touched by
+    the operation are listed only once, after the operation stopped.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param stack_set_name: the stack set name
+    :param operation_id: the stack set operation id
+    :param delays: how long it waits (in seconds) between two polls, or a
+        :class:`~aws_cloudformation.waiter.DelayStrategy` object
+    :param timeout: how long it will raise timeout error
+    :param verbose: whether you want to log information to console
+    :param call_as_self: see :func:`describe_stack_set`
+    :param call_as_delegated_admin: see :func:`describe_stack_set`
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
+
+    :return: the stack instances touched by the operation
+
+    :raises: :class:`~aws_cloudformation.exc.DeployStackInstanceFailedError`
+        if the operation is failed or stopped.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    reporter.on_event(
+        "wait_stack_set_operation",
+        f"  {Fore.CYAN}wait for stack set operation {operation_id} to stop"
+        f"{Style.RESET_ALL} ...",
+        stack_set_name=stack_set_name,
+        operation_id=operation_id,
+    )
+    waiter = Waiter(
+        delays=delays,
+        timeout=timeout,
+        indent=4,
+        reporter=reporter,
+    )
+    for _ in waiter:
+        try:
+            operation = describe_stack_set_operation(
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                operation_id=operation_id,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                waiter.notify_throttled()
+                continue
+            raise
+        if operation.is_stopped():
+            stack_instances = _handle_stack_set_operation_stopped(
+                bsm=bsm,
+                stack_set_name=stack_set_name,
+                operation=operation,
+                reporter=reporter,
+                call_as_self=call_as_self,
+                call_as_delegated_admin=call_as_delegated_admin,
+            )
+            waiter.done()
             return stack_instances
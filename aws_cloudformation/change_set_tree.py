@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Load a change set and all its nested change sets into an in-memory tree.
+Loading and rendering are separated, the tree can be rendered by
+:func:`~aws_cloudformation.change_set_visualizer.visualize_change_set_tree`,
+or consumed programmatically.
+
+Usage example::
+
+    tree = load_change_set_tree(bsm, change_set)
+    for depth, node in tree.walk():
+        for resource_change in node.resource_changes:
+            ...
+"""
+
+import typing as T
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+from .stack import ChangeSet
+from .resource_change import ResourceChange
+from .better_boto import describe_change_set, load_all_changes
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclasses.dataclass
+class ChangeSetTree:
+    """
+    A change set and the change sets of its nested stacks.
+
+    :param change_set: the :class:`~aws_cloudformation.stack.ChangeSet`,
+        with all the changes loaded
+    :param resource_changes: the parsed resource changes, in the api order
+    :param children: the trees of the nested stacks change sets, in the
+        order of the resource changes
+    """
+
+    change_set: ChangeSet = dataclasses.field()
+    resource_changes: T.List[ResourceChange] = dataclasses.field(default_factory=list)
+    children: T.List["ChangeSetTree"] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def from_change_set(cls, change_set: ChangeSet) -> "ChangeSetTree":
+        return cls(
+            change_set=change_set,
+            resource_changes=list(change_set.resource_changes),
+        )
+
+    @property
+    def nested_change_set_ids(self) -> T.List[str]:
+        """
+        The change set ids of the nested stacks.
+        """
+        return [
+            resource_change.change_set_id
+            for resource_change in self.resource_changes
+            if resource_change.change_set_id is not None
+        ]
+
+    def walk(self, _depth: int = 0) -> T.Iterable[T.Tuple[int, "ChangeSetTree"]]:
+        """
+        Iterate all the nodes depth first, the parent before its children.
+
+        :return: yield ``(depth, node)``, the depth of the root is 0
+        """
+        yield _depth, self
+        for child in self.children:
+            yield from child.walk(_depth + 1)
+
+
+def load_change_set_tree(
+    bsm: "BotoSesManager",
+    change_set: ChangeSet,
+    include_nested_stack: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> ChangeSetTree:
+    """
+    Load the change set and, level by level, all its nested change sets.
+    The change sets in the same level are fetched concurrently in a bounded
+    thread pool.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param change_set: the root change set, usually returned by
+        :func:`~aws_cloudformation.better_boto.stacks.wait_create_change_set_to_finish`
+    :param include_nested_stack: if False, only the root is loaded
+    :param max_workers: the max number of concurrent ``describe_change_set``
+    """
+    root = ChangeSetTree.from_change_set(load_all_changes(bsm, change_set))
+    if include_nested_stack is False:
+        return root
+
+    def fetch(change_set_id: str) -> T.Optional[ChangeSet]:
+        return load_all_changes(
+            bsm=bsm,
+            change_set=describe_change_set(bsm=bsm, change_set_name=change_set_id),
+        )
+
+    level = [root]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            jobs = [
+                (node, change_set_id)
+                for node in level
+                for change_set_id in node.nested_change_set_ids
+            ]
+            # map keeps the order, children are in the order of the changes
+            results = executor.map(fetch, [change_set_id for _, change_set_id in jobs])
+            next_level = list()
+            for (parent, _), nested_change_set in zip(jobs, results):
+                if nested_change_set is None:  # pragma: no cover
+                    continue
+                child = ChangeSetTree.from_change_set(nested_change_set)
+                parent.children.append(child)
+                next_level.append(child)
+            level = next_level
+    return root
@@ -1,127 +1,27 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
-import enum
-import dataclasses
 from collections import Counter
 
 from colorama import Fore, Style
 
-from .better_boto import describe_change_set_with_paginator
 from .stack import ChangeSet
+from .change_set_tree import ChangeSetTree, load_change_set_tree
+from .resource_change import (
+    TargetAttributeEnum,
+    Target,
+    Detail,
+    sort_details,
+    ChangeActionEnum,
+    ResourceChange,
+    sort_changes,
+)
 
 
 if T.TYPE_CHECKING:
     from boto_session_manager import BotoSesManager
 
 
-class TargetAttributeEnum(enum.Enum):
-    PROPERTIES = "Properties"
-    METADATA = "Metadata"
-    CREATION_POLICY = "CreationPolicy"
-    UPDATE_POLICY = "UpdatePolicy"
-    DELETION_POLICY = "DeletionPolicy"
-    TAGS = "Tags"
-
-
-target_attribute_sort_key_mapper = {
-    TargetAttributeEnum.PROPERTIES.value: 1,
-    TargetAttributeEnum.METADATA.value: 2,
-    TargetAttributeEnum.CREATION_POLICY.value: 3,
-    TargetAttributeEnum.UPDATE_POLICY.value: 4,
-    TargetAttributeEnum.DELETION_POLICY.value: 5,
-    TargetAttributeEnum.TAGS.value: 6,
-}
-
-
-@dataclasses.dataclass
-class Target:
-    attribute: str = dataclasses.field(default=None)
-    name: str = dataclasses.field(default=None)
-    requires_recreation: str = dataclasses.field(default=None)
-
-    @classmethod
-    def from_dict(cls, dct: dict) -> "Target":
-        return cls(
-            attribute=dct.get("Attribute"),
-            name=dct.get("Name"),
-            requires_recreation=dct.get("RequiresRecreation"),
-        )
-
-
-@dataclasses.dataclass
-class Detail:
-    target: Target = dataclasses.field()
-    evaluation: str = dataclasses.field(default=None)
-    change_source: str = dataclasses.field(default=None)
-    causing_entity: str = dataclasses.field(default=None)
-
-    @classmethod
-    def from_dict(cls, dct: dict) -> "Detail":
-        return cls(
-            target=Target.from_dict(dct["Target"]),
-            evaluation=dct.get("Evaluation"),
-            change_source=dct.get("ChangeSource"),
-            causing_entity=dct.get("CausingEntity"),
-        )
-
-
-def sort_details(details: T.Iterable[Detail]) -> T.Iterable[Detail]:
-    return sorted(
-        details,
-        key=lambda detail: target_attribute_sort_key_mapper[detail.target.attribute],
-    )
-
-
-class ChangeActionEnum(enum.Enum):
-    ADD = "Add"
-    MODIFY = "Modify"
-    REMOVE = "Remove"
-    IMPORT = "Import"
-    DYNAMIC = "Dynamic"
-
-
-@dataclasses.dataclass
-class ResourceChange:
-    action: str = dataclasses.field()
-    resource_type: str = dataclasses.field()
-    logical_resource_id: str = dataclasses.field()
-    physical_resource_id: T.Optional[str] = dataclasses.field(default=None)
-    replacement: T.Optional[str] = dataclasses.field(default=None)
-    change_set_id: T.Optional[str] = dataclasses.field(default=None)
-    details: T.List[Detail] = dataclasses.field(default_factory=list)
-
-    @classmethod
-    def from_dict(cls, dct: dict) -> "ResourceChange":
-        return cls(
-            action=dct["Action"],
-            resource_type=dct["ResourceType"],
-            logical_resource_id=dct["LogicalResourceId"],
-            physical_resource_id=dct.get("PhysicalResourceId"),
-            replacement=dct.get("Replacement"),
-            change_set_id=dct.get("ChangeSetId"),
-            details=list(
-                sort_details([Detail.from_dict(d) for d in dct.get("Details", [])])
-            ),
-        )
-
-
-action_sort_key_mapper = {
-    ChangeActionEnum.ADD.value: 1,
-    ChangeActionEnum.MODIFY.value: 2,
-    ChangeActionEnum.REMOVE.value: 3,
-    ChangeActionEnum.IMPORT.value: 4,
-    ChangeActionEnum.DYNAMIC.value: 5,
-}
-
-
-def sort_changes(changes: T.Iterable[ResourceChange]) -> T.Iterable[ResourceChange]:
-    return sorted(
-        changes,
-        key=lambda rc: action_sort_key_mapper[rc.action],
-    )
-
-
 # @dataclasses.dataclass
 # class ChangeSet:
 #     change_set_id: str = dataclasses.field()
@@ -165,27 +65,25 @@ icon_mapper = {
 }
 
 
-def print_header(msg: str, char: str, length: int, corner_char=""):
+def format_header(msg: str, char: str, length: int, corner_char="") -> str:
     msg = f" {msg} "
     template = "{corner_char}{{msg:{char}^{length}}}".format(
         char=char,
         length=length,
         corner_char=corner_char,
     )
-    print(template.format(msg=msg))
+    return template.format(msg=msg)
 
 
-def visualize_change_set(
+def print_header(msg: str, char: str, length: int, corner_char=""):
+    print(format_header(msg, char, length, corner_char))
+
+
+def _render_change_set(
     change_set: ChangeSet,
-    bsm: T.Optional["BotoSesManager"] = None,
-    include_nested_stack: bool = False,
+    resource_changes: T.List[ResourceChange],
     _verbose: bool = True,
 ):
-    """
-    Ref:
-
-    - https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation.html#CloudFormation.Client.describe_change_set
-    """
     print_header(
         f"    >>> Change for stack {Fore.CYAN}{change_set.stack_name}{Style.RESET_ALL} <<<",
         " ",
@@ -194,14 +92,7 @@ def visualize_change_set(
     print(f"stack id = {Fore.CYAN}{change_set.stack_id}{Style.RESET_ALL}")
     print(f"change set id = {Fore.CYAN}{change_set.change_set_id}{Style.RESET_ALL}")
 
-    resource_change_list = list(
-        sort_changes(
-            [
-                ResourceChange.from_dict(d["ResourceChange"])
-                for d in change_set.changes
-            ]
-        )
-    )
+    resource_change_list = list(sort_changes(resource_changes))
     action_counter = Counter(
         [resource_change.action for resource_change in resource_change_list]
     )
@@ -257,16 +148,47 @@ def visualize_change_set(
         print("|")
         print("+" + "-" * 80)
 
-    # --- Nested stack
-    if include_nested_stack:
-        for resource_change in resource_change_list:
-            if resource_change.change_set_id is not None:
-                change_set = describe_change_set_with_paginator(
-                    bsm=bsm,
-                    change_set_name=resource_change.change_set_id,
-                )
-                visualize_change_set(
-                    change_set=change_set,
-                    bsm=bsm,
-                    include_nested_stack=include_nested_stack,
-                )
+
+def visualize_change_set_tree(
+    tree: ChangeSetTree,
+    _verbose: bool = True,
+):
+    """
+    Render the change set and its nested change sets, the parent before its
+    children.
+
+    :param tree: the :class:`~aws_cloudformation.change_set_tree.ChangeSetTree`
+        returned by :func:`~aws_cloudformation.change_set_tree.load_change_set_tree`
+    """
+    for _, node in tree.walk():
+        _render_change_set(
+            change_set=node.change_set,
+            resource_changes=node.resource_changes,
+            _verbose=_verbose,
+        )
+
+
+def visualize_change_set(
+    change_set: ChangeSet,
+    bsm: T.Optional["BotoSesManager"] = None,
+    include_nested_stack: bool = False,
+    _verbose: bool = True,
+):
+    """
+    Load the change set tree (see
+    :func:`~aws_cloudformation.change_set_tree.load_change_set_tree`) and
+    render it.
+
+    Ref:
+
+    - https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation.html#CloudFormation.Client.describe_change_set
+    """
+    if bsm is None:
+        tree = ChangeSetTree.from_change_set(change_set)
+    else:
+        tree = load_change_set_tree(
+            bsm=bsm,
+            change_set=change_set,
+            include_nested_stack=include_nested_stack,
+        )
+    visualize_change_set_tree(tree, _verbose=_verbose)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import dataclasses
 
 if (
     sys.version_info.major == 2
@@ -12,3 +13,29 @@ if sys.version_info.minor < 8:
     from cached_property import cached_property
 else:
     from functools import cached_property
+
+
+def add_slots(cls):
+    """
+    Class decorator, turn a dataclass into a ``__slots__`` class, so the
+    instances don't have the per instance ``__dict__``, they use less
+    memory. It is the backport of ``@dataclasses.dataclass(slots=True)``
+    in Python3.10+. Usage::
+
+        @add_slots
+        @dataclasses.dataclass
+        class Stack:
+            ...
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    # the default values are class attributes, they conflict with the slots,
+    # the generated __init__ already knows the defaults
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+"""
+The per boto session context, it caches the boto3 clients, the paginators
+and the :class:`~aws_console_url.api.AWSConsole` object, so the polling
+loops don't rebuild them on every tick.
+
+Usage example::
+
+    from aws_cloudformation.context import get_context
+
+    ctx = get_context(bsm)
+    ctx.cf_client.describe_stacks(...)
+    ctx.get_paginator("describe_stacks").paginate(...)
+    ctx.upload_index.is_uploaded("s3://bucket/key")
+
+All the functions in this library use :func:`get_context` internally, you
+only need it if you want to tune the connection pool size, for example,
+deploy hundreds of stacks concurrently with one ``bsm``::
+
+    get_context(bsm, max_pool_connections=100)
+
+The CloudFormation client calls go through the process-wide
+:mod:`aws_cloudformation.rate_limiter`. The calls made inside
+:func:`botocore_retry_disabled` (the mutating calls wrapped by
+:func:`~aws_cloudformation.retry.call_with_retry`) use a second
+CloudFormation client without botocore retries
+(:data:`NO_RETRY_CF_CLIENT_RETRIES`), so the attempts are not multiplied.
+All the other calls keep the botocore retries.
+"""
+
+import typing as T
+import json
+import time
+import weakref
+import functools
+import threading
+import contextlib
+from pathlib import Path
+
+from botocore.config import Config
+from boto_session_manager import BotoSesManager, AwsServiceEnum
+from aws_console_url.api import AWSConsole
+
+from .rate_limiter import install_rate_limiter
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from botocore.client import BaseClient
+    from botocore.paginate import Paginator
+
+
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+"""
+botocore defaults to 10 connections per client, which is too small when many
+threads poll with the same client.
+"""
+
+
+NO_RETRY_CF_CLIENT_RETRIES = {"total_max_attempts": 1}
+"""
+The botocore retry config of the CloudFormation client used inside
+:func:`botocore_retry_disabled`, one attempt only.
+"""
+
+_thread_local = threading.local()
+
+
+@contextlib.contextmanager
+def botocore_retry_disabled():
+    """
+    In this block, :attr:`Context.cf_client` of the current thread is the
+    client without botocore retries, the caller retries by itself.
+    """
+    previous = getattr(_thread_local, "no_retry", False)
+    _thread_local.no_retry = True
+    try:
+        yield
+    finally:
+        _thread_local.no_retry = previous
+
+
+def is_botocore_retry_disabled() -> bool:
+    return getattr(_thread_local, "no_retry", False)
+
+
+DEFAULT_UPLOAD_INDEX_PATH = Path.home().joinpath(
+    ".aws_cloudformation",
+    "uploaded-s3-objects.json",
+)
+
+DEFAULT_UPLOAD_INDEX_TTL = 24 * 3600
+
+
+class UploadIndex:
+    """
+    The index of the S3 objects that are already uploaded, so the
+    content-addressed templates and stack policies are not uploaded again.
+
+    By default, it is stored in :data:`DEFAULT_UPLOAD_INDEX_PATH`, so the
+    uploads are remembered across runs and processes. An entry older than
+    ``ttl`` seconds is not trusted, because the object may have been deleted
+    (for example, by a lifecycle rule), the caller checks S3 again. To keep
+    it in memory only::
+
+        get_context(bsm).upload_index = UploadIndex(path=None)
+
+    :param path: the json file to store the index, None means in memory only
+    :param ttl: how long (in seconds) an entry is trusted
+    """
+
+    def __init__(
+        self,
+        path: T.Optional[T.Union[str, Path]] = DEFAULT_UPLOAD_INDEX_PATH,
+        ttl: int = DEFAULT_UPLOAD_INDEX_TTL,
+    ):
+        self.path = None if path is None else Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: T.Optional[T.Dict[str, float]] = None
+
+    def _read(self) -> T.Dict[str, float]:
+        if self.path is None:
+            return dict()
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return dict()
+
+    def _get_data(self) -> T.Dict[str, float]:
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def is_uploaded(self, s3_uri: str) -> bool:
+        with self._lock:
+            uploaded_at = self._get_data().get(s3_uri)
+        if uploaded_at is None:
+            return False
+        return (time.time() - uploaded_at) <= self.ttl
+
+    def mark_uploaded(self, s3_uri: str):
+        now = time.time()
+        with self._lock:
+            if self.path is None:
+                self._get_data()[s3_uri] = now
+                return
+            # re-read the file, other processes may have updated it, and
+            # drop the expired entries, don't let the file grow forever
+            data = {k: v for k, v in self._read().items() if (now - v) <= self.ttl}
+            data[s3_uri] = now
+            self._data = data
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=4))
+
+
+class Context:
+    """
+    The cached clients, paginators and ``AWSConsole`` of one boto session.
+    It is thread safe, boto3 clients and paginators can be shared by threads,
+    and they are only created once.
+
+    Don't create it directly, use :func:`get_context`.
+
+    :param bsm: the boto session manager
+    :param max_pool_connections: the botocore connection pool size of the
+        clients created by this context
+    """
+
+    def __init__(
+        self,
+        bsm: BotoSesManager,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+    ):
+        # the cache is keyed by bsm, don't keep it alive
+        self._bsm_ref = weakref.ref(bsm)
+        self.aws_region: str = bsm.aws_region
+        self.max_pool_connections = max_pool_connections
+        self._lock = threading.RLock()
+        self._clients: T.Dict[T.Tuple[str, bool], "BaseClient"] = dict()
+        self._paginators: T.Dict[T.Tuple[str, str], "Paginator"] = dict()
+        self._aws_console: T.Optional[AWSConsole] = None
+        self.upload_index: UploadIndex = UploadIndex()
+
+    @property
+    def bsm(self) -> BotoSesManager:
+        return self._bsm_ref()
+
+    def _get_client_kwargs(self, retry: bool = True) -> dict:
+        kwargs = dict(self.bsm.default_client_kwargs)
+        config = Config(max_pool_connections=self.max_pool_connections)
+        if retry is False:
+            config = config.merge(Config(retries=dict(NO_RETRY_CF_CLIENT_RETRIES)))
+        if kwargs.get("config") is not None:
+            config = kwargs["config"].merge(config)
+        kwargs["config"] = config
+        return kwargs
+
+    def get_client(
+        self,
+        service_name: str,
+        retry: bool = True,
+    ) -> "BaseClient":
+        """
+        Get the cached boto3 client of the given service.
+
+        :param retry: if False, get the client without botocore retries
+        """
+        key = (service_name, retry)
+        try:
+            return self._clients[key]
+        except KeyError:
+            pass
+        # boto3 session is not thread safe, create clients one at a time
+        with self._lock:
+            if key not in self._clients:
+                client = self.bsm.boto_ses.client(
+                    service_name,
+                    **self._get_client_kwargs(retry=retry),
+                )
+                if service_name == AwsServiceEnum.CloudFormation:
+                    install_rate_limiter(
+                        client,
+                        get_aws_account_id=self._get_aws_account_id,
+                        aws_region=self.aws_region,
+                    )
+                self._clients[key] = client
+            return self._clients[key]
+
+    def set_max_pool_connections(self, max_pool_connections: int):
+        """
+        Change the connection pool size of the clients created from now on.
+
+        If the CloudFormation clients are already created, only they (and
+        their paginators) are created again with the new size on next use,
+        because they are the ones shared by the polling threads. The other
+        clients and states (for example, :attr:`upload_index`) are kept, and
+        the threads still holding the old clients can keep using them.
+        """
+        cf = AwsServiceEnum.CloudFormation
+        with self._lock:
+            if self.max_pool_connections == max_pool_connections:
+                return
+            self.max_pool_connections = max_pool_connections
+            # don't mutate the dict, it is read without the lock
+            self._clients = {
+                key: client for key, client in self._clients.items() if key[0] != cf
+            }
+            self._paginators = {
+                key: paginator
+                for key, paginator in self._paginators.items()
+                if key[0] != cf
+            }
+
+    def _get_aws_account_id(self) -> str:
+        return self.bsm.aws_account_id
+
+    @property
+    def cf_client(self):
+        """
+        The CloudFormation client, without botocore retries inside
+        :func:`botocore_retry_disabled`.
+        """
+        return self.get_client(
+            AwsServiceEnum.CloudFormation,
+            retry=not is_botocore_retry_disabled(),
+        )
+
+    @property
+    def s3_client(self):
+        return self.get_client(AwsServiceEnum.S3)
+
+    def get_paginator(
+        self,
+        operation_name: str,
+        service_name: str = AwsServiceEnum.CloudFormation,
+    ) -> "Paginator":
+        """
+        Get the cached paginator of the given operation, by default it is
+        a CloudFormation operation.
+        """
+        key = (service_name, operation_name)
+        try:
+            return self._paginators[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._paginators:
+                client = self.get_client(service_name)
+                self._paginators[key] = client.get_paginator(operation_name)
+            return self._paginators[key]
+
+    @property
+    def aws_console(self) -> AWSConsole:
+        """
+        The ``AWSConsole`` object to build console urls.
+        """
+        if self._aws_console is None:
+            with self._lock:
+                if self._aws_console is None:
+                    self._aws_console = AWSConsole(
+                        aws_region=self.aws_region,
+                        bsm=self.bsm,
+                    )
+        return self._aws_console
+
+
+_context_cache: "weakref.WeakKeyDictionary[BotoSesManager, Context]" = (
+    weakref.WeakKeyDictionary()
+)
+_context_cache_lock = threading.Lock()
+
+
+def get_context(
+    bsm: BotoSesManager,
+    max_pool_connections: T.Optional[int] = None,
+) -> Context:
+    """
+    Get the :class:`Context` of the ``bsm``, create it if not exists.
+
+    :param bsm: the boto session manager
+    :param max_pool_connections: if given, and it is different from the
+        existing context, the CloudFormation clients of the context are
+        re-created with this pool size, see
+        :meth:`Context.set_max_pool_connections`.
+    """
+    ctx = _context_cache.get(bsm)
+    if ctx is None:
+        with _context_cache_lock:
+            ctx = _context_cache.get(bsm)
+            if ctx is None:
+                ctx = Context(
+                    bsm=bsm,
+                    max_pool_connections=(
+                        DEFAULT_MAX_POOL_CONNECTIONS
+                        if max_pool_connections is None
+                        else max_pool_connections
+                    ),
+                )
+                _context_cache[bsm] = ctx
+    if max_pool_connections is not None:
+        ctx.set_max_pool_connections(max_pool_connections)
+    return ctx
+
+
+@functools.lru_cache(maxsize=None)
+def get_region_console(aws_region: str) -> AWSConsole:
+    """
+    The cached ``AWSConsole`` of the region, for the objects that only know
+    the region, for example, :attr:`aws_cloudformation.stack.Stack.console_url`.
+    """
+    return AWSConsole(aws_region=aws_region)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""
+Find the dependencies between stacks from the ``Outputs.Export`` and
+``Fn::ImportValue`` in the templates, and order them.
+"""
+
+import typing as T
+import json
+import dataclasses
+
+import yaml
+
+from . import exc
+from .deploy_helpers import detect_template_type
+
+
+class _CfnYamlLoader(yaml.SafeLoader):
+    """
+    A YAML loader that knows the CloudFormation short form intrinsic
+    functions, ``!ImportValue x`` is loaded as ``{"Fn::ImportValue": "x"}``.
+    """
+
+
+def _construct_cfn_tag(loader: yaml.SafeLoader, tag_suffix: str, node: yaml.Node):
+    if tag_suffix in ("Ref", "Condition"):
+        key = tag_suffix
+    else:
+        key = f"Fn::{tag_suffix}"
+    if isinstance(node, yaml.ScalarNode):
+        value = loader.construct_scalar(node)
+        if key == "Fn::GetAtt":
+            value = value.split(".", 1)
+    elif isinstance(node, yaml.SequenceNode):
+        value = loader.construct_sequence(node, deep=True)
+    else:
+        value = loader.construct_mapping(node, deep=True)
+    return {key: value}
+
+
+_CfnYamlLoader.add_multi_constructor("!", _construct_cfn_tag)
+
+
+def load_template(template: str) -> dict:
+    """
+    Load the CloudFormation template JSON or Yaml body into a dict, the
+    short form intrinsic functions in Yaml are converted to the full form.
+    """
+    if detect_template_type(template) == "json":
+        return json.loads(template)
+    else:
+        return yaml.load(template, Loader=_CfnYamlLoader)
+
+
+def _find_import_values(data: T.Any, names: T.Set[str], strict: bool):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "Fn::ImportValue":
+                if isinstance(value, str):
+                    names.add(value)
+                elif strict:
+                    raise exc.UnresolvableExportNameError(
+                        f"can't resolve the export name of "
+                        f"'Fn::ImportValue': {value!r}"
+                    )
+            else:
+                _find_import_values(value, names, strict)
+    elif isinstance(data, list):
+        for value in data:
+            _find_import_values(value, names, strict)
+
+
+def find_import_values(template: str, strict: bool = True) -> T.Set[str]:
+    """
+    Find all the export names a template imports with ``Fn::ImportValue``.
+    An export name built by ``Fn::Sub`` or ``Fn::Join`` can't be resolved
+    without deployment.
+
+    :param template: CloudFormation template JSON or Yaml body in text
+    :param strict: if True, raise on an export name that can't be resolved,
+        otherwise only the literal export names are returned.
+
+    :raises: :class:`~aws_cloudformation.exc.UnresolvableExportNameError`
+    """
+    names = set()
+    _find_import_values(load_template(template), names, strict)
+    return names
+
+
+def find_export_names(template: str, strict: bool = True) -> T.Set[str]:
+    """
+    Find all the ``Outputs.${key}.Export.Name`` in a template.
+
+    :param template: CloudFormation template JSON or Yaml body in text
+    :param strict: if True, raise on an export name that can't be resolved,
+        otherwise only the literal export names are returned.
+
+    :raises: :class:`~aws_cloudformation.exc.UnresolvableExportNameError`
+    """
+    names = set()
+    outputs = (load_template(template) or {}).get("Outputs") or {}
+    for output in outputs.values():
+        if not isinstance(output, dict) or "Export" not in output:
+            continue
+        name = output["Export"].get("Name")
+        if isinstance(name, str):
+            names.add(name)
+        elif strict:
+            raise exc.UnresolvableExportNameError(
+                f"can't resolve the export name of 'Outputs.Export.Name': {name!r}"
+            )
+    return names
+
+
+@dataclasses.dataclass
+class StackDag:
+    """
+    A directed acyclic graph of stacks. The node is the index of the stack
+    in the input list.
+
+    :param upstream: node -> the nodes it depends on.
+    """
+
+    upstream: T.Dict[int, T.Set[int]] = dataclasses.field(default_factory=dict)
+
+    @property
+    def downstream(self) -> T.Dict[int, T.Set[int]]:
+        downstream = {node: set() for node in self.upstream}
+        for node, upstream_nodes in self.upstream.items():
+            for upstream_node in upstream_nodes:
+                downstream[upstream_node].add(node)
+        return downstream
+
+    def topological_levels(self) -> T.List[T.List[int]]:
+        """
+        Group the nodes by level, all the upstream of a node are in the
+        previous levels.
+
+        :raises: :class:`~aws_cloudformation.exc.StackDependencyCycleError`
+        """
+        levels = list()
+        done = set()
+        remaining = set(self.upstream)
+        while remaining:
+            level = sorted(
+                node for node in remaining if self.upstream[node].issubset(done)
+            )
+            if len(level) == 0:
+                raise exc.StackDependencyCycleError(
+                    f"found dependency cycle among stacks: {sorted(remaining)}"
+                )
+            levels.append(level)
+            done.update(level)
+            remaining.difference_update(level)
+        return levels
+
+
+def build_stack_dag(
+    region_keys: T.List[T.Tuple[str, str]],
+    stack_names: T.List[str],
+    imports: T.List[T.Optional[T.Set[str]]],
+    exports: T.List[T.Optional[T.Set[str]]],
+    depends_on: T.Optional[T.List[T.Iterable[str]]] = None,
+) -> StackDag:
+    """
+    Build the :class:`StackDag`. Export names are unique per AWS account and
+    region, so are the stack names. An imported export that is not
+    produced by any of the stacks is considered already there.
+
+    A stack whose imports or exports are unknown (None) falls back to the
+    serial order: it depends on all the stacks before it in the same account
+    and region, and all the stacks after it depend on it.
+
+    :param region_keys: the (aws_account_id, aws_region) of each stack
+    :param stack_names: the name of each stack
+    :param imports: the export names each stack imports, None if unknown
+    :param exports: the export names each stack exports, None if unknown
+    :param depends_on: the stack names each stack explicitly depends on,
+        in the same account and region
+
+    :raises: :class:`~aws_cloudformation.exc.StackDependencyCycleError`
+    """
+    producers: T.Dict[T.Tuple[str, str, str], int] = dict()
+    for node, (region_key, export_names) in enumerate(zip(region_keys, exports)):
+        for export_name in export_names or ():
+            producers[(*region_key, export_name)] = node
+    nodes_by_name = {
+        (*region_key, stack_name): node
+        for node, (region_key, stack_name) in enumerate(
+            zip(region_keys, stack_names)
+        )
+    }
+
+    dag = StackDag(upstream={node: set() for node in range(len(stack_names))})
+    for node, (region_key, import_names) in enumerate(zip(region_keys, imports)):
+        for import_name in import_names or ():
+            producer = producers.get((*region_key, import_name))
+            if producer is not None and producer != node:
+                dag.upstream[node].add(producer)
+        if depends_on is not None:
+            for stack_name in depends_on[node]:
+                try:
+                    dag.upstream[node].add(nodes_by_name[(*region_key, stack_name)])
+                except KeyError:
+                    raise ValueError(
+                        f"stack {stack_names[node]!r} depends on "
+                        f"{stack_name!r}, but it is not in the stack list!"
+                    )
+    for node, region_key in enumerate(region_keys):
+        if imports[node] is None or exports[node] is None:
+            for other, other_region_key in enumerate(region_keys):
+                if other_region_key != region_key:
+                    continue
+                if other < node:
+                    dag.upstream[node].add(other)
+                elif other > node:
+                    dag.upstream[other].add(node)
+    # fail early
+    dag.topological_levels()
+    return dag
@@ -9,7 +9,6 @@ import dataclasses
 from datetime import datetime
 
 from boto_session_manager import BotoSesManager
-from aws_console_url.api import AWSConsole
 from colorama import Fore, Style
 from func_args import NOTHING, resolve_kwargs
 
@@ -22,15 +21,28 @@ from .stack import (
     StackStatusEnum,
     Stack,
     ChangeSet,
+    ChangeSetExecutionStatusEnum,
 )
+from .waiter import DelayStrategy
+from .reporter import BaseReporter, resolve_reporter
+from .context import get_context
 from .change_set_visualizer import (
-    print_header,
-    visualize_change_set,
+    format_header,
 )
+from .change_set_tree import load_change_set_tree
+from .plan import Plan, PlanArtifact
+from .dependency import find_export_names, find_import_values
+from .exports import invalidate_stack_exports
+from .retry import RetryPolicy, call_with_retry
 from .better_boto.stacksets_helpers import get_filter_stack_set_console_url
 from .deploy_helpers import (
     DEFAULT_S3_PREFIX_FOR_TEMPLATE,
     DEFAULT_S3_PREFIX_FOR_STACK_POLICY,
+    FINGERPRINT_TAG_KEY,
+    get_deploy_fingerprint,
+    get_template_hash,
+    get_parameters_hash,
+    is_fingerprint_matched,
     resolve_template_kwargs,
     resolve_stack_policy_kwargs,
 )
@@ -53,10 +65,22 @@ def prompt_to_proceed() -> bool:  # pragma: no cover
 
 @dataclasses.dataclass
 class DeployStackResponse:
+    """
+    The result of :func:`deploy_stack`.
+
+    :param is_deploy_happened: whether the stack is created / updated
+    :param is_create: True if created, False if updated, None if no deployment
+    :param stack_id: the stack id
+    :param change_set_id: the change set id, if using change set
+    :param plan: the :class:`~aws_cloudformation.plan.Plan` of the change
+        set, None if ``skip_plan=True`` or there's no change.
+    """
+
     is_deploy_happened: bool = dataclasses.field(default=False)
     is_create: T.Optional[bool] = dataclasses.field(default=None)
     stack_id: T.Optional[str] = dataclasses.field(default=None)
     change_set_id: T.Optional[str] = dataclasses.field(default=None)
+    plan: T.Optional[Plan] = dataclasses.field(default=None)
 
 
 def _deploy_stack_without_change_set(
@@ -84,16 +108,27 @@ def _deploy_stack_without_change_set(
     on_failure_rollback: T.Optional[bool] = NOTHING,
     on_failure_delete: T.Optional[bool] = NOTHING,
     wait: bool = True,
-    delays: T.Union[int, float] = DEFAULT_UPDATE_DELAYS,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
     timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
     wait_until_exec_stopped_on_failure: bool = False,
     skip_prompt: bool = False,
-    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    fingerprint: T.Optional[str] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
 ) -> DeployStackResponse:
     stack = better_boto.describe_live_stack(
         bsm=bsm,
         name=stack_name,
     )
+    if is_fingerprint_matched(stack, fingerprint):
+        reporter.on_event(
+            "no_change",
+            "  🟡 the template, parameters and tags didn't change "
+            "since the last deployment, skip.",
+            stack_name=stack_name,
+        )
+        return DeployStackResponse()
 
     # doesn't exist, do create
     if stack is None:
@@ -127,7 +162,7 @@ def _deploy_stack_without_change_set(
             template=template,
             bucket=bucket,
             prefix=prefix,
-            verbose=verbose,
+            reporter=reporter,
         )
         resolve_stack_policy_kwargs(
             kwargs=kwargs,
@@ -135,19 +170,32 @@ def _deploy_stack_without_change_set(
             stack_policy=stack_policy,
             bucket=bucket,
             prefix=prefix_stack_policy,
-            verbose=verbose,
+            reporter=reporter,
+        )
+        stack_id = call_with_retry(
+            better_boto.create_stack,
+            retry_policy=retry_policy,
+            reporter=reporter,
+            **resolve_kwargs(**kwargs),
+        )
+        stack = Stack.from_arn(stack_id)
+        reporter.on_event(
+            "create_stack",
+            f"  {Fore.GREEN}+{Style.RESET_ALL} create new stack ...\n"
+            f"    preview at: {stack.console_url}",
+            stack_name=stack_name,
+            stack_id=stack_id,
         )
-        stack_id = better_boto.create_stack(**resolve_kwargs(**kwargs))
-        if verbose:
-            stack = Stack.from_arn(stack_id)
-            print(f"  {Fore.GREEN}+{Style.RESET_ALL} create new stack ...")
-            print(f"    preview at: {stack.console_url}")
     # already exists, do update
     else:
         is_create = False
-        if verbose:
-            print(f"  {Fore.GREEN}+{Style.RESET_ALL}/{Fore.RED}-{Style.RESET_ALL} update existing stack ...")
-            print(f"    preview at: {stack.console_url}")
+        reporter.on_event(
+            "update_stack",
+            f"  {Fore.GREEN}+{Style.RESET_ALL}/{Fore.RED}-{Style.RESET_ALL} update existing stack ...\n"
+            f"    preview at: {stack.console_url}",
+            stack_name=stack_name,
+            stack_id=stack.id,
+        )
 
         if stack.status == StackStatusEnum.REVIEW_IN_PROGRESS:  # pragma: no cover
             raise ValueError(
@@ -185,7 +233,7 @@ def _deploy_stack_without_change_set(
                 template=template,
                 bucket=bucket,
                 prefix=prefix,
-                verbose=verbose,
+                reporter=reporter,
             )
             resolve_stack_policy_kwargs(
                 kwargs=kwargs,
@@ -193,13 +241,21 @@ def _deploy_stack_without_change_set(
                 stack_policy=stack_policy,
                 bucket=bucket,
                 prefix=prefix_stack_policy,
-                verbose=verbose,
+                reporter=reporter,
+            )
+            stack_id = call_with_retry(
+                better_boto.update_stack,
+                retry_policy=retry_policy,
+                reporter=reporter,
+                **resolve_kwargs(**kwargs),
             )
-            stack_id = better_boto.update_stack(**resolve_kwargs(**kwargs))
         except Exception as e:
             if "No updates are to be performed" in str(e):
-                if verbose:
-                    print("  🟡 no updates are to be performed.")
+                reporter.on_event(
+                    "no_change",
+                    "  🟡 no updates are to be performed.",
+                    stack_name=stack_name,
+                )
                 return DeployStackResponse()
             else:  # pragma: no cover
                 raise e
@@ -212,7 +268,9 @@ def _deploy_stack_without_change_set(
             wait_until_exec_stopped=wait_until_exec_stopped_on_failure,
             delays=delays,
             timeout=timeout,
-            verbose=verbose,
+            verbose=False,
+            multi_stack_waiter=multi_stack_waiter,
+            reporter=reporter,
         )
     return DeployStackResponse(
         is_deploy_happened=True,
@@ -225,7 +283,7 @@ def change_set_name_suffix() -> str:
     return datetime.utcnow().strftime("%Y-%m-%d-%H-%M-%S-%f")[:-3]
 
 
-def _deploy_stack_using_change_set(
+def _create_stack_change_set(
     bsm: "BotoSesManager",
     stack_name: str,
     template: T.Optional[str] = NOTHING,
@@ -242,23 +300,32 @@ def _deploy_stack_using_change_set(
     prefix_stack_policy: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_STACK_POLICY,
     resource_types: T.Optional[T.List[str]] = NOTHING,
     client_request_token: T.Optional[str] = NOTHING,
-    disable_rollback: T.Optional[bool] = NOTHING,
     rollback_configuration: T.Optional[dict] = NOTHING,
     notification_arns: T.Optional[T.List[str]] = NOTHING,
     plan_nested_stack: bool = True,
-    wait: bool = True,
-    delays: T.Union[int, float] = DEFAULT_UPDATE_DELAYS,
-    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
-    wait_until_exec_stopped_on_failure: bool = False,
-    change_set_delays: T.Union[int, float] = DEFAULT_CHANGE_SET_DELAYS,
+    change_set_delays: T.Union[int, float, DelayStrategy] = DEFAULT_CHANGE_SET_DELAYS,
     change_set_timeout: T.Union[int, float] = DEFAULT_CHANGE_SET_TIMEOUT,
-    skip_prompt: bool = False,
-    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+    fingerprint: T.Optional[str] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
 ) -> DeployStackResponse:
+    """
+    The plan phase of :func:`_deploy_stack_using_change_set`, create the
+    change set and wait for it. The returned ``change_set_id`` is None if
+    there's no change.
+    """
     stack = better_boto.describe_live_stack(
         bsm,
         name=stack_name,
     )
+    if is_fingerprint_matched(stack, fingerprint):
+        reporter.on_event(
+            "no_change",
+            "  🟡 the template, parameters and tags didn't change "
+            "since the last deployment, skip.",
+            stack_name=stack_name,
+        )
+        return DeployStackResponse()
     change_set_name = f"{stack_name}-{change_set_name_suffix()}"
     create_change_set_kwargs = dict(
         bsm=bsm,
@@ -283,7 +350,7 @@ def _deploy_stack_using_change_set(
         template=template,
         bucket=bucket,
         prefix=prefix,
-        verbose=verbose,
+        reporter=reporter,
     )
     resolve_stack_policy_kwargs(
         kwargs=create_change_set_kwargs,
@@ -291,13 +358,12 @@ def _deploy_stack_using_change_set(
         stack_policy=stack_policy,
         bucket=bucket,
         prefix=prefix_stack_policy,
-        verbose=verbose,
+        reporter=reporter,
     )
 
     # doesn't exist, do create
     if stack is None:
         is_create = True
-        execute_message = f"{Fore.GREEN}+{Style.RESET_ALL} create new stack ..."
         create_change_set_kwargs["change_set_type_is_create"] = True
     # already exist, do update
     else:
@@ -309,22 +375,30 @@ def _deploy_stack_using_change_set(
                 f"You can delete it and retry."
             )
         is_create = False
-        execute_message = f"{Fore.GREEN}+{Style.RESET_ALL}/{Fore.RED}-{Style.RESET_ALL} update existing stack ..."
         create_change_set_kwargs["change_set_type_is_update"] = True
 
-    stack_id, change_set_id = better_boto.create_change_set(
-        **resolve_kwargs(**create_change_set_kwargs)
+    stack_id, change_set_id = call_with_retry(
+        better_boto.create_change_set,
+        retry_policy=retry_policy,
+        reporter=reporter,
+        **resolve_kwargs(**create_change_set_kwargs),
     )
 
-    if verbose:
-        change_set = ChangeSet(
-            change_set_id=change_set_id,
-            change_set_name="",
-            stack_id=stack_id,
-            stack_name=stack_name,
-        )
-        print("  🔎 create change set ...")
-        print(f"    preview at: {change_set.console_url}")
+    change_set = ChangeSet(
+        change_set_id=change_set_id,
+        change_set_name="",
+        stack_id=stack_id,
+        stack_name=stack_name,
+    )
+    reporter.on_event(
+        "create_change_set",
+        f"  🔎 create change set ...\n"
+        f"    preview at: {change_set.console_url}",
+        stack_name=stack_name,
+        stack_id=stack_id,
+        change_set_id=change_set_id,
+        is_create=is_create,
+    )
 
     try:
         change_set = better_boto.wait_create_change_set_to_finish(
@@ -333,50 +407,90 @@ def _deploy_stack_using_change_set(
             change_set_id=change_set_id,
             delays=change_set_delays,
             timeout=change_set_timeout,
-            verbose=verbose,
+            verbose=False,
+            reporter=reporter,
+        )
+        # fetch the nested change sets once, for both the plan and the reporter
+        tree = load_change_set_tree(
+            bsm=bsm,
+            change_set=change_set,
+            include_nested_stack=plan_nested_stack,
+        )
+        plan = Plan.from_change_set_tree(tree)
+        reporter.on_change_set(
+            change_set=change_set,
+            bsm=bsm,
+            include_nested_stack=plan_nested_stack,
+            tree=tree,
         )
-        if verbose:
-            visualize_change_set(
-                change_set=change_set,
-                bsm=bsm,
-                include_nested_stack=plan_nested_stack,
-            )
     except TimeoutError as e:  # pragma: no cover
         raise e
     except exc.CreateStackChangeSetButNotChangeError as e:
-        print(
+        reporter.on_event(
+            "no_change",
             f"    🟡 the submitted information didn't contain changes. "
-            f"Submit different information to create a change set."
+            f"Submit different information to create a change set.",
+            stack_name=stack_name,
         )
         return DeployStackResponse()
     except exc.CreateStackChangeSetFailedError as e:  # pragma: no cover
         raise e
 
-    print("    need to execute the change set to apply those changes.")
+    reporter.on_event(
+        "change_set_ready",
+        "    need to execute the change set to apply those changes.",
+        stack_name=stack_name,
+        change_set_id=change_set_id,
+    )
 
-    if skip_prompt is False:  # pragma: no cover
-        if prompt_to_proceed() is False:
-            # create logic branch
-            if stack is None:
-                print("  cancel creation.")
-                better_boto.delete_stack(
-                    bsm=bsm,
-                    stack_name=stack_id,
-                )
-            else:
-                print("  cancel update.")
-            return DeployStackResponse()
+    return DeployStackResponse(
+        is_create=is_create,
+        stack_id=stack_id,
+        change_set_id=change_set_id,
+        plan=plan,
+    )
 
-    if verbose:
-        stack = Stack.from_arn(stack_id)
-        print(f"  {execute_message}")
-        print(f"    preview at: {stack.console_url}")
 
+def _execute_stack_change_set(
+    bsm: "BotoSesManager",
+    stack_id: str,
+    change_set_id: str,
+    is_create: bool,
+    plan: T.Optional[Plan] = None,
+    disable_rollback: T.Optional[bool] = NOTHING,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    reporter: T.Optional[BaseReporter] = None,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
+) -> DeployStackResponse:
+    """
+    The apply phase of :func:`_deploy_stack_using_change_set`, execute the
+    change set and wait for the stack.
+    """
+    stack = Stack.from_arn(stack_id)
+    if is_create:
+        execute_message = f"{Fore.GREEN}+{Style.RESET_ALL} create new stack ..."
+    else:
+        execute_message = f"{Fore.GREEN}+{Style.RESET_ALL}/{Fore.RED}-{Style.RESET_ALL} update existing stack ..."
+    reporter.on_event(
+        "execute_change_set",
+        f"  {execute_message}\n"
+        f"    preview at: {stack.console_url}",
+        stack_name=stack.name,
+        stack_id=stack_id,
+        change_set_id=change_set_id,
+        is_create=is_create,
+    )
 
-    better_boto.execute_change_set(
+    call_with_retry(
+        better_boto.execute_change_set,
+        retry_policy=retry_policy,
+        reporter=reporter,
         bsm=bsm,
-        change_set_name=change_set_name,
-        stack_name=stack_name,
+        change_set_name=change_set_id,
         disable_rollback=disable_rollback,
     )
 
@@ -388,7 +502,9 @@ def _deploy_stack_using_change_set(
             wait_until_exec_stopped=wait_until_exec_stopped_on_failure,
             delays=delays,
             timeout=timeout,
-            verbose=verbose,
+            verbose=False,
+            multi_stack_waiter=multi_stack_waiter,
+            reporter=reporter,
         )
 
     return DeployStackResponse(
@@ -396,6 +512,99 @@ def _deploy_stack_using_change_set(
         is_create=is_create,
         stack_id=stack_id,
         change_set_id=change_set_id,
+        plan=plan,
+    )
+
+
+def _deploy_stack_using_change_set(
+    bsm: "BotoSesManager",
+    stack_name: str,
+    template: T.Optional[str] = NOTHING,
+    use_previous_template: T.Optional[bool] = NOTHING,
+    bucket: T.Optional[str] = NOTHING,
+    prefix: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_TEMPLATE,
+    parameters: T.Optional[T.List[Parameter]] = NOTHING,
+    tags: T.Optional[T.Dict[str, str]] = NOTHING,
+    execution_role_arn: T.Optional[str] = NOTHING,
+    include_iam: T.Optional[bool] = NOTHING,
+    include_named_iam: T.Optional[bool] = NOTHING,
+    include_macro: T.Optional[bool] = NOTHING,
+    stack_policy: T.Optional[str] = NOTHING,
+    prefix_stack_policy: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_STACK_POLICY,
+    resource_types: T.Optional[T.List[str]] = NOTHING,
+    client_request_token: T.Optional[str] = NOTHING,
+    disable_rollback: T.Optional[bool] = NOTHING,
+    rollback_configuration: T.Optional[dict] = NOTHING,
+    notification_arns: T.Optional[T.List[str]] = NOTHING,
+    plan_nested_stack: bool = True,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    change_set_delays: T.Union[int, float, DelayStrategy] = DEFAULT_CHANGE_SET_DELAYS,
+    change_set_timeout: T.Union[int, float] = DEFAULT_CHANGE_SET_TIMEOUT,
+    skip_prompt: bool = False,
+    reporter: T.Optional[BaseReporter] = None,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    fingerprint: T.Optional[str] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
+) -> DeployStackResponse:
+    response = _create_stack_change_set(
+        bsm=bsm,
+        stack_name=stack_name,
+        template=template,
+        use_previous_template=use_previous_template,
+        bucket=bucket,
+        prefix=prefix,
+        parameters=parameters,
+        tags=tags,
+        execution_role_arn=execution_role_arn,
+        include_iam=include_iam,
+        include_named_iam=include_named_iam,
+        include_macro=include_macro,
+        stack_policy=stack_policy,
+        prefix_stack_policy=prefix_stack_policy,
+        resource_types=resource_types,
+        client_request_token=client_request_token,
+        rollback_configuration=rollback_configuration,
+        notification_arns=notification_arns,
+        plan_nested_stack=plan_nested_stack,
+        change_set_delays=change_set_delays,
+        change_set_timeout=change_set_timeout,
+        reporter=reporter,
+        fingerprint=fingerprint,
+        retry_policy=retry_policy,
+    )
+    if response.change_set_id is None:
+        return response
+
+    if skip_prompt is False:  # pragma: no cover
+        if prompt_to_proceed() is False:
+            # create logic branch
+            if response.is_create:
+                print("  cancel creation.")
+                better_boto.delete_stack(
+                    bsm=bsm,
+                    stack_name=response.stack_id,
+                )
+            else:
+                print("  cancel update.")
+            return DeployStackResponse(plan=response.plan)
+
+    return _execute_stack_change_set(
+        bsm=bsm,
+        stack_id=response.stack_id,
+        change_set_id=response.change_set_id,
+        is_create=response.is_create,
+        plan=response.plan,
+        disable_rollback=disable_rollback,
+        wait=wait,
+        delays=delays,
+        timeout=timeout,
+        wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
+        reporter=reporter,
+        multi_stack_waiter=multi_stack_waiter,
+        retry_policy=retry_policy,
     )
 
 
@@ -411,6 +620,49 @@ def _find_ruler_length(
         return 172
 
 
+def _resolve_fingerprint(
+    skip_unchanged: bool,
+    tags: T.Optional[T.Dict[str, str]] = NOTHING,
+    **kwargs,
+) -> T.Tuple[T.Optional[str], T.Optional[T.Dict[str, str]]]:
+    """
+    Compute the deploy fingerprint if ``skip_unchanged``, and add it to the tags.
+
+    :return: the fingerprint (None if not ``skip_unchanged`` or not
+        reproducible) and the new tags
+    """
+    if skip_unchanged is False:
+        return None, tags
+    fingerprint = get_deploy_fingerprint(tags=tags, **kwargs)
+    if fingerprint is None:
+        return None, tags
+    tags = dict() if tags is NOTHING else dict(tags)
+    tags[FINGERPRINT_TAG_KEY] = fingerprint
+    return fingerprint, tags
+
+
+def _report_header(
+    bsm: "BotoSesManager",
+    stack_name: str,
+    title: str,
+    event: str,
+    reporter: BaseReporter,
+):
+    length = _find_ruler_length(stack_name, 48)
+    aws_console = get_context(bsm).aws_console
+    console_url = aws_console.cloudformation.filter_stack(name=stack_name)
+    reporter.on_event(
+        event,
+        format_header(
+            f"{title} stack: {Fore.CYAN}{stack_name}{Style.RESET_ALL}",
+            "=",
+            length,
+        )
+        + f"\n  📋 filter stack in AWS CloudFormation console: {console_url}",
+        stack_name=stack_name,
+    )
+
+
 def deploy_stack(
     bsm: "BotoSesManager",
     stack_name: str,
@@ -436,15 +688,19 @@ def deploy_stack(
     on_failure_rollback: T.Optional[bool] = NOTHING,
     on_failure_delete: T.Optional[bool] = NOTHING,
     wait: bool = True,
-    delays: T.Union[int, float] = DEFAULT_UPDATE_DELAYS,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
     timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
     wait_until_exec_stopped_on_failure: bool = False,
     plan_nested_stack: bool = True,
     skip_plan: bool = False,
     skip_prompt: bool = False,
-    change_set_delays: T.Union[int, float] = DEFAULT_CHANGE_SET_DELAYS,
+    change_set_delays: T.Union[int, float, DelayStrategy] = DEFAULT_CHANGE_SET_DELAYS,
     change_set_timeout: T.Union[int, float] = DEFAULT_CHANGE_SET_TIMEOUT,
     verbose: bool = True,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    reporter: T.Optional[BaseReporter] = None,
+    skip_unchanged: bool = False,
+    retry_policy: T.Optional[RetryPolicy] = None,
 ) -> DeployStackResponse:
     """
     Deploy (create or update) an AWS CloudFormation stack. But more powerful
@@ -494,7 +750,8 @@ def deploy_stack(
         note that if you have skip_plan is False (using change set), you always
         have to wait the change set creation to finish.
     :param delays: how long it waits (in seconds) between two
-        "describe_stacks" api call to get the stack status
+        "describe_stacks" api call to get the stack status, or a
+        :class:`~aws_cloudformation.waiter.DelayStrategy` object
     :param timeout: how long it will raise timeout error
     :param wait_until_exec_stopped_on_failure: if False, it will raise an
         :class:`~aws_cloudformation.exc.DeployStackFailedError` exception immediately
@@ -508,24 +765,53 @@ def deploy_stack(
     :param skip_prompt: default False; if False, you have to enter "Yes"
         in prompt to do deployment; if True, then execute the deployment directly.
     :param change_set_delays: how long it waits (in seconds) between two
-        "describe_change_set" api call to get the change set status
+        "describe_change_set" api call to get the change set status, or a
+        :class:`~aws_cloudformation.waiter.DelayStrategy` object
     :param change_set_timeout: how long it will raise timeout error
     :param verbose: whether you want to log information to console
+    :param multi_stack_waiter: optional
+        :class:`~aws_cloudformation.better_boto.stacks.MultiStackWaiter`
+        shared with other deployments in the same account and region, to
+        reduce the ``describe_stacks`` api calls.
+    :param reporter: where the progress and events go, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+    :param skip_unchanged: default False; if True, the fingerprint of the
+        template, parameters, tags, capabilities and stack policy (see
+        :func:`~aws_cloudformation.deploy_helpers.get_deploy_fingerprint`)
+        is stored as a stack tag. If the live stack has the same fingerprint,
+        it returns immediately without creating a change set.
+    :param retry_policy: how the create / update / execute api calls are
+        retried on throttling and transient errors, default to
+        :data:`~aws_cloudformation.retry.DEFAULT_RETRY_POLICY`. If
+        ``client_request_token`` is not given, a new one is generated for
+        each call and reused by its retries.
 
     :return: Nothing
 
     .. versionadded:: 0.1.1
     """
-    if verbose:
-        length = _find_ruler_length(stack_name, 48)
-        print_header(
-            f"🚀 {Fore.CYAN}Deploy{Style.RESET_ALL} stack: {Fore.CYAN}{stack_name}{Style.RESET_ALL}",
-            "=",
-            length,
-        )
-        aws_console = AWSConsole(aws_region=bsm.aws_region, bsm=bsm)
-        console_url = aws_console.cloudformation.filter_stack(name=stack_name)
-        print(f"  📋 filter stack in AWS CloudFormation console: {console_url}")
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    fingerprint, tags = _resolve_fingerprint(
+        skip_unchanged=skip_unchanged,
+        template=template,
+        parameters=parameters,
+        tags=tags,
+        include_iam=include_iam,
+        include_named_iam=include_named_iam,
+        include_macro=include_macro,
+        stack_policy=stack_policy,
+        execution_role_arn=execution_role_arn,
+        resource_types=resource_types,
+        rollback_configuration=rollback_configuration,
+        notification_arns=notification_arns,
+    )
+    _report_header(
+        bsm=bsm,
+        stack_name=stack_name,
+        title=f"🚀 {Fore.CYAN}Deploy{Style.RESET_ALL}",
+        event="deploy_stack",
+        reporter=reporter,
+    )
 
     if skip_plan is True:
         deploy_stack_response = _deploy_stack_without_change_set(
@@ -557,7 +843,10 @@ def deploy_stack(
             timeout=timeout,
             wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
             skip_prompt=skip_prompt,
-            verbose=verbose,
+            reporter=reporter,
+            multi_stack_waiter=multi_stack_waiter,
+            fingerprint=fingerprint,
+            retry_policy=retry_policy,
         )
     else:
         deploy_stack_response = _deploy_stack_using_change_set(
@@ -586,15 +875,279 @@ def deploy_stack(
             change_set_delays=change_set_delays,
             change_set_timeout=change_set_timeout,
             skip_prompt=skip_prompt,
-            verbose=verbose,
+            reporter=reporter,
+            multi_stack_waiter=multi_stack_waiter,
+            fingerprint=fingerprint,
+            retry_policy=retry_policy,
+        )
+
+    if deploy_stack_response.is_deploy_happened:
+        export_names = None
+        import_values = None
+        if isinstance(template, str) and not template.startswith("s3://"):
+            # invalidate everything if any export name can't be resolved
+            try:
+                export_names = find_export_names(template)
+                import_values = find_import_values(template)
+            except exc.UnresolvableExportNameError:
+                export_names = None
+        invalidate_stack_exports(
+            bsm=bsm,
+            stack_name_or_id=stack_name,
+            export_names=export_names,
+            import_values=import_values,
         )
 
-    if verbose:
-        print("  done")
+    reporter.on_event("done", "  done", stack_name=stack_name)
 
     return deploy_stack_response
 
 
+def plan_stack(
+    bsm: "BotoSesManager",
+    stack_name: str,
+    template: T.Optional[str] = NOTHING,
+    use_previous_template: T.Optional[bool] = NOTHING,
+    bucket: T.Optional[str] = NOTHING,
+    prefix: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_TEMPLATE,
+    parameters: T.Optional[T.List[Parameter]] = NOTHING,
+    tags: T.Optional[T.Dict[str, str]] = NOTHING,
+    execution_role_arn: T.Optional[str] = NOTHING,
+    include_iam: T.Optional[bool] = NOTHING,
+    include_named_iam: T.Optional[bool] = NOTHING,
+    include_macro: T.Optional[bool] = NOTHING,
+    stack_policy: T.Optional[str] = NOTHING,
+    prefix_stack_policy: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_STACK_POLICY,
+    resource_types: T.Optional[T.List[str]] = NOTHING,
+    client_request_token: T.Optional[str] = NOTHING,
+    rollback_configuration: T.Optional[dict] = NOTHING,
+    notification_arns: T.Optional[T.List[str]] = NOTHING,
+    plan_nested_stack: bool = True,
+    change_set_delays: T.Union[int, float, DelayStrategy] = DEFAULT_CHANGE_SET_DELAYS,
+    change_set_timeout: T.Union[int, float] = DEFAULT_CHANGE_SET_TIMEOUT,
+    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+    skip_unchanged: bool = False,
+    retry_policy: T.Optional[RetryPolicy] = None,
+) -> DeployStackResponse:
+    """
+    The first half of :func:`deploy_stack`, create the change set and wait
+    for it, but don't execute it. Use :func:`execute_stack_change_set` to
+    apply it later. The arguments are the same as :func:`deploy_stack`.
+
+    :return: a :class:`DeployStackResponse` object, ``is_deploy_happened``
+        is always False, ``change_set_id`` is None if there's no change.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    fingerprint, tags = _resolve_fingerprint(
+        skip_unchanged=skip_unchanged,
+        template=template,
+        parameters=parameters,
+        tags=tags,
+        include_iam=include_iam,
+        include_named_iam=include_named_iam,
+        include_macro=include_macro,
+        stack_policy=stack_policy,
+        execution_role_arn=execution_role_arn,
+        resource_types=resource_types,
+        rollback_configuration=rollback_configuration,
+        notification_arns=notification_arns,
+    )
+    _report_header(
+        bsm=bsm,
+        stack_name=stack_name,
+        title=f"🔎 {Fore.CYAN}Plan{Style.RESET_ALL}",
+        event="plan_stack",
+        reporter=reporter,
+    )
+    response = _create_stack_change_set(
+        bsm=bsm,
+        stack_name=stack_name,
+        template=template,
+        use_previous_template=use_previous_template,
+        bucket=bucket,
+        prefix=prefix,
+        parameters=parameters,
+        tags=tags,
+        execution_role_arn=execution_role_arn,
+        include_iam=include_iam,
+        include_named_iam=include_named_iam,
+        include_macro=include_macro,
+        stack_policy=stack_policy,
+        prefix_stack_policy=prefix_stack_policy,
+        resource_types=resource_types,
+        client_request_token=client_request_token,
+        rollback_configuration=rollback_configuration,
+        notification_arns=notification_arns,
+        plan_nested_stack=plan_nested_stack,
+        change_set_delays=change_set_delays,
+        change_set_timeout=change_set_timeout,
+        reporter=reporter,
+        fingerprint=fingerprint,
+        retry_policy=retry_policy,
+    )
+    reporter.on_event("done", "  done", stack_name=stack_name)
+    return response
+
+
+def execute_stack_change_set(
+    bsm: "BotoSesManager",
+    stack_id: str,
+    change_set_id: str,
+    is_create: bool,
+    plan: T.Optional[Plan] = None,
+    disable_rollback: T.Optional[bool] = NOTHING,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    verbose: bool = True,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    reporter: T.Optional[BaseReporter] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
+) -> DeployStackResponse:
+    """
+    The second half of :func:`deploy_stack`, execute the change set created
+    by :func:`plan_stack` and wait for the stack. There's no prompt.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param stack_id: the unique stack id
+    :param change_set_id: the change set id
+    :param is_create: whether the change set creates the stack
+    :param plan: the :class:`~aws_cloudformation.plan.Plan` of the change set,
+        it is returned as it is.
+
+    The other arguments are the same as :func:`deploy_stack`.
+
+    :return: a :class:`DeployStackResponse` object.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    response = _execute_stack_change_set(
+        bsm=bsm,
+        stack_id=stack_id,
+        change_set_id=change_set_id,
+        is_create=is_create,
+        plan=plan,
+        disable_rollback=disable_rollback,
+        wait=wait,
+        delays=delays,
+        timeout=timeout,
+        wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
+        reporter=reporter,
+        multi_stack_waiter=multi_stack_waiter,
+        retry_policy=retry_policy,
+    )
+    invalidate_stack_exports(
+        bsm=bsm,
+        stack_name_or_id=stack_id,
+    )
+    return response
+
+
+def apply_plan(
+    bsm: "BotoSesManager",
+    artifact: PlanArtifact,
+    template: T.Optional[str] = NOTHING,
+    parameters: T.Optional[T.List[Parameter]] = NOTHING,
+    disable_rollback: T.Optional[bool] = NOTHING,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    verbose: bool = True,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    reporter: T.Optional[BaseReporter] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
+) -> DeployStackResponse:
+    """
+    Execute the change set of a :class:`~aws_cloudformation.plan.PlanArtifact`
+    created earlier (for example, in the plan stage of a pipeline), without
+    uploading the template and creating the change set again. There's no
+    prompt, the approval is supposed to happen before calling it.
+
+    It verifies that the artifact belongs to the AWS account and region of
+    the ``bsm``, and the change set is still ``AVAILABLE`` to execute. If
+    the stack is updated after the plan, the change set becomes ``OBSOLETE``,
+    you have to plan again.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object
+    :param artifact: the :class:`~aws_cloudformation.plan.PlanArtifact`
+    :param template: optional, if given, it has to be the same as the
+        planned template
+    :param parameters: optional, if given, they have to be the same as the
+        planned parameters
+
+    The other arguments are the same as :func:`deploy_stack`.
+
+    :return: a :class:`DeployStackResponse` object.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    if (bsm.aws_account_id, bsm.aws_region) != (
+        artifact.aws_account_id,
+        artifact.aws_region,
+    ):
+        raise exc.PlanArtifactNotApplicableError(
+            f"the plan of stack {artifact.stack_name!r} is for "
+            f"{artifact.aws_account_id}/{artifact.aws_region}, "
+            f"not {bsm.aws_account_id}/{bsm.aws_region}!"
+        )
+    if template is not NOTHING and get_template_hash(template) != (
+        artifact.template_hash
+    ):
+        raise exc.PlanArtifactNotApplicableError(
+            f"the template of stack {artifact.stack_name!r} "
+            f"changed since the plan, plan again!"
+        )
+    if parameters is not NOTHING and get_parameters_hash(parameters) != (
+        artifact.parameters_hash
+    ):
+        raise exc.PlanArtifactNotApplicableError(
+            f"the parameters of stack {artifact.stack_name!r} "
+            f"changed since the plan, plan again!"
+        )
+    change_set = better_boto.describe_change_set(
+        bsm=bsm,
+        change_set_name=artifact.change_set_id,
+    )
+    if change_set is None:
+        raise exc.PlanArtifactNotApplicableError(
+            f"the change set {artifact.change_set_id} doesn't exist, "
+            f"it may be deleted or executed by another plan, plan again!"
+        )
+    if change_set.execution_status != ChangeSetExecutionStatusEnum.AVAILABLE:
+        status = getattr(change_set.execution_status, "value", None)
+        raise exc.PlanArtifactNotApplicableError(
+            f"the execution status of change set {artifact.change_set_id} "
+            f"is {status}, not {ChangeSetExecutionStatusEnum.AVAILABLE.value}, "
+            f"plan again!"
+        )
+
+    _report_header(
+        bsm=bsm,
+        stack_name=artifact.stack_name,
+        title=f"🚀 {Fore.CYAN}Apply{Style.RESET_ALL} plan of",
+        event="apply_plan",
+        reporter=reporter,
+    )
+    response = execute_stack_change_set(
+        bsm=bsm,
+        stack_id=artifact.stack_id,
+        change_set_id=artifact.change_set_id,
+        is_create=artifact.is_create,
+        plan=artifact.plan,
+        disable_rollback=disable_rollback,
+        wait=wait,
+        delays=delays,
+        timeout=timeout,
+        wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
+        multi_stack_waiter=multi_stack_waiter,
+        reporter=reporter,
+        retry_policy=retry_policy,
+    )
+    reporter.on_event("done", "  done", stack_name=artifact.stack_name)
+    return response
+
+
 def remove_stack(
     bsm: "BotoSesManager",
     stack_name: str,
@@ -602,11 +1155,14 @@ def remove_stack(
     role_arn: T.Optional[str] = NOTHING,
     client_request_token: T.Optional[str] = NOTHING,
     wait: bool = True,
-    delays: T.Union[int, float] = DEFAULT_UPDATE_DELAYS,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
     timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
     wait_until_exec_stopped_on_failure: bool = False,
     skip_prompt: bool = False,
     verbose: bool = True,
+    multi_stack_waiter: T.Optional[better_boto.MultiStackWaiter] = None,
+    reporter: T.Optional[BaseReporter] = None,
+    retry_policy: T.Optional[RetryPolicy] = None,
 ):
     """
     Remove an AWS CloudFormation Stack.
@@ -623,7 +1179,8 @@ def remove_stack(
     :param wait: default True; if True, then wait the delete action
         to success or fail; if False, then it is an async call and return immediately.
     :param delays: how long it waits (in seconds) between two
-        "describe_stacks" api call to get the stack status
+        "describe_stacks" api call to get the stack status, or a
+        :class:`~aws_cloudformation.waiter.DelayStrategy` object
     :param timeout: how long it will raise timeout error
     :param wait_until_exec_stopped_on_failure: if False, it will raise an
         :class:`~aws_cloudformation.exc.DeleteStackFailedError` exception immediately
@@ -634,21 +1191,34 @@ def remove_stack(
     :param skip_prompt: default False; if False, you have to enter "Yes"
         in prompt to do deletion; if True, then execute the deletion directly.
     :param verbose: whether you want to log information to console
+    :param multi_stack_waiter: optional
+        :class:`~aws_cloudformation.better_boto.stacks.MultiStackWaiter`
+        shared with other deletions in the same account and region, to
+        reduce the ``describe_stacks`` api calls.
+    :param reporter: where the progress and events go, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+    :param retry_policy: how the ``delete_stack`` api call is retried on
+        throttling and transient errors, default to
+        :data:`~aws_cloudformation.retry.DEFAULT_RETRY_POLICY`.
 
     :return: None
 
     .. versionadded:: 0.1.1
     """
-    if verbose:
-        length = _find_ruler_length(stack_name, 48)
-        print_header(
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    length = _find_ruler_length(stack_name, 48)
+    aws_console = get_context(bsm).aws_console
+    console_url = aws_console.cloudformation.filter_stack(name=stack_name)
+    reporter.on_event(
+        "remove_stack",
+        format_header(
             f"🗑 {Fore.CYAN}Remove{Style.RESET_ALL} stack {Fore.CYAN}{stack_name}{Style.RESET_ALL}",
             "=",
             length,
         )
-        aws_console = AWSConsole(aws_region=bsm.aws_region, bsm=bsm)
-        console_url = aws_console.cloudformation.filter_stack(name=stack_name)
-        print(f"  📋 filter stack in AWS CloudFormation console: {console_url}")
+        + f"\n  📋 filter stack in AWS CloudFormation console: {console_url}",
+        stack_name=stack_name,
+    )
 
     stack = better_boto.describe_live_stack(
         bsm=bsm,
@@ -656,8 +1226,11 @@ def remove_stack(
     )
 
     if stack is None:
-        print("  stack doesn't exists!")
-        print("  done!")
+        reporter.on_event(
+            "done",
+            "  stack doesn't exists!\n  done!",
+            stack_name=stack_name,
+        )
         return
 
     if skip_prompt is False:  # pragma: no cover
@@ -665,7 +1238,10 @@ def remove_stack(
             print("Do nothing.")
             return
 
-    better_boto.delete_stack(
+    call_with_retry(
+        better_boto.delete_stack,
+        retry_policy=retry_policy,
+        reporter=reporter,
         bsm=bsm,
         stack_name=stack_name,
         retain_resources=retain_resources,
@@ -680,11 +1256,22 @@ def remove_stack(
             wait_until_exec_stopped=wait_until_exec_stopped_on_failure,
             delays=delays,
             timeout=timeout,
-            verbose=verbose,
+            verbose=False,
+            multi_stack_waiter=multi_stack_waiter,
+            reporter=reporter,
         )
 
-    if verbose:
-        print("  done")
+    invalidate_stack_exports(
+        bsm=bsm,
+        stack_name_or_id=stack.id,
+        export_names=[
+            output.export_name
+            for output in stack.outputs.values()
+            if output.export_name is not None
+        ],
+    )
+
+    reporter.on_event("done", "  done", stack_name=stack_name)
 
 
 def deploy_stack_set(
@@ -717,6 +1304,7 @@ def deploy_stack_set(
     client_request_token: T.Optional[str] = NOTHING,
     managed_execution_active: T.Optional[bool] = NOTHING,
     verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
 ) -> T.Tuple[bool, str]:  # pragma: no cover
     """
     Deploy (create or update) an AWS CloudFormation stack set. But more powerful
@@ -759,24 +1347,30 @@ def deploy_stack_set(
     :param client_request_token: see "Deploy StackSet related boto3 API" link
     :param managed_execution_active: see "Deploy StackSet related boto3 API" link
     :param verbose: whether you want to log information to console
+    :param reporter: where the progress and events go, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
 
     :return: (is_create, stack_set_id_or_operation_id)
     """
-    aws_console = AWSConsole(aws_region=bsm.aws_region, bsm=bsm)
-    if verbose:
-        length = _find_ruler_length(stack_set_name, 52)
-        print_header(
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    aws_console = get_context(bsm).aws_console
+    length = _find_ruler_length(stack_set_name, 52)
+    console_url = get_filter_stack_set_console_url(
+        aws_console=aws_console,
+        stack_set_name=stack_set_name,
+        call_as_self=call_as_self,
+        call_as_delegated_admin=call_as_delegated_admin,
+    )
+    reporter.on_event(
+        "deploy_stack_set",
+        format_header(
             f"🚀 {Fore.CYAN}Deploy{Style.RESET_ALL} stack set: {Fore.CYAN}{stack_set_name}{Style.RESET_ALL}",
             "=",
             length,
         )
-        console_url = get_filter_stack_set_console_url(
-            aws_console=aws_console,
-            stack_set_name=stack_set_name,
-            call_as_self=call_as_self,
-            call_as_delegated_admin=call_as_delegated_admin,
-        )
-        print(f"  📋 filter stack set in AWS CloudFormation console: {console_url}")
+        + f"\n  📋 filter stack set in AWS CloudFormation console: {console_url}",
+        stack_set_name=stack_set_name,
+    )
 
     stack_set = better_boto.describe_stack_set(
         bsm=bsm,
@@ -786,8 +1380,11 @@ def deploy_stack_set(
     )
     if stack_set is None:
         is_create = True
-        if verbose:
-            print(f"  {Fore.CYAN}+{Style.RESET_ALL} create stack set ...")
+        reporter.on_event(
+            "create_stack_set",
+            f"  {Fore.CYAN}+{Style.RESET_ALL} create stack set ...",
+            stack_set_name=stack_set_name,
+        )
         kwargs = dict(
             bsm=bsm,
             stack_set_name=stack_set_name,
@@ -815,15 +1412,18 @@ def deploy_stack_set(
             template=template,
             bucket=bucket,
             prefix=prefix,
-            verbose=verbose,
+            reporter=reporter,
         )
         stack_set_id_or_operation_id = better_boto.create_stack_set(
             **resolve_kwargs(**kwargs)
         )
     else:
         is_create = False
-        if verbose:
-            print(f"  {Fore.CYAN}+/-{Style.RESET_ALL} update stack set ...")
+        reporter.on_event(
+            "update_stack_set",
+            f"  {Fore.CYAN}+/-{Style.RESET_ALL} update stack set ...",
+            stack_set_name=stack_set_name,
+        )
         kwargs = dict(
             bsm=bsm,
             stack_set_name=stack_set_name,
@@ -855,7 +1455,7 @@ def deploy_stack_set(
             template=template,
             bucket=bucket,
             prefix=prefix,
-            verbose=verbose,
+            reporter=reporter,
         )
         stack_set_id_or_operation_id = better_boto.update_stack_set(
             **resolve_kwargs(**kwargs)
@@ -869,9 +1469,13 @@ def deploy_stack_set(
     else:
         kwargs["is_self_managed"] = True
     console_url = aws_console.cloudformation.get_stack_set_info(**kwargs)
-    print(f"  📋 review stack set info in AWS CloudFormation console: {console_url}")
-    if verbose:
-        print("  done")
+    reporter.on_event(
+        "done",
+        f"  📋 review stack set info in AWS CloudFormation console: {console_url}\n"
+        f"  done",
+        stack_set_name=stack_set_name,
+        stack_set_id_or_operation_id=stack_set_id_or_operation_id,
+    )
 
     return is_create, stack_set_id_or_operation_id
 
@@ -882,6 +1486,7 @@ def remove_stack_set(
     call_as_self: T.Optional[bool] = NOTHING,
     call_as_delegated_admin: T.Optional[bool] = NOTHING,
     verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
 ):
     """
     Remove an AWS CloudFormation stack set.
@@ -895,24 +1500,30 @@ def remove_stack_set(
     :param call_as_self: see "Delete StackSet related boto3 API" link
     :param call_as_delegated_admin: see "Delete StackSet related boto3 API" link
     :param verbose: whether you want to log information to console
+    :param reporter: where the progress and events go, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
 
     :return: None
     """
-    aws_console = AWSConsole(aws_region=bsm.aws_region, bsm=bsm)
-    if verbose:
-        length = _find_ruler_length(stack_set_name, 52)
-        print_header(
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    aws_console = get_context(bsm).aws_console
+    length = _find_ruler_length(stack_set_name, 52)
+    console_url = get_filter_stack_set_console_url(
+        aws_console=aws_console,
+        stack_set_name=stack_set_name,
+        call_as_self=call_as_self,
+        call_as_delegated_admin=call_as_delegated_admin,
+    )
+    reporter.on_event(
+        "remove_stack_set",
+        format_header(
             f"🗑 {Fore.CYAN}Remove{Style.RESET_ALL} stack set {Fore.CYAN}{stack_set_name}{Style.RESET_ALL}",
             "=",
             length,
         )
-        console_url = get_filter_stack_set_console_url(
-            aws_console=aws_console,
-            stack_set_name=stack_set_name,
-            call_as_self=call_as_self,
-            call_as_delegated_admin=call_as_delegated_admin,
-        )
-        print(f"  📋 filter stack set in AWS CloudFormation console: {console_url}")
+        + f"\n  📋 filter stack set in AWS CloudFormation console: {console_url}",
+        stack_set_name=stack_set_name,
+    )
 
     better_boto.delete_stack_set(
         bsm=bsm,
@@ -921,5 +1532,4 @@ def remove_stack_set(
         call_as_delegated_admin=call_as_delegated_admin,
     )
 
-    if verbose:
-        print("  done")
+    reporter.on_event("done", "  done", stack_set_name=stack_set_name)
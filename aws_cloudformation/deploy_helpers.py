@@ -2,12 +2,17 @@
 
 import typing as T
 import sys
+import json
+import hashlib
 
+from botocore.exceptions import ClientError
 from boto_session_manager import BotoSesManager
 from func_args import NOTHING
-from aws_console_url.api import AWSConsole
 
 from .helper import md5_of_text
+from .stack import Parameter, Stack
+from .reporter import BaseReporter, resolve_reporter
+from .context import get_context
 
 DEFAULT_S3_PREFIX_FOR_TEMPLATE = "cloudformation/template"
 DEFAULT_S3_PREFIX_FOR_STACK_POLICY = "cloudformation/policy"
@@ -28,21 +33,180 @@ def detect_template_type(template: str) -> str:
         return "yaml"
 
 
+FINGERPRINT_TAG_KEY = "aws_cloudformation:fingerprint"
+
+
+def normalize_template(template: str) -> str:
+    """
+    Normalize the JSON template (or stack policy), so the key order and the
+    white spaces don't change the fingerprint. YAML template is only stripped.
+    """
+    if detect_template_type(template) == "json":
+        try:
+            return json.dumps(
+                json.loads(template),
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except ValueError:  # pragma: no cover
+            pass
+    return template.strip()
+
+
+def _sha256_of_json(data) -> str:
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_template_hash(template: T.Optional[str] = NOTHING) -> T.Optional[str]:
+    """
+    The sha256 of the normalized template, see :func:`normalize_template`.
+
+    :return: the hash, or None if there's no template.
+    """
+    if template is NOTHING or template is None:
+        return None
+    return _sha256_of_json(normalize_template(template))
+
+
+def _dump_parameters(parameters: T.List[Parameter]) -> T.List[list]:
+    return sorted(
+        [[param.key, param.value, param.use_previous_value] for param in parameters],
+        key=lambda x: x[0],
+    )
+
+
+def get_parameters_hash(parameters: T.Optional[T.List[Parameter]] = NOTHING) -> str:
+    """
+    The sha256 of the parameters, the order doesn't matter.
+    """
+    if parameters is NOTHING or parameters is None:
+        parameters = []
+    return _sha256_of_json(_dump_parameters(parameters))
+
+
+def _none_if_nothing(value):
+    return None if value is NOTHING else value
+
+
+def get_deploy_fingerprint(
+    template: T.Optional[str] = NOTHING,
+    parameters: T.Optional[T.List[Parameter]] = NOTHING,
+    tags: T.Optional[T.Dict[str, str]] = NOTHING,
+    include_iam: T.Optional[bool] = NOTHING,
+    include_named_iam: T.Optional[bool] = NOTHING,
+    include_macro: T.Optional[bool] = NOTHING,
+    stack_policy: T.Optional[str] = NOTHING,
+    execution_role_arn: T.Optional[str] = NOTHING,
+    resource_types: T.Optional[T.List[str]] = NOTHING,
+    rollback_configuration: T.Optional[dict] = NOTHING,
+    notification_arns: T.Optional[T.List[str]] = NOTHING,
+) -> T.Optional[str]:
+    """
+    The sha256 fingerprint of everything that decides the result of a stack
+    deployment: the normalized template, parameters, tags, capabilities,
+    stack policy and so on. The same fingerprint means nothing changed.
+
+    :return: the fingerprint, or None if the deployment is not reproducible:
+        there's no template (for example, ``use_previous_template=True``), or
+        the template / stack policy is an s3 uri, the object at the same uri
+        may be overwritten.
+    """
+    if template is NOTHING:
+        return None
+    if template.startswith("s3://"):
+        return None
+    if stack_policy is not NOTHING and stack_policy.startswith("s3://"):
+        return None
+    if parameters is NOTHING:
+        parameters = []
+    if tags is NOTHING:
+        tags = {}
+    if stack_policy is not NOTHING:
+        stack_policy = normalize_template(stack_policy)
+    data = dict(
+        template=normalize_template(template),
+        parameters=_dump_parameters(parameters),
+        tags={k: v for k, v in tags.items() if k != FINGERPRINT_TAG_KEY},
+        include_iam=_none_if_nothing(include_iam),
+        include_named_iam=_none_if_nothing(include_named_iam),
+        include_macro=_none_if_nothing(include_macro),
+        stack_policy=_none_if_nothing(stack_policy),
+        execution_role_arn=_none_if_nothing(execution_role_arn),
+        resource_types=_none_if_nothing(resource_types),
+        rollback_configuration=_none_if_nothing(rollback_configuration),
+        notification_arns=_none_if_nothing(notification_arns),
+    )
+    return _sha256_of_json(data)
+
+
+def is_fingerprint_matched(
+    stack: T.Optional[Stack],
+    fingerprint: T.Optional[str],
+) -> bool:
+    """
+    Whether the live stack was successfully deployed with the same
+    fingerprint, see :func:`get_deploy_fingerprint`.
+    """
+    if fingerprint is None or stack is None:
+        return False
+    if stack.is_success() is False:
+        return False
+    return stack.tags.get(FINGERPRINT_TAG_KEY) == fingerprint
+
+
+def is_s3_object_uploaded(
+    s3_client,
+    bucket: str,
+    key: str,
+    md5: str,
+) -> bool:
+    """
+    Check if the S3 object exists and its ETag is the md5 of the content,
+    it costs one ``head_object`` request and no download.
+
+    .. note::
+
+        The ETag is not the md5 for multipart uploads and SSE-KMS encrypted
+        objects, they are considered as not uploaded.
+    """
+    try:
+        res = s3_client.head_object(Bucket=bucket, Key=key)
+    except ClientError:
+        # not found, or no permission to check, just upload it
+        return False
+    return res.get("ETag", "").strip('"') == md5
+
+
 def upload_template_to_s3(
     bsm: BotoSesManager,
     template: str,
     bucket: str,
     prefix: T.Optional[str] = None,
     verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
 ) -> str:
     """
     Upload the CloudFormation template body to S3 before deployment.
     The target location is: s3://${bucket}/${prefix}/${md5_of_template_body}.${json_or_yaml}.
 
+    Because the key is the md5 of the content, the same template is only
+    uploaded once. It checks the
+    :class:`~aws_cloudformation.context.UploadIndex` of the ``bsm`` first,
+    then the ETag of the existing object (see :func:`is_s3_object_uploaded`).
+    By default, the index is stored in
+    :data:`~aws_cloudformation.context.DEFAULT_UPLOAD_INDEX_PATH` and shared
+    by all the processes, an entry is trusted for 24 hours. Set
+    ``get_context(bsm).upload_index = UploadIndex(path=None)`` to keep it in
+    memory only.
+
     :param bsm: ``boto_session_manager.BotoSesManager`` object
     :param template: template Body in string
     :param bucket: s3 bucket name
     :param prefix: s3 prefix
+    :param verbose: whether you want to log information to console
+    :param reporter: see :mod:`aws_cloudformation.reporter`, if given,
+        ``verbose`` is ignored
 
     :return: the template url (NOT s3 uri) for the template uploads.
     """
@@ -56,16 +220,38 @@ def upload_template_to_s3(
     key = f"{prefix}{md5}.{template_type}"
     s3_uri = f"s3://{bucket}/{key}"
     template_url = f"https://s3.amazonaws.com/{bucket}/{key}"
-    if verbose:  # pragma: no cover
-        print(f"  🪣 upload template to {s3_uri} ...")
-        aws_console = AWSConsole(aws_region=bsm.aws_region, bsm=bsm)
-        console_url = aws_console.s3.get_console_url(bucket=bucket, prefix=key)
-        print(f"    preview template in AWS S3 console: {console_url}")
-    bsm.s3_client.put_object(
-        Bucket=bucket,
-        Key=key,
-        Body=template,
-    )
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    ctx = get_context(bsm)
+    console_url = ctx.aws_console.s3.get_console_url(bucket=bucket, prefix=key)
+    is_indexed = ctx.upload_index.is_uploaded(s3_uri)
+    if is_indexed or is_s3_object_uploaded(
+        s3_client=ctx.s3_client,
+        bucket=bucket,
+        key=key,
+        md5=md5,
+    ):
+        reporter.on_event(
+            "upload_template",
+            f"  🪣 template is already uploaded to {s3_uri}, skip upload\n"
+            f"    preview template in AWS S3 console: {console_url}",
+            s3_uri=s3_uri,
+            uploaded=False,
+        )
+    else:
+        reporter.on_event(
+            "upload_template",
+            f"  🪣 upload template to {s3_uri} ...\n"
+            f"    preview template in AWS S3 console: {console_url}",
+            s3_uri=s3_uri,
+            uploaded=True,
+        )
+        ctx.s3_client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=template,
+        )
+    if is_indexed is False:
+        ctx.upload_index.mark_uploaded(s3_uri)
     return template_url
 
 
@@ -76,6 +262,7 @@ def resolve_template_kwargs(
     bucket: T.Optional[str] = NOTHING,
     prefix: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_TEMPLATE,
     verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
 ):
     if template is NOTHING:
         return
@@ -90,6 +277,7 @@ def resolve_template_kwargs(
             bucket=bucket,
             prefix=prefix,
             verbose=verbose,
+            reporter=reporter,
         )
         kwargs["template_url"] = template_url
     elif sys.getsizeof(template) > TEMPLATE_BODY_SIZE_LIMIT:
@@ -108,6 +296,7 @@ def resolve_stack_policy_kwargs(
     bucket: T.Optional[str] = None,
     prefix: T.Optional[str] = DEFAULT_S3_PREFIX_FOR_STACK_POLICY,
     verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
 ):
     if stack_policy is NOTHING:
         return
@@ -119,6 +308,7 @@ def resolve_stack_policy_kwargs(
             bucket=bucket,
             prefix=prefix,
             verbose=verbose,
+            reporter=reporter,
         )
         kwargs["stack_policy_url"] = policy_url
     elif sys.getsizeof(stack_policy) > STACK_POLICY_SIZE_LIMIT:
@@ -23,3 +23,19 @@ class CreateStackChangeSetFailedError(Exception):
 
 class DeployStackInstanceFailedError(Exception):
     pass
+
+
+class StackDependencyCycleError(Exception):
+    pass
+
+
+class UpstreamStackFailedError(Exception):
+    pass
+
+
+class PlanArtifactNotApplicableError(Exception):
+    pass
+
+
+class UnresolvableExportNameError(Exception):
+    pass
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+"""
+The cached index of the exported output values of an account and region,
+to resolve the ``Fn::ImportValue`` of a template and to find who imports an
+export, without paginating ``list_exports`` on every deployment.
+
+Usage example::
+
+    from aws_cloudformation.exports import get_exports_index
+
+    index = get_exports_index(bsm)
+    index.get_value("my-vpc-id")
+    index.resolve_import_values(template)
+    index.get_importing_stacks("my-vpc-id")
+
+:func:`~aws_cloudformation.deploy.deploy_stack` and
+:func:`~aws_cloudformation.deploy.remove_stack` invalidate the index when the
+stack produces exports, and forget the cached importing stacks of the exports
+the stack imports.
+"""
+
+import typing as T
+import time
+import weakref
+import threading
+
+from boto_session_manager import BotoSesManager
+
+from . import exc
+from .stack import Export
+from .better_boto.stacks import list_exports, list_imports
+from .dependency import find_import_values, find_export_names
+
+
+DEFAULT_EXPORTS_INDEX_TTL = 300
+
+
+class ExportsIndex:
+    """
+    The exports of one account and region, loaded by one paginated
+    ``list_exports`` sweep and trusted for ``ttl`` seconds. The importing
+    stacks of an export are loaded by ``list_imports`` on demand, and cached
+    with the same ttl.
+
+    Don't create it directly, use :func:`get_exports_index`.
+
+    :param bsm: the boto session manager
+    :param ttl: how long (in seconds) the loaded exports are trusted
+    """
+
+    def __init__(
+        self,
+        bsm: BotoSesManager,
+        ttl: int = DEFAULT_EXPORTS_INDEX_TTL,
+    ):
+        # the cache is keyed by bsm, don't keep it alive
+        self._bsm_ref = weakref.ref(bsm)
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._loaded_at: T.Optional[float] = None
+        self._exports: T.Dict[str, Export] = dict()
+        self._by_stack_id: T.Dict[str, T.List[Export]] = dict()
+        self._imports: T.Dict[str, T.Tuple[float, T.List[str]]] = dict()
+
+    @property
+    def bsm(self) -> BotoSesManager:
+        return self._bsm_ref()
+
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_expired(self) -> bool:
+        return (self._loaded_at is None) or (
+            (time.time() - self._loaded_at) > self.ttl
+        )
+
+    def load(self):
+        """
+        Load all the exports by ``list_exports``.
+        """
+        with self._lock:
+            exports = dict()
+            by_stack_id = dict()
+            for export in list_exports(bsm=self.bsm):
+                exports[export.name] = export
+                by_stack_id.setdefault(export.exporting_stack_id, []).append(export)
+            self._exports = exports
+            self._by_stack_id = by_stack_id
+            self._imports.clear()
+            self._loaded_at = time.time()
+
+    def _get_exports(self) -> T.Dict[str, Export]:
+        if self.is_expired():
+            with self._lock:
+                if self.is_expired():
+                    self.load()
+        return self._exports
+
+    def invalidate(self):
+        """
+        Forget everything, the next lookup loads the exports again.
+        """
+        with self._lock:
+            self._loaded_at = None
+            self._exports = dict()
+            self._by_stack_id = dict()
+            self._imports.clear()
+
+    def invalidate_stack(
+        self,
+        stack_name_or_id: str,
+        export_names: T.Optional[T.Iterable[str]] = None,
+    ) -> bool:
+        """
+        Invalidate the index if the stack has exports in the index, or it
+        declares any export.
+
+        :param stack_name_or_id: the stack name or stack id
+        :param export_names: the export names the stack declares
+
+        :return: whether the index is invalidated
+        """
+        with self._lock:
+            if self.is_loaded() is False:
+                return False
+            stale = bool(export_names) or any(
+                stack_name_or_id in (stack_id, exports[0].exporting_stack_name)
+                for stack_id, exports in self._by_stack_id.items()
+            )
+            if stale:
+                self.invalidate()
+            return stale
+
+    def invalidate_imports(
+        self,
+        export_names: T.Optional[T.Iterable[str]] = None,
+    ):
+        """
+        Forget the cached importing stacks of the given exports, because a
+        stack that imports them is deployed or removed.
+
+        :param export_names: the export names the stack imports, None means
+            unknown, then all the cached importing stacks are forgotten.
+        """
+        with self._lock:
+            if export_names is None:
+                self._imports.clear()
+            else:
+                for export_name in export_names:
+                    self._imports.pop(export_name, None)
+
+    def get_export(self, export_name: str) -> T.Optional[Export]:
+        return self._get_exports().get(export_name)
+
+    def get_value(self, export_name: str) -> T.Optional[str]:
+        """
+        The current value of the export, None if it doesn't exist.
+        """
+        export = self.get_export(export_name)
+        return None if export is None else export.value
+
+    def get_stack_exports(self, stack_name_or_id: str) -> T.List[Export]:
+        """
+        The exports of the given stack.
+        """
+        self._get_exports()
+        with self._lock:
+            for stack_id, exports in self._by_stack_id.items():
+                if stack_name_or_id in (stack_id, exports[0].exporting_stack_name):
+                    return list(exports)
+        return []
+
+    def resolve_import_values(self, template: str) -> T.Dict[str, T.Optional[str]]:
+        """
+        The current value of every literal ``Fn::ImportValue`` in the template,
+        None if the export doesn't exist yet.
+
+        :param template: CloudFormation template JSON or Yaml body in text
+        """
+        return {
+            export_name: self.get_value(export_name)
+            for export_name in sorted(find_import_values(template, strict=False))
+        }
+
+    def get_importing_stacks(self, export_name: str) -> T.List[str]:
+        """
+        The names of the stacks that import the export.
+        """
+        cached = self._imports.get(export_name)
+        if cached is not None and (time.time() - cached[0]) <= self.ttl:
+            return cached[1]
+        stack_names = list_imports(bsm=self.bsm, export_name=export_name)
+        self._imports[export_name] = (time.time(), stack_names)
+        return stack_names
+
+    def find_removed_exports_in_use(
+        self,
+        stack_name_or_id: str,
+        template: str,
+    ) -> T.Dict[str, T.List[str]]:
+        """
+        Find the exports the stack has now, but the new template doesn't
+        declare, and are still imported by other stacks. Deploying the
+        template would fail with "export ... is in use".
+
+        If an export name in the new template can't be resolved, it is not
+        known which exports are removed, nothing is reported.
+
+        :param stack_name_or_id: the stack to deploy
+        :param template: the new CloudFormation template body
+
+        :return: export name -> importing stack names
+        """
+        try:
+            new_export_names = find_export_names(template)
+        except exc.UnresolvableExportNameError:
+            return {}
+        in_use = dict()
+        for export in self.get_stack_exports(stack_name_or_id):
+            if export.name in new_export_names:
+                continue
+            stack_names = self.get_importing_stacks(export.name)
+            if stack_names:
+                in_use[export.name] = stack_names
+        return in_use
+
+
+_exports_index_cache: "weakref.WeakKeyDictionary[BotoSesManager, ExportsIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+_exports_index_cache_lock = threading.Lock()
+
+
+def get_exports_index(
+    bsm: BotoSesManager,
+    ttl: T.Optional[int] = None,
+) -> ExportsIndex:
+    """
+    Get the :class:`ExportsIndex` of the ``bsm``, create it if not exists.
+
+    :param bsm: the boto session manager
+    :param ttl: if given, update the ttl of the index
+    """
+    index = _exports_index_cache.get(bsm)
+    if index is None:
+        with _exports_index_cache_lock:
+            index = _exports_index_cache.get(bsm)
+            if index is None:
+                index = ExportsIndex(bsm=bsm)
+                _exports_index_cache[bsm] = index
+    if ttl is not None:
+        index.ttl = ttl
+    return index
+
+
+def invalidate_stack_exports(
+    bsm: BotoSesManager,
+    stack_name_or_id: str,
+    export_names: T.Optional[T.Iterable[str]] = None,
+    import_values: T.Optional[T.Iterable[str]] = None,
+) -> bool:
+    """
+    Invalidate the cached exports index of the ``bsm`` after the stack is
+    deployed or removed, if the stack produces exports. The cached importing
+    stacks of the exports the stack imports are always forgotten.
+
+    :param bsm: the boto session manager
+    :param stack_name_or_id: the stack name or stack id
+    :param export_names: the export names the stack declares, None means
+        unknown (for example, the template is an S3 uri), then the index is
+        always invalidated.
+    :param import_values: the export names the stack imports, None means
+        unknown, then all the cached importing stacks are forgotten.
+
+    :return: whether the index is invalidated
+    """
+    index = _exports_index_cache.get(bsm)
+    if index is None:
+        return False
+    index.invalidate_imports(export_names=import_values)
+    if index.is_loaded() is False:
+        return False
+    if export_names is None:
+        index.invalidate()
+        return True
+    return index.invalidate_stack(
+        stack_name_or_id=stack_name_or_id,
+        export_names=export_names,
+    )
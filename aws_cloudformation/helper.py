@@ -5,6 +5,7 @@ import enum
 import random
 import hashlib
 from func_args import NOTHING
+from botocore.exceptions import ClientError
 
 
 def md5_of_text(text: str) -> str:
@@ -29,3 +30,23 @@ def get_enum_by_name(enum_class: T.Type[enum.Enum], name: T.Optional[str]):
 
 def get_true_flag_count(args: T.List[T.Optional[bool]]) -> int:
     return sum([False if arg is NOTHING else arg for arg in args])
+
+
+_throttling_error_codes = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "RequestThrottled",
+    "RequestThrottledException",
+}
+
+
+def is_throttling_error(e: Exception) -> bool:
+    """
+    Is it a boto3 API call throttling error.
+    """
+    if isinstance(e, ClientError):
+        return e.response.get("Error", {}).get("Code") in _throttling_error_codes
+    return False
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+"""
+The in-memory inventory of all the stacks in one account and region, with
+indexes by status, tag, root / parent stack and export name, so the queries
+don't call ``describe_stacks`` again and again.
+
+Usage example::
+
+    inventory = StackInventory()
+    inventory.refresh(bsm)  # full describe_stacks sweep
+    stacks = inventory.find(
+        status=StackStatusEnum.UPDATE_ROLLBACK_FAILED,
+        tags={"team": "data"},
+    )
+    ...
+    # later, only the new and changed stacks are described again
+    inventory.refresh(bsm)
+"""
+
+import typing as T
+import bisect
+import threading
+import dataclasses
+from datetime import datetime
+
+from .stack import StackStatusEnum, Stack
+from .better_boto.stacks import (
+    LIVE_STACK_STATUS_FILTER,
+    describe_stacks,
+    list_stacks,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+
+
+DEFAULT_FULL_SWEEP_RATIO = 0.2
+"""
+In incremental refresh, if more than this ratio of the stacks are changed,
+one paginated ``describe_stacks`` sweep is cheaper than describing them
+one by one.
+"""
+
+
+@dataclasses.dataclass
+class RefreshResult:
+    """
+    What is changed in the inventory by :meth:`StackInventory.refresh`.
+
+    :param added: the new stacks
+    :param updated: the stacks whose status or last updated time changed
+    :param removed: the stacks that are deleted
+    :param full_sweep: whether a full ``describe_stacks`` sweep is used
+    """
+
+    added: T.List[Stack] = dataclasses.field(default_factory=list)
+    updated: T.List[Stack] = dataclasses.field(default_factory=list)
+    removed: T.List[Stack] = dataclasses.field(default_factory=list)
+    full_sweep: bool = dataclasses.field(default=False)
+
+    @property
+    def changed(self) -> T.List[Stack]:
+        return self.added + self.updated + self.removed
+
+
+def _version(stack: Stack) -> T.Tuple[StackStatusEnum, T.Optional[datetime]]:
+    return stack.status, stack.last_updated_time
+
+
+class StackInventory:
+    """
+    The indexed stacks (except the deleted ones) of one account and region.
+    All the queries are dictionary lookups, it is thread safe.
+
+    :param full_sweep_ratio: see :data:`DEFAULT_FULL_SWEEP_RATIO`
+    """
+
+    def __init__(
+        self,
+        full_sweep_ratio: float = DEFAULT_FULL_SWEEP_RATIO,
+    ):
+        self.full_sweep_ratio = full_sweep_ratio
+        self.last_refresh_time: T.Optional[datetime] = None
+        self._lock = threading.RLock()
+        self._stacks: T.Dict[str, Stack] = dict()
+        self._by_name: T.Dict[str, str] = dict()
+        self._by_status: T.Dict[StackStatusEnum, T.Set[str]] = dict()
+        self._by_tag: T.Dict[T.Tuple[str, str], T.Set[str]] = dict()
+        self._by_tag_key: T.Dict[str, T.Set[str]] = dict()
+        self._by_root_id: T.Dict[str, T.Set[str]] = dict()
+        self._by_parent_id: T.Dict[str, T.Set[str]] = dict()
+        self._by_export_name: T.Dict[str, str] = dict()
+        # built on demand by the name prefix query
+        self._sorted_names: T.Optional[T.List[str]] = None
+
+    # --------------------------------------------------------------------------
+    # maintain the indexes
+    # --------------------------------------------------------------------------
+    def _add(self, stack: Stack):
+        self._discard(stack.id)
+        self._stacks[stack.id] = stack
+        self._by_name[stack.name] = stack.id
+        self._by_status.setdefault(stack.status, set()).add(stack.id)
+        for key, value in stack.tags.items():
+            self._by_tag.setdefault((key, value), set()).add(stack.id)
+            self._by_tag_key.setdefault(key, set()).add(stack.id)
+        if stack.root_id is not None:
+            self._by_root_id.setdefault(stack.root_id, set()).add(stack.id)
+        if stack.parent_id is not None:
+            self._by_parent_id.setdefault(stack.parent_id, set()).add(stack.id)
+        for output in stack.outputs.values():
+            if output.export_name is not None:
+                self._by_export_name[output.export_name] = stack.id
+        self._sorted_names = None
+
+    @staticmethod
+    def _discard_from(index: T.Dict[T.Any, T.Set[str]], key, stack_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(stack_id)
+            if len(ids) == 0:
+                del index[key]
+
+    def _discard(self, stack_id: str) -> T.Optional[Stack]:
+        stack = self._stacks.pop(stack_id, None)
+        if stack is None:
+            return None
+        if self._by_name.get(stack.name) == stack_id:
+            del self._by_name[stack.name]
+        self._discard_from(self._by_status, stack.status, stack_id)
+        for key, value in stack.tags.items():
+            self._discard_from(self._by_tag, (key, value), stack_id)
+            self._discard_from(self._by_tag_key, key, stack_id)
+        self._discard_from(self._by_root_id, stack.root_id, stack_id)
+        self._discard_from(self._by_parent_id, stack.parent_id, stack_id)
+        for output in stack.outputs.values():
+            if self._by_export_name.get(output.export_name) == stack_id:
+                del self._by_export_name[output.export_name]
+        self._sorted_names = None
+        return stack
+
+    def _full_sweep(self, bsm: "BotoSesManager") -> RefreshResult:
+        result = RefreshResult(full_sweep=True)
+        old_stacks = self._stacks
+        self._stacks = dict()
+        for index in [
+            self._by_name,
+            self._by_status,
+            self._by_tag,
+            self._by_tag_key,
+            self._by_root_id,
+            self._by_parent_id,
+            self._by_export_name,
+        ]:
+            index.clear()
+        for stack in describe_stacks(bsm=bsm):
+            if stack.is_live() is False:  # pragma: no cover
+                continue
+            old_stack = old_stacks.pop(stack.id, None)
+            if old_stack is None:
+                result.added.append(stack)
+            elif _version(old_stack) != _version(stack):
+                result.updated.append(stack)
+            self._add(stack)
+        result.removed.extend(old_stacks.values())
+        return result
+
+    def refresh(
+        self,
+        bsm: "BotoSesManager",
+        full: bool = False,
+    ) -> RefreshResult:
+        """
+        Refresh the inventory.
+
+        The first refresh is a full ``describe_stacks`` sweep. After that,
+        it uses the cheap ``list_stacks`` to find the new, changed (by status
+        and ``last_updated_time``) and deleted stacks, and only describes
+        the new and changed ones.
+
+        :param bsm: the boto session manager of the account and region
+        :param full: force a full ``describe_stacks`` sweep
+        """
+        with self._lock:
+            refresh_time = datetime.utcnow()
+            if full or self.last_refresh_time is None:
+                result = self._full_sweep(bsm)
+                self.last_refresh_time = refresh_time
+                return result
+
+            summaries = {
+                stack.id: stack
+                for stack in list_stacks(
+                    bsm=bsm,
+                    status_filter=LIVE_STACK_STATUS_FILTER,
+                )
+            }
+            changed_ids = [
+                stack_id
+                for stack_id, summary in summaries.items()
+                if stack_id not in self._stacks
+                or _version(self._stacks[stack_id]) != _version(summary)
+            ]
+            if len(changed_ids) > self.full_sweep_ratio * max(len(summaries), 1):
+                result = self._full_sweep(bsm)
+                self.last_refresh_time = refresh_time
+                return result
+
+            result = RefreshResult()
+            for stack_id in list(self._stacks):
+                if stack_id not in summaries:
+                    result.removed.append(self._discard(stack_id))
+            for stack_id in changed_ids:
+                stack = describe_stacks(bsm=bsm, name=stack_id).one_or_none()
+                if stack is None or stack.is_live() is False:  # pragma: no cover
+                    removed = self._discard(stack_id)
+                    if removed is not None:
+                        result.removed.append(removed)
+                    continue
+                if stack_id in self._stacks:
+                    result.updated.append(stack)
+                else:
+                    result.added.append(stack)
+                self._add(stack)
+            self.last_refresh_time = refresh_time
+            return result
+
+    # --------------------------------------------------------------------------
+    # query
+    # --------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._stacks)
+
+    def __iter__(self) -> T.Iterator[Stack]:
+        with self._lock:
+            return iter(list(self._stacks.values()))
+
+    def __contains__(self, name_or_id: str) -> bool:
+        return self.get(name_or_id) is not None
+
+    def get(self, name_or_id: str) -> T.Optional[Stack]:
+        """
+        Get a stack by the stack name or stack id.
+        """
+        with self._lock:
+            stack_id = self._by_name.get(name_or_id, name_or_id)
+            return self._stacks.get(stack_id)
+
+    def get_by_export_name(self, export_name: str) -> T.Optional[Stack]:
+        """
+        Get the stack that exports the given ``Outputs.Export.Name``.
+        """
+        with self._lock:
+            stack_id = self._by_export_name.get(export_name)
+            return None if stack_id is None else self._stacks.get(stack_id)
+
+    def _ids_by_name_prefix(self, name_prefix: str) -> T.Set[str]:
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._by_name)
+        names = self._sorted_names
+        ids = set()
+        i = bisect.bisect_left(names, name_prefix)
+        while i < len(names) and names[i].startswith(name_prefix):
+            ids.add(self._by_name[names[i]])
+            i += 1
+        return ids
+
+    def find(
+        self,
+        status: T.Optional[
+            T.Union[str, StackStatusEnum, T.Iterable[T.Union[str, StackStatusEnum]]]
+        ] = None,
+        tags: T.Optional[T.Dict[str, T.Optional[str]]] = None,
+        root_id: T.Optional[str] = None,
+        parent_id: T.Optional[str] = None,
+        name_prefix: T.Optional[str] = None,
+    ) -> T.List[Stack]:
+        """
+        Find the stacks match all the given conditions, sorted by name.
+
+        :param status: a status (the enum or its value, for example
+            ``"UPDATE_ROLLBACK_FAILED"``), or any of the status
+        :param tags: the tag key value pairs, a None value only requires
+            the tag key exists
+        :param root_id: the root stack id of nested stacks
+        :param parent_id: the parent stack id of nested stacks
+        :param name_prefix: the stack name prefix
+        """
+        with self._lock:
+            candidates: T.List[T.Set[str]] = list()
+            if status is not None:
+                # StackStatusEnum is also a str
+                if isinstance(status, str):
+                    status = [status]
+                ids = set()
+                for s in status:
+                    ids.update(self._by_status.get(StackStatusEnum(s), set()))
+                candidates.append(ids)
+            if tags is not None:
+                for key, value in tags.items():
+                    if value is None:
+                        candidates.append(self._by_tag_key.get(key, set()))
+                    else:
+                        candidates.append(self._by_tag.get((key, value), set()))
+            if root_id is not None:
+                candidates.append(self._by_root_id.get(root_id, set()))
+            if parent_id is not None:
+                candidates.append(self._by_parent_id.get(parent_id, set()))
+            if name_prefix is not None:
+                candidates.append(self._ids_by_name_prefix(name_prefix))
+
+            if len(candidates) == 0:
+                ids = set(self._stacks)
+            else:
+                candidates.sort(key=len)
+                ids = set(candidates[0]).intersection(*candidates[1:])
+            stacks = [self._stacks[stack_id] for stack_id in ids]
+        return sorted(stacks, key=lambda stack: stack.name)
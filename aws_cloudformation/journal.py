@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+"""
+The append-only local journal of a multi-stack rollout. Each line is one
+:class:`JournalEntry`, it records the phase a stack reached: template
+uploaded, change set created, executed, stopped (or failed). If the runner
+dies halfway, run :func:`~aws_cloudformation.multi_deploy.deploy_stacks`
+again with the same journal, the completed stacks are skipped and the
+in-flight stacks are re-attached by their ``stack_id`` / ``change_set_id``.
+
+Usage example::
+
+    from aws_cloudformation.journal import DeployJournal
+
+    journal = DeployJournal(path="rollout-2024-01-01.jsonl")
+    deploy_stacks(specs, journal=journal)
+
+Use a new journal file for a new rollout.
+"""
+
+import typing as T
+import os
+import enum
+import json
+import threading
+import dataclasses
+from pathlib import Path
+from datetime import datetime, timezone
+
+from .reporter import BaseReporter, NoOpReporter
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+    from .stack import ChangeSet
+    from .change_set_tree import ChangeSetTree
+
+
+class DeployPhaseEnum(str, enum.Enum):
+    """
+    The phases of a stack deployment, in order.
+    """
+
+    UPLOADED = "UPLOADED"
+    CHANGE_SET_CREATED = "CHANGE_SET_CREATED"
+    EXECUTED = "EXECUTED"
+    STOPPED = "STOPPED"
+    FAILED = "FAILED"
+
+
+@dataclasses.dataclass
+class JournalEntry:
+    """
+    One line of the :class:`DeployJournal`.
+
+    :param aws_account_id: the AWS account id of the stack
+    :param aws_region: the AWS region of the stack
+    :param stack_name: the stack name
+    :param phase: the phase the stack reached
+    :param fingerprint: the deploy fingerprint of the stack spec, the entry
+        is only trusted when the spec didn't change, see
+        :func:`~aws_cloudformation.deploy_helpers.get_deploy_fingerprint`.
+        None (not reproducible, for example, an s3 uri template) is never
+        trusted.
+    :param stack_id: the stack id, if known
+    :param change_set_id: the change set id, if using change set
+    :param is_deploy_happened: see
+        :class:`~aws_cloudformation.deploy.DeployStackResponse`
+    :param is_create: see :class:`~aws_cloudformation.deploy.DeployStackResponse`
+    :param error: the error message if failed
+    :param time: when the entry is written, in ISO format
+    """
+
+    aws_account_id: str = dataclasses.field()
+    aws_region: str = dataclasses.field()
+    stack_name: str = dataclasses.field()
+    phase: DeployPhaseEnum = dataclasses.field()
+    fingerprint: T.Optional[str] = dataclasses.field(default=None)
+    stack_id: T.Optional[str] = dataclasses.field(default=None)
+    change_set_id: T.Optional[str] = dataclasses.field(default=None)
+    is_deploy_happened: T.Optional[bool] = dataclasses.field(default=None)
+    is_create: T.Optional[bool] = dataclasses.field(default=None)
+    error: T.Optional[str] = dataclasses.field(default=None)
+    time: T.Optional[str] = dataclasses.field(default=None)
+
+    @property
+    def key(self) -> T.Tuple[str, str, str]:
+        return self.aws_account_id, self.aws_region, self.stack_name
+
+    def to_dict(self) -> dict:
+        data = dataclasses.asdict(self)
+        data["phase"] = self.phase.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JournalEntry":
+        data = dict(data)
+        data["phase"] = DeployPhaseEnum(data["phase"])
+        return cls(**data)
+
+
+class DeployJournal:
+    """
+    The append-only JSON lines journal. Each entry is flushed and synced to
+    the disk before :meth:`record` returns, a truncated last line (the
+    process is killed while writing) is ignored when reading. It is thread
+    safe, many stacks deploying in parallel share one journal.
+
+    :param path: the journal file
+    """
+
+    def __init__(self, path: T.Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._latest: T.Optional[T.Dict[T.Tuple[str, str, str], JournalEntry]] = None
+
+    def read(self) -> T.List[JournalEntry]:
+        """
+        Read all the entries, in the order they are written.
+        """
+        entries = list()
+        try:
+            lines = self.path.read_text().splitlines()
+        except FileNotFoundError:
+            return entries
+        for line in lines:
+            try:
+                entries.append(JournalEntry.from_dict(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                continue
+        return entries
+
+    def _get_latest(self) -> T.Dict[T.Tuple[str, str, str], JournalEntry]:
+        if self._latest is None:
+            self._latest = {entry.key: entry for entry in self.read()}
+        return self._latest
+
+    def record(self, entry: JournalEntry):
+        """
+        Append an entry to the journal.
+        """
+        if entry.time is None:
+            entry.time = datetime.now(timezone.utc).isoformat()
+        line = json.dumps(entry.to_dict()) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._get_latest()[entry.key] = entry
+
+    def get_entry(
+        self,
+        aws_account_id: str,
+        aws_region: str,
+        stack_name: str,
+    ) -> T.Optional[JournalEntry]:
+        """
+        The latest entry of the stack, None if it is not in the journal.
+        """
+        with self._lock:
+            return self._get_latest().get((aws_account_id, aws_region, stack_name))
+
+
+class JournalReporter(BaseReporter):
+    """
+    Turn the events of one :func:`~aws_cloudformation.deploy.deploy_stack`
+    into :class:`JournalEntry`, and forward everything to the inner reporter.
+
+    :param journal: the :class:`DeployJournal`
+    :param aws_account_id: the AWS account id of the stack
+    :param aws_region: the AWS region of the stack
+    :param stack_name: the stack name
+    :param fingerprint: the deploy fingerprint of the stack spec
+    :param reporter: the inner reporter, default report nothing
+    """
+
+    def __init__(
+        self,
+        journal: DeployJournal,
+        aws_account_id: str,
+        aws_region: str,
+        stack_name: str,
+        fingerprint: T.Optional[str] = None,
+        reporter: T.Optional[BaseReporter] = None,
+    ):
+        self.journal = journal
+        self.aws_account_id = aws_account_id
+        self.aws_region = aws_region
+        self.stack_name = stack_name
+        self.fingerprint = fingerprint
+        self.reporter = NoOpReporter() if reporter is None else reporter
+
+    def record(self, phase: DeployPhaseEnum, **kwargs):
+        self.journal.record(
+            JournalEntry(
+                aws_account_id=self.aws_account_id,
+                aws_region=self.aws_region,
+                stack_name=self.stack_name,
+                phase=phase,
+                fingerprint=self.fingerprint,
+                **kwargs,
+            )
+        )
+
+    def on_tick(
+        self,
+        attempt: int,
+        elapsed: int,
+        timeout: T.Union[int, float],
+        indent: int = 0,
+    ):
+        self.reporter.on_tick(attempt, elapsed, timeout, indent=indent)
+
+    def on_event(
+        self,
+        event: str,
+        message: str,
+        **data,
+    ):
+        if event == "upload_template":
+            self.record(DeployPhaseEnum.UPLOADED)
+        elif event == "create_change_set":
+            self.record(
+                DeployPhaseEnum.CHANGE_SET_CREATED,
+                stack_id=data.get("stack_id"),
+                change_set_id=data.get("change_set_id"),
+                is_create=data.get("is_create"),
+            )
+        elif event == "execute_change_set":
+            self.record(
+                DeployPhaseEnum.EXECUTED,
+                stack_id=data.get("stack_id"),
+                change_set_id=data.get("change_set_id"),
+                is_create=data.get("is_create"),
+            )
+        elif event in ("create_stack", "update_stack"):
+            self.record(
+                DeployPhaseEnum.EXECUTED,
+                stack_id=data.get("stack_id"),
+                is_create=event == "create_stack",
+            )
+        self.reporter.on_event(event, message, **data)
+
+    def on_change_set(
+        self,
+        change_set: "ChangeSet",
+        bsm: T.Optional["BotoSesManager"] = None,
+        include_nested_stack: bool = False,
+        tree: T.Optional["ChangeSetTree"] = None,
+    ):
+        self.reporter.on_change_set(
+            change_set,
+            bsm=bsm,
+            include_nested_stack=include_nested_stack,
+            tree=tree,
+        )
@@ -0,0 +1,1470 @@
+# -*- coding: utf-8 -*-
+
+"""
+Deploy (or remove) many AWS CloudFormation stacks concurrently, on top of
+:func:`~aws_cloudformation.deploy.deploy_stack` and
+:func:`~aws_cloudformation.deploy.remove_stack`. Stacks depending on each other
+can be scheduled by their exports / imports.
+
+It also has the two-phase "terraform plan / apply" of an environment:
+:func:`plan_stacks` creates the change sets of all the stacks concurrently,
+:func:`apply_stacks` asks for approval once and executes them in parallel.
+"""
+
+import typing as T
+import time
+import json
+import inspect
+import threading
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+
+from boto_session_manager import BotoSesManager
+from colorama import Fore, Style
+from func_args import NOTHING
+
+from . import exc, better_boto
+from .stack import (
+    Parameter,
+    Stack,
+    ChangeSetStatusEnum,
+    ChangeSetExecutionStatusEnum,
+)
+from .plan import Plan, PlanArtifact
+from .resource_change import ChangeActionEnum
+from .waiter import DelayStrategy
+from .reporter import BaseReporter, resolve_reporter
+from .context import get_context
+from .dependency import (
+    find_import_values,
+    find_export_names,
+    StackDag,
+    build_stack_dag,
+)
+from .exports import get_exports_index
+from .retry import call_with_retry
+from .deploy_helpers import get_deploy_fingerprint
+from .journal import DeployPhaseEnum, JournalEntry, DeployJournal, JournalReporter
+from .deploy import (
+    DEFAULT_UPDATE_DELAYS,
+    DEFAULT_UPDATE_TIMEOUT,
+    DEFAULT_CHANGE_SET_DELAYS,
+    DEFAULT_CHANGE_SET_TIMEOUT,
+    DeployStackResponse,
+    prompt_to_proceed,
+    deploy_stack,
+    plan_stack,
+    execute_stack_change_set,
+    remove_stack,
+)
+
+DEFAULT_MAX_WORKERS = 10
+# CloudFormation throttles per account per region, don't hammer the same one
+DEFAULT_MAX_PER_REGION = 5
+# the min interval between two shared describe_stacks sweeps when each
+# stack waits with its own DelayStrategy
+DEFAULT_MIN_SWEEP_INTERVAL = 1
+
+
+# the deploy_stack arguments that the concurrent runner owns, a spec cannot
+# override them, for example, a prompt in a worker thread would hang
+_runner_only_kwargs = {"skip_prompt", "verbose", "reporter", "multi_stack_waiter"}
+
+
+@dataclasses.dataclass
+class StackSpec:
+    """
+    Everything :func:`deploy_stacks` needs to deploy one stack.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object of the
+        target AWS account and region
+    :param stack_name: the stack name
+    :param template: CloudFormation template JSON or Yaml body in text, or the
+        s3 uri pointing to a CloudFormation template file.
+    :param bucket: if given, automatically upload template to S3 before deployment
+    :param parameters: list of :class:`aws_cloudformation.stack.Parameter` object
+    :param tags: key value dictionary for tags
+    :param kwargs: any other keyword arguments for
+        :func:`~aws_cloudformation.deploy.deploy_stack`, for example
+        ``include_named_iam=True``. It overrides the arguments given to
+        :func:`deploy_stacks`, except ``skip_prompt``, ``verbose``,
+        ``reporter`` and ``multi_stack_waiter``, they are always decided by
+        :func:`deploy_stacks` and ignored here.
+    :param depends_on: list of stack names in the same account and region
+        this stack has to wait for, in addition to the dependencies found
+        from the exports / imports.
+    """
+
+    bsm: BotoSesManager = dataclasses.field()
+    stack_name: str = dataclasses.field()
+    template: T.Optional[str] = dataclasses.field(default=NOTHING)
+    bucket: T.Optional[str] = dataclasses.field(default=NOTHING)
+    parameters: T.Optional[T.List[Parameter]] = dataclasses.field(default=NOTHING)
+    tags: T.Optional[T.Dict[str, str]] = dataclasses.field(default=NOTHING)
+    kwargs: dict = dataclasses.field(default_factory=dict)
+    depends_on: T.List[str] = dataclasses.field(default_factory=list)
+
+    def find_import_values(self) -> T.Optional[T.Set[str]]:
+        """
+        The export names the template imports, None if any of them can't be
+        resolved.
+        """
+        if self.template is NOTHING or self.template.startswith("s3://"):
+            return set()
+        try:
+            return find_import_values(self.template)
+        except exc.UnresolvableExportNameError:
+            return None
+
+    def find_export_names(self) -> T.Optional[T.Set[str]]:
+        """
+        The export names in the template, plus the ones in the live stack.
+        None if any of the export names in the template can't be resolved.
+        """
+        export_names = set()
+        if not (self.template is NOTHING or self.template.startswith("s3://")):
+            try:
+                export_names.update(find_export_names(self.template))
+            except exc.UnresolvableExportNameError:
+                return None
+        stack = better_boto.describe_live_stack(self.bsm, self.stack_name)
+        if stack is not None:
+            export_names.update(
+                output.export_name
+                for output in stack.outputs.values()
+                if output.export_name
+            )
+        return export_names
+
+    def get_fingerprint(self) -> T.Optional[str]:
+        """
+        The deploy fingerprint of this spec, see
+        :func:`~aws_cloudformation.deploy_helpers.get_deploy_fingerprint`.
+        """
+        keys = [
+            "include_iam",
+            "include_named_iam",
+            "include_macro",
+            "stack_policy",
+            "execution_role_arn",
+            "resource_types",
+            "rollback_configuration",
+            "notification_arns",
+        ]
+        return get_deploy_fingerprint(
+            template=self.template,
+            parameters=self.parameters,
+            tags=self.tags,
+            **{key: self.kwargs[key] for key in keys if key in self.kwargs},
+        )
+
+    def to_deploy_stack_kwargs(self, **defaults) -> dict:
+        kwargs = dict(defaults)
+        # the stateful delay strategy given to the runner is per stack
+        for key in ["delays", "change_set_delays"]:
+            if key in kwargs:
+                kwargs[key] = _delays_for_stack(kwargs[key], self.stack_name)
+        kwargs.update(
+            {k: v for k, v in self.kwargs.items() if k not in _runner_only_kwargs}
+        )
+        kwargs.update(
+            bsm=self.bsm,
+            stack_name=self.stack_name,
+            template=self.template,
+            bucket=self.bucket,
+            parameters=self.parameters,
+            tags=self.tags,
+        )
+        return kwargs
+
+
+@dataclasses.dataclass
+class StackDeployResult:
+    """
+    The deployment result of one :class:`StackSpec`.
+
+    :param spec: the :class:`StackSpec`
+    :param response: the :class:`~aws_cloudformation.deploy.DeployStackResponse`,
+        None if the deployment raised an error
+    :param error: the exception raised by the deployment, None if succeeded
+    :param elapsed: how long (in seconds) the deployment took
+    """
+
+    spec: StackSpec = dataclasses.field()
+    response: T.Optional[DeployStackResponse] = dataclasses.field(default=None)
+    error: T.Optional[Exception] = dataclasses.field(default=None)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    @property
+    def stack_name(self) -> str:
+        return self.spec.stack_name
+
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass
+class DeployStacksResponse:
+    """
+    The aggregate report of :func:`deploy_stacks`. The ``results`` are in the
+    same order as the input specs.
+    """
+
+    results: T.List[StackDeployResult] = dataclasses.field(default_factory=list)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    @property
+    def responses(self) -> T.List[T.Optional[DeployStackResponse]]:
+        return [result.response for result in self.results]
+
+    @property
+    def succeeded(self) -> T.List[StackDeployResult]:
+        return [result for result in self.results if result.is_success()]
+
+    @property
+    def failed(self) -> T.List[StackDeployResult]:
+        return [result for result in self.results if not result.is_success()]
+
+    @property
+    def deployed(self) -> T.List[StackDeployResult]:
+        """
+        Succeeded deployments that actually changed something.
+        """
+        return [
+            result
+            for result in self.succeeded
+            if result.response.is_deploy_happened
+        ]
+
+    def is_success(self) -> bool:
+        return len(self.failed) == 0
+
+
+def _grow_connection_pool(bsm: BotoSesManager, max_workers: int):
+    """
+    All the threads share the clients of the bsm, make the pool big enough.
+    It only grows, and it is called before the runner uses any client, see
+    :meth:`~aws_cloudformation.context.Context.set_max_pool_connections`.
+    """
+    ctx = get_context(bsm)
+    if ctx.max_pool_connections < max_workers:
+        ctx.set_max_pool_connections(max_workers)
+
+
+def _delays_for_stack(
+    delays: T.Union[int, float, DelayStrategy],
+    stack_name: str,
+) -> T.Union[int, float, DelayStrategy]:
+    """
+    See :meth:`~aws_cloudformation.waiter.DelayStrategy.for_stack`.
+    """
+    if isinstance(delays, DelayStrategy):
+        return delays.for_stack(stack_name)
+    return delays
+
+
+def _new_multi_stack_waiters(
+    specs: T.List[T.Union["StackSpec", "StackRemoveSpec"]],
+    region_keys: T.List[T.Tuple[str, str]],
+    delays: T.Union[int, float, DelayStrategy],
+    max_workers: int,
+) -> T.Dict[T.Tuple[str, str], better_boto.MultiStackWaiter]:
+    """
+    The stacks in the same account and region share one
+    :class:`~aws_cloudformation.better_boto.stacks.MultiStackWaiter`, so they
+    share the ``describe_stacks`` call. Also grow the connection pool of each
+    bsm for ``max_workers`` threads.
+
+    :return: region key -> ``MultiStackWaiter`` mapper
+    """
+    if isinstance(delays, DelayStrategy):
+        sweep_interval = DEFAULT_MIN_SWEEP_INTERVAL
+    else:
+        sweep_interval = delays
+    multi_stack_waiters = dict()
+    for spec, region_key in zip(specs, region_keys):
+        _grow_connection_pool(spec.bsm, max_workers)
+        if region_key not in multi_stack_waiters:
+            multi_stack_waiters[region_key] = better_boto.MultiStackWaiter(
+                bsm=spec.bsm,
+                delays=sweep_interval,
+            )
+    return multi_stack_waiters
+
+
+def get_region_key(bsm: BotoSesManager) -> T.Tuple[str, str]:
+    """
+    The (aws_account_id, aws_region) pair that CloudFormation uses to throttle.
+    """
+    return bsm.aws_account_id, bsm.aws_region
+
+
+class RegionLimiter:
+    """
+    Limit the number of concurrent jobs per AWS account and region.
+    """
+
+    def __init__(self, max_per_region: int):
+        self.max_per_region = max_per_region
+        self._lock = threading.Lock()
+        self._semaphores: T.Dict[T.Tuple[str, str], threading.BoundedSemaphore] = {}
+
+    def get(self, key: T.Tuple[str, str]) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = threading.BoundedSemaphore(
+                    self.max_per_region
+                )
+            return self._semaphores[key]
+
+
+def _report_result(reporter: BaseReporter, result: StackDeployResult):
+    if result.is_success():
+        if result.response.is_deploy_happened:
+            icon, status = "🟢", "deployed"
+        else:
+            icon, status = "🟡", "no change"
+    else:
+        icon, status = "🔴", f"failed: {result.error!r}"
+    reporter.on_event(
+        "stack_result",
+        f"  {icon} {Fore.CYAN}{result.stack_name}{Style.RESET_ALL} "
+        f"{status} in {result.elapsed:.1f} seconds",
+        stack_name=result.stack_name,
+        is_success=result.is_success(),
+        error=None if result.error is None else repr(result.error),
+        elapsed=result.elapsed,
+    )
+
+
+def _report_summary(reporter: BaseReporter, response: DeployStacksResponse):
+    reporter.on_event(
+        "done",
+        f"  deployed {len(response.deployed)}, "
+        f"no change {len(response.succeeded) - len(response.deployed)}, "
+        f"failed {len(response.failed)}, "
+        f"elapsed {response.elapsed:.1f} seconds\n"
+        f"  done",
+        n_deployed=len(response.deployed),
+        n_succeeded=len(response.succeeded),
+        n_failed=len(response.failed),
+        elapsed=response.elapsed,
+    )
+
+
+def resume_stack_deployment(
+    entry: JournalEntry,
+    deploy_stack_kwargs: dict,
+) -> T.Optional[DeployStackResponse]:
+    """
+    Continue a stack deployment from its last :class:`~aws_cloudformation.journal.JournalEntry`.
+
+    - stopped: it is done, return the recorded result.
+    - change set created / executed: re-attach to the change set by its id,
+        execute it if it is not executed yet, then wait for the stack.
+    - executed without change set: wait for the stack if it is still in
+        progress.
+
+    :param entry: the latest journal entry of the stack
+    :param deploy_stack_kwargs: the arguments of
+        :func:`~aws_cloudformation.deploy.deploy_stack` for this stack
+
+    :return: the :class:`~aws_cloudformation.deploy.DeployStackResponse`,
+        or None if it has to be deployed again from the beginning.
+    """
+    kwargs = deploy_stack_kwargs
+    bsm = kwargs["bsm"]
+    reporter = kwargs.get("reporter") or resolve_reporter(verbose=False)
+    if entry.phase == DeployPhaseEnum.STOPPED:
+        return DeployStackResponse(
+            is_deploy_happened=bool(entry.is_deploy_happened),
+            is_create=entry.is_create,
+            stack_id=entry.stack_id,
+            change_set_id=entry.change_set_id,
+        )
+
+    def wait_stack(stack_id: str, change_set_id: T.Optional[str] = None):
+        if kwargs.get("wait", True):
+            better_boto.wait_create_or_update_stack_to_finish(
+                bsm=bsm,
+                stack_name=stack_id,
+                wait_until_exec_stopped=kwargs.get(
+                    "wait_until_exec_stopped_on_failure", False
+                ),
+                delays=kwargs.get("delays", DEFAULT_UPDATE_DELAYS),
+                timeout=kwargs.get("timeout", DEFAULT_UPDATE_TIMEOUT),
+                verbose=False,
+                multi_stack_waiter=kwargs.get("multi_stack_waiter"),
+                reporter=reporter,
+            )
+        return DeployStackResponse(
+            is_deploy_happened=True,
+            is_create=entry.is_create,
+            stack_id=stack_id,
+            change_set_id=change_set_id,
+        )
+
+    if (
+        entry.phase
+        in (DeployPhaseEnum.CHANGE_SET_CREATED, DeployPhaseEnum.EXECUTED)
+        and entry.change_set_id
+    ):
+        change_set = better_boto.describe_change_set(
+            bsm=bsm,
+            change_set_name=entry.change_set_id,
+        )
+        if change_set is None:
+            return None
+        if change_set.status in (
+            ChangeSetStatusEnum.CREATE_PENDING,
+            ChangeSetStatusEnum.CREATE_IN_PROGRESS,
+        ):
+            try:
+                change_set = better_boto.wait_create_change_set_to_finish(
+                    bsm=bsm,
+                    stack_name=change_set.stack_id,
+                    change_set_id=change_set.change_set_id,
+                    delays=kwargs.get("change_set_delays", DEFAULT_CHANGE_SET_DELAYS),
+                    timeout=kwargs.get(
+                        "change_set_timeout", DEFAULT_CHANGE_SET_TIMEOUT
+                    ),
+                    verbose=False,
+                    reporter=reporter,
+                )
+            except exc.CreateStackChangeSetButNotChangeError:
+                return DeployStackResponse()
+        if change_set.execution_status == ChangeSetExecutionStatusEnum.AVAILABLE:
+            reporter.on_event(
+                "execute_change_set",
+                f"  execute change set {change_set.change_set_id} ...",
+                stack_name=change_set.stack_name,
+                stack_id=change_set.stack_id,
+                change_set_id=change_set.change_set_id,
+                is_create=entry.is_create,
+            )
+            call_with_retry(
+                better_boto.execute_change_set,
+                retry_policy=kwargs.get("retry_policy"),
+                reporter=reporter,
+                bsm=bsm,
+                change_set_name=change_set.change_set_id,
+            )
+        elif change_set.execution_status not in (
+            ChangeSetExecutionStatusEnum.EXECUTE_IN_PROGRESS,
+            ChangeSetExecutionStatusEnum.EXECUTE_COMPLETE,
+        ):
+            return None
+        return wait_stack(change_set.stack_id, change_set.change_set_id)
+
+    if entry.phase == DeployPhaseEnum.EXECUTED and entry.stack_id:
+        stack = better_boto.describe_live_stack(bsm=bsm, name=entry.stack_id)
+        if stack is not None and stack.is_in_progress():
+            return wait_stack(stack.id)
+    # create / update again, it is idempotent
+    return None
+
+
+def resolve_stack_dag(
+    specs: T.List[StackSpec],
+    region_keys: T.List[T.Tuple[str, str]],
+    detect_dependency: bool,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> StackDag:
+    """
+    Build the :class:`~aws_cloudformation.dependency.StackDag` of the specs.
+
+    :param detect_dependency: if True, find the dependencies from the
+        ``Fn::ImportValue`` in the templates and the exports of the templates
+        and the live stacks; otherwise only the ``StackSpec.depends_on`` is used.
+        A stack with an export name that can't be resolved, for example
+        built by ``Fn::Sub``, is deployed in the serial order.
+    """
+    if detect_dependency:
+        imports = [spec.find_import_values() for spec in specs]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            exports = list(
+                executor.map(lambda spec: spec.find_export_names(), specs)
+            )
+    else:
+        imports = [set() for _ in specs]
+        exports = [set() for _ in specs]
+    return build_stack_dag(
+        region_keys=region_keys,
+        stack_names=[spec.stack_name for spec in specs],
+        imports=imports,
+        exports=exports,
+        depends_on=[spec.depends_on for spec in specs],
+    )
+
+
+def deploy_stacks(
+    specs: T.Iterable[StackSpec],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_region: int = DEFAULT_MAX_PER_REGION,
+    detect_dependency: bool = False,
+    skip_plan: bool = False,
+    plan_nested_stack: bool = True,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    change_set_delays: T.Union[int, float, DelayStrategy] = DEFAULT_CHANGE_SET_DELAYS,
+    change_set_timeout: T.Union[int, float] = DEFAULT_CHANGE_SET_TIMEOUT,
+    skip_unchanged: bool = False,
+    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+    journal: T.Optional[DeployJournal] = None,
+) -> DeployStacksResponse:
+    """
+    Deploy many stacks concurrently. Each stack is deployed by
+    :func:`~aws_cloudformation.deploy.deploy_stack` in a bounded thread pool,
+    there's no prompt, and one failed stack doesn't stop the others.
+
+    A stack starts as soon as all its upstream stacks succeeded, it doesn't
+    wait for the other stacks in the same topological level. If any of
+    its upstream stacks failed, it is not deployed and the error is
+    :class:`~aws_cloudformation.exc.UpstreamStackFailedError`.
+
+    :param specs: list of :class:`StackSpec`
+    :param max_workers: the max number of stacks deploying at the same time
+    :param max_per_region: the max number of stacks deploying at the same time
+        in the same AWS account and region
+    :param detect_dependency: if True, find the dependencies between stacks
+        from the exports / imports, see :func:`resolve_stack_dag`. The
+        ``StackSpec.depends_on`` is always respected. Note that the dependency
+        only makes sense when ``wait`` is True.
+    :param skip_plan: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param plan_nested_stack: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param wait: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param delays: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param timeout: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param wait_until_exec_stopped_on_failure: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param change_set_delays: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param change_set_timeout: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param skip_unchanged: see :func:`~aws_cloudformation.deploy.deploy_stack`,
+        it is useful when most of the stacks are not changed.
+    :param verbose: whether you want to log the progress of each stack
+        to console. The detailed log of each ``deploy_stack`` is always turned
+        off, because they are interleaved.
+    :param reporter: where the progress of each stack goes, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+    :param journal: the :class:`~aws_cloudformation.journal.DeployJournal`
+        to record the phase of each stack. If the journal already has the
+        stack with the same deploy fingerprint, for example, the previous run
+        died halfway, the deployment resumes from it, see
+        :func:`resume_stack_deployment`.
+
+    :return: a :class:`DeployStacksResponse` object.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    specs = list(specs)
+    defaults = dict(
+        skip_plan=skip_plan,
+        plan_nested_stack=plan_nested_stack,
+        wait=wait,
+        delays=delays,
+        timeout=timeout,
+        wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
+        change_set_delays=change_set_delays,
+        change_set_timeout=change_set_timeout,
+        skip_unchanged=skip_unchanged,
+        skip_prompt=True,
+        verbose=False,
+    )
+    limiter = RegionLimiter(max_per_region)
+    # resolve the region key before going parallel, it may need a sts call
+    region_keys = [get_region_key(spec.bsm) for spec in specs]
+    multi_stack_waiters = _new_multi_stack_waiters(
+        specs=specs,
+        region_keys=region_keys,
+        delays=delays,
+        max_workers=max_workers,
+    )
+    dag = resolve_stack_dag(
+        specs=specs,
+        region_keys=region_keys,
+        detect_dependency=detect_dependency,
+        max_workers=max_workers,
+    )
+
+    def log_result(result: StackDeployResult):
+        _report_result(reporter, result)
+
+    def run(node: int) -> StackDeployResult:
+        spec = specs[node]
+        with limiter.get(region_keys[node]):
+            start = time.time()
+            result = StackDeployResult(spec=spec)
+            kwargs = spec.to_deploy_stack_kwargs(
+                multi_stack_waiter=multi_stack_waiters[region_keys[node]],
+                **defaults,
+            )
+            journal_reporter = None
+            if journal is not None:
+                journal_reporter = JournalReporter(
+                    journal=journal,
+                    aws_account_id=region_keys[node][0],
+                    aws_region=region_keys[node][1],
+                    stack_name=spec.stack_name,
+                    fingerprint=spec.get_fingerprint(),
+                    reporter=kwargs.get("reporter"),
+                )
+                kwargs["reporter"] = journal_reporter
+            try:
+                if journal_reporter is not None:
+                    entry = journal.get_entry(*region_keys[node], spec.stack_name)
+                    # None means not reproducible, always deploy again
+                    if (
+                        entry is not None
+                        and journal_reporter.fingerprint is not None
+                        and entry.fingerprint == journal_reporter.fingerprint
+                    ):
+                        reporter.on_event(
+                            "resume_stack",
+                            f"  ⏩ {Fore.CYAN}{spec.stack_name}{Style.RESET_ALL} "
+                            f"resume from {entry.phase.value.lower()}",
+                            stack_name=spec.stack_name,
+                            phase=entry.phase.value,
+                        )
+                        result.response = resume_stack_deployment(entry, kwargs)
+                if result.response is None:
+                    result.response = deploy_stack(**kwargs)
+                if journal_reporter is not None:
+                    journal_reporter.record(
+                        DeployPhaseEnum.STOPPED,
+                        stack_id=result.response.stack_id,
+                        change_set_id=result.response.change_set_id,
+                        is_deploy_happened=result.response.is_deploy_happened,
+                        is_create=result.response.is_create,
+                    )
+            except Exception as e:
+                result.error = e
+                if journal_reporter is not None:
+                    journal_reporter.record(DeployPhaseEnum.FAILED, error=repr(e))
+            result.elapsed = time.time() - start
+        log_result(result)
+        return result
+
+    levels = dag.topological_levels()
+    lines = [f"🚀 {Fore.CYAN}Deploy{Style.RESET_ALL} {len(specs)} stacks ..."]
+    if len(levels) > 1:
+        for ith, level in enumerate(levels, start=1):
+            stack_names = ", ".join(specs[node].stack_name for node in level)
+            lines.append(f"  level {ith}: {stack_names}")
+    reporter.on_event(
+        "deploy_stacks",
+        "\n".join(lines),
+        levels=[[specs[node].stack_name for node in level] for level in levels],
+    )
+
+    start = time.time()
+    results: T.List[T.Optional[StackDeployResult]] = [None] * len(specs)
+    pending = set(range(len(specs)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = dict()
+
+        def submit_ready():
+            # keep looping, skipping a stack may unblock (skip) its downstream
+            changed = True
+            while changed:
+                changed = False
+                for node in sorted(pending):
+                    upstream_results = [results[up] for up in dag.upstream[node]]
+                    failed = [
+                        result.stack_name
+                        for result in upstream_results
+                        if (result is not None) and (not result.is_success())
+                    ]
+                    if failed:
+                        results[node] = StackDeployResult(
+                            spec=specs[node],
+                            error=exc.UpstreamStackFailedError(
+                                f"upstream stacks failed: {failed}"
+                            ),
+                        )
+                        log_result(results[node])
+                    elif all(result is not None for result in upstream_results):
+                        running[executor.submit(run, node)] = node
+                    else:
+                        continue
+                    pending.discard(node)
+                    changed = True
+
+        submit_ready()
+        while running:
+            done, _ = wait_futures(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+            submit_ready()
+
+    response = DeployStacksResponse(results=results, elapsed=time.time() - start)
+
+    _report_summary(reporter, response)
+
+    return response
+
+
+@dataclasses.dataclass
+class StackRemoveSpec:
+    """
+    Everything :func:`remove_stacks` needs to remove one stack.
+
+    :param bsm: ``boto_session_manager.BotoSesManager`` object of the
+        target AWS account and region
+    :param stack_name: the stack name
+    :param retain_resources: the logical ids of the resources to retain,
+        see :func:`~aws_cloudformation.deploy.remove_stack`
+    :param role_arn: see :func:`~aws_cloudformation.deploy.remove_stack`
+    """
+
+    bsm: BotoSesManager = dataclasses.field()
+    stack_name: str = dataclasses.field()
+    retain_resources: T.Optional[T.List[str]] = dataclasses.field(default=NOTHING)
+    role_arn: T.Optional[str] = dataclasses.field(default=NOTHING)
+
+
+@dataclasses.dataclass
+class StackRemoveResult:
+    """
+    The removal result of one :class:`StackRemoveSpec`.
+
+    :param spec: the :class:`StackRemoveSpec`
+    :param stack: the live stack before the removal, None if it doesn't exist
+    :param retained_resources: the logical ids of the resources that are
+        retained (``DELETE_SKIPPED``), by ``retain_resources`` or
+        ``DeletionPolicy: Retain``
+    :param removed_by: the name of the parent stack if it is a nested stack
+        removed with its parent, the ``error`` is the parent's error
+    :param error: the exception raised by the removal, None if succeeded
+    :param elapsed: how long (in seconds) the removal took
+    """
+
+    spec: StackRemoveSpec = dataclasses.field()
+    stack: T.Optional[Stack] = dataclasses.field(default=None)
+    retained_resources: T.List[str] = dataclasses.field(default_factory=list)
+    removed_by: T.Optional[str] = dataclasses.field(default=None)
+    error: T.Optional[Exception] = dataclasses.field(default=None)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    @property
+    def stack_name(self) -> str:
+        return self.spec.stack_name
+
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass
+class RemoveStacksResponse:
+    """
+    The aggregate report of :func:`remove_stacks`. The ``results`` are in the
+    same order as the input specs.
+
+    :param tiers: the stack names removed in parallel in each tier
+    """
+
+    results: T.List[StackRemoveResult] = dataclasses.field(default_factory=list)
+    tiers: T.List[T.List[str]] = dataclasses.field(default_factory=list)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    @property
+    def succeeded(self) -> T.List[StackRemoveResult]:
+        return [result for result in self.results if result.is_success()]
+
+    @property
+    def failed(self) -> T.List[StackRemoveResult]:
+        return [result for result in self.results if not result.is_success()]
+
+    @property
+    def removed(self) -> T.List[StackRemoveResult]:
+        """
+        Succeeded removals of the stacks that existed.
+        """
+        return [result for result in self.succeeded if result.stack is not None]
+
+    def is_success(self) -> bool:
+        return len(self.failed) == 0
+
+
+def resolve_remove_stack_dag(
+    specs: T.List[StackRemoveSpec],
+    stacks: T.List[T.Optional[Stack]],
+    region_keys: T.List[T.Tuple[str, str]],
+) -> StackDag:
+    """
+    Build the :class:`~aws_cloudformation.dependency.StackDag` of the
+    removal, a stack importing an export has to be removed before the stack
+    exporting it. The exports come from ``list_exports``, the importing
+    stacks come from ``list_imports``, both are cached by
+    :class:`~aws_cloudformation.exports.ExportsIndex`.
+    """
+    # for removal, the importing stack is the "producer", the exporting stack
+    # is the "consumer" that has to wait for it
+    exports_of_stack: T.List[T.Set[str]] = list()
+    imports_of_stack: T.Dict[T.Tuple[str, str, str], T.Set[str]] = dict()
+    for spec, stack, region_key in zip(specs, stacks, region_keys):
+        export_names = set()
+        if stack is not None:
+            index = get_exports_index(spec.bsm)
+            for export in index.get_stack_exports(stack.id):
+                export_names.add(export.name)
+                for stack_name in index.get_importing_stacks(export.name):
+                    imports_of_stack.setdefault(
+                        (*region_key, stack_name), set()
+                    ).add(export.name)
+        exports_of_stack.append(export_names)
+    return build_stack_dag(
+        region_keys=region_keys,
+        stack_names=[spec.stack_name for spec in specs],
+        imports=exports_of_stack,
+        exports=[
+            imports_of_stack.get((*region_key, spec.stack_name), set())
+            for spec, region_key in zip(specs, region_keys)
+        ],
+    )
+
+
+def _report_remove_result(reporter: BaseReporter, result: StackRemoveResult):
+    if result.is_success():
+        if result.stack is None:
+            icon, status = "🟡", "not exists"
+        elif result.removed_by is not None:
+            icon, status = "🟢", f"removed with {result.removed_by}"
+        else:
+            icon, status = "🟢", "removed"
+        if result.retained_resources:
+            status = f"{status}, retained {result.retained_resources}"
+    elif result.removed_by is not None:
+        icon, status = "🔴", f"failed with {result.removed_by}: {result.error!r}"
+    else:
+        icon, status = "🔴", f"failed: {result.error!r}"
+    reporter.on_event(
+        "stack_result",
+        f"  {icon} {Fore.CYAN}{result.stack_name}{Style.RESET_ALL} "
+        f"{status} in {result.elapsed:.1f} seconds",
+        stack_name=result.stack_name,
+        is_success=result.is_success(),
+        retained_resources=result.retained_resources,
+        removed_by=result.removed_by,
+        error=None if result.error is None else repr(result.error),
+        elapsed=result.elapsed,
+    )
+
+
+def _find_retained_resources(bsm: BotoSesManager, stack_id: str) -> T.List[str]:
+    events = better_boto.StackEventStream(bsm=bsm, name=stack_id).poll()
+    return [
+        event.logical_resource_id
+        for event in events
+        if event.resource_status == "DELETE_SKIPPED"
+    ]
+
+
+def remove_stacks(
+    specs: T.Iterable[StackRemoveSpec],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_region: int = DEFAULT_MAX_PER_REGION,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+) -> RemoveStacksResponse:
+    """
+    Remove many stacks concurrently, tier by tier in the reverse dependency
+    order (see :func:`resolve_remove_stack_dag`). The stacks in the same tier
+    are removed in parallel by :func:`~aws_cloudformation.deploy.remove_stack`
+    in a bounded thread pool, and the stacks in the same account and region
+    share one :class:`~aws_cloudformation.better_boto.stacks.MultiStackWaiter`.
+    There's no prompt.
+
+    A nested stack whose parent is also in the list is not removed by
+    itself, it is removed with its parent. If a stack failed to be removed,
+    the stacks it imports from are not removed, the error is
+    :class:`~aws_cloudformation.exc.UpstreamStackFailedError`.
+
+    :param specs: list of :class:`StackRemoveSpec`
+    :param max_workers: the max number of stacks removing at the same time
+    :param max_per_region: the max number of stacks removing at the same time
+        in the same AWS account and region
+    :param wait: see :func:`~aws_cloudformation.deploy.remove_stack`, note that
+        the tiers only make sense when it is True
+    :param delays: see :func:`~aws_cloudformation.deploy.remove_stack`
+    :param timeout: see :func:`~aws_cloudformation.deploy.remove_stack`
+    :param wait_until_exec_stopped_on_failure: see :func:`~aws_cloudformation.deploy.remove_stack`
+    :param verbose: whether you want to log the progress of each stack
+        to console.
+    :param reporter: where the progress of each stack goes, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+
+    :return: a :class:`RemoveStacksResponse` object.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    specs = list(specs)
+    limiter = RegionLimiter(max_per_region)
+    region_keys = [get_region_key(spec.bsm) for spec in specs]
+    multi_stack_waiters = _new_multi_stack_waiters(
+        specs=specs,
+        region_keys=region_keys,
+        delays=delays,
+        max_workers=max_workers,
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        stacks = list(
+            executor.map(
+                lambda spec: better_boto.describe_live_stack(
+                    bsm=spec.bsm,
+                    name=spec.stack_name,
+                ),
+                specs,
+            )
+        )
+    dag = resolve_remove_stack_dag(specs=specs, stacks=stacks, region_keys=region_keys)
+
+    results: T.List[T.Optional[StackRemoveResult]] = [None] * len(specs)
+    # the nested stacks removed with their parent, nested node -> parent node
+    stack_ids = {stack.id: node for node, stack in enumerate(stacks) if stack}
+    parents: T.Dict[int, int] = dict()
+    for node, stack in enumerate(stacks):
+        if stack is None:
+            results[node] = StackRemoveResult(spec=specs[node])
+        elif stack.parent_id in stack_ids:
+            parents[node] = stack_ids[stack.parent_id]
+
+    def resolve_nested():
+        # the result of a nested stack is known after its parent's is known
+        resolved = True
+        while resolved:
+            resolved = False
+            for node, parent in parents.items():
+                if results[node] is None and results[parent] is not None:
+                    results[node] = StackRemoveResult(
+                        spec=specs[node],
+                        stack=stacks[node],
+                        removed_by=specs[parent].stack_name,
+                        error=results[parent].error,
+                        elapsed=results[parent].elapsed,
+                    )
+                    _report_remove_result(reporter, results[node])
+                    resolved = True
+
+    def run(node: int) -> StackRemoveResult:
+        spec = specs[node]
+        with limiter.get(region_keys[node]):
+            start = time.time()
+            result = StackRemoveResult(spec=spec, stack=stacks[node])
+            try:
+                remove_stack(
+                    bsm=spec.bsm,
+                    stack_name=spec.stack_name,
+                    retain_resources=spec.retain_resources,
+                    role_arn=spec.role_arn,
+                    wait=wait,
+                    delays=_delays_for_stack(delays, spec.stack_name),
+                    timeout=timeout,
+                    wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
+                    skip_prompt=True,
+                    verbose=False,
+                    multi_stack_waiter=multi_stack_waiters[region_keys[node]],
+                )
+                if wait:
+                    result.retained_resources = _find_retained_resources(
+                        bsm=spec.bsm,
+                        stack_id=stacks[node].id,
+                    )
+            except Exception as e:
+                result.error = e
+            result.elapsed = time.time() - start
+        _report_remove_result(reporter, result)
+        return result
+
+    tiers = [
+        [
+            node
+            for node in level
+            if (results[node] is None) and (node not in parents)
+        ]
+        for level in dag.topological_levels()
+    ]
+    tiers = [tier for tier in tiers if tier]
+    lines = [f"🗑 {Fore.CYAN}Remove{Style.RESET_ALL} {len(specs)} stacks ..."]
+    for ith, tier in enumerate(tiers, start=1):
+        stack_names = ", ".join(specs[node].stack_name for node in tier)
+        lines.append(f"  tier {ith}: {stack_names}")
+    reporter.on_event(
+        "remove_stacks",
+        "\n".join(lines),
+        tiers=[[specs[node].stack_name for node in tier] for tier in tiers],
+    )
+    for node, result in enumerate(results):
+        if result is not None:
+            _report_remove_result(reporter, result)
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for tier in tiers:
+            runnable = list()
+            for node in tier:
+                failed = [
+                    results[up].stack_name
+                    for up in dag.upstream[node]
+                    if (results[up] is not None) and (not results[up].is_success())
+                ]
+                if failed:
+                    results[node] = StackRemoveResult(
+                        spec=specs[node],
+                        stack=stacks[node],
+                        error=exc.UpstreamStackFailedError(
+                            f"importing stacks failed to remove: {failed}"
+                        ),
+                    )
+                    _report_remove_result(reporter, results[node])
+                else:
+                    runnable.append(node)
+            for node, result in zip(runnable, executor.map(run, runnable)):
+                results[node] = result
+            resolve_nested()
+
+    response = RemoveStacksResponse(
+        results=results,
+        tiers=[[specs[node].stack_name for node in tier] for tier in tiers],
+        elapsed=time.time() - start,
+    )
+    reporter.on_event(
+        "done",
+        f"  removed {len(response.removed)}, "
+        f"not exists {len(response.succeeded) - len(response.removed)}, "
+        f"failed {len(response.failed)}, "
+        f"elapsed {response.elapsed:.1f} seconds\n"
+        f"  done",
+        n_removed=len(response.removed),
+        n_succeeded=len(response.succeeded),
+        n_failed=len(response.failed),
+        elapsed=response.elapsed,
+    )
+    return response
+
+
+_plan_stack_args = set(inspect.signature(plan_stack).parameters)
+
+
+@dataclasses.dataclass
+class StackPlanResult:
+    """
+    The plan result of one :class:`~aws_cloudformation.multi_deploy.StackSpec`.
+
+    :param spec: the :class:`~aws_cloudformation.multi_deploy.StackSpec`
+    :param aws_account_id: the AWS account id of the stack
+    :param aws_region: the AWS region of the stack
+    :param response: the :class:`~aws_cloudformation.deploy.DeployStackResponse`
+        of :func:`~aws_cloudformation.deploy.plan_stack`, None if the
+        planning raised an error
+    :param error: the exception raised by the planning, None if succeeded
+    :param elapsed: how long (in seconds) the planning took
+    """
+
+    spec: StackSpec = dataclasses.field()
+    aws_account_id: str = dataclasses.field()
+    aws_region: str = dataclasses.field()
+    response: T.Optional[DeployStackResponse] = dataclasses.field(default=None)
+    error: T.Optional[Exception] = dataclasses.field(default=None)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    @property
+    def stack_name(self) -> str:
+        return self.spec.stack_name
+
+    @property
+    def plan(self) -> T.Optional[Plan]:
+        return None if self.response is None else self.response.plan
+
+    def is_success(self) -> bool:
+        return self.error is None
+
+    def has_change(self) -> bool:
+        return self.is_success() and self.response.change_set_id is not None
+
+    def to_artifact(self) -> T.Optional[PlanArtifact]:
+        """
+        The :class:`~aws_cloudformation.plan.PlanArtifact` to apply the change
+        set later by :func:`~aws_cloudformation.deploy.apply_plan`, None if
+        there's no change.
+        """
+        if self.has_change() is False:
+            return None
+        return PlanArtifact.from_plan(
+            plan=self.plan,
+            is_create=self.response.is_create,
+            aws_account_id=self.aws_account_id,
+            aws_region=self.aws_region,
+            template=self.spec.template,
+            parameters=self.spec.parameters,
+        )
+
+    def to_dict(self) -> dict:
+        response = self.response or DeployStackResponse()
+        return dict(
+            aws_account_id=self.aws_account_id,
+            aws_region=self.aws_region,
+            stack_name=self.stack_name,
+            stack_id=response.stack_id,
+            change_set_id=response.change_set_id,
+            is_create=response.is_create,
+            error=None if self.error is None else repr(self.error),
+            plan=None if response.plan is None else response.plan.to_dict(),
+        )
+
+
+@dataclasses.dataclass
+class EnvironmentPlan:
+    """
+    The aggregated plan of :func:`plan_stacks`. The ``results`` are in the
+    same order as the input specs. The ``dag`` is the dependency graph of the
+    stacks resolved by :func:`plan_stacks`, :func:`apply_stacks` executes the
+    change sets in its order.
+    """
+
+    results: T.List[StackPlanResult] = dataclasses.field(default_factory=list)
+    elapsed: float = dataclasses.field(default=0.0)
+    dag: T.Optional[StackDag] = dataclasses.field(default=None)
+
+    @property
+    def succeeded(self) -> T.List[StackPlanResult]:
+        return [result for result in self.results if result.is_success()]
+
+    @property
+    def failed(self) -> T.List[StackPlanResult]:
+        return [result for result in self.results if not result.is_success()]
+
+    @property
+    def changed(self) -> T.List[StackPlanResult]:
+        """
+        The stacks that have a change set to execute.
+        """
+        return [result for result in self.results if result.has_change()]
+
+    def is_success(self) -> bool:
+        return len(self.failed) == 0
+
+    @property
+    def total_counts(self) -> T.Dict[str, int]:
+        """
+        The number of resource changes by action of all the stacks, including
+        the nested stacks.
+        """
+        counts = {action.value: 0 for action in ChangeActionEnum}
+        for result in self.changed:
+            for action, count in result.plan.total_counts.items():
+                counts[action] = counts.get(action, 0) + count
+        return counts
+
+    def has_replacement(self) -> bool:
+        return any(result.plan.has_replacement() for result in self.changed)
+
+    def has_removal(self) -> bool:
+        return any(result.plan.has_removal() for result in self.changed)
+
+    def to_dict(self) -> dict:
+        return dict(
+            total_counts=self.total_counts,
+            stacks=[result.to_dict() for result in self.results],
+        )
+
+    def to_json(self, indent: T.Optional[int] = None) -> str:
+        """
+        Serialize to JSON, including the change set ids, compact by default.
+        """
+        if indent is None:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+def _format_counts(counts: T.Dict[str, int]) -> str:
+    return (
+        f"{Fore.GREEN}+{counts[ChangeActionEnum.ADD.value]}{Style.RESET_ALL} "
+        f"{Fore.YELLOW}~{counts[ChangeActionEnum.MODIFY.value]}{Style.RESET_ALL} "
+        f"{Fore.RED}-{counts[ChangeActionEnum.REMOVE.value]}{Style.RESET_ALL}"
+    )
+
+
+def _report_plan_result(reporter: BaseReporter, result: StackPlanResult):
+    if result.is_success() is False:
+        icon, status = "🔴", f"failed: {result.error!r}"
+    elif result.has_change():
+        icon = "🔵"
+        status = _format_counts(result.plan.total_counts)
+        if result.plan.has_replacement():
+            n_replacement = len(result.plan.replacements)
+            status += f" {Fore.RED}({n_replacement} replacement){Style.RESET_ALL}"
+    else:
+        icon, status = "🟡", "no change"
+    reporter.on_event(
+        "stack_plan",
+        f"  {icon} {Fore.CYAN}{result.stack_name}{Style.RESET_ALL} {status}",
+        stack_name=result.stack_name,
+        is_success=result.is_success(),
+        change_set_id=result.response and result.response.change_set_id,
+        error=None if result.error is None else repr(result.error),
+        elapsed=result.elapsed,
+    )
+
+
+def plan_stacks(
+    specs: T.Iterable[StackSpec],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_region: int = DEFAULT_MAX_PER_REGION,
+    detect_dependency: bool = False,
+    plan_nested_stack: bool = True,
+    change_set_delays: T.Union[int, float, DelayStrategy] = DEFAULT_CHANGE_SET_DELAYS,
+    change_set_timeout: T.Union[int, float] = DEFAULT_CHANGE_SET_TIMEOUT,
+    skip_unchanged: bool = False,
+    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+) -> EnvironmentPlan:
+    """
+    Create the change sets of many stacks concurrently by
+    :func:`~aws_cloudformation.deploy.plan_stack`, nothing is executed.
+    One failed stack doesn't stop the others. Then review the aggregated
+    plan and execute it by :func:`apply_stacks`::
+
+        env_plan = plan_stacks(specs)
+        Path("plan.json").write_text(env_plan.to_json(indent=4))
+        response = apply_stacks(env_plan)
+
+    Note that the change sets are created against the current state of the
+    environment, if a stack imports a value that its upstream stack is going
+    to export, deploy the upstream stack first.
+
+    :param specs: list of :class:`~aws_cloudformation.multi_deploy.StackSpec`,
+        the ``StackSpec.kwargs`` not used by planning (for example,
+        ``disable_rollback``) are used by :func:`apply_stacks`.
+    :param max_workers: the max number of stacks planning at the same time
+    :param max_per_region: the max number of stacks planning at the same time
+        in the same AWS account and region
+    :param detect_dependency: if True, find the dependencies between stacks
+        from the exports / imports, see :func:`resolve_stack_dag`. The
+        ``StackSpec.depends_on`` is always respected. The dependency graph is
+        stored in ``EnvironmentPlan.dag`` and used by :func:`apply_stacks`.
+    :param plan_nested_stack: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param change_set_delays: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param change_set_timeout: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param skip_unchanged: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param verbose: whether you want to log the progress of each stack
+        to console
+    :param reporter: where the progress of each stack goes, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+
+    :return: a :class:`EnvironmentPlan` object.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    specs = list(specs)
+    defaults = dict(
+        plan_nested_stack=plan_nested_stack,
+        change_set_delays=change_set_delays,
+        change_set_timeout=change_set_timeout,
+        skip_unchanged=skip_unchanged,
+        verbose=False,
+    )
+    limiter = RegionLimiter(max_per_region)
+    region_keys = [get_region_key(spec.bsm) for spec in specs]
+    for spec in specs:
+        _grow_connection_pool(spec.bsm, max_workers)
+    dag = resolve_stack_dag(
+        specs=specs,
+        region_keys=region_keys,
+        detect_dependency=detect_dependency,
+        max_workers=max_workers,
+    )
+
+    def run(node: int) -> StackPlanResult:
+        spec = specs[node]
+        result = StackPlanResult(
+            spec=spec,
+            aws_account_id=region_keys[node][0],
+            aws_region=region_keys[node][1],
+        )
+        with limiter.get(region_keys[node]):
+            start = time.time()
+            kwargs = spec.to_deploy_stack_kwargs(**defaults)
+            try:
+                result.response = plan_stack(
+                    **{k: v for k, v in kwargs.items() if k in _plan_stack_args}
+                )
+            except Exception as e:
+                result.error = e
+            result.elapsed = time.time() - start
+        _report_plan_result(reporter, result)
+        return result
+
+    reporter.on_event(
+        "plan_stacks",
+        f"🔎 {Fore.CYAN}Plan{Style.RESET_ALL} {len(specs)} stacks ...",
+        stack_names=[spec.stack_name for spec in specs],
+    )
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run, range(len(specs))))
+    env_plan = EnvironmentPlan(
+        results=results,
+        elapsed=time.time() - start,
+        dag=dag,
+    )
+
+    reporter.on_event(
+        "plan_summary",
+        f"  {len(env_plan.changed)} to change "
+        f"({_format_counts(env_plan.total_counts)}), "
+        f"no change {len(env_plan.succeeded) - len(env_plan.changed)}, "
+        f"failed {len(env_plan.failed)}, "
+        f"elapsed {env_plan.elapsed:.1f} seconds",
+        n_changed=len(env_plan.changed),
+        n_succeeded=len(env_plan.succeeded),
+        n_failed=len(env_plan.failed),
+        total_counts=env_plan.total_counts,
+        elapsed=env_plan.elapsed,
+    )
+    return env_plan
+
+
+def apply_stacks(
+    env_plan: EnvironmentPlan,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_region: int = DEFAULT_MAX_PER_REGION,
+    wait: bool = True,
+    delays: T.Union[int, float, DelayStrategy] = DEFAULT_UPDATE_DELAYS,
+    timeout: T.Union[int, float] = DEFAULT_UPDATE_TIMEOUT,
+    wait_until_exec_stopped_on_failure: bool = False,
+    skip_prompt: bool = False,
+    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+) -> DeployStacksResponse:
+    """
+    Execute all the change sets of an :class:`EnvironmentPlan` with one
+    approval, in parallel. The stacks waiting at the same time in the same
+    AWS account and region share one ``describe_stacks`` sweep. The stacks
+    are executed in the order of ``EnvironmentPlan.dag`` (see the
+    ``detect_dependency`` of :func:`plan_stacks`), if any of its upstream
+    stacks failed, the stack is not executed and the error is
+    :class:`~aws_cloudformation.exc.UpstreamStackFailedError`.
+
+    :param env_plan: the :class:`EnvironmentPlan` from :func:`plan_stacks`,
+        it cannot have failed stacks.
+    :param max_workers: the max number of stacks executing at the same time
+    :param max_per_region: the max number of stacks executing at the same time
+        in the same AWS account and region
+    :param wait: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param delays: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param timeout: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param wait_until_exec_stopped_on_failure: see :func:`~aws_cloudformation.deploy.deploy_stack`
+    :param skip_prompt: default False; if False, you have to enter "Yes"
+        in prompt once to execute all the change sets; if True, then execute
+        them directly.
+    :param verbose: whether you want to log the progress of each stack
+        to console
+    :param reporter: where the progress of each stack goes, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+
+    :return: a :class:`~aws_cloudformation.multi_deploy.DeployStacksResponse`
+        object, the stacks without change are "no change".
+    """
+    if env_plan.is_success() is False:
+        stack_names = [result.stack_name for result in env_plan.failed]
+        raise ValueError(
+            f"the plan of stacks {stack_names} failed, fix them and plan again!"
+        )
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    results: T.List[T.Optional[StackDeployResult]] = [
+        StackDeployResult(spec=result.spec, response=DeployStackResponse())
+        for result in env_plan.results
+    ]
+    changed = [result.has_change() for result in env_plan.results]
+    reporter.on_event(
+        "apply_stacks",
+        f"🚀 {Fore.CYAN}Apply{Style.RESET_ALL} {sum(changed)} stacks "
+        f"({_format_counts(env_plan.total_counts)}) ...",
+        stack_names=[result.stack_name for result in env_plan.changed],
+    )
+    if sum(changed) == 0:
+        return DeployStacksResponse(results=results)
+    if skip_prompt is False:  # pragma: no cover
+        if prompt_to_proceed() is False:
+            print("  cancel apply.")
+            return DeployStacksResponse(results=results)
+
+    specs = [result.spec for result in env_plan.results]
+    region_keys = [
+        (result.aws_account_id, result.aws_region) for result in env_plan.results
+    ]
+    limiter = RegionLimiter(max_per_region)
+    multi_stack_waiters = _new_multi_stack_waiters(
+        specs=specs,
+        region_keys=region_keys,
+        delays=delays,
+        max_workers=max_workers,
+    )
+    dag = env_plan.dag
+    if dag is None:
+        dag = resolve_stack_dag(
+            specs=specs,
+            region_keys=region_keys,
+            detect_dependency=False,
+        )
+
+    def run(node: int) -> StackDeployResult:
+        plan_result = env_plan.results[node]
+        spec = plan_result.spec
+        result = StackDeployResult(spec=spec)
+        with limiter.get(region_keys[node]):
+            start = time.time()
+            try:
+                result.response = execute_stack_change_set(
+                    bsm=spec.bsm,
+                    stack_id=plan_result.response.stack_id,
+                    change_set_id=plan_result.response.change_set_id,
+                    is_create=plan_result.response.is_create,
+                    plan=plan_result.plan,
+                    disable_rollback=spec.kwargs.get("disable_rollback", NOTHING),
+                    wait=wait,
+                    delays=_delays_for_stack(delays, spec.stack_name),
+                    timeout=timeout,
+                    wait_until_exec_stopped_on_failure=wait_until_exec_stopped_on_failure,
+                    verbose=False,
+                    multi_stack_waiter=multi_stack_waiters[region_keys[node]],
+                    retry_policy=spec.kwargs.get("retry_policy"),
+                )
+            except Exception as e:
+                result.error = e
+            result.elapsed = time.time() - start
+        _report_result(reporter, result)
+        return result
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for level in dag.topological_levels():
+            nodes = list()
+            for node in level:
+                failed = [
+                    results[up].stack_name
+                    for up in dag.upstream[node]
+                    if not results[up].is_success()
+                ]
+                if failed:
+                    results[node] = StackDeployResult(
+                        spec=specs[node],
+                        error=exc.UpstreamStackFailedError(
+                            f"upstream stacks failed: {failed}"
+                        ),
+                    )
+                    _report_result(reporter, results[node])
+                elif changed[node]:
+                    nodes.append(node)
+            for node, result in zip(nodes, executor.map(run, nodes)):
+                results[node] = result
+
+    response = DeployStacksResponse(results=results, elapsed=time.time() - start)
+
+    _report_summary(reporter, response)
+
+    return response
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+"""
+The machine-readable plan of a deployment, built from the change set and
+its nested change sets. It can be used to gate the approval, and saved as
+JSON for audit.
+
+Usage example::
+
+    response = aws_cf.deploy_stack(...)
+    plan = response.plan
+    if plan.has_replacement():
+        ...
+    Path("plan.json").write_text(plan.to_json())
+
+To approve and apply the plan later, for example in another pipeline stage,
+save a :class:`PlanArtifact` and apply it by
+:func:`~aws_cloudformation.deploy.apply_plan`, the change set is executed
+directly without being created again.
+"""
+
+import typing as T
+import json
+import dataclasses
+from datetime import datetime, timezone
+
+from func_args import NOTHING
+
+from .stack import Parameter
+from .resource_change import ChangeActionEnum, ResourceChange
+from .change_set_tree import ChangeSetTree
+from .deploy_helpers import get_template_hash, get_parameters_hash
+
+
+@dataclasses.dataclass
+class Plan:
+    """
+    The planned resource changes of a stack, and the plans of its nested
+    stacks.
+
+    :param stack_name: the stack name
+    :param stack_id: the stack id
+    :param change_set_id: the change set id
+    :param resource_changes: list of
+        :class:`~aws_cloudformation.resource_change.ResourceChange`
+    :param children: the plans of the nested stacks
+    """
+
+    stack_name: str = dataclasses.field()
+    stack_id: str = dataclasses.field()
+    change_set_id: str = dataclasses.field()
+    resource_changes: T.List[ResourceChange] = dataclasses.field(default_factory=list)
+    children: T.List["Plan"] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def from_change_set_tree(cls, tree: ChangeSetTree) -> "Plan":
+        return cls(
+            stack_name=tree.change_set.stack_name,
+            stack_id=tree.change_set.stack_id,
+            change_set_id=tree.change_set.change_set_id,
+            resource_changes=list(tree.resource_changes),
+            children=[cls.from_change_set_tree(child) for child in tree.children],
+        )
+
+    def walk(self, _depth: int = 0) -> T.Iterable[T.Tuple[int, "Plan"]]:
+        """
+        Iterate all the plans depth first, the parent before its children.
+
+        :return: yield ``(depth, plan)``, the depth of the root is 0
+        """
+        yield _depth, self
+        for child in self.children:
+            yield from child.walk(_depth + 1)
+
+    @property
+    def counts(self) -> T.Dict[str, int]:
+        """
+        The number of resource changes by action of this stack, not including
+        the nested stacks. For example ``{"Add": 1, "Modify": 0, ...}``.
+        """
+        counts = {action.value: 0 for action in ChangeActionEnum}
+        for resource_change in self.resource_changes:
+            counts[resource_change.action] = counts.get(resource_change.action, 0) + 1
+        return counts
+
+    @property
+    def total_counts(self) -> T.Dict[str, int]:
+        """
+        Same as :attr:`counts`, including the nested stacks.
+        """
+        counts = {action.value: 0 for action in ChangeActionEnum}
+        for _, plan in self.walk():
+            for action, count in plan.counts.items():
+                counts[action] = counts.get(action, 0) + count
+        return counts
+
+    @property
+    def replacements(self) -> T.List[ResourceChange]:
+        """
+        The resource changes that (may) re-create the resource, including
+        the nested stacks.
+        """
+        return [
+            resource_change
+            for _, plan in self.walk()
+            for resource_change in plan.resource_changes
+            if resource_change.is_replacement()
+            or resource_change.is_conditional_replacement()
+        ]
+
+    def has_replacement(self) -> bool:
+        return len(self.replacements) > 0
+
+    def has_removal(self) -> bool:
+        return self.total_counts[ChangeActionEnum.REMOVE.value] > 0
+
+    def to_dict(self) -> dict:
+        return dict(
+            stack_name=self.stack_name,
+            stack_id=self.stack_id,
+            change_set_id=self.change_set_id,
+            counts=self.counts,
+            resource_changes=[rc.to_dict() for rc in self.resource_changes],
+            children=[child.to_dict() for child in self.children],
+        )
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> "Plan":
+        return cls(
+            stack_name=dct["stack_name"],
+            stack_id=dct["stack_id"],
+            change_set_id=dct["change_set_id"],
+            resource_changes=[
+                ResourceChange.from_dict(d) for d in dct.get("resource_changes", [])
+            ],
+            children=[cls.from_dict(d) for d in dct.get("children", [])],
+        )
+
+    def to_json(self, indent: T.Optional[int] = None) -> str:
+        """
+        Serialize to JSON, compact by default.
+        """
+        if indent is None:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
+        return json.dumps(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_json(cls, s: str) -> "Plan":
+        return cls.from_dict(json.loads(s))
+
+
+@dataclasses.dataclass
+class PlanArtifact:
+    """
+    The serializable artifact of a planned (not executed) stack deployment,
+    everything :func:`~aws_cloudformation.deploy.apply_plan` needs to execute
+    the change set later.
+
+    :param aws_account_id: the AWS account id of the stack
+    :param aws_region: the AWS region of the stack
+    :param stack_name: the stack name
+    :param stack_id: the stack id
+    :param change_set_id: the change set id
+    :param is_create: whether the change set creates the stack
+    :param template_hash: the hash of the planned template, see
+        :func:`~aws_cloudformation.deploy_helpers.get_template_hash`
+    :param parameters_hash: the hash of the planned parameters, see
+        :func:`~aws_cloudformation.deploy_helpers.get_parameters_hash`
+    :param plan: the :class:`Plan` of the change set, for review
+    :param create_time: when the artifact is created, in ISO format
+    """
+
+    aws_account_id: str = dataclasses.field()
+    aws_region: str = dataclasses.field()
+    stack_name: str = dataclasses.field()
+    stack_id: str = dataclasses.field()
+    change_set_id: str = dataclasses.field()
+    is_create: bool = dataclasses.field()
+    template_hash: T.Optional[str] = dataclasses.field(default=None)
+    parameters_hash: T.Optional[str] = dataclasses.field(default=None)
+    plan: T.Optional[Plan] = dataclasses.field(default=None)
+    create_time: T.Optional[str] = dataclasses.field(default=None)
+
+    @classmethod
+    def from_plan(
+        cls,
+        plan: Plan,
+        is_create: bool,
+        aws_account_id: str,
+        aws_region: str,
+        template: T.Optional[str] = NOTHING,
+        parameters: T.Optional[T.List[Parameter]] = NOTHING,
+    ) -> "PlanArtifact":
+        """
+        Create the artifact from the plan returned by
+        :func:`~aws_cloudformation.deploy.plan_stack`, the ``template`` and
+        ``parameters`` are the ones used for planning.
+        """
+        return cls(
+            aws_account_id=aws_account_id,
+            aws_region=aws_region,
+            stack_name=plan.stack_name,
+            stack_id=plan.stack_id,
+            change_set_id=plan.change_set_id,
+            is_create=is_create,
+            template_hash=get_template_hash(template),
+            parameters_hash=get_parameters_hash(parameters),
+            plan=plan,
+            create_time=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+        }
+        data["plan"] = None if self.plan is None else self.plan.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> "PlanArtifact":
+        dct = dict(dct)
+        if dct.get("plan") is not None:
+            dct["plan"] = Plan.from_dict(dct["plan"])
+        return cls(**dct)
+
+    def to_json(self, indent: T.Optional[int] = None) -> str:
+        """
+        Serialize to JSON, compact by default.
+        """
+        if indent is None:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
+        return json.dumps(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_json(cls, s: str) -> "PlanArtifact":
+        return cls.from_dict(json.loads(s))
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+"""
+The process-wide CloudFormation API rate limiter. Every CloudFormation API
+call made by the clients of :mod:`aws_cloudformation.context` (that is,
+every :mod:`aws_cloudformation.better_boto` function) takes a token from the
+token bucket of its ``(aws_account_id, aws_region, operation)`` first, so
+many threads and concurrent deployments share one quota instead of
+competing for it and oscillating through throttling retries.
+
+By default, there's no rate limit, only the metrics are collected.
+Usage example::
+
+    from aws_cloudformation.rate_limiter import get_rate_limiter
+
+    rate_limiter = get_rate_limiter()
+    # 5 calls per second per account / region / operation, burst 10
+    rate_limiter.set_rate(rate=5, burst=10)
+    # a lower rate for one operation
+    rate_limiter.set_rate(rate=1, burst=2, operation="CreateChangeSet")
+
+    deploy_stacks(...)
+
+    for stats in rate_limiter.get_stats():
+        print(stats.operation, stats.n_calls, stats.total_wait, stats.max_wait)
+
+The token is taken before each HTTP request, including the botocore retries.
+"""
+
+import typing as T
+import time
+import dataclasses
+import threading
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from botocore.client import BaseClient
+
+
+@dataclasses.dataclass
+class RateLimitStats:
+    """
+    The queue-wait metrics of one ``(aws_account_id, aws_region, operation)``.
+
+    :param aws_account_id: the AWS account id
+    :param aws_region: the AWS region
+    :param operation: the API operation name, for example ``DescribeStacks``
+    :param n_calls: how many calls took a token
+    :param n_waited: how many calls had to wait for a token
+    :param total_wait: the total time (in seconds) the calls waited
+    :param max_wait: the longest time (in seconds) a call waited
+    """
+
+    aws_account_id: str = dataclasses.field()
+    aws_region: str = dataclasses.field()
+    operation: str = dataclasses.field()
+    n_calls: int = dataclasses.field(default=0)
+    n_waited: int = dataclasses.field(default=0)
+    total_wait: float = dataclasses.field(default=0.0)
+    max_wait: float = dataclasses.field(default=0.0)
+
+    @property
+    def avg_wait(self) -> float:
+        return (self.total_wait / self.n_calls) if self.n_calls else 0.0
+
+
+class TokenBucket:
+    """
+    A thread safe token bucket, the tokens are refilled at ``rate`` per
+    second, up to ``burst``. The callers are served in the order they ask,
+    a caller reserves its token then sleeps until the token is refilled,
+    without holding the lock.
+
+    :param rate: how many tokens are refilled per second, None means unlimited
+    :param burst: the max number of tokens in the bucket, default to ``rate``
+    """
+
+    def __init__(
+        self,
+        rate: T.Optional[float] = None,
+        burst: T.Optional[float] = None,
+    ):
+        self._lock = threading.Lock()
+        self._tokens = 0.0
+        self.set_rate(rate=rate, burst=burst)
+
+    def set_rate(
+        self,
+        rate: T.Optional[float] = None,
+        burst: T.Optional[float] = None,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate has to be greater than 0!")
+        with self._lock:
+            self.rate = rate
+            if rate is None:
+                self.burst = None
+            else:
+                self.burst = max(1.0, float(rate if burst is None else burst))
+                self._tokens = self.burst
+            self._updated_at = time.monotonic()
+
+    def acquire(self) -> float:
+        """
+        Take one token, wait if the bucket is empty.
+
+        :return: how long (in seconds) it waited
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            # the token can go negative, it is the queue of the reservations
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else (-self._tokens / self.rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    The token buckets of all ``(aws_account_id, aws_region, operation)``,
+    created on demand with the configured rate of the operation.
+
+    Don't create it directly, use :func:`get_rate_limiter`.
+
+    :param rate: the default rate (calls per second) of all operations,
+        None means unlimited
+    :param burst: the default burst of all operations
+    """
+
+    def __init__(
+        self,
+        rate: T.Optional[float] = None,
+        burst: T.Optional[float] = None,
+    ):
+        self._lock = threading.Lock()
+        self._default_rate: T.Tuple[T.Optional[float], T.Optional[float]] = (
+            rate,
+            burst,
+        )
+        self._rates: T.Dict[str, T.Tuple[T.Optional[float], T.Optional[float]]] = (
+            dict()
+        )
+        self._buckets: T.Dict[T.Tuple[str, str, str], TokenBucket] = dict()
+        self._stats: T.Dict[T.Tuple[str, str, str], RateLimitStats] = dict()
+
+    def get_rate(
+        self,
+        operation: str,
+    ) -> T.Tuple[T.Optional[float], T.Optional[float]]:
+        """
+        The ``(rate, burst)`` of the operation.
+        """
+        return self._rates.get(operation, self._default_rate)
+
+    def set_rate(
+        self,
+        rate: T.Optional[float],
+        burst: T.Optional[float] = None,
+        operation: T.Optional[str] = None,
+    ):
+        """
+        Set the rate of one operation, or the default rate of all the
+        operations that don't have their own rate. The existing token buckets
+        are updated.
+
+        :param rate: how many calls per second, None means unlimited
+        :param burst: how many calls can be made at once, default to ``rate``
+        :param operation: the API operation name, for example
+            ``DescribeStacks``, None means the default rate
+        """
+        with self._lock:
+            if operation is None:
+                self._default_rate = (rate, burst)
+            else:
+                self._rates[operation] = (rate, burst)
+            for key, bucket in self._buckets.items():
+                new_rate, new_burst = self.get_rate(key[2])
+                if (bucket.rate, bucket.burst) != (new_rate, new_burst):
+                    bucket.set_rate(rate=new_rate, burst=new_burst)
+
+    def _get_bucket(
+        self,
+        key: T.Tuple[str, str, str],
+    ) -> T.Tuple[TokenBucket, RateLimitStats]:
+        try:
+            return self._buckets[key], self._stats[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._buckets:
+                rate, burst = self.get_rate(key[2])
+                self._stats[key] = RateLimitStats(
+                    aws_account_id=key[0],
+                    aws_region=key[1],
+                    operation=key[2],
+                )
+                self._buckets[key] = TokenBucket(rate=rate, burst=burst)
+            return self._buckets[key], self._stats[key]
+
+    def acquire(
+        self,
+        aws_account_id: str,
+        aws_region: str,
+        operation: str,
+    ) -> float:
+        """
+        Take one token of the operation in the account and region, wait if
+        there's no token left.
+
+        :return: how long (in seconds) it waited
+        """
+        bucket, stats = self._get_bucket((aws_account_id, aws_region, operation))
+        wait = bucket.acquire()
+        with self._lock:
+            stats.n_calls += 1
+            if wait > 0:
+                stats.n_waited += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+        return wait
+
+    def get_stats(
+        self,
+        aws_account_id: T.Optional[str] = None,
+        aws_region: T.Optional[str] = None,
+        operation: T.Optional[str] = None,
+    ) -> T.List[RateLimitStats]:
+        """
+        A snapshot of the queue-wait metrics, optionally filtered by account,
+        region and operation.
+        """
+        with self._lock:
+            return [
+                dataclasses.replace(stats)
+                for (account_id, region, op), stats in sorted(self._stats.items())
+                if (aws_account_id is None or account_id == aws_account_id)
+                and (aws_region is None or region == aws_region)
+                and (operation is None or op == operation)
+            ]
+
+    def reset_stats(self):
+        with self._lock:
+            for key, stats in self._stats.items():
+                self._stats[key] = RateLimitStats(
+                    aws_account_id=stats.aws_account_id,
+                    aws_region=stats.aws_region,
+                    operation=stats.operation,
+                )
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide :class:`RateLimiter`.
+    """
+    return _rate_limiter
+
+
+class _RateLimitHook:
+    """
+    The botocore ``before-send`` event handler, it takes a token before each
+    HTTP request of the client.
+    """
+
+    def __init__(
+        self,
+        get_aws_account_id: T.Callable[[], str],
+        aws_region: str,
+    ):
+        self.get_aws_account_id = get_aws_account_id
+        self.aws_region = aws_region
+        self._aws_account_id: T.Optional[str] = None
+
+    @property
+    def aws_account_id(self) -> str:
+        if self._aws_account_id is None:
+            try:
+                self._aws_account_id = self.get_aws_account_id()
+            except Exception:  # pragma: no cover
+                # don't fail the API call, share one bucket per region instead
+                return ""
+        return self._aws_account_id
+
+    def __call__(self, event_name: str, **kwargs):
+        rate_limiter = get_rate_limiter()
+        rate_limiter.acquire(
+            aws_account_id=self.aws_account_id,
+            aws_region=self.aws_region,
+            operation=event_name.rsplit(".", 1)[-1],
+        )
+        # return None, a response would short-circuit the request
+
+
+def install_rate_limiter(
+    client: "BaseClient",
+    get_aws_account_id: T.Callable[[], str],
+    aws_region: str,
+):
+    """
+    Let every API call of the boto3 client go through the rate limiter.
+
+    :param client: the boto3 client
+    :param get_aws_account_id: a callable returns the AWS account id of the
+        client, it is only called on the first API call
+    :param aws_region: the AWS region of the client
+    """
+    service_id = client.meta.service_model.service_id.hyphenize()
+    # it has to run before any handler that returns a response
+    client.meta.events.register_first(
+        f"before-send.{service_id}",
+        _RateLimitHook(
+            get_aws_account_id=get_aws_account_id,
+            aws_region=aws_region,
+        ),
+        unique_id=f"aws-cloudformation-rate-limiter-{service_id}",
+    )
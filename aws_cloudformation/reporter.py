@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+"""
+Reporter receives the progress and the events of deployments and waiters,
+and decides how to present them. The ``verbose`` console logging is one
+implementation, :class:`ConsoleReporter`.
+
+Usage example::
+
+    import aws_cloudformation as aws_cf
+
+    # in CI, one json line per event, no progress bar
+    aws_cf.deploy_stack(
+        ...,
+        reporter=aws_cf.JsonLinesReporter(path="deploy.jsonl"),
+    )
+"""
+
+import typing as T
+import re
+import sys
+import json
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+    from .stack import ChangeSet
+    from .change_set_tree import ChangeSetTree
+
+
+class BaseReporter:
+    """
+    The base class of all reporters, all the hooks do nothing by default.
+    """
+
+    def on_tick(
+        self,
+        attempt: int,
+        elapsed: int,
+        timeout: T.Union[int, float],
+        indent: int = 0,
+    ):
+        """
+        Called by the :class:`~aws_cloudformation.waiter.Waiter` on each attempt.
+
+        :param attempt: the nth attempt, starts from 1
+        :param elapsed: how long (in seconds) it has been waiting
+        :param timeout: how long it will raise timeout error
+        :param indent: the indent of the console output
+        """
+
+    def on_event(
+        self,
+        event: str,
+        message: str,
+        **data,
+    ):
+        """
+        Called when something happens, for example, a stack reaches a status.
+
+        :param event: the event name, for example ``"stack_status"``
+        :param message: human-readable message, may contain colorama color codes
+        :param data: the structured data of the event, must be json serializable
+        """
+
+    def on_change_set(
+        self,
+        change_set: "ChangeSet",
+        bsm: T.Optional["BotoSesManager"] = None,
+        include_nested_stack: bool = False,
+        tree: T.Optional["ChangeSetTree"] = None,
+    ):
+        """
+        Called when a change set is created and ready to review.
+
+        :param tree: the already loaded
+            :class:`~aws_cloudformation.change_set_tree.ChangeSetTree` of the
+            change set, if given, the reporter should not fetch it again.
+        """
+
+
+class NoOpReporter(BaseReporter):
+    """
+    Report nothing, it is what ``verbose=False`` means.
+    """
+
+
+class ConsoleReporter(BaseReporter):
+    """
+    Print to the console, it is what ``verbose=True`` means.
+
+    The waiter progress line is rewritten in place with ``\\r`` on every
+    attempt, it only makes sense in a terminal. When the output is not
+    a TTY (for example, in CI), the progress is not printed.
+
+    :param stream: the output stream, default ``sys.stdout``
+    :param show_ticks: True / False to force show / hide the progress line,
+        default None means show it only if the stream is a TTY.
+    """
+
+    def __init__(
+        self,
+        stream: T.Optional[T.TextIO] = None,
+        show_ticks: T.Optional[bool] = None,
+    ):
+        self.stream = stream
+        self.show_ticks = show_ticks
+        self._lock = threading.Lock()
+
+    def _get_stream(self) -> T.TextIO:
+        # resolve at call time, sys.stdout may be replaced, e.g. by pytest
+        return sys.stdout if self.stream is None else self.stream
+
+    def _is_show_ticks(self, stream: T.TextIO) -> bool:
+        if self.show_ticks is None:
+            isatty = getattr(stream, "isatty", None)
+            return bool(isatty()) if isatty is not None else False
+        return self.show_ticks
+
+    def on_tick(
+        self,
+        attempt: int,
+        elapsed: int,
+        timeout: T.Union[int, float],
+        indent: int = 0,
+    ):
+        stream = self._get_stream()
+        if self._is_show_ticks(stream):
+            tab = " " * indent
+            stream.write(
+                f"\r{tab}on {attempt} th attempt, "
+                f"elapsed {elapsed} seconds, "
+                f"remain {timeout - elapsed} seconds ..."
+            )
+            stream.flush()
+
+    def on_event(
+        self,
+        event: str,
+        message: str,
+        **data,
+    ):
+        stream = self._get_stream()
+        # the leading new line ends the progress line
+        if not self._is_show_ticks(stream):
+            message = message.lstrip("\n")
+        # many threads may share one reporter, don't interleave the lines
+        with self._lock:
+            print(message, file=stream)
+
+    def on_change_set(
+        self,
+        change_set: "ChangeSet",
+        bsm: T.Optional["BotoSesManager"] = None,
+        include_nested_stack: bool = False,
+        tree: T.Optional["ChangeSetTree"] = None,
+    ):
+        # change_set_visualizer depends on better_boto, which depends on this module
+        from .change_set_visualizer import (
+            visualize_change_set,
+            visualize_change_set_tree,
+        )
+
+        if tree is not None:
+            visualize_change_set_tree(tree)
+        else:
+            visualize_change_set(
+                change_set=change_set,
+                bsm=bsm,
+                include_nested_stack=include_nested_stack,
+            )
+
+
+_ansi_escape_pattern = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def strip_ansi(text: str) -> str:
+    """
+    Remove the colorama color codes.
+    """
+    return _ansi_escape_pattern.sub("", text)
+
+
+class JsonLinesReporter(BaseReporter):
+    """
+    Write one json object per event, one event per line. Good for CI logs and
+    machine processing. Each line has ``time``, ``event``, ``message``
+    (without color codes) and the structured data of the event. It is
+    thread safe, many deployments can share one reporter.
+
+    :param path: append to this file, if given
+    :param stream: write to this stream if ``path`` is not given, default
+        ``sys.stdout``
+    :param include_ticks: whether to report the waiter progress as
+        ``"tick"`` events, default False
+    """
+
+    def __init__(
+        self,
+        path: T.Optional[T.Union[str, Path]] = None,
+        stream: T.Optional[T.TextIO] = None,
+        include_ticks: bool = False,
+    ):
+        self.path = None if path is None else Path(path)
+        self.stream = stream
+        self.include_ticks = include_ticks
+        self._lock = threading.Lock()
+
+    def write(self, record: dict):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self.path is not None:
+                with self.path.open("a") as f:
+                    f.write(line)
+            else:
+                stream = sys.stdout if self.stream is None else self.stream
+                stream.write(line)
+                stream.flush()
+
+    def _make_record(self, event: str, message: str, **data) -> dict:
+        record = dict(
+            time=datetime.now(timezone.utc).isoformat(),
+            event=event,
+            message=strip_ansi(message).strip(),
+        )
+        record.update(data)
+        return record
+
+    def on_tick(
+        self,
+        attempt: int,
+        elapsed: int,
+        timeout: T.Union[int, float],
+        indent: int = 0,
+    ):
+        if self.include_ticks:
+            self.write(
+                self._make_record(
+                    "tick",
+                    f"on {attempt} th attempt",
+                    attempt=attempt,
+                    elapsed=elapsed,
+                    timeout=timeout,
+                )
+            )
+
+    def on_event(
+        self,
+        event: str,
+        message: str,
+        **data,
+    ):
+        self.write(self._make_record(event, message, **data))
+
+    def on_change_set(
+        self,
+        change_set: "ChangeSet",
+        bsm: T.Optional["BotoSesManager"] = None,
+        include_nested_stack: bool = False,
+        tree: T.Optional["ChangeSetTree"] = None,
+    ):
+        actions = [
+            change.get("ResourceChange", {}).get("Action")
+            for change in change_set.changes
+        ]
+        data = dict(
+            stack_name=change_set.stack_name,
+            stack_id=change_set.stack_id,
+            change_set_id=change_set.change_set_id,
+            n_add=actions.count("Add"),
+            n_modify=actions.count("Modify"),
+            n_remove=actions.count("Remove"),
+            n_import=actions.count("Import"),
+            n_dynamic=actions.count("Dynamic"),
+        )
+        if tree is not None:
+            from .plan import Plan
+
+            data["plan"] = Plan.from_change_set_tree(tree).to_dict()
+        self.write(
+            self._make_record(
+                "change_set",
+                f"change set for stack {change_set.stack_name} is created",
+                **data,
+            )
+        )
+
+
+def resolve_reporter(
+    verbose: bool,
+    reporter: T.Optional[BaseReporter] = None,
+) -> BaseReporter:
+    """
+    The ``reporter`` argument wins if it is given, otherwise
+    ``verbose=True`` means :class:`ConsoleReporter` and ``verbose=False``
+    means :class:`NoOpReporter`.
+    """
+    if reporter is not None:
+        return reporter
+    if verbose:
+        return ConsoleReporter()
+    return NoOpReporter()
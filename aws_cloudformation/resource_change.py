@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+The data model of the resource changes in a change set, the ``Changes``
+field of the ``describe_change_set`` response.
+"""
+
+import typing as T
+import enum
+import dataclasses
+
+from .compat import add_slots
+
+
+class TargetAttributeEnum(enum.Enum):
+    PROPERTIES = "Properties"
+    METADATA = "Metadata"
+    CREATION_POLICY = "CreationPolicy"
+    UPDATE_POLICY = "UpdatePolicy"
+    DELETION_POLICY = "DeletionPolicy"
+    TAGS = "Tags"
+
+
+target_attribute_sort_key_mapper = {
+    TargetAttributeEnum.PROPERTIES.value: 1,
+    TargetAttributeEnum.METADATA.value: 2,
+    TargetAttributeEnum.CREATION_POLICY.value: 3,
+    TargetAttributeEnum.UPDATE_POLICY.value: 4,
+    TargetAttributeEnum.DELETION_POLICY.value: 5,
+    TargetAttributeEnum.TAGS.value: 6,
+}
+
+
+def _drop_none(dct: dict) -> dict:
+    return {k: v for k, v in dct.items() if v is not None}
+
+
+@add_slots
+@dataclasses.dataclass
+class Target:
+    attribute: str = dataclasses.field(default=None)
+    name: str = dataclasses.field(default=None)
+    requires_recreation: str = dataclasses.field(default=None)
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> "Target":
+        return cls(
+            attribute=dct.get("Attribute"),
+            name=dct.get("Name"),
+            requires_recreation=dct.get("RequiresRecreation"),
+        )
+
+    def to_dict(self) -> dict:
+        return _drop_none(
+            dict(
+                Attribute=self.attribute,
+                Name=self.name,
+                RequiresRecreation=self.requires_recreation,
+            )
+        )
+
+
+@add_slots
+@dataclasses.dataclass
+class Detail:
+    target: Target = dataclasses.field()
+    evaluation: str = dataclasses.field(default=None)
+    change_source: str = dataclasses.field(default=None)
+    causing_entity: str = dataclasses.field(default=None)
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> "Detail":
+        return cls(
+            target=Target.from_dict(dct["Target"]),
+            evaluation=dct.get("Evaluation"),
+            change_source=dct.get("ChangeSource"),
+            causing_entity=dct.get("CausingEntity"),
+        )
+
+    def to_dict(self) -> dict:
+        return _drop_none(
+            dict(
+                Target=self.target.to_dict(),
+                Evaluation=self.evaluation,
+                ChangeSource=self.change_source,
+                CausingEntity=self.causing_entity,
+            )
+        )
+
+
+def sort_details(details: T.Iterable[Detail]) -> T.Iterable[Detail]:
+    return sorted(
+        details,
+        key=lambda detail: target_attribute_sort_key_mapper[detail.target.attribute],
+    )
+
+
+class ChangeActionEnum(enum.Enum):
+    ADD = "Add"
+    MODIFY = "Modify"
+    REMOVE = "Remove"
+    IMPORT = "Import"
+    DYNAMIC = "Dynamic"
+
+
+@add_slots
+@dataclasses.dataclass
+class ResourceChange:
+    action: str = dataclasses.field()
+    resource_type: str = dataclasses.field()
+    logical_resource_id: str = dataclasses.field()
+    physical_resource_id: T.Optional[str] = dataclasses.field(default=None)
+    replacement: T.Optional[str] = dataclasses.field(default=None)
+    change_set_id: T.Optional[str] = dataclasses.field(default=None)
+    details: T.List[Detail] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> "ResourceChange":
+        return cls(
+            action=dct["Action"],
+            resource_type=dct["ResourceType"],
+            logical_resource_id=dct["LogicalResourceId"],
+            physical_resource_id=dct.get("PhysicalResourceId"),
+            replacement=dct.get("Replacement"),
+            change_set_id=dct.get("ChangeSetId"),
+            details=list(
+                sort_details([Detail.from_dict(d) for d in dct.get("Details", [])])
+            ),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        The reverse of :meth:`from_dict`, the None values are omitted.
+        """
+        dct = _drop_none(
+            dict(
+                Action=self.action,
+                ResourceType=self.resource_type,
+                LogicalResourceId=self.logical_resource_id,
+                PhysicalResourceId=self.physical_resource_id,
+                Replacement=self.replacement,
+                ChangeSetId=self.change_set_id,
+            )
+        )
+        if self.details:
+            dct["Details"] = [detail.to_dict() for detail in self.details]
+        return dct
+
+    def is_replacement(self) -> bool:
+        """
+        The resource will be deleted and re-created.
+        """
+        return self.replacement == "True"
+
+    def is_conditional_replacement(self) -> bool:
+        """
+        The resource may be re-created, depends on the value of the properties
+        that are only known at deployment.
+        """
+        return self.replacement == "Conditional"
+
+
+action_sort_key_mapper = {
+    ChangeActionEnum.ADD.value: 1,
+    ChangeActionEnum.MODIFY.value: 2,
+    ChangeActionEnum.REMOVE.value: 3,
+    ChangeActionEnum.IMPORT.value: 4,
+    ChangeActionEnum.DYNAMIC.value: 5,
+}
+
+
+def sort_changes(changes: T.Iterable[ResourceChange]) -> T.Iterable[ResourceChange]:
+    return sorted(
+        changes,
+        key=lambda rc: action_sort_key_mapper[rc.action],
+    )
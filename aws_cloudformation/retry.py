@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""
+The retry layer of the mutating ``better_boto`` calls, such as
+``create_stack``, ``update_stack``, ``create_change_set``,
+``execute_change_set`` and ``delete_stack``.
+
+The errors are classified as throttling, transient or terminal, only the
+first two are retried with backoff. The idempotency token
+(``client_request_token``) is generated once and reused by all the attempts,
+so if the first attempt actually reached CloudFormation but the response is
+lost, the retry is recognized as the same request instead of a second
+submission.
+
+Usage example::
+
+    from aws_cloudformation import better_boto
+    from aws_cloudformation.retry import RetryPolicy, call_with_retry
+
+    stack_id = call_with_retry(
+        better_boto.create_stack,
+        bsm=bsm,
+        stack_name="my-stack",
+        template_body=template_body,
+        retry_policy=RetryPolicy(max_attempts=5),
+    )
+
+:func:`~aws_cloudformation.deploy.deploy_stack` and
+:func:`~aws_cloudformation.deploy.remove_stack` use it with the
+:data:`DEFAULT_RETRY_POLICY`, see their ``retry_policy`` argument. The
+``func`` is called in
+:func:`~aws_cloudformation.context.botocore_retry_disabled`, its
+CloudFormation calls are not retried by botocore again, so the attempts are
+not multiplied.
+"""
+
+import typing as T
+import enum
+import time
+import uuid
+import inspect
+import dataclasses
+
+from botocore.exceptions import (
+    ClientError,
+    HTTPClientError,
+    ConnectionError as BotoConnectionError,
+)
+from func_args import NOTHING
+from colorama import Fore, Style
+
+from .helper import is_throttling_error
+from .context import botocore_retry_disabled
+from .waiter import DelayStrategy, DecorrelatedJitter
+from .reporter import BaseReporter, NoOpReporter
+
+
+class ErrorKindEnum(str, enum.Enum):
+    """
+    - THROTTLING: the API call is throttled, retry later
+    - TRANSIENT: the network or the service is temporarily unavailable,
+        retry later
+    - TERMINAL: the request itself is wrong, retry won't help
+    """
+
+    THROTTLING = "THROTTLING"
+    TRANSIENT = "TRANSIENT"
+    TERMINAL = "TERMINAL"
+
+
+_transient_error_codes = {
+    "InternalFailure",
+    "InternalError",
+    "InternalServiceError",
+    "ServiceUnavailable",
+    "ServiceUnavailableException",
+    "RequestTimeout",
+    "RequestTimeoutException",
+}
+
+
+def classify_error(e: Exception) -> ErrorKindEnum:
+    """
+    Classify the exception raised by a boto3 API call.
+    """
+    if is_throttling_error(e):
+        return ErrorKindEnum.THROTTLING
+    # connection error, connect / read timeout, ...
+    if isinstance(e, (HTTPClientError, BotoConnectionError)):
+        return ErrorKindEnum.TRANSIENT
+    if isinstance(e, ClientError):
+        if e.response.get("Error", {}).get("Code") in _transient_error_codes:
+            return ErrorKindEnum.TRANSIENT
+        status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status_code, int) and status_code >= 500:
+            return ErrorKindEnum.TRANSIENT
+    return ErrorKindEnum.TERMINAL
+
+
+def new_client_request_token() -> str:
+    """
+    A new idempotency token, it is valid for both ``ClientRequestToken``
+    and the ``ClientToken`` of ``create_change_set``.
+    """
+    return f"aws-cf-{uuid.uuid4()}"
+
+
+def _default_delays() -> DelayStrategy:
+    return DecorrelatedJitter(base=1, cap=20)
+
+
+@dataclasses.dataclass
+class RetryPolicy:
+    """
+    How a mutating API call is retried.
+
+    :param max_attempts: the max number of attempts, 1 means no retry
+    :param delays: how long it waits (in seconds) before each retry
+    :param retry_throttling: whether to retry the throttling errors
+    :param retry_transient: whether to retry the transient errors
+    """
+
+    max_attempts: int = dataclasses.field(default=5)
+    delays: DelayStrategy = dataclasses.field(default_factory=_default_delays)
+    retry_throttling: bool = dataclasses.field(default=True)
+    retry_transient: bool = dataclasses.field(default=True)
+
+    def is_retryable(self, e: Exception) -> bool:
+        error_kind = classify_error(e)
+        if error_kind == ErrorKindEnum.THROTTLING:
+            return self.retry_throttling
+        if error_kind == ErrorKindEnum.TRANSIENT:
+            return self.retry_transient
+        return False
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def call_with_retry(
+    func: T.Callable,
+    retry_policy: T.Optional[RetryPolicy] = None,
+    reporter: T.Optional[BaseReporter] = None,
+    token_arg: T.Optional[str] = "client_request_token",
+    **kwargs,
+):
+    """
+    Call ``func(**kwargs)``, retry it by the ``retry_policy`` when it fails
+    with a throttling or transient error. The CloudFormation calls in ``func``
+    use the client without botocore retries. The terminal error and the last
+    error are raised as it is.
+
+    :param func: usually a mutating ``better_boto`` function
+    :param retry_policy: default to :data:`DEFAULT_RETRY_POLICY`
+    :param reporter: the ``retry`` events go here, see
+        :mod:`aws_cloudformation.reporter`
+    :param token_arg: the idempotency token argument of ``func``. If ``func``
+        takes it and it is not given, a new token is generated and reused by
+        all the attempts. None means don't generate it.
+    :param kwargs: the arguments of ``func``
+
+    :return: the return value of ``func``
+    """
+    if retry_policy is None:
+        retry_policy = DEFAULT_RETRY_POLICY
+    if reporter is None:
+        reporter = NoOpReporter()
+    if (
+        token_arg is not None
+        and kwargs.get(token_arg, NOTHING) in (NOTHING, None)
+        and token_arg in inspect.signature(func).parameters
+    ):
+        kwargs[token_arg] = new_client_request_token()
+
+    delays = iter(retry_policy.delays)
+    attempt = 1
+    while True:
+        try:
+            with botocore_retry_disabled():
+                return func(**kwargs)
+        except Exception as e:
+            if attempt >= retry_policy.max_attempts or (
+                retry_policy.is_retryable(e) is False
+            ):
+                raise
+            delay = next(delays)
+            reporter.on_event(
+                "retry",
+                f"    {Fore.YELLOW}{func.__name__} failed by "
+                f"{classify_error(e).value.lower()} error{Style.RESET_ALL}, "
+                f"retry in {delay:.1f} seconds ({attempt}/"
+                f"{retry_policy.max_attempts - 1}) ...",
+                operation=func.__name__,
+                attempt=attempt,
+                error=repr(e),
+                error_kind=classify_error(e).value,
+                delay=delay,
+            )
+            time.sleep(delay)
+            attempt += 1
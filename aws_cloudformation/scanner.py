@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+"""
+Scan the stacks of many AWS accounts and regions concurrently, into one
+queryable collection of :class:`~aws_cloudformation.inventory.StackInventory`.
+
+Usage example::
+
+    targets = [
+        ScanTarget(bsm=bsm, aws_region=aws_region)
+        for aws_region in ["us-east-1", "us-west-2"]
+    ] + [
+        ScanTarget(bsm=bsm, role_arn=role_arn, aws_region="us-east-1")
+        for role_arn in role_arn_list
+    ]
+    scan = scan_stacks(targets)
+    for result in scan.failed:
+        print(result.target, result.error)
+    stacks = scan.find(aws_region="us-east-1", tags={"team": "data"})
+
+    # scan again later, only the changed stacks are described
+    scan = scan_stacks(targets, scan=scan)
+"""
+
+import typing as T
+import time
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+from boto_session_manager import BotoSesManager
+from colorama import Fore, Style
+from func_args import NOTHING
+
+from .stack import Stack
+from .reporter import BaseReporter, resolve_reporter
+from .inventory import RefreshResult, StackInventory
+from .multi_deploy import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_PER_REGION,
+    RegionLimiter,
+    get_region_key,
+)
+
+
+@dataclasses.dataclass
+class ScanTarget:
+    """
+    One AWS account and region to scan.
+
+    :param bsm: the boto session manager. If ``role_arn`` is given, it is the
+        session to assume the role.
+    :param aws_region: the region to scan, default to the region of ``bsm``
+    :param role_arn: the IAM role to assume, usually the role in another
+        AWS account
+    """
+
+    bsm: BotoSesManager = dataclasses.field()
+    aws_region: T.Optional[str] = dataclasses.field(default=None)
+    role_arn: T.Optional[str] = dataclasses.field(default=None)
+
+    def get_bsm(self) -> BotoSesManager:
+        """
+        Get the boto session manager of the target account and region.
+        """
+        if self.role_arn is not None:
+            region_name = NOTHING if self.aws_region is None else self.aws_region
+            return self.bsm.assume_role(
+                role_arn=self.role_arn,
+                region_name=region_name,
+            )
+        if self.aws_region is None or self.aws_region == self.bsm.aws_region:
+            return self.bsm
+        # a scan is short-lived, the frozen credentials are good enough
+        credentials = self.bsm.boto_ses.get_credentials().get_frozen_credentials()
+        return BotoSesManager(
+            aws_access_key_id=credentials.access_key,
+            aws_secret_access_key=credentials.secret_key,
+            aws_session_token=credentials.token,
+            region_name=self.aws_region,
+        )
+
+    @property
+    def label(self) -> str:
+        parts = [self.role_arn, self.aws_region or self.bsm.aws_region]
+        return " ".join(part for part in parts if part is not None)
+
+
+@dataclasses.dataclass
+class TargetScanResult:
+    """
+    The scan result of one :class:`ScanTarget`.
+
+    :param target: the :class:`ScanTarget`
+    :param aws_account_id: the AWS account id, None if it failed to get it
+    :param aws_region: the AWS region, None if it failed to get it
+    :param inventory: the :class:`~aws_cloudformation.inventory.StackInventory`
+        of the account and region, None if the scan failed
+    :param refresh_result: what's changed since the last scan
+    :param error: the exception raised by the scan, None if succeeded
+    :param elapsed: how long (in seconds) the scan took
+    """
+
+    target: ScanTarget = dataclasses.field()
+    aws_account_id: T.Optional[str] = dataclasses.field(default=None)
+    aws_region: T.Optional[str] = dataclasses.field(default=None)
+    inventory: T.Optional[StackInventory] = dataclasses.field(default=None)
+    refresh_result: T.Optional[RefreshResult] = dataclasses.field(default=None)
+    error: T.Optional[Exception] = dataclasses.field(default=None)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass
+class ScanStacksResponse:
+    """
+    The merged result of :func:`scan_stacks`, the ``results`` are in the same
+    order as the input targets. The stacks are queryable by
+    ``(Stack.aws_account_id, Stack.aws_region)``.
+    """
+
+    results: T.List[TargetScanResult] = dataclasses.field(default_factory=list)
+    elapsed: float = dataclasses.field(default=0.0)
+
+    @property
+    def succeeded(self) -> T.List[TargetScanResult]:
+        return [result for result in self.results if result.is_success()]
+
+    @property
+    def failed(self) -> T.List[TargetScanResult]:
+        return [result for result in self.results if not result.is_success()]
+
+    def is_success(self) -> bool:
+        return len(self.failed) == 0
+
+    @property
+    def inventories(self) -> T.Dict[T.Tuple[str, str], StackInventory]:
+        """
+        The stack inventories by ``(aws_account_id, aws_region)``.
+        """
+        return {
+            (result.aws_account_id, result.aws_region): result.inventory
+            for result in self.succeeded
+        }
+
+    def get_inventory(
+        self,
+        aws_account_id: str,
+        aws_region: str,
+    ) -> T.Optional[StackInventory]:
+        return self.inventories.get((aws_account_id, aws_region))
+
+    def find(
+        self,
+        aws_account_id: T.Optional[str] = None,
+        aws_region: T.Optional[str] = None,
+        **kwargs,
+    ) -> T.List[Stack]:
+        """
+        Find the stacks in all the scanned accounts and regions.
+
+        :param aws_account_id: only find in this AWS account
+        :param aws_region: only find in this AWS region
+        :param kwargs: see :meth:`~aws_cloudformation.inventory.StackInventory.find`
+        """
+        stacks = list()
+        for (account_id, region), inventory in self.inventories.items():
+            if aws_account_id is not None and account_id != aws_account_id:
+                continue
+            if aws_region is not None and region != aws_region:
+                continue
+            stacks.extend(inventory.find(**kwargs))
+        return stacks
+
+
+def _report_result(reporter: BaseReporter, result: TargetScanResult):
+    if result.is_success():
+        icon = "🟢"
+        status = f"{len(result.inventory)} stacks"
+    else:
+        icon = "🔴"
+        status = f"failed: {result.error!r}"
+    reporter.on_event(
+        "scan_result",
+        f"  {icon} {Fore.CYAN}{result.target.label}{Style.RESET_ALL} "
+        f"{status} in {result.elapsed:.1f} seconds",
+        aws_account_id=result.aws_account_id,
+        aws_region=result.aws_region,
+        is_success=result.is_success(),
+        error=None if result.error is None else repr(result.error),
+        elapsed=result.elapsed,
+    )
+
+
+def scan_stacks(
+    targets: T.Iterable[ScanTarget],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_region: int = DEFAULT_MAX_PER_REGION,
+    scan: T.Optional[ScanStacksResponse] = None,
+    full: bool = False,
+    verbose: bool = True,
+    reporter: T.Optional[BaseReporter] = None,
+) -> ScanStacksResponse:
+    """
+    Scan the stacks of all the targets concurrently in a bounded thread pool.
+    A failed target doesn't stop the others, the error is in its
+    :class:`TargetScanResult`.
+
+    :param targets: list of :class:`ScanTarget`
+    :param max_workers: the max number of targets scanning at the same time
+    :param max_per_region: the max number of targets scanning at the same
+        time in the same AWS account and region
+    :param scan: the previous scan result, its inventories are refreshed
+        incrementally, see :meth:`~aws_cloudformation.inventory.StackInventory.refresh`
+    :param full: force a full ``describe_stacks`` sweep
+    :param verbose: whether you want to log the progress to console
+    :param reporter: where the progress goes, see
+        :mod:`aws_cloudformation.reporter`. If given, ``verbose`` is ignored.
+
+    :return: a :class:`ScanStacksResponse` object.
+    """
+    reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+    targets = list(targets)
+    inventories = dict() if scan is None else scan.inventories
+    limiter = RegionLimiter(max_per_region)
+
+    def run(target: ScanTarget) -> TargetScanResult:
+        start = time.time()
+        result = TargetScanResult(target=target)
+        try:
+            bsm = target.get_bsm()
+            region_key = get_region_key(bsm)
+            result.aws_account_id, result.aws_region = region_key
+            with limiter.get(region_key):
+                # the targets of the same account and region share one
+                inventory = inventories.setdefault(region_key, StackInventory())
+                result.refresh_result = inventory.refresh(bsm, full=full)
+                result.inventory = inventory
+        except Exception as e:
+            result.error = e
+        result.elapsed = time.time() - start
+        _report_result(reporter, result)
+        return result
+
+    reporter.on_event(
+        "scan_stacks",
+        f"🔍 {Fore.CYAN}Scan{Style.RESET_ALL} stacks in {len(targets)} targets ...",
+        n_targets=len(targets),
+    )
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run, targets))
+    response = ScanStacksResponse(results=results, elapsed=time.time() - start)
+    reporter.on_event(
+        "done",
+        f"  succeeded {len(response.succeeded)}, "
+        f"failed {len(response.failed)}, "
+        f"elapsed {response.elapsed:.1f} seconds\n"
+        f"  done",
+        n_succeeded=len(response.succeeded),
+        n_failed=len(response.failed),
+        elapsed=response.elapsed,
+    )
+    return response
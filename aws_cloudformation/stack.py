@@ -10,10 +10,12 @@ import dataclasses
 from datetime import datetime
 
 import aws_arns.api as aws_arns
-import aws_console_url.api as acu
 
+from .compat import add_slots
 from .helper import get_enum_by_name
+from .context import get_region_console
 from .taggings import to_tag_dict
+from .resource_change import ResourceChange
 
 
 class StackStatusEnum(str, enum.Enum):
@@ -141,6 +143,7 @@ _NOT_LIVE_STATUS: T.Set[StackStatusEnum] = {
 }
 
 
+@add_slots
 @dataclasses.dataclass
 class Output:
     """
@@ -155,6 +158,35 @@ class Output:
     export_name: T.Optional[str] = dataclasses.field(default=None)
 
 
+@add_slots
+@dataclasses.dataclass
+class Export:
+    """
+    An exported output value in the account and region.
+
+    Ref:
+
+    - list_exports: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_exports.html
+    """
+
+    name: str = dataclasses.field()
+    value: str = dataclasses.field()
+    exporting_stack_id: str = dataclasses.field()
+
+    @classmethod
+    def from_list_exports_response(cls, data: dict) -> "Export":
+        return cls(
+            name=data["Name"],
+            value=data["Value"],
+            exporting_stack_id=data["ExportingStackId"],
+        )
+
+    @property
+    def exporting_stack_name(self) -> str:
+        return self.exporting_stack_id.split("/")[1]
+
+
+@add_slots
 @dataclasses.dataclass
 class Parameter:
     """
@@ -195,6 +227,7 @@ class DriftStatusEnum(str, enum.Enum):
         return get_enum_by_name(cls, name)
 
 
+@add_slots
 @dataclasses.dataclass
 class Stack:
     """ """
@@ -311,6 +344,36 @@ class Stack:
             ),
         )
 
+    @classmethod
+    def from_list_stacks_response(cls, data: dict) -> "Stack":
+        """
+        Create a :class:`~aws_cottonformation.stack.Stack` object from the
+        ``list_stacks`` API response. The stack summary doesn't have the
+        outputs, parameters and tags.
+
+        Ref:
+
+        - list_stacks: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_stacks.html
+        """
+        drift_status = data.get("DriftInformation", dict()).get("StackDriftStatus")
+        if drift_status is not None:
+            drift_status = DriftStatusEnum.get_by_name(drift_status)
+        return cls(
+            id=data["StackId"],
+            name=data["StackName"],
+            status=StackStatusEnum.get_by_name(data["StackStatus"]),
+            description=data.get("TemplateDescription"),
+            creation_time=data.get("CreationTime"),
+            last_updated_time=data.get("LastUpdatedTime"),
+            deletion_time=data.get("DeletionTime"),
+            parent_id=data.get("ParentId"),
+            root_id=data.get("RootId"),
+            drift_status=drift_status,
+            drift_last_check_time=data.get("DriftInformation", dict()).get(
+                "LastCheckTimestamp"
+            ),
+        )
+
     @property
     def aws_region(self) -> str:
         return self.id.split(":")[3]
@@ -321,10 +384,103 @@ class Stack:
 
     @property
     def console_url(self) -> str:
-        aws_console = acu.AWSConsole(aws_region=self.aws_region)
+        aws_console = get_region_console(self.aws_region)
         return aws_console.cloudformation.get_stack_info(name_or_arn=self.id)
 
 
+_STACK_OPERATION_START_STATUS: T.Set[StackStatusEnum] = {
+    StackStatusEnum.CREATE_IN_PROGRESS,
+    StackStatusEnum.UPDATE_IN_PROGRESS,
+    StackStatusEnum.DELETE_IN_PROGRESS,
+    StackStatusEnum.IMPORT_IN_PROGRESS,
+}
+
+
+@add_slots
+@dataclasses.dataclass
+class StackEvent:
+    """
+    Ref:
+
+    - describe_stack_events: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/describe_stack_events.html
+    """
+
+    stack_id: str = dataclasses.field()
+    event_id: str = dataclasses.field()
+    stack_name: str = dataclasses.field()
+    logical_resource_id: T.Optional[str] = dataclasses.field(default=None)
+    physical_resource_id: T.Optional[str] = dataclasses.field(default=None)
+    resource_type: T.Optional[str] = dataclasses.field(default=None)
+    timestamp: T.Optional[datetime] = dataclasses.field(default=None)
+    resource_status: T.Optional[str] = dataclasses.field(default=None)
+    resource_status_reason: T.Optional[str] = dataclasses.field(default=None)
+    resource_properties: T.Optional[str] = dataclasses.field(default=None)
+    client_request_token: T.Optional[str] = dataclasses.field(default=None)
+
+    def is_stack_event(self) -> bool:
+        """
+        Is it an event of the stack itself, not a resource in the stack.
+        """
+        return (self.resource_type == "AWS::CloudFormation::Stack") and (
+            self.logical_resource_id == self.stack_name
+        )
+
+    def is_failed(self) -> bool:
+        """ """
+        return (self.resource_status is not None) and self.resource_status.endswith(
+            "_FAILED"
+        )
+
+    def is_in_progress(self) -> bool:
+        """ """
+        return (self.resource_status is not None) and self.resource_status.endswith(
+            "_IN_PROGRESS"
+        )
+
+    @property
+    def stack_status(self) -> T.Optional[StackStatusEnum]:
+        """
+        The stack status if it is a stack event, otherwise None.
+        """
+        if self.is_stack_event():
+            return StackStatusEnum.get_by_name(self.resource_status)
+        else:
+            return None
+
+    def is_stack_stopped(self) -> bool:
+        """
+        Is it the stack event that ends a stack operation.
+        """
+        return self.stack_status in _STOPPED_STATUS
+
+    def is_stack_operation_start(self) -> bool:
+        """
+        Is it the stack event that starts a create / update / delete / import
+        stack operation.
+        """
+        return self.stack_status in _STACK_OPERATION_START_STATUS
+
+    @classmethod
+    def from_describe_stack_events_response(cls, data: dict) -> "StackEvent":
+        """
+        Create a :class:`~aws_cottonformation.stack.StackEvent` object from the
+        ``describe_stack_events`` API response.
+        """
+        return cls(
+            stack_id=data["StackId"],
+            event_id=data["EventId"],
+            stack_name=data["StackName"],
+            logical_resource_id=data.get("LogicalResourceId"),
+            physical_resource_id=data.get("PhysicalResourceId"),
+            resource_type=data.get("ResourceType"),
+            timestamp=data.get("Timestamp"),
+            resource_status=data.get("ResourceStatus"),
+            resource_status_reason=data.get("ResourceStatusReason"),
+            resource_properties=data.get("ResourceProperties"),
+            client_request_token=data.get("ClientRequestToken"),
+        )
+
+
 class ChangeSetStatusEnum(str, enum.Enum):
     """ """
 
@@ -371,6 +527,7 @@ class ChangeSetExecutionStatusEnum(str, enum.Enum):
         return get_enum_by_name(cls, name)
 
 
+@add_slots
 @dataclasses.dataclass
 class ChangeSet:
     """
@@ -401,6 +558,33 @@ class ChangeSet:
     next_token: T.Optional[str] = dataclasses.field(default=None)
     parent_change_set_id: T.Optional[str] = dataclasses.field(default=None)
     root_change_set_id: T.Optional[str] = dataclasses.field(default=None)
+    # the cache of the parsed resource changes, see resource_changes
+    _resource_changes_cache: tuple = dataclasses.field(
+        default_factory=tuple,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def resource_changes(self) -> T.List[ResourceChange]:
+        """
+        The :attr:`changes` (raw boto3 dict) parsed as
+        :class:`~aws_cloudformation.resource_change.ResourceChange` objects.
+        It is parsed on the first access, and parsed again only if
+        :attr:`changes` is replaced or extended.
+        """
+        changes = self.changes or []
+        cache = self._resource_changes_cache
+        if len(cache) == 0 or cache[0] is not changes or cache[1] != len(changes):
+            resource_changes = [
+                ResourceChange.from_dict(d["ResourceChange"])
+                for d in changes
+                if "ResourceChange" in d
+            ]
+            cache = (changes, len(changes), resource_changes)
+            self._resource_changes_cache = cache
+        return cache[2]
 
     def is_status_create_pending(self) -> bool:  # pragma: no cover
         """ """
@@ -514,7 +698,7 @@ class ChangeSet:
 
     @property
     def console_url(self) -> str:
-        aws_console = acu.AWSConsole(aws_region=self.aws_region)
+        aws_console = get_region_console(self.aws_region)
         return aws_console.cloudformation.get_change_set(
             stack_name_or_arn=self.stack_id,
             change_set_id=self.change_set_id,
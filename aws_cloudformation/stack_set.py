@@ -10,9 +10,10 @@ import dataclasses
 from datetime import datetime
 
 import aws_arns.api as aws_arns
-import aws_console_url.api as acu
 
+from .compat import add_slots
 from .helper import get_enum_by_name
+from .context import get_region_console
 from .stack import (
     Parameter,
 )
@@ -53,6 +54,7 @@ class StackSetCallAsEnum(str, enum.Enum):
         return get_enum_by_name(cls, name)
 
 
+@add_slots
 @dataclasses.dataclass
 class StackSet:
     """ """
@@ -148,7 +150,7 @@ class StackSet:
 
     @property
     def console_url(self) -> str:
-        aws_console = acu.AWSConsole(aws_region=self.aws_region)
+        aws_console = get_region_console(self.aws_region)
         return aws_console.cloudformation.get_stack_set_info(
             name_or_id_or_arn=self.arn,
             is_self_managed=self.is_self_managed,
@@ -202,6 +204,7 @@ class StackInstanceDriftStatusEnum(str, enum.Enum):
         return get_enum_by_name(cls, name)
 
 
+@add_slots
 @dataclasses.dataclass
 class StackInstance:
     """ """
@@ -335,7 +338,128 @@ class StackInstance:
         """
         The URL to the deployment target account CloudFormation stack.
         """
-        aws_console = acu.AWSConsole(aws_region=self.aws_region)
+        aws_console = get_region_console(self.aws_region)
         return aws_console.cloudformation.get_stack_info(
             name_or_arn=self.stack_id,
         )
+
+
+class StackSetOperationStatusEnum(str, enum.Enum):
+    """ """
+
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    STOPPING = "STOPPING"
+    STOPPED = "STOPPED"
+    QUEUED = "QUEUED"
+
+    @classmethod
+    def get_by_name(
+        cls, name: T.Optional[str]
+    ) -> T.Optional["StackSetOperationStatusEnum"]:
+        return get_enum_by_name(cls, name)
+
+
+@add_slots
+@dataclasses.dataclass
+class StackSetOperation:
+    """
+    Ref:
+
+    - describe_stack_set_operation: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/describe_stack_set_operation.html
+    """
+
+    operation_id: str = dataclasses.field()
+    stack_set_id: str = dataclasses.field()
+    action: T.Optional[str] = dataclasses.field(default=None)
+    status: T.Optional[StackSetOperationStatusEnum] = dataclasses.field(default=None)
+    status_reason: T.Optional[str] = dataclasses.field(default=None)
+    failed_stack_instances_count: T.Optional[int] = dataclasses.field(default=None)
+    creation_timestamp: T.Optional[datetime] = dataclasses.field(default=None)
+    end_timestamp: T.Optional[datetime] = dataclasses.field(default=None)
+
+    def is_succeeded(self) -> bool:
+        return self.status == StackSetOperationStatusEnum.SUCCEEDED
+
+    def is_stopped(self) -> bool:
+        """
+        The operation is finished, it won't change anymore.
+        """
+        return self.status in [
+            StackSetOperationStatusEnum.SUCCEEDED,
+            StackSetOperationStatusEnum.FAILED,
+            StackSetOperationStatusEnum.STOPPED,
+        ]
+
+    @classmethod
+    def from_describe_stack_set_operation_response(
+        cls,
+        data: dict,
+    ) -> "StackSetOperation":
+        return cls(
+            operation_id=data["OperationId"],
+            stack_set_id=data["StackSetId"],
+            action=data.get("Action"),
+            status=StackSetOperationStatusEnum.get_by_name(data.get("Status")),
+            status_reason=data.get("StatusReason"),
+            failed_stack_instances_count=data.get("StatusDetails", {}).get(
+                "FailedStackInstancesCount"
+            ),
+            creation_timestamp=data.get("CreationTimestamp"),
+            end_timestamp=data.get("EndTimestamp"),
+        )
+
+
+class StackSetOperationResultStatusEnum(str, enum.Enum):
+    """ """
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+    @classmethod
+    def get_by_name(
+        cls, name: T.Optional[str]
+    ) -> T.Optional["StackSetOperationResultStatusEnum"]:
+        return get_enum_by_name(cls, name)
+
+
+@add_slots
+@dataclasses.dataclass
+class StackSetOperationResult:
+    """
+    The result of a stack set operation in one account and region.
+
+    Ref:
+
+    - list_stack_set_operation_results: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cloudformation/client/list_stack_set_operation_results.html
+    """
+
+    aws_account_id: str = dataclasses.field()
+    aws_region: str = dataclasses.field()
+    status: T.Optional[StackSetOperationResultStatusEnum] = dataclasses.field(
+        default=None
+    )
+    status_reason: T.Optional[str] = dataclasses.field(default=None)
+    account_gate_result: dict = dataclasses.field(default_factory=dict)
+    org_unit_id: T.Optional[str] = dataclasses.field(default=None)
+
+    def is_failed(self) -> bool:
+        return self.status == StackSetOperationResultStatusEnum.FAILED
+
+    @classmethod
+    def from_list_stack_set_operation_results_response(
+        cls,
+        data: dict,
+    ) -> "StackSetOperationResult":
+        return cls(
+            aws_account_id=data["Account"],
+            aws_region=data["Region"],
+            status=StackSetOperationResultStatusEnum.get_by_name(data.get("Status")),
+            status_reason=data.get("StatusReason"),
+            account_gate_result=data.get("AccountGateResult", {}),
+            org_unit_id=data.get("OrganizationalUnitId"),
+        )
@@ -4,6 +4,8 @@ import typing as T
 import moto
 from boto_session_manager import BotoSesManager
 
+from ..context import UploadIndex, get_context
+
 
 class BaseTest:
     bucket: str = "111122223333-us-east-1-artifacts"
@@ -24,6 +26,8 @@ class BaseTest:
         cls.mock_cf.start()
         cls.mock_sts.start()
         cls.bsm = BotoSesManager(region_name="us-east-1")
+        # the mocked bucket is empty in every run, don't trust the local index
+        get_context(cls.bsm).upload_index = UploadIndex(path=None)
 
         cls.setup_s3_bucket()
 
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stacks depending on each other through ``Outputs.Export`` and ``Fn::ImportValue``.
+"""
+
+import cottonformation as cf
+from cottonformation.res import iam
+
+
+def make_policy(logic_id: str, policy_name: str) -> iam.ManagedPolicy:
+    return iam.ManagedPolicy(
+        logic_id,
+        p_ManagedPolicyName=policy_name,
+        rp_PolicyDocument={
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": "s3:GetObject",
+                    "Resource": "arn:aws:s3:::this-bucket-not-exists/this-file-not-exists.txt",
+                }
+            ],
+        },
+    )
+
+
+def make_producer_tpl(project_name: str) -> cf.Template:
+    """
+    Exports ``${project_name}-policy-arn``.
+    """
+    tpl = cf.Template()
+    policy = make_policy("Policy", f"{project_name}-producer")
+    tpl.add(policy)
+    tpl.add(
+        cf.Output(
+            "PolicyArn",
+            Value=policy.ref(),
+            Export=cf.Export(Name=f"{project_name}-policy-arn"),
+        )
+    )
+    return tpl
+
+
+def make_consumer_tpl(project_name: str) -> cf.Template:
+    """
+    Imports ``${project_name}-policy-arn``.
+    """
+    tpl = cf.Template()
+    policy = make_policy("Policy", f"{project_name}-consumer")
+    policy.p_Description = cf.ImportValue(f"{project_name}-policy-arn")
+    tpl.add(policy)
+    return tpl
@@ -1,43 +1,324 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
-import sys
+import json
 import time
+import random
+import asyncio
 import itertools
+import threading
+from pathlib import Path
+
+from .reporter import BaseReporter, resolve_reporter
+
+
+class DelayStrategy:
+    """
+    Base class of the delay strategies, it decides how long :class:`Waiter`
+    waits before each attempt. Iterating it yields the delays (in seconds)
+    of a new wait, so the same object can be reused.
+    """
+
+    def __iter__(self) -> T.Iterator[float]:  # pragma: no cover
+        raise NotImplementedError
+
+    def record(self, elapsed: float):
+        """
+        Called by :meth:`Waiter.done` when the wait finished successfully
+        before timeout, the strategy can learn from it. Failed waits (for
+        example, the stack rolled back) are not recorded.
+
+        :param elapsed: how long (in seconds) the wait took
+        """
+
+    def for_stack(self, stack_name: str) -> "DelayStrategy":
+        """
+        The strategy for one of the stacks given to the multi stack runners,
+        such as :func:`~aws_cloudformation.multi_deploy.deploy_stacks`. A
+        stateless strategy returns itself, a stateful one returns a copy of
+        its own for the stack.
+
+        :param stack_name: the stack name
+        """
+        return self
+
+
+class FixedDelay(DelayStrategy):
+    """
+    Always wait the same seconds, the default behavior of :class:`Waiter`.
+    """
+
+    def __init__(self, delays: T.Union[int, float]):
+        self.delays = delays
+
+    def __iter__(self) -> T.Iterator[float]:
+        return itertools.repeat(self.delays)
+
+
+class ExponentialBackoff(DelayStrategy):
+    """
+    ``base``, ``base * factor``, ``base * factor ** 2``, ... until ``cap``.
+    Short operation finishes with a few quick polls, long operation doesn't
+    waste api calls.
+
+    :param base: the first delay
+    :param factor: the multiplier of the next delay
+    :param cap: the max delay
+    """
+
+    def __init__(
+        self,
+        base: T.Union[int, float] = 1,
+        factor: T.Union[int, float] = 2,
+        cap: T.Union[int, float] = 30,
+    ):
+        self.base = base
+        self.factor = factor
+        self.cap = cap
+
+    def __iter__(self) -> T.Iterator[float]:
+        delay = self.base
+        while True:
+            yield min(delay, self.cap)
+            delay = delay * self.factor
+
+
+class DecorrelatedJitter(DelayStrategy):
+    """
+    The "decorrelated jitter" backoff, the next delay is a random number
+    between ``base`` and 3 times the previous delay, until ``cap``. Many
+    waiters started at the same time won't poll at the same time.
+
+    Ref:
+
+    - https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+
+    :param base: the min delay
+    :param cap: the max delay
+    """
+
+    def __init__(
+        self,
+        base: T.Union[int, float] = 1,
+        cap: T.Union[int, float] = 30,
+    ):
+        self.base = base
+        self.cap = cap
+
+    def __iter__(self) -> T.Iterator[float]:
+        delay = self.base
+        while True:
+            delay = min(self.cap, random.uniform(self.base, delay * 3))
+            yield delay
+
+
+DEFAULT_EXPECTED_DURATION_PATH = Path.home().joinpath(
+    ".aws_cloudformation",
+    "expected-duration.json",
+)
+
+_expected_duration_file_lock = threading.Lock()
+
+
+class ExpectedDuration(DelayStrategy):
+    """
+    Learn how long the previous waits of the same ``key`` (usually the stack
+    name and the operation) took, and store it in a local json file. It waits
+    longer at the beginning and polls quicker when it is close to the
+    expected duration, then falls back to :class:`ExponentialBackoff` if it
+    takes longer than expected. Without history, it is just an
+    :class:`ExponentialBackoff`.
+
+    Use one object for one stack, the history of different stacks should
+    not be mixed. The multi stack runners, such as
+    :func:`~aws_cloudformation.multi_deploy.deploy_stacks`, copy it for each
+    stack by :meth:`for_stack`, for example, ``ExpectedDuration(key="update")``
+    uses the key ``"my-stack:update"`` for the stack ``my-stack``.
+
+    :param key: the key of the history, for example ``"my-stack:update"``
+    :param base: the min delay
+    :param factor: the multiplier of the delay after the expected duration
+    :param cap: the max delay
+    :param n_history: how many previous durations to remember
+    :param path: the json file to store the history
+    """
+
+    def __init__(
+        self,
+        key: str,
+        base: T.Union[int, float] = 1,
+        factor: T.Union[int, float] = 2,
+        cap: T.Union[int, float] = 30,
+        n_history: int = 10,
+        path: Path = DEFAULT_EXPECTED_DURATION_PATH,
+    ):
+        self.key = key
+        self.base = base
+        self.factor = factor
+        self.cap = cap
+        self.n_history = n_history
+        self.path = Path(path)
+
+    def for_stack(self, stack_name: str) -> "ExpectedDuration":
+        return ExpectedDuration(
+            key=f"{stack_name}:{self.key}",
+            base=self.base,
+            factor=self.factor,
+            cap=self.cap,
+            n_history=self.n_history,
+            path=self.path,
+        )
+
+    def _read(self) -> T.Dict[str, T.List[float]]:
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return dict()
+
+    def get_history(self) -> T.List[float]:
+        return self._read().get(self.key, [])
+
+    def get_expected_duration(self) -> T.Optional[float]:
+        """
+        The median of the history, None if there's no history.
+        """
+        history = sorted(self.get_history())
+        if len(history) == 0:
+            return None
+        return history[len(history) // 2]
+
+    def record(self, elapsed: float):
+        with _expected_duration_file_lock:
+            data = self._read()
+            history = data.get(self.key, [])
+            history.append(round(elapsed, 3))
+            data[self.key] = history[-self.n_history :]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=4))
+
+    def __iter__(self) -> T.Iterator[float]:
+        expected = self.get_expected_duration()
+        if expected is not None:
+            # halve the remaining time to the expected duration
+            total = 0
+            while (expected - total) > self.base:
+                delay = min(self.cap, max(self.base, (expected - total) / 2))
+                yield delay
+                total += delay
+        yield from ExponentialBackoff(
+            base=self.base,
+            factor=self.factor,
+            cap=self.cap,
+        )
 
 
 class Waiter:
     """
     Simple retry / poll with progress.
+
+    :param delays: how long it waits (in seconds) between two attempts, or
+        a :class:`DelayStrategy` object.
+    :param timeout: how long it will raise timeout error
+    :param verbose: whether you want to log the progress to console,
+        ignored if ``reporter`` is given
+    :param max_throttle_factor: see :meth:`notify_throttled`
+    :param reporter: report the progress to a
+        :class:`~aws_cloudformation.reporter.BaseReporter`
     """
+
     def __init__(
         self,
-        delays: T.Union[int, float],
+        delays: T.Union[int, float, DelayStrategy],
         timeout: T.Union[int, float],
         indent: int = 0,
         verbose: bool = True,
+        max_throttle_factor: int = 16,
+        reporter: T.Optional[BaseReporter] = None,
     ):
-        self.delays = itertools.repeat(delays)
+        if isinstance(delays, DelayStrategy):
+            self.strategy = delays
+        else:
+            self.strategy = FixedDelay(delays)
+        self.delays = iter(self.strategy)
         self.timeout = timeout
-        self.tab = " " * indent
+        self.indent = indent
         self.verbose = verbose
+        self.reporter = resolve_reporter(verbose=verbose, reporter=reporter)
+        self.max_throttle_factor = max_throttle_factor
+        self.throttle_factor = 1
+        self._throttled = False
+        self._start: T.Optional[float] = None
+
+    def notify_throttled(self):
+        """
+        Tell the waiter the last attempt is throttled, the next delays are
+        doubled (up to ``max_throttle_factor`` times). Each attempt that is
+        not throttled halves it back.
+        """
+        self._throttled = True
+        self.throttle_factor = min(self.throttle_factor * 2, self.max_throttle_factor)
+
+    def done(self):
+        """
+        Tell the waiter the thing it waits for finished successfully, the
+        elapsed time is recorded by the :class:`DelayStrategy`. Call it right
+        before returning from the loop, don't call it on failure.
+        """
+        if self._start is not None:
+            self.strategy.record(time.time() - self._start)
+            self._start = None
+
+    def _next_tick(
+        self,
+        attempt: int,
+        delay: float,
+        start: float,
+    ) -> T.Tuple[float, int]:
+        """
+        :return: how long to sleep before this attempt, and the elapsed seconds
+            after the sleep.
+        """
+        if self._throttled is False:
+            self.throttle_factor = max(1, self.throttle_factor // 2)
+        self._throttled = False
+        delay = delay * self.throttle_factor
+        now = time.time()
+        remaining = start + self.timeout - now
+        if remaining < 0:
+            raise TimeoutError(f"timed out in {self.timeout} seconds!")
+        elapsed = int(now - start + delay)
+        self.reporter.on_tick(
+            attempt=attempt,
+            elapsed=elapsed,
+            timeout=self.timeout,
+            indent=self.indent,
+        )
+        return min(delay, remaining), elapsed
 
     def __iter__(self):
         start = time.time()
-        end = start + self.timeout
+        self._start = start
+        for attempt, delay in enumerate(self.delays, 1):
+            sleep, elapsed = self._next_tick(attempt, delay, start)
+            time.sleep(sleep)
+            yield attempt, elapsed
+
+
+class AsyncWaiter(Waiter):
+    """
+    The asyncio version of :class:`Waiter`, it waits with ``asyncio.sleep``
+    so thousands of waits can share one event loop.
+
+    Example::
+
+        async for attempt, elapsed in AsyncWaiter(delays=3, timeout=60):
+            ...
+    """
+
+    async def __aiter__(self):
+        start = time.time()
+        self._start = start
         for attempt, delay in enumerate(self.delays, 1):
-            now = time.time()
-            remaining = end - now
-            if remaining < 0:
-                raise TimeoutError(f"timed out in {self.timeout} seconds!")
-            else:
-                time.sleep(min(delay, remaining))
-                elapsed = int(now - start + delay)
-                if self.verbose:
-                    sys.stdout.write(
-                        f"\r{self.tab}on {attempt} th attempt, "
-                        f"elapsed {elapsed} seconds, "
-                        f"remain {self.timeout - elapsed} seconds ..."
-                    )
-                    sys.stdout.flush()
-                yield attempt, int(elapsed)
+            sleep, elapsed = self._next_tick(attempt, delay, start)
+            await asyncio.sleep(sleep)
+            yield attempt, elapsed
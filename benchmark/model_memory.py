@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memory usage of the ``__slots__`` models vs the plain dataclass models, and
+the cost of the cached ``ChangeSet.resource_changes`` on top of the raw
+``ChangeSet.changes``.
+
+Usage::
+
+    python benchmark/model_memory.py
+"""
+
+import gc
+import dataclasses
+import tracemalloc
+
+from aws_cloudformation.stack import Stack, ChangeSet
+
+N = 100_000
+# change sets are much bigger, and there are much fewer of them
+N_CHANGE_SET = 2_000
+N_CHANGES = 20
+
+
+def make_unslotted(cls):
+    """
+    Create the same dataclass without ``__slots__``, for comparison.
+    """
+    fields = [
+        (
+            field.name,
+            field.type,
+            dataclasses.field(
+                default=field.default,
+                default_factory=field.default_factory,
+                init=field.init,
+                repr=field.repr,
+                compare=field.compare,
+            ),
+        )
+        for field in dataclasses.fields(cls)
+    ]
+    return dataclasses.make_dataclass(f"{cls.__name__}WithDict", fields)
+
+
+def make_response(i: int) -> dict:
+    return {
+        "StackId": f"arn:aws:cloudformation:us-east-1:111122223333:stack/stack-{i}/{i:08d}",
+        "StackName": f"stack-{i}",
+        "StackStatus": "UPDATE_COMPLETE",
+        "Tags": [{"Key": "Project", "Value": "demo"}],
+    }
+
+
+def make_change_set_response(i: int) -> dict:
+    return {
+        "ChangeSetId": f"arn:aws:cloudformation:us-east-1:111122223333:changeSet/cs-{i}/{i:08d}",
+        "ChangeSetName": f"cs-{i}",
+        "StackId": f"arn:aws:cloudformation:us-east-1:111122223333:stack/stack-{i}/{i:08d}",
+        "StackName": f"stack-{i}",
+        "Status": "CREATE_COMPLETE",
+        "ExecutionStatus": "AVAILABLE",
+        "Changes": [
+            {
+                "Type": "Resource",
+                "ResourceChange": {
+                    "Action": "Modify",
+                    "LogicalResourceId": f"Resource{j}",
+                    "PhysicalResourceId": f"resource-{i}-{j}",
+                    "ResourceType": "AWS::IAM::Role",
+                    "Replacement": "False",
+                    "Scope": ["Properties"],
+                    "Details": [
+                        {
+                            "Target": {
+                                "Attribute": "Properties",
+                                "Name": "Description",
+                                "RequiresRecreation": "Never",
+                            },
+                            "Evaluation": "Static",
+                            "ChangeSource": "DirectModification",
+                        }
+                    ],
+                },
+            }
+            for j in range(N_CHANGES)
+        ],
+    }
+
+
+def measure(create, n: int = N) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [create(i) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return total / n
+
+
+def main_change_set():
+    """
+    The raw ``Changes`` dicts are built inside the measurement, they are the
+    bulk of a change set.
+    """
+    ChangeSetWithDict = make_unslotted(ChangeSet)
+
+    def create_slotted(i: int) -> ChangeSet:
+        return ChangeSet.from_describe_change_set_response(make_change_set_response(i))
+
+    def create_unslotted(i: int):
+        change_set = create_slotted(i)
+        return ChangeSetWithDict(
+            **{
+                field.name: getattr(change_set, field.name)
+                for field in dataclasses.fields(ChangeSet)
+                if field.init
+            }
+        )
+
+    def create_with_parsed(i: int):
+        # the parsed changes are cached on the first access
+        change_set = create_slotted(i)
+        _ = change_set.resource_changes
+        return change_set
+
+    slotted = measure(create_slotted, N_CHANGE_SET)
+    unslotted = measure(create_unslotted, N_CHANGE_SET)
+    parsed = measure(create_with_parsed, N_CHANGE_SET)
+    print(
+        f"{N_CHANGE_SET} ChangeSet objects with {N_CHANGES} changes, "
+        f"bytes per object (including the field values)"
+    )
+    print(f"  with __dict__                    : {unslotted:,.0f}")
+    print(f"  with __slots__                   : {slotted:,.0f}")
+    print(f"  with __slots__ + resource_changes: {parsed:,.0f}")
+
+
+def main():
+    StackWithDict = make_unslotted(Stack)
+    responses = [make_response(i) for i in range(N)]
+
+    def create_slotted(i: int) -> Stack:
+        return Stack.from_describe_stacks_response(responses[i])
+
+    def create_unslotted(i: int):
+        stack = Stack.from_describe_stacks_response(responses[i])
+        return StackWithDict(
+            **{
+                field.name: getattr(stack, field.name)
+                for field in dataclasses.fields(Stack)
+                if field.init
+            }
+        )
+
+    slotted = measure(create_slotted)
+    unslotted = measure(create_unslotted)
+    print(f"{N} Stack objects, bytes per object (including the field values)")
+    print(f"  with __dict__ : {unslotted:,.0f}")
+    print(f"  with __slots__: {slotted:,.0f}")
+    print(f"  saved         : {(unslotted - slotted) / unslotted:.1%}")
+    main_change_set()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.better_boto import aio
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1
+
+
+class Test(BaseTest):
+    async def _test_stacks(self):
+        project_names = [f"aws-cf-better-boto-aio-test-{ith}" for ith in range(1, 1 + 3)]
+
+        async def create_stack(project_name: str) -> aws_cf.Stack:
+            stack_id, change_set_id = await aio.create_change_set(
+                bsm=self.bsm,
+                stack_name=project_name,
+                change_set_name="cs-1",
+                template_body=make_tpl_1().to_json(),
+                parameters=[aws_cf.Parameter(key="ProjectName", value=project_name)],
+                include_named_iam=True,
+                change_set_type_is_create=True,
+            )
+            change_set = await aio.wait_create_change_set_to_finish(
+                bsm=self.bsm,
+                stack_name=project_name,
+                change_set_id=change_set_id,
+                delays=0.1,
+                timeout=3,
+                verbose=False,
+            )
+            assert change_set.is_status_create_complete() is True
+            await aio.execute_change_set(
+                bsm=self.bsm,
+                stack_name=project_name,
+                change_set_name=change_set_id,
+            )
+            return await aio.wait_create_or_update_stack_to_finish(
+                bsm=self.bsm,
+                stack_name=stack_id,
+                wait_until_exec_stopped=True,
+                delays=0.1,
+                timeout=3,
+                verbose=False,
+            )
+
+        stacks = await asyncio.gather(*[create_stack(name) for name in project_names])
+        for stack in stacks:
+            assert stack.is_success() is True
+
+        stack_list = await aio.describe_stacks(bsm=self.bsm)
+        assert {stack.name for stack in stack_list}.issuperset(project_names)
+
+        async def delete_stack(stack: aws_cf.Stack):
+            await aio.run_in_executor(
+                aws_cf.better_boto.delete_stack,
+                bsm=self.bsm,
+                stack_name=stack.id,
+            )
+            await aio.wait_delete_stack_to_finish(
+                bsm=self.bsm,
+                stack_id=stack.id,
+                wait_until_exec_stopped=True,
+                delays=0.1,
+                timeout=3,
+                verbose=False,
+            )
+
+        await asyncio.gather(*[delete_stack(stack) for stack in stacks])
+        for project_name in project_names:
+            stack = await aio.describe_live_stack(bsm=self.bsm, name=project_name)
+            assert stack is None
+
+    def test(self):
+        asyncio.run(self._test_stacks())
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.better_boto.aio", preview=False)
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import io
+import json
+import time
+
 import pytest
 from rich import print as rprint
 import aws_cloudformation as aws_cf
@@ -240,6 +244,204 @@ class Test(BaseTest):
         assert stack.id == stack_id
         assert stack.status.is_stopped()
 
+    def test_multi_stack_waiter(self):
+        multi_stack_waiter = aws_cf.better_boto.MultiStackWaiter(
+            bsm=self.bsm,
+            delays=0.1,
+        )
+        stack_ids = list()
+        for ith in range(1, 1 + 3):
+            project_name = f"aws-cf-better-boto-multi-stack-waiter-test-{ith}"
+            stack_id = aws_cf.better_boto.create_stack(
+                bsm=self.bsm,
+                stack_name=project_name,
+                template_body=make_tpl_1().to_json(),
+                parameters=[aws_cf.Parameter(key="ProjectName", value=project_name)],
+                include_named_iam=True,
+            )
+            stack_ids.append(stack_id)
+
+        # one sweep for all stacks
+        stacks = multi_stack_waiter.wait(stack_ids, timeout=3)
+        assert multi_stack_waiter.n_sweep == 1
+        assert set(stacks) == set(stack_ids)
+        for stack in stacks.values():
+            assert stack.is_success()
+
+        # the snapshot is shared until it is stale
+        stack = multi_stack_waiter.get_stack(stack_ids[0])
+        assert stack.id == stack_ids[0]
+        stack = multi_stack_waiter.get_stack(stack.name)
+        assert stack.id == stack_ids[0]
+        assert multi_stack_waiter.n_sweep == 1
+        # a snapshot older than the caller's wait start is not trusted
+        stack = multi_stack_waiter.get_stack(stack.name, not_before=time.time())
+        assert stack.id == stack_ids[0]
+        assert multi_stack_waiter.n_sweep == 2
+
+        stack = aws_cf.better_boto.wait_create_or_update_stack_to_finish(
+            bsm=self.bsm,
+            stack_name=stack_ids[1],
+            wait_until_exec_stopped=True,
+            delays=0.1,
+            timeout=3,
+            verbose=False,
+            multi_stack_waiter=multi_stack_waiter,
+        )
+        assert stack.id == stack_ids[1]
+
+        for stack_id in stack_ids:
+            aws_cf.better_boto.delete_stack(bsm=self.bsm, stack_name=stack_id)
+            aws_cf.better_boto.wait_delete_stack_to_finish(
+                bsm=self.bsm,
+                stack_id=stack_id,
+                wait_until_exec_stopped=True,
+                delays=0.1,
+                timeout=3,
+                verbose=False,
+                multi_stack_waiter=multi_stack_waiter,
+            )
+        stacks = multi_stack_waiter.wait(stack_ids, timeout=3)
+        assert stacks == {stack_id: None for stack_id in stack_ids}
+
+    def test_stack_events(self):
+        project_name = "aws-cf-better-boto-stack-events-test"
+        stack_id = aws_cf.better_boto.create_stack(
+            bsm=self.bsm,
+            stack_name=project_name,
+            template_body=make_tpl_1().to_json(),
+            parameters=[aws_cf.Parameter(key="ProjectName", value=project_name)],
+            include_named_iam=True,
+        )
+        event_list = aws_cf.better_boto.describe_stack_events(
+            bsm=self.bsm,
+            name=stack_id,
+        ).all()
+        assert len(event_list) > 0
+
+        events = list(
+            aws_cf.better_boto.stream_stack_events(
+                bsm=self.bsm,
+                stack_name=stack_id,
+                delays=0.1,
+                timeout=3,
+                verbose=False,
+            )
+        )
+        # chronological, from the operation start to the stopped stack event
+        assert events[0].is_stack_operation_start() is True
+        assert events[-1].is_stack_stopped() is True
+        assert events[-1].stack_status.is_success() is True
+
+        # the waiter progress goes to the given reporter
+        polls = []
+        real_poll = aws_cf.better_boto.StackEventStream.poll
+
+        def slow_poll(stream):
+            polls.append(1)
+            return [] if len(polls) == 1 else real_poll(stream)
+
+        stream = io.StringIO()
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(aws_cf.better_boto.StackEventStream, "poll", slow_poll)
+            new_events = list(
+                aws_cf.better_boto.stream_stack_events(
+                    bsm=self.bsm,
+                    stack_name=stack_id,
+                    delays=0.1,
+                    timeout=3,
+                    verbose=False,
+                    reporter=aws_cf.JsonLinesReporter(
+                        stream=stream,
+                        include_ticks=True,
+                    ),
+                )
+            )
+        assert new_events == events
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records[0]["event"] == "tick"
+
+        # the cursor only returns the new events
+        stream = aws_cf.better_boto.StackEventStream(bsm=self.bsm, name=stack_id)
+        assert len(stream.poll()) == len(events)
+        assert stream.poll() == []
+
+        aws_cf.better_boto.delete_stack(bsm=self.bsm, stack_name=stack_id)
+        new_events = stream.poll()
+        assert len(new_events) > 0
+        assert new_events[0].is_stack_operation_start() is True
+
+        assert aws_cf.better_boto.find_root_cause_event(self.bsm, stack_id) is None
+
+    def test_iter_resource_changes(self, monkeypatch):
+        from aws_cloudformation.better_boto import stacks
+
+        def make_change(logical_id: str) -> dict:
+            return {
+                "Type": "Resource",
+                "ResourceChange": {
+                    "Action": "Add",
+                    "LogicalResourceId": logical_id,
+                    "ResourceType": "AWS::IAM::Role",
+                },
+            }
+
+        pages = {
+            "token-1": aws_cf.ChangeSet(
+                change_set_id="cs",
+                change_set_name="cs",
+                stack_id="stack",
+                stack_name="stack",
+                changes=[make_change("B")],
+                next_token="token-2",
+            ),
+            "token-2": aws_cf.ChangeSet(
+                change_set_id="cs",
+                change_set_name="cs",
+                stack_id="stack",
+                stack_name="stack",
+                changes=[make_change("C")],
+            ),
+        }
+        calls = list()
+
+        def describe_change_set(bsm, change_set_name, next_token):
+            calls.append(next_token)
+            return pages[next_token]
+
+        monkeypatch.setattr(stacks, "describe_change_set", describe_change_set)
+
+        def make_first_page():
+            return aws_cf.ChangeSet(
+                change_set_id="cs",
+                change_set_name="cs",
+                stack_id="stack",
+                stack_name="stack",
+                changes=[make_change("A")],
+                next_token="token-1",
+            )
+
+        # lazy, the held page doesn't need any api call
+        iterator = aws_cf.better_boto.iter_resource_changes(
+            bsm=self.bsm,
+            change_set=make_first_page(),
+        )
+        assert iterator.one().logical_resource_id == "A"
+        assert calls == []
+        assert [rc.logical_resource_id for rc in iterator] == ["B", "C"]
+        assert calls == ["token-1", "token-2"]
+
+        calls.clear()
+        change_set = aws_cf.better_boto.load_all_changes(
+            bsm=self.bsm,
+            change_set=make_first_page(),
+        )
+        assert [
+            change["ResourceChange"]["LogicalResourceId"]
+            for change in change_set.changes
+        ] == ["A", "B", "C"]
+        assert change_set.next_token is None
+        assert calls == ["token-1", "token-2"]
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ import pytest
 from rich import print as rprint
 import aws_cloudformation as aws_cf
 
+from aws_cloudformation.context import get_context
 from aws_cloudformation.tests.mocker import BaseTest
 from aws_cloudformation.tests.stacks.iam_stack import (
     make_tpl_1,
@@ -14,6 +15,17 @@ from aws_cloudformation.tests.stacks.iam_stack import (
 )
 
 
+def test_build_stack_instance_filters():
+    assert aws_cf.better_boto.build_stack_instance_filters() == []
+    assert aws_cf.better_boto.build_stack_instance_filters(
+        detailed_status=aws_cf.StackInstanceDetailedStatusEnum.FAILED,
+        drift_status="DRIFTED",
+    ) == [
+        {"Name": "DETAILED_STATUS", "Values": "FAILED"},
+        {"Name": "DRIFT_STATUS", "Values": "DRIFTED"},
+    ]
+
+
 class Test(BaseTest):
     def test(self):
         # ----------------------------------------------------------------------
@@ -92,6 +104,54 @@ class Test(BaseTest):
             call_as_self=True,
         )
 
+        operation = aws_cf.better_boto.describe_stack_set_operation(
+            bsm=self.bsm,
+            stack_set_name=stack_set_name,
+            operation_id=op_id,
+            call_as_self=True,
+        )
+        assert operation.operation_id == op_id
+        assert operation.is_stopped() is True
+        results = aws_cf.better_boto.list_stack_set_operation_results(
+            bsm=self.bsm,
+            stack_set_name=stack_set_name,
+            operation_id=op_id,
+            call_as_self=True,
+        ).all()
+        assert len(results) == (len(accounts) * len(regions))
+        assert any(result.is_failed() for result in results) is False
+        stack_instances = aws_cf.better_boto.wait_stack_set_operation_to_stop(
+            bsm=self.bsm,
+            stack_set_name=stack_set_name,
+            operation_id=op_id,
+            delays=0.1,
+            timeout=3,
+            verbose=False,
+            call_as_self=True,
+        )
+        assert len(stack_instances) == (len(accounts) * len(regions))
+
+        # streamed with the max page size, and stops when the caller stops
+        api_params = []
+        get_context(self.bsm).cf_client.meta.events.register(
+            "provide-client-params.cloudformation.ListStackInstances",
+            lambda params, **kwargs: api_params.append(params),
+        )
+        stack_instance = aws_cf.better_boto.list_stack_instances(
+            bsm=self.bsm,
+            stack_set_name=stack_set_name,
+            filters=aws_cf.better_boto.build_stack_instance_filters(
+                last_operation_id=op_id,
+            ),
+            call_as_self=True,
+        ).one()
+        assert isinstance(stack_instance, aws_cf.StackInstance)
+        assert len(api_params) == 1
+        assert api_params[0]["MaxResults"] == 100
+        assert api_params[0]["Filters"] == [
+            {"Name": "LAST_OPERATION_ID", "Values": op_id}
+        ]
+
         stack_instance_iterproxy = aws_cf.better_boto.list_stack_instances(
             bsm=self.bsm,
             stack_set_name=stack_set_name,
@@ -10,15 +10,26 @@ def test():
     _ = aws_cf.better_boto.StackIterProxy
     _ = aws_cf.better_boto.describe_stacks
     _ = aws_cf.better_boto.describe_live_stack
+    _ = aws_cf.better_boto.list_stacks
+    _ = aws_cf.better_boto.list_exports
+    _ = aws_cf.better_boto.list_imports
+    _ = aws_cf.better_boto.StackEventIterProxy
+    _ = aws_cf.better_boto.describe_stack_events
+    _ = aws_cf.better_boto.StackEventStream
+    _ = aws_cf.better_boto.find_root_cause_event
     _ = aws_cf.better_boto.create_stack
     _ = aws_cf.better_boto.update_stack
     _ = aws_cf.better_boto.create_change_set
     _ = aws_cf.better_boto.describe_change_set
     _ = aws_cf.better_boto.describe_change_set_with_paginator
+    _ = aws_cf.better_boto.iter_resource_changes
+    _ = aws_cf.better_boto.load_all_changes
     _ = aws_cf.better_boto.execute_change_set
     _ = aws_cf.better_boto.delete_stack
+    _ = aws_cf.better_boto.MultiStackWaiter
     _ = aws_cf.better_boto.wait_create_or_update_stack_to_finish
     _ = aws_cf.better_boto.wait_delete_stack_to_finish
+    _ = aws_cf.better_boto.stream_stack_events
     _ = aws_cf.better_boto.wait_create_change_set_to_finish
     _ = aws_cf.better_boto.describe_stack_set
     _ = aws_cf.better_boto.create_stack_set
@@ -28,9 +39,26 @@ def test():
     _ = aws_cf.better_boto.create_stack_instances
     _ = aws_cf.better_boto.update_stack_instances
     _ = aws_cf.better_boto.delete_stack_instances
+    _ = aws_cf.better_boto.LIST_STACK_INSTANCES_MAX_PAGE_SIZE
+    _ = aws_cf.better_boto.build_stack_instance_filters
     _ = aws_cf.better_boto.StackInstanceIterProxy
     _ = aws_cf.better_boto.list_stack_instances
     _ = aws_cf.better_boto.wait_deploy_stack_instances_to_stop
+    _ = aws_cf.better_boto.describe_stack_set_operation
+    _ = aws_cf.better_boto.list_stack_set_operation_results
+    _ = aws_cf.better_boto.wait_stack_set_operation_to_stop
+    _ = aws_cf.better_boto.aio.describe_stacks
+    _ = aws_cf.better_boto.aio.describe_live_stack
+    _ = aws_cf.better_boto.aio.create_change_set
+    _ = aws_cf.better_boto.aio.describe_change_set
+    _ = aws_cf.better_boto.aio.execute_change_set
+    _ = aws_cf.better_boto.aio.wait_delete_stack_to_finish
+    _ = aws_cf.better_boto.aio.wait_create_or_update_stack_to_finish
+    _ = aws_cf.better_boto.aio.wait_create_change_set_to_finish
+    _ = aws_cf.better_boto.aio.describe_stack_set
+    _ = aws_cf.better_boto.aio.list_stack_instances
+    _ = aws_cf.better_boto.aio.wait_deploy_stack_instances_to_stop
+    _ = aws_cf.better_boto.aio.wait_stack_set_operation_to_stop
     _ = aws_cf.exc
     _ = aws_cf.exc.StackNotExistError
     _ = aws_cf.exc.DeployStackFailedError
@@ -38,15 +66,38 @@ def test():
     _ = aws_cf.exc.CreateStackChangeSetButNotChangeError
     _ = aws_cf.exc.CreateStackChangeSetFailedError
     _ = aws_cf.exc.DeployStackInstanceFailedError
+    _ = aws_cf.exc.StackDependencyCycleError
+    _ = aws_cf.exc.UpstreamStackFailedError
+    _ = aws_cf.exc.PlanArtifactNotApplicableError
     _ = aws_cf.deploy_stack
     _ = aws_cf.remove_stack
     _ = aws_cf.deploy_stack_set
     _ = aws_cf.remove_stack_set
+    _ = aws_cf.plan_stack
+    _ = aws_cf.execute_stack_change_set
+    _ = aws_cf.apply_plan
+    _ = aws_cf.StackSpec
+    _ = aws_cf.deploy_stacks
+    _ = aws_cf.StackRemoveSpec
+    _ = aws_cf.StackRemoveResult
+    _ = aws_cf.RemoveStacksResponse
+    _ = aws_cf.remove_stacks
+    _ = aws_cf.resume_stack_deployment
+    _ = aws_cf.StackPlanResult
+    _ = aws_cf.EnvironmentPlan
+    _ = aws_cf.plan_stacks
+    _ = aws_cf.apply_stacks
+    _ = aws_cf.DeployPhaseEnum
+    _ = aws_cf.JournalEntry
+    _ = aws_cf.DeployJournal
+    _ = aws_cf.JournalReporter
     _ = aws_cf.StackStatusEnum
     _ = aws_cf.Output
+    _ = aws_cf.Export
     _ = aws_cf.Parameter
     _ = aws_cf.DriftStatusEnum
     _ = aws_cf.Stack
+    _ = aws_cf.StackEvent
     _ = aws_cf.ChangeSetStatusEnum
     _ = aws_cf.ChangeSetTypeEnum
     _ = aws_cf.ChangeSetExecutionStatusEnum
@@ -59,12 +110,49 @@ def test():
     _ = aws_cf.StackInstanceDetailedStatusEnum
     _ = aws_cf.StackInstanceDriftStatusEnum
     _ = aws_cf.StackInstance
+    _ = aws_cf.StackSetOperationStatusEnum
+    _ = aws_cf.StackSetOperation
+    _ = aws_cf.StackSetOperationResultStatusEnum
+    _ = aws_cf.StackSetOperationResult
     _ = aws_cf.TargetAttributeEnum
     _ = aws_cf.Target
     _ = aws_cf.Detail
     _ = aws_cf.ChangeActionEnum
     _ = aws_cf.ResourceChange
+    _ = aws_cf.ChangeSetTree
+    _ = aws_cf.load_change_set_tree
+    _ = aws_cf.Plan
+    _ = aws_cf.PlanArtifact
+    _ = aws_cf.RefreshResult
+    _ = aws_cf.StackInventory
+    _ = aws_cf.ExportsIndex
+    _ = aws_cf.get_exports_index
+    _ = aws_cf.ScanTarget
+    _ = aws_cf.TargetScanResult
+    _ = aws_cf.ScanStacksResponse
+    _ = aws_cf.scan_stacks
+    _ = aws_cf.visualize_change_set_tree
     _ = aws_cf.visualize_change_set
+    _ = aws_cf.DelayStrategy
+    _ = aws_cf.FixedDelay
+    _ = aws_cf.ExponentialBackoff
+    _ = aws_cf.DecorrelatedJitter
+    _ = aws_cf.ExpectedDuration
+    _ = aws_cf.BaseReporter
+    _ = aws_cf.NoOpReporter
+    _ = aws_cf.ConsoleReporter
+    _ = aws_cf.JsonLinesReporter
+    _ = aws_cf.UploadIndex
+    _ = aws_cf.Context
+    _ = aws_cf.get_context
+    _ = aws_cf.ErrorKindEnum
+    _ = aws_cf.classify_error
+    _ = aws_cf.RetryPolicy
+    _ = aws_cf.call_with_retry
+    _ = aws_cf.TokenBucket
+    _ = aws_cf.RateLimitStats
+    _ = aws_cf.RateLimiter
+    _ = aws_cf.get_rate_limiter
     _ = aws_cf.to_tag_list
     _ = aws_cf.to_tag_dict
 
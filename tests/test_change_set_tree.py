@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from aws_cloudformation import change_set_tree
+from aws_cloudformation.stack import ChangeSet
+from aws_cloudformation.change_set_tree import load_change_set_tree
+from aws_cloudformation.change_set_visualizer import visualize_change_set_tree
+
+
+def make_change_set(change_set_id: str, nested: list) -> ChangeSet:
+    changes = [
+        {
+            "Type": "Resource",
+            "ResourceChange": {
+                "Action": "Add",
+                "LogicalResourceId": f"{change_set_id}Role",
+                "ResourceType": "AWS::IAM::Role",
+            },
+        }
+    ]
+    for nested_id in nested:
+        changes.append(
+            {
+                "Type": "Resource",
+                "ResourceChange": {
+                    "Action": "Modify",
+                    "LogicalResourceId": f"{nested_id}Stack",
+                    "ResourceType": "AWS::CloudFormation::Stack",
+                    "ChangeSetId": nested_id,
+                },
+            }
+        )
+    return ChangeSet(
+        change_set_id=change_set_id,
+        change_set_name=change_set_id,
+        stack_id=change_set_id,
+        stack_name=change_set_id,
+        changes=changes,
+    )
+
+
+def test_load_change_set_tree(monkeypatch):
+    # root -> a, b; a -> a1, a2; b -> b1
+    nested_mapper = {
+        "a": ["a1", "a2"],
+        "b": ["b1"],
+        "a1": [],
+        "a2": [],
+        "b1": [],
+    }
+    thread_ids = set()
+
+    def describe_change_set(bsm, change_set_name):
+        thread_ids.add(threading.get_ident())
+        return make_change_set(change_set_name, nested_mapper[change_set_name])
+
+    monkeypatch.setattr(change_set_tree, "describe_change_set", describe_change_set)
+
+    root = make_change_set("root", ["a", "b"])
+    tree = load_change_set_tree(bsm=None, change_set=root, max_workers=4)
+    assert tree.nested_change_set_ids == ["a", "b"]
+    assert [
+        (depth, node.change_set.change_set_id) for depth, node in tree.walk()
+    ] == [
+        (0, "root"),
+        (1, "a"),
+        (2, "a1"),
+        (2, "a2"),
+        (1, "b"),
+        (2, "b1"),
+    ]
+    assert threading.get_ident() not in thread_ids
+
+    tree = load_change_set_tree(bsm=None, change_set=root, include_nested_stack=False)
+    assert tree.children == []
+
+    visualize_change_set_tree(tree, _verbose=False)
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.change_set_tree", preview=False)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.config import Config
+from boto_session_manager import BotoSesManager
+
+from aws_cloudformation.context import (
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_UPLOAD_INDEX_PATH,
+    UploadIndex,
+    botocore_retry_disabled,
+    get_context,
+    get_region_console,
+)
+from aws_cloudformation.tests.mocker import BaseTest
+
+
+class Test(BaseTest):
+    def test_get_context(self):
+        ctx = get_context(self.bsm)
+        assert get_context(self.bsm) is ctx
+        assert ctx.bsm is self.bsm
+        assert ctx.max_pool_connections == DEFAULT_MAX_POOL_CONNECTIONS
+
+        # the clients and paginators are created once
+        assert ctx.cf_client is ctx.cf_client
+        assert ctx.s3_client is ctx.s3_client
+        assert ctx.cf_client.meta.config.max_pool_connections == (
+            DEFAULT_MAX_POOL_CONNECTIONS
+        )
+        # the client without botocore retries is only used when disabled
+        assert "total_max_attempts" not in ctx.cf_client.meta.config.retries
+        with botocore_retry_disabled():
+            assert ctx.cf_client is not ctx.get_client("cloudformation")
+            assert ctx.cf_client.meta.config.retries["total_max_attempts"] == 1
+        assert ctx.cf_client is ctx.get_client("cloudformation")
+        paginator = ctx.get_paginator("describe_stacks")
+        assert ctx.get_paginator("describe_stacks") is paginator
+        assert ctx.aws_console is ctx.aws_console
+        assert ctx.aws_console.aws_region == "us-east-1"
+
+        # different bsm, different context
+        bsm = BotoSesManager(region_name="us-east-1")
+        assert get_context(bsm) is not ctx
+
+        # a different pool size re-creates the clients, keeps the other states
+        upload_index = UploadIndex(path=None)
+        ctx.upload_index = upload_index
+        cf_client = ctx.cf_client
+        s3_client = ctx.s3_client
+        new_ctx = get_context(self.bsm, max_pool_connections=100)
+        assert new_ctx is ctx
+        assert ctx.upload_index is upload_index
+        # only the cloudformation clients are created again
+        assert ctx.s3_client is s3_client
+        assert ctx.cf_client is not cf_client
+        assert ctx.cf_client.meta.config.max_pool_connections == 100
+        assert ctx.get_paginator("describe_stacks") is not paginator
+        assert get_context(self.bsm) is ctx
+
+    def test_user_retries_config(self):
+        bsm = BotoSesManager(
+            region_name="us-east-1",
+            default_client_kwargs=dict(
+                config=Config(retries={"total_max_attempts": 3}),
+            ),
+        )
+        retries = get_context(bsm).cf_client.meta.config.retries
+        assert retries["total_max_attempts"] == 3
+        with botocore_retry_disabled():
+            retries = get_context(bsm).cf_client.meta.config.retries
+            assert retries["total_max_attempts"] == 1
+
+    def test_thread_safe(self):
+        bsm = BotoSesManager(region_name="us-east-1")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(
+                executor.map(lambda _: get_context(bsm).cf_client, range(32))
+            )
+        assert len({id(client) for client in clients}) == 1
+
+    def test_get_region_console(self):
+        assert get_region_console("us-east-1") is get_region_console("us-east-1")
+
+
+def test_upload_index(tmp_path):
+    assert UploadIndex().path == DEFAULT_UPLOAD_INDEX_PATH
+    index = UploadIndex(path=None)
+    assert index.is_uploaded("s3://bucket/a.json") is False
+    index.mark_uploaded("s3://bucket/a.json")
+    assert index.is_uploaded("s3://bucket/a.json") is True
+
+    path = tmp_path.joinpath("index.json")
+    UploadIndex(path=path).mark_uploaded("s3://bucket/a.json")
+    assert UploadIndex(path=path).is_uploaded("s3://bucket/a.json") is True
+    # expired
+    assert UploadIndex(path=path, ttl=-1).is_uploaded("s3://bucket/a.json") is False
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.context", preview=False)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from aws_cloudformation import exc
+from aws_cloudformation.dependency import (
+    load_template,
+    find_import_values,
+    find_export_names,
+    StackDag,
+    build_stack_dag,
+)
+from aws_cloudformation.tests.stacks.export_import import (
+    make_producer_tpl,
+    make_consumer_tpl,
+)
+
+
+def test_find_import_values():
+    for tpl in [make_consumer_tpl("p1").to_json(), make_consumer_tpl("p1").to_yml()]:
+        assert find_import_values(tpl) == {"p1-policy-arn"}
+    for tpl in [make_producer_tpl("p1").to_json(), make_producer_tpl("p1").to_yml()]:
+        assert find_import_values(tpl) == set()
+
+
+def test_find_export_names():
+    for tpl in [make_producer_tpl("p1").to_json(), make_producer_tpl("p1").to_yml()]:
+        assert find_export_names(tpl) == {"p1-policy-arn"}
+    for tpl in [make_consumer_tpl("p1").to_json(), make_consumer_tpl("p1").to_yml()]:
+        assert find_export_names(tpl) == set()
+
+
+yaml_tpl = """
+# Fn::ImportValue: commented-out
+Description: |
+  Fn::ImportValue: not-an-import
+  Export:
+    Name: not-an-export
+Resources:
+  Topic:
+    Type: AWS::SNS::Topic
+    Properties:
+      TopicName: !Sub "Fn::ImportValue: not-an-import-${AWS::StackName}"
+      KmsMasterKeyId: !ImportValue kms-key-id
+      DisplayName:
+        Fn::ImportValue: "display-name"
+Outputs:
+  TopicArn:
+    Value: !Ref Topic
+    Export:
+      Name: topic-arn
+  TopicName:
+    Value: !GetAtt Topic.TopicName
+"""
+
+unresolvable_import_tpl = """
+Resources:
+  Topic:
+    Type: AWS::SNS::Topic
+    Properties:
+      KmsMasterKeyId: !ImportValue
+        Fn::Sub: "${Env}-kms-key-id"
+      DisplayName:
+        Fn::ImportValue: !Join ["-", [!Ref Env, "display-name"]]
+"""
+
+unresolvable_export_tpl = """
+Resources:
+  Topic:
+    Type: AWS::SNS::Topic
+Outputs:
+  TopicArn:
+    Value: !Ref Topic
+    Export:
+      Name: !Sub "${AWS::StackName}-topic-arn"
+"""
+
+
+def test_load_template():
+    data = load_template(yaml_tpl)
+    assert data["Outputs"]["TopicArn"]["Value"] == {"Ref": "Topic"}
+    assert data["Outputs"]["TopicName"]["Value"] == {
+        "Fn::GetAtt": ["Topic", "TopicName"]
+    }
+
+
+def test_find_in_yaml():
+    assert find_import_values(yaml_tpl) == {"kms-key-id", "display-name"}
+    assert find_export_names(yaml_tpl) == {"topic-arn"}
+
+    with pytest.raises(exc.UnresolvableExportNameError):
+        find_import_values(unresolvable_import_tpl)
+    assert find_import_values(unresolvable_import_tpl, strict=False) == set()
+    assert find_export_names(unresolvable_import_tpl) == set()
+
+    with pytest.raises(exc.UnresolvableExportNameError):
+        find_export_names(unresolvable_export_tpl)
+    assert find_export_names(unresolvable_export_tpl, strict=False) == set()
+
+
+class TestStackDag:
+    def test_topological_levels(self):
+        dag = StackDag(upstream={0: set(), 1: {0}, 2: {0}, 3: {1, 2}, 4: set()})
+        assert dag.topological_levels() == [[0, 4], [1, 2], [3]]
+        assert dag.downstream == {0: {1, 2}, 1: {3}, 2: {3}, 3: set(), 4: set()}
+
+        dag = StackDag(upstream={0: {1}, 1: {0}, 2: set()})
+        with pytest.raises(exc.StackDependencyCycleError):
+            dag.topological_levels()
+
+    def test_build_stack_dag(self):
+        key1 = ("111111111111", "us-east-1")
+        key2 = ("222222222222", "us-east-1")
+        dag = build_stack_dag(
+            region_keys=[key1, key1, key2, key1],
+            stack_names=["producer", "consumer", "consumer", "standalone"],
+            imports=[set(), {"arn", "external"}, {"arn"}, set()],
+            exports=[{"arn"}, set(), set(), set()],
+            depends_on=[[], [], [], ["consumer"]],
+        )
+        # the consumer in another account doesn't depend on the producer
+        assert dag.upstream == {0: set(), 1: {0}, 2: set(), 3: {1}}
+
+        with pytest.raises(ValueError):
+            build_stack_dag(
+                region_keys=[key1],
+                stack_names=["standalone"],
+                imports=[set()],
+                exports=[set()],
+                depends_on=[["not-exists"]],
+            )
+
+        # the stack with unknown imports falls back to the serial order
+        dag = build_stack_dag(
+            region_keys=[key1, key2, key1, key1],
+            stack_names=["s1", "s2", "s3", "s4"],
+            imports=[set(), set(), None, set()],
+            exports=[set(), set(), set(), set()],
+        )
+        assert dag.upstream == {0: set(), 1: set(), 2: {0}, 3: {2}}
+
+        with pytest.raises(exc.StackDependencyCycleError):
+            build_stack_dag(
+                region_keys=[key1, key1],
+                stack_names=["s1", "s2"],
+                imports=[{"e2"}, {"e1"}],
+                exports=[{"e1"}, {"e2"}],
+            )
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.dependency", preview=False)
@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import pytest
 import cottonformation as cf
 
 import aws_cloudformation as aws_cf
+from aws_cloudformation import exc
+from aws_cloudformation.plan import PlanArtifact
 from aws_cloudformation.deploy import (
     deploy_stack,
     remove_stack,
     deploy_stack_set,
     remove_stack_set,
+    plan_stack,
+    apply_plan,
 )
 
 from aws_cloudformation.tests.mocker import BaseTest
@@ -81,6 +86,8 @@ class Test(BaseTest):
         response = deployment(ith=2, tpl=make_tpl_2(), skip_plan=False)
         assert response.is_deploy_happened is True
         assert response.is_create is False
+        assert response.plan.change_set_id == response.change_set_id
+        assert sum(response.plan.total_counts.values()) > 0
 
         response = deployment(ith=2, tpl=make_tpl_2(), skip_plan=False)
         assert response.is_deploy_happened is False
@@ -137,8 +144,64 @@ class Test(BaseTest):
         deployment(ith=1, tpl=make_tpl_1())
         deployment(ith=2, tpl=make_tpl_2())
 
+    def _test_apply_plan(self):
+        stack_name = "aws-cf-apply-plan-test"
+        template = make_tpl_1().to_json()
+        params = [aws_cf.Parameter(key="ProjectName", value=stack_name)]
+
+        # the plan stage
+        response = plan_stack(
+            bsm=self.bsm,
+            stack_name=stack_name,
+            template=template,
+            parameters=params,
+            include_named_iam=True,
+            change_set_delays=0.1,
+        )
+        assert response.is_deploy_happened is False
+        assert response.is_create is True
+        artifact = PlanArtifact.from_plan(
+            plan=response.plan,
+            is_create=response.is_create,
+            aws_account_id=self.bsm.aws_account_id,
+            aws_region=self.bsm.aws_region,
+            template=template,
+            parameters=params,
+        )
+        s = artifact.to_json()
+
+        # the apply stage
+        artifact = PlanArtifact.from_json(s)
+        with pytest.raises(exc.PlanArtifactNotApplicableError):
+            apply_plan(
+                bsm=self.bsm,
+                artifact=artifact,
+                template=make_tpl_2().to_json(),
+            )
+        wrong_region_artifact = PlanArtifact.from_json(s)
+        wrong_region_artifact.aws_region = "us-west-2"
+        with pytest.raises(exc.PlanArtifactNotApplicableError):
+            apply_plan(bsm=self.bsm, artifact=wrong_region_artifact)
+
+        response = apply_plan(
+            bsm=self.bsm,
+            artifact=artifact,
+            template=template,
+            parameters=params,
+            delays=0.1,
+        )
+        assert response.is_deploy_happened is True
+        assert response.change_set_id == artifact.change_set_id
+        stack = aws_cf.better_boto.describe_live_stack(self.bsm, stack_name)
+        assert stack.is_success() is True
+
+        # the change set is already executed
+        with pytest.raises(exc.PlanArtifactNotApplicableError):
+            apply_plan(bsm=self.bsm, artifact=artifact)
+
     def test(self):
         self._test_stack()
+        self._test_apply_plan()
         # self._test_stack_set()
 
 
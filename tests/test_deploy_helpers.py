@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+from boto_session_manager import BotoSesManager
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.context import UploadIndex, get_context
+from aws_cloudformation.reporter import JsonLinesReporter
+from aws_cloudformation.deploy import deploy_stack
+from aws_cloudformation.deploy_helpers import (
+    FINGERPRINT_TAG_KEY,
+    normalize_template,
+    get_deploy_fingerprint,
+    get_template_hash,
+    get_parameters_hash,
+    is_s3_object_uploaded,
+    upload_template_to_s3,
+)
+from aws_cloudformation.helper import md5_of_text
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1, make_tpl_2
+
+
+def test_normalize_template():
+    assert normalize_template('{"b": 1, "a": 2}') == normalize_template(
+        '{\n  "a": 2,\n  "b": 1\n}'
+    )
+    assert normalize_template("  a: 1\n") == "a: 1"
+
+
+def test_get_deploy_fingerprint():
+    assert get_deploy_fingerprint() is None
+    params = [aws_cf.Parameter(key="a", value="1"), aws_cf.Parameter(key="b", value="2")]
+    fp = get_deploy_fingerprint(template='{"a": 1}', parameters=params)
+    # order doesn't matter
+    assert fp == get_deploy_fingerprint(
+        template='{ "a": 1 }',
+        parameters=params[::-1],
+        tags={FINGERPRINT_TAG_KEY: "old"},
+    )
+    assert fp != get_deploy_fingerprint(template='{"a": 1}', parameters=params[:1])
+    assert fp != get_deploy_fingerprint(
+        template='{"a": 1}', parameters=params, include_named_iam=True
+    )
+    # the s3 object may be overwritten, not reproducible
+    assert get_deploy_fingerprint(template="s3://bucket/tpl.json") is None
+    assert (
+        get_deploy_fingerprint(
+            template='{"a": 1}',
+            stack_policy="s3://bucket/policy.json",
+        )
+        is None
+    )
+
+
+def test_get_template_and_parameters_hash():
+    assert get_template_hash() is None
+    assert get_template_hash('{"a": 1, "b": 2}') == get_template_hash(
+        '{"b": 2, "a": 1}'
+    )
+    params = [aws_cf.Parameter(key="a", value="1"), aws_cf.Parameter(key="b", value="2")]
+    assert get_parameters_hash(params) == get_parameters_hash(params[::-1])
+    assert get_parameters_hash(params) != get_parameters_hash(params[:1])
+    assert get_parameters_hash() == get_parameters_hash([])
+
+
+class Test(BaseTest):
+    def test_upload_template_to_s3(self, tmp_path):
+        template = '{"Resources": {}}'
+        md5 = md5_of_text(template)
+        index_path = tmp_path.joinpath("uploaded-s3-objects.json")
+        bsm = BotoSesManager(region_name="us-east-1")
+        ctx = get_context(bsm)
+        ctx.upload_index = UploadIndex(path=index_path)
+
+        calls = list()
+        ctx.s3_client.meta.events.register(
+            "before-call.s3.*",
+            lambda model, **kwargs: calls.append(model.name),
+        )
+
+        assert (
+            is_s3_object_uploaded(ctx.s3_client, self.bucket, f"{md5}.json", md5)
+            is False
+        )
+        calls.clear()
+
+        url = upload_template_to_s3(bsm, template, self.bucket, verbose=False)
+        assert url.endswith(f"{md5}.json")
+        assert calls == ["HeadObject", "PutObject"]
+
+        # found in the index, no request at all
+        calls.clear()
+        assert upload_template_to_s3(bsm, template, self.bucket, verbose=False) == url
+        assert calls == []
+
+        # new session (or process), the index file is shared, no request
+        def new_session(upload_index: UploadIndex) -> BotoSesManager:
+            bsm = BotoSesManager(region_name="us-east-1")
+            ctx = get_context(bsm)
+            ctx.upload_index = upload_index
+            ctx.s3_client.meta.events.register(
+                "before-call.s3.*",
+                lambda model, **kwargs: calls.append(model.name),
+            )
+            return bsm
+
+        bsm = new_session(UploadIndex(path=index_path))
+        assert upload_template_to_s3(bsm, template, self.bucket, verbose=False) == url
+        assert calls == []
+
+        # in memory index, the object exists, only one head_object
+        bsm = new_session(UploadIndex(path=None))
+        assert upload_template_to_s3(bsm, template, self.bucket, verbose=False) == url
+        assert calls == ["HeadObject"]
+
+    def test_skip_unchanged(self):
+        stack_name = "aws-cf-skip-unchanged-test"
+
+        def deploy(tpl, project_name: str = stack_name) -> list:
+            stream = io.StringIO()
+            deploy_stack(
+                bsm=self.bsm,
+                stack_name=stack_name,
+                template=tpl.to_json(),
+                parameters=[aws_cf.Parameter(key="ProjectName", value=project_name)],
+                include_named_iam=True,
+                skip_prompt=True,
+                skip_unchanged=True,
+                delays=0.1,
+                reporter=JsonLinesReporter(stream=stream),
+            )
+            return [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+
+        assert "execute_change_set" in deploy(make_tpl_1())
+        stack = aws_cf.better_boto.describe_live_stack(self.bsm, stack_name)
+        assert FINGERPRINT_TAG_KEY in stack.tags
+
+        # unchanged, no change set at all
+        events = deploy(make_tpl_1())
+        assert "no_change" in events
+        assert "create_change_set" not in events
+
+        assert "execute_change_set" in deploy(make_tpl_2())
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.deploy_helpers", preview=False)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation import exports
+from aws_cloudformation.exports import get_exports_index
+from aws_cloudformation.context import get_context
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.export_import import (
+    make_producer_tpl,
+    make_consumer_tpl,
+)
+
+
+class TestExportsIndex(BaseTest):
+    def test(self, monkeypatch):
+        project_name = "aws-cf-exports-test"
+        producer_name = f"{project_name}-producer"
+        export_name = f"{project_name}-policy-arn"
+        index = get_exports_index(self.bsm)
+        assert get_exports_index(self.bsm) is index
+
+        aws_cf.deploy_stack(
+            bsm=self.bsm,
+            stack_name=producer_name,
+            template=make_producer_tpl(project_name).to_json(),
+            include_named_iam=True,
+            skip_plan=True,  # moto doesn't export the outputs of a change set
+            skip_prompt=True,
+            delays=0.1,
+            verbose=False,
+        )
+        # resolved by one list_exports call, then from the cache
+        n_calls = []
+        get_context(self.bsm).cf_client.meta.events.register(
+            "before-call.cloudformation.ListExports",
+            lambda **kwargs: n_calls.append(1),
+        )
+        consumer_tpl = make_consumer_tpl(project_name).to_json()
+        values = index.resolve_import_values(consumer_tpl)
+        assert values[export_name].startswith("arn:aws:iam::")
+        assert index.get_value(export_name) == values[export_name]
+        assert index.get_value("not-exists") is None
+        assert index.get_export(export_name).exporting_stack_name == producer_name
+        assert len(n_calls) == 1
+
+        # the stack is going to drop the export, which is still imported
+        monkeypatch.setattr(
+            exports,
+            "list_imports",
+            lambda bsm, export_name: [f"{project_name}-consumer"],
+        )
+        in_use = index.find_removed_exports_in_use(producer_name, consumer_tpl)
+        assert in_use == {export_name: [f"{project_name}-consumer"]}
+        assert index.find_removed_exports_in_use(
+            producer_name,
+            make_producer_tpl(project_name).to_json(),
+        ) == {}
+
+        # removing the producer stack invalidates the index
+        assert index.is_loaded() is True
+        aws_cf.remove_stack(
+            bsm=self.bsm,
+            stack_name=producer_name,
+            skip_prompt=True,
+            delays=0.1,
+            verbose=False,
+        )
+        assert index.is_loaded() is False
+        assert index.get_value(export_name) is None
+
+        # a stack without exports doesn't invalidate the index
+        assert exports.invalidate_stack_exports(self.bsm, "another-stack", []) is False
+        assert index.is_loaded() is True
+        # unknown template always invalidates the index
+        assert exports.invalidate_stack_exports(self.bsm, "another-stack") is True
+
+    def test_importing_stacks_after_deploy(self, monkeypatch):
+        project_name = "aws-cf-exports-import-test"
+        producer_name = f"{project_name}-producer"
+        consumer_name = f"{project_name}-consumer"
+        export_name = f"{project_name}-policy-arn"
+        index = get_exports_index(self.bsm)
+
+        aws_cf.deploy_stack(
+            bsm=self.bsm,
+            stack_name=producer_name,
+            template=make_producer_tpl(project_name).to_json(),
+            include_named_iam=True,
+            skip_plan=True,
+            skip_prompt=True,
+            delays=0.1,
+            verbose=False,
+        )
+
+        # moto doesn't implement list_imports, fake it with the deployed stacks
+        importing_stacks = []
+        monkeypatch.setattr(
+            exports,
+            "list_imports",
+            lambda bsm, export_name: list(importing_stacks),
+        )
+        assert index.get_importing_stacks(export_name) == []
+
+        # the cache is warm, deploying a consumer must not leave it stale
+        aws_cf.deploy_stack(
+            bsm=self.bsm,
+            stack_name=consumer_name,
+            template=make_consumer_tpl(project_name).to_json(),
+            include_named_iam=True,
+            skip_plan=True,
+            skip_prompt=True,
+            delays=0.1,
+            verbose=False,
+        )
+        importing_stacks.append(consumer_name)
+        assert index.get_importing_stacks(export_name) == [consumer_name]
+        in_use = index.find_removed_exports_in_use(producer_name, "{}")
+        assert in_use == {export_name: [consumer_name]}
+
+        # the imports of a removed stack are unknown, forget all of them
+        aws_cf.remove_stack(
+            bsm=self.bsm,
+            stack_name=consumer_name,
+            skip_prompt=True,
+            delays=0.1,
+            verbose=False,
+        )
+        importing_stacks.clear()
+        assert index.get_importing_stacks(export_name) == []
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.exports", preview=False)
@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import enum
+from botocore.exceptions import ClientError
 from func_args import NOTHING
 from aws_cloudformation.helper import (
     md5_of_text,
     rand_hex,
     get_enum_by_name,
     get_true_flag_count,
+    is_throttling_error,
 )
 
 
@@ -35,6 +37,15 @@ def test_get_true_flag_count():
     assert get_true_flag_count([True, False, NOTHING]) == 1
 
 
+def test_is_throttling_error():
+    def make_error(code: str) -> ClientError:
+        return ClientError({"Error": {"Code": code, "Message": ""}}, "DescribeStacks")
+
+    assert is_throttling_error(make_error("Throttling")) is True
+    assert is_throttling_error(make_error("ValidationError")) is False
+    assert is_throttling_error(ValueError()) is False
+
+
 if __name__ == "__main__":
     from aws_cloudformation.tests import run_cov_test
 
@@ -12,12 +12,30 @@ def test():
     _ = aws_cloudformation.remove_stack
     _ = aws_cloudformation.deploy_stack_set
     _ = aws_cloudformation.remove_stack_set
+    _ = aws_cloudformation.plan_stack
+    _ = aws_cloudformation.execute_stack_change_set
+    _ = aws_cloudformation.apply_plan
+    _ = aws_cloudformation.StackSpec
+    _ = aws_cloudformation.deploy_stacks
+    _ = aws_cloudformation.StackRemoveSpec
+    _ = aws_cloudformation.remove_stacks
+    _ = aws_cloudformation.resume_stack_deployment
+    _ = aws_cloudformation.StackPlanResult
+    _ = aws_cloudformation.EnvironmentPlan
+    _ = aws_cloudformation.plan_stacks
+    _ = aws_cloudformation.apply_stacks
+    _ = aws_cloudformation.DeployPhaseEnum
+    _ = aws_cloudformation.JournalEntry
+    _ = aws_cloudformation.DeployJournal
+    _ = aws_cloudformation.JournalReporter
 
     _ = aws_cloudformation.StackStatusEnum
     _ = aws_cloudformation.Output
+    _ = aws_cloudformation.Export
     _ = aws_cloudformation.Parameter
     _ = aws_cloudformation.DriftStatusEnum
     _ = aws_cloudformation.Stack
+    _ = aws_cloudformation.StackEvent
     _ = aws_cloudformation.ChangeSetStatusEnum
     _ = aws_cloudformation.ChangeSetTypeEnum
     _ = aws_cloudformation.ChangeSetExecutionStatusEnum
@@ -31,15 +49,49 @@ def test():
     _ = aws_cloudformation.StackInstanceDetailedStatusEnum
     _ = aws_cloudformation.StackInstanceDriftStatusEnum
     _ = aws_cloudformation.StackInstance
+    _ = aws_cloudformation.StackSetOperationStatusEnum
+    _ = aws_cloudformation.StackSetOperation
+    _ = aws_cloudformation.StackSetOperationResultStatusEnum
+    _ = aws_cloudformation.StackSetOperationResult
 
     _ = aws_cloudformation.TargetAttributeEnum
     _ = aws_cloudformation.Target
     _ = aws_cloudformation.Detail
     _ = aws_cloudformation.ChangeActionEnum
     _ = aws_cloudformation.ResourceChange
+    _ = aws_cloudformation.ChangeSetTree
+    _ = aws_cloudformation.load_change_set_tree
+    _ = aws_cloudformation.Plan
+    _ = aws_cloudformation.PlanArtifact
+    _ = aws_cloudformation.StackInventory
+    _ = aws_cloudformation.ExportsIndex
+    _ = aws_cloudformation.get_exports_index
+    _ = aws_cloudformation.ScanTarget
+    _ = aws_cloudformation.scan_stacks
+    _ = aws_cloudformation.visualize_change_set_tree
     _ = aws_cloudformation.visualize_change_set
 
     _ = aws_cloudformation.to_tag_dict
+    _ = aws_cloudformation.DelayStrategy
+    _ = aws_cloudformation.FixedDelay
+    _ = aws_cloudformation.ExponentialBackoff
+    _ = aws_cloudformation.DecorrelatedJitter
+    _ = aws_cloudformation.ExpectedDuration
+    _ = aws_cloudformation.BaseReporter
+    _ = aws_cloudformation.NoOpReporter
+    _ = aws_cloudformation.ConsoleReporter
+    _ = aws_cloudformation.JsonLinesReporter
+    _ = aws_cloudformation.UploadIndex
+    _ = aws_cloudformation.Context
+    _ = aws_cloudformation.get_context
+    _ = aws_cloudformation.ErrorKindEnum
+    _ = aws_cloudformation.classify_error
+    _ = aws_cloudformation.RetryPolicy
+    _ = aws_cloudformation.call_with_retry
+    _ = aws_cloudformation.TokenBucket
+    _ = aws_cloudformation.RateLimitStats
+    _ = aws_cloudformation.RateLimiter
+    _ = aws_cloudformation.get_rate_limiter
     _ = aws_cloudformation.to_tag_list
 
 
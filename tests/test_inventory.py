@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.inventory import StackInventory
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.export_import import make_producer_tpl
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1
+
+
+def test_export_name_index():
+    # moto doesn't return the export name in describe_stacks
+    inventory = StackInventory()
+    stack = aws_cf.Stack(
+        id="arn:aws:cloudformation:us-east-1:111122223333:stack/producer/1a2b",
+        name="producer",
+        status=aws_cf.StackStatusEnum.CREATE_COMPLETE,
+        outputs={
+            "PolicyArn": aws_cf.Output(
+                key="PolicyArn",
+                value="arn:aws:iam::111122223333:policy/p",
+                export_name="policy-arn",
+            )
+        },
+    )
+    inventory._add(stack)
+    assert inventory.get_by_export_name("policy-arn") is stack
+    inventory._discard(stack.id)
+    assert inventory.get_by_export_name("policy-arn") is None
+    assert len(inventory) == 0
+
+
+class TestStackInventory(BaseTest):
+    def create_stack(self, stack_name: str, team: str, template: str):
+        aws_cf.better_boto.create_stack(
+            bsm=self.bsm,
+            stack_name=stack_name,
+            template_body=template,
+            parameters=[aws_cf.Parameter(key="ProjectName", value=stack_name)],
+            include_named_iam=True,
+            tags={"team": team},
+        )
+
+    def test(self):
+        self.create_stack(
+            "aws-cf-inventory-producer",
+            "data",
+            make_producer_tpl("aws-cf-inventory").to_json(),
+        )
+        self.create_stack("aws-cf-inventory-app", "data", make_tpl_1().to_json())
+        self.create_stack("aws-cf-inventory-web", "web", make_tpl_1().to_json())
+
+        inventory = StackInventory()
+        result = inventory.refresh(self.bsm)
+        assert result.full_sweep is True
+        assert len(result.added) == 3
+        assert len(inventory) == 3
+
+        # query
+        names = [stack.name for stack in inventory.find(tags={"team": "data"})]
+        assert names == ["aws-cf-inventory-app", "aws-cf-inventory-producer"]
+        stacks = inventory.find(
+            status=aws_cf.StackStatusEnum.CREATE_COMPLETE,
+            tags={"team": "web"},
+        )
+        assert [stack.name for stack in stacks] == ["aws-cf-inventory-web"]
+        assert len(inventory.find(tags={"team": None})) == 3
+        assert inventory.find(status=aws_cf.StackStatusEnum.UPDATE_ROLLBACK_FAILED) == []
+        assert inventory.find(status="UPDATE_ROLLBACK_FAILED") == []
+        assert len(inventory.find(status="CREATE_COMPLETE")) == 3
+        assert len(inventory.find(status=["CREATE_COMPLETE", "UPDATE_COMPLETE"])) == 3
+        assert len(inventory.find(name_prefix="aws-cf-inventory-")) == 3
+        assert [stack.name for stack in inventory.find(name_prefix="aws-cf-inventory-p")] == [
+            "aws-cf-inventory-producer"
+        ]
+        stack = inventory.get("aws-cf-inventory-producer")
+        assert inventory.get(stack.id) is stack
+        assert "aws-cf-inventory-app" in inventory
+
+        # incremental refresh, only the changed stack is described
+        inventory.full_sweep_ratio = 1
+        aws_cf.better_boto.delete_stack(bsm=self.bsm, stack_name="aws-cf-inventory-web")
+        result = inventory.refresh(self.bsm)
+        assert result.full_sweep is False
+        assert [stack.name for stack in result.removed] == ["aws-cf-inventory-web"]
+        assert result.added == []
+        assert len(inventory) == 2
+        assert inventory.find(tags={"team": "web"}) == []
+
+        self.create_stack("aws-cf-inventory-api", "web", make_tpl_1().to_json())
+        result = inventory.refresh(self.bsm)
+        assert result.full_sweep is False
+        assert [stack.name for stack in result.added] == ["aws-cf-inventory-api"]
+        assert len(inventory.find(tags={"team": "web"})) == 1
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.inventory", preview=False)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.journal import (
+    DeployPhaseEnum,
+    JournalEntry,
+    DeployJournal,
+)
+from aws_cloudformation.multi_deploy import StackSpec, deploy_stacks
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1
+
+
+def test_deploy_journal(tmp_path):
+    path = tmp_path.joinpath("journal.jsonl")
+    journal = DeployJournal(path=path)
+    assert journal.get_entry("111122223333", "us-east-1", "my-stack") is None
+    for phase in [DeployPhaseEnum.UPLOADED, DeployPhaseEnum.CHANGE_SET_CREATED]:
+        journal.record(
+            JournalEntry(
+                aws_account_id="111122223333",
+                aws_region="us-east-1",
+                stack_name="my-stack",
+                phase=phase,
+            )
+        )
+    # the process is killed while writing the last line
+    with path.open("a") as f:
+        f.write('{"aws_account_id": "1111')
+
+    journal = DeployJournal(path=path)
+    assert len(journal.read()) == 2
+    entry = journal.get_entry("111122223333", "us-east-1", "my-stack")
+    assert entry.phase == DeployPhaseEnum.CHANGE_SET_CREATED
+    assert entry.time is not None
+
+
+class TestResume(BaseTest):
+    def make_spec(self, stack_name: str) -> StackSpec:
+        return StackSpec(
+            bsm=self.bsm,
+            stack_name=stack_name,
+            template=make_tpl_1().to_json(),
+            parameters=[aws_cf.Parameter(key="ProjectName", value=stack_name)],
+            kwargs=dict(include_named_iam=True),
+        )
+
+    def test(self, tmp_path):
+        journal = DeployJournal(path=tmp_path.joinpath("journal.jsonl"))
+        aws_account_id = self.bsm.aws_account_id
+        # the previous run created the change set of stack 1, then died
+        spec1 = self.make_spec("aws-cf-journal-test-1")
+        stack_id, change_set_id = aws_cf.better_boto.create_change_set(
+            bsm=self.bsm,
+            stack_name=spec1.stack_name,
+            change_set_name=f"{spec1.stack_name}-1",
+            template_body=spec1.template,
+            parameters=spec1.parameters,
+            include_named_iam=True,
+            change_set_type_is_create=True,
+        )
+        journal.record(
+            JournalEntry(
+                aws_account_id=aws_account_id,
+                aws_region="us-east-1",
+                stack_name=spec1.stack_name,
+                phase=DeployPhaseEnum.CHANGE_SET_CREATED,
+                fingerprint=spec1.get_fingerprint(),
+                stack_id=stack_id,
+                change_set_id=change_set_id,
+                is_create=True,
+            )
+        )
+        # stack 2 is already done, stack 3 is done with an older template
+        spec2 = self.make_spec("aws-cf-journal-test-2")
+        spec3 = self.make_spec("aws-cf-journal-test-3")
+        for spec, fingerprint in [(spec2, spec2.get_fingerprint()), (spec3, "old")]:
+            journal.record(
+                JournalEntry(
+                    aws_account_id=aws_account_id,
+                    aws_region="us-east-1",
+                    stack_name=spec.stack_name,
+                    phase=DeployPhaseEnum.STOPPED,
+                    fingerprint=fingerprint,
+                    is_deploy_happened=True,
+                    is_create=True,
+                )
+            )
+
+        stream = io.StringIO()
+        response = deploy_stacks(
+            [spec1, spec2, spec3],
+            delays=0.1,
+            change_set_delays=0.1,
+            reporter=aws_cf.JsonLinesReporter(stream=stream),
+            journal=journal,
+        )
+        assert response.is_success() is True
+        # stack 1 is re-attached, the existing change set is executed
+        assert response.responses[0].change_set_id == change_set_id
+        assert response.responses[0].is_create is True
+        stack = aws_cf.better_boto.describe_live_stack(self.bsm, spec1.stack_name)
+        assert stack.is_success() is True
+        # stack 2 is skipped, stack 3 is deployed again
+        assert aws_cf.better_boto.describe_live_stack(self.bsm, spec2.stack_name) is None
+        assert aws_cf.better_boto.describe_live_stack(self.bsm, spec3.stack_name)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        resumed = [record for record in records if record["event"] == "resume_stack"]
+        assert [record["stack_name"] for record in resumed] == [
+            spec1.stack_name,
+            spec2.stack_name,
+        ]
+
+        phases = [
+            entry.phase
+            for entry in journal.read()
+            if entry.stack_name == spec3.stack_name
+        ]
+        assert phases[-3:] == [
+            DeployPhaseEnum.CHANGE_SET_CREATED,
+            DeployPhaseEnum.EXECUTED,
+            DeployPhaseEnum.STOPPED,
+        ]
+
+        # run again, everything is skipped, the recorded results are returned
+        n_entries = len(journal.read())
+        response = deploy_stacks(
+            [spec1, spec2, spec3],
+            verbose=False,
+            journal=DeployJournal(path=journal.path),
+        )
+        assert response.is_success() is True
+        assert len(response.deployed) == 3
+        new_entries = journal.read()[n_entries:]
+        assert [entry.phase for entry in new_entries] == [DeployPhaseEnum.STOPPED] * 3
+
+        # an s3 uri template is not reproducible, it is never resumed
+        spec4 = StackSpec(
+            bsm=self.bsm,
+            stack_name="aws-cf-journal-test-4",
+            template="s3://bucket/tpl.json",
+        )
+        assert spec4.get_fingerprint() is None
+        journal.record(
+            JournalEntry(
+                aws_account_id=aws_account_id,
+                aws_region="us-east-1",
+                stack_name=spec4.stack_name,
+                phase=DeployPhaseEnum.STOPPED,
+                is_deploy_happened=True,
+            )
+        )
+        stream = io.StringIO()
+        deploy_stacks(
+            [spec4],
+            reporter=aws_cf.JsonLinesReporter(stream=stream),
+            journal=journal,
+        )
+        events = [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+        assert "resume_stack" not in events
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.journal", preview=False)
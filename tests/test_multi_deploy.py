@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import pytest
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation import exc, exports, multi_deploy
+from aws_cloudformation.waiter import ExpectedDuration
+from aws_cloudformation.multi_deploy import (
+    StackSpec,
+    deploy_stacks,
+    StackRemoveSpec,
+    remove_stacks,
+    plan_stacks,
+    apply_stacks,
+)
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1
+from aws_cloudformation.tests.stacks.export_import import (
+    make_producer_tpl,
+    make_consumer_tpl,
+)
+
+
+def test_stack_spec_to_deploy_stack_kwargs():
+    spec = StackSpec(
+        bsm=None,
+        stack_name="my-stack",
+        kwargs=dict(skip_prompt=False, verbose=True, include_iam=True),
+    )
+    kwargs = spec.to_deploy_stack_kwargs(skip_prompt=True, verbose=False)
+    # the runner owned arguments cannot be overridden
+    assert kwargs["skip_prompt"] is True
+    assert kwargs["verbose"] is False
+    assert kwargs["include_iam"] is True
+    assert "reporter" not in kwargs
+
+    # the stateful delay strategy given to the runner is per stack
+    delays = ExpectedDuration(key="update")
+    kwargs = spec.to_deploy_stack_kwargs(delays=delays, change_set_delays=1)
+    assert kwargs["delays"].key == "my-stack:update"
+    assert kwargs["change_set_delays"] == 1
+
+
+class Test(BaseTest):
+    def _test_independent_stacks(self):
+        def make_spec(project_name: str, **kwargs) -> StackSpec:
+            return StackSpec(
+                bsm=self.bsm,
+                stack_name=project_name,
+                template=make_tpl_1().to_json(),
+                bucket=self.bucket,
+                parameters=[
+                    aws_cf.Parameter(key="ProjectName", value=project_name),
+                ],
+                kwargs=dict(include_named_iam=True, **kwargs),
+            )
+
+        specs = [
+            make_spec("aws-cf-multi-deploy-test-1"),
+            make_spec("aws-cf-multi-deploy-test-2"),
+            make_spec("aws-cf-multi-deploy-test-3", skip_plan=True),
+        ]
+        response = deploy_stacks(
+            specs,
+            max_workers=3,
+            max_per_region=2,
+            delays=0.1,
+            change_set_delays=0.1,
+            verbose=False,
+        )
+        assert response.is_success() is True
+        assert len(response.deployed) == 3
+        assert [result.stack_name for result in response.results] == [
+            spec.stack_name for spec in specs
+        ]
+        for deploy_stack_response in response.responses:
+            assert deploy_stack_response.is_create is True
+
+        # nothing changed, and a broken spec doesn't stop the others
+        specs.append(
+            StackSpec(
+                bsm=self.bsm,
+                stack_name="aws-cf-multi-deploy-test-4",
+                template="{}",
+            )
+        )
+        response = deploy_stacks(
+            specs,
+            delays=0.1,
+            change_set_delays=0.1,
+            verbose=True,
+        )
+        assert response.is_success() is False
+        assert len(response.deployed) == 0
+        assert len(response.succeeded) == 3
+        assert len(response.failed) == 1
+        assert response.failed[0].stack_name == "aws-cf-multi-deploy-test-4"
+
+    def _test_dependent_stacks(self):
+        project_name = "aws-cf-multi-deploy-dag-test"
+
+        def make_spec(stack_name: str, template: str, **kwargs) -> StackSpec:
+            return StackSpec(
+                bsm=self.bsm,
+                stack_name=stack_name,
+                template=template,
+                kwargs=dict(include_named_iam=True),
+                **kwargs,
+            )
+
+        specs = [
+            make_spec("consumer", make_consumer_tpl(project_name).to_json()),
+            make_spec("producer", make_producer_tpl(project_name).to_yml()),
+            make_spec("last", make_tpl_1().to_json(), depends_on=["consumer"]),
+        ]
+        response = deploy_stacks(
+            specs,
+            detect_dependency=True,
+            skip_plan=True,
+            delays=0.1,
+            verbose=True,
+        )
+        # the 3rd stack failed because of missing parameter
+        assert [result.is_success() for result in response.results] == [
+            True,
+            True,
+            False,
+        ]
+
+        # upstream failed, downstream is skipped
+        specs = [
+            make_spec("broken", "{}"),
+            make_spec("child", make_tpl_1().to_json(), depends_on=["broken"]),
+            make_spec("grand-child", make_tpl_1().to_json(), depends_on=["child"]),
+        ]
+        response = deploy_stacks(specs, delays=0.1, verbose=False)
+        assert response.is_success() is False
+        for result in response.results[1:]:
+            assert isinstance(result.error, exc.UpstreamStackFailedError)
+
+    def _test_remove_stacks(self, monkeypatch):
+        project_name = "aws-cf-multi-deploy-remove-test"
+        specs = [
+            StackSpec(
+                bsm=self.bsm,
+                stack_name=f"{project_name}-consumer",
+                template=make_consumer_tpl(project_name).to_json(),
+                kwargs=dict(include_named_iam=True),
+            ),
+            StackSpec(
+                bsm=self.bsm,
+                stack_name=f"{project_name}-producer",
+                template=make_producer_tpl(project_name).to_json(),
+                kwargs=dict(include_named_iam=True),
+            ),
+        ]
+        response = deploy_stacks(
+            specs,
+            detect_dependency=True,
+            skip_plan=True,  # moto doesn't export the outputs of a change set
+            delays=0.1,
+            verbose=False,
+        )
+        assert response.is_success() is True
+
+        # moto doesn't implement list_imports
+        monkeypatch.setattr(
+            exports,
+            "list_imports",
+            lambda bsm, export_name: [f"{project_name}-consumer"],
+        )
+        response = remove_stacks(
+            [
+                StackRemoveSpec(bsm=self.bsm, stack_name=f"{project_name}-producer"),
+                StackRemoveSpec(bsm=self.bsm, stack_name=f"{project_name}-consumer"),
+                StackRemoveSpec(bsm=self.bsm, stack_name=f"{project_name}-not-exists"),
+            ],
+            delays=0.1,
+            verbose=True,
+        )
+        assert response.is_success() is True
+        # the importing stack is removed first
+        assert response.tiers == [
+            [f"{project_name}-consumer"],
+            [f"{project_name}-producer"],
+        ]
+        assert response.results[2].stack is None
+        for spec in specs:
+            stack = aws_cf.better_boto.describe_live_stack(self.bsm, spec.stack_name)
+            assert stack is None
+
+    def _test_remove_nested_stacks(self, monkeypatch):
+        arn = "arn:aws:cloudformation:us-east-1:123456789012:stack"
+        parent = aws_cf.Stack(id=f"{arn}/parent/1", name="parent")
+        child = aws_cf.Stack(id=f"{arn}/child/1", name="child", parent_id=parent.id)
+        grand_child = aws_cf.Stack(
+            id=f"{arn}/grand-child/1",
+            name="grand-child",
+            parent_id=child.id,
+        )
+        stacks = {stack.name: stack for stack in [parent, child, grand_child]}
+
+        def remove_stack(stack_name, **kwargs):
+            raise ValueError(f"failed to remove {stack_name}")
+
+        with monkeypatch.context() as m:
+            m.setattr(
+                aws_cf.better_boto,
+                "describe_live_stack",
+                lambda bsm, name: stacks[name],
+            )
+            m.setattr(multi_deploy, "remove_stack", remove_stack)
+            response = remove_stacks(
+                [
+                    StackRemoveSpec(bsm=self.bsm, stack_name="grand-child"),
+                    StackRemoveSpec(bsm=self.bsm, stack_name="child"),
+                    StackRemoveSpec(bsm=self.bsm, stack_name="parent"),
+                ],
+                wait=False,
+                verbose=True,
+            )
+        # only the parent is removed by itself, the nested stacks share its error
+        assert response.tiers == [["parent"]]
+        assert len(response.failed) == 3
+        error = response.results[2].error
+        assert isinstance(error, ValueError)
+        assert response.results[1].removed_by == "parent"
+        assert response.results[1].error is error
+        assert response.results[0].removed_by == "child"
+        assert response.results[0].error is error
+
+    def _test_plan_apply_stacks(self):
+        project_name = "aws-cf-multi-deploy-plan-test"
+
+        def make_spec(stack_name: str, **kwargs) -> StackSpec:
+            return StackSpec(
+                bsm=self.bsm,
+                stack_name=f"{project_name}-{stack_name}",
+                template=make_tpl_1().to_json(),
+                parameters=[
+                    aws_cf.Parameter(
+                        key="ProjectName",
+                        value=f"{project_name}-{stack_name}",
+                    ),
+                ],
+                kwargs=dict(include_named_iam=True),
+                **kwargs,
+            )
+
+        specs = [
+            make_spec("1"),
+            make_spec("2", depends_on=[f"{project_name}-1"]),
+            make_spec("3"),
+        ]
+        env_plan = plan_stacks(specs, change_set_delays=0.1, verbose=True)
+        assert env_plan.is_success() is True
+        assert len(env_plan.changed) == 3
+        assert env_plan.total_counts["Add"] == 3
+        assert env_plan.has_replacement() is False
+        data = json.loads(env_plan.to_json())
+        assert [stack["change_set_id"] for stack in data["stacks"]] == [
+            result.response.change_set_id for result in env_plan.results
+        ]
+        artifact = env_plan.results[0].to_artifact()
+        assert artifact.change_set_id == env_plan.results[0].response.change_set_id
+        assert artifact.aws_account_id == self.bsm.aws_account_id
+        # nothing is executed yet
+        for spec in specs:
+            stack = aws_cf.better_boto.describe_live_stack(self.bsm, spec.stack_name)
+            assert stack is None or stack.status.value == "REVIEW_IN_PROGRESS"
+
+        assert env_plan.dag.upstream == {0: set(), 1: {0}, 2: set()}
+        response = apply_stacks(env_plan, delays=0.1, skip_prompt=True, verbose=True)
+        assert response.is_success() is True
+        assert len(response.deployed) == 3
+        for spec, result in zip(specs, env_plan.results):
+            stack = aws_cf.better_boto.describe_live_stack(self.bsm, spec.stack_name)
+            assert stack.is_success() is True
+            assert stack.id == result.response.stack_id
+
+        # the dependencies from the exports / imports are kept for apply
+        env_plan = plan_stacks(
+            [
+                StackSpec(
+                    bsm=self.bsm,
+                    stack_name=f"{project_name}-consumer",
+                    template=make_consumer_tpl(project_name).to_json(),
+                    kwargs=dict(include_named_iam=True),
+                ),
+                StackSpec(
+                    bsm=self.bsm,
+                    stack_name=f"{project_name}-producer",
+                    template=make_producer_tpl(project_name).to_json(),
+                    kwargs=dict(include_named_iam=True),
+                ),
+            ],
+            detect_dependency=True,
+            change_set_delays=0.1,
+            verbose=False,
+        )
+        assert env_plan.dag.upstream == {0: {1}, 1: set()}
+        stream = io.StringIO()
+        apply_stacks(
+            env_plan,
+            delays=0.1,
+            skip_prompt=True,
+            reporter=aws_cf.JsonLinesReporter(stream=stream),
+        )
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        # the producer is executed before the consumer
+        assert [
+            record["stack_name"]
+            for record in records
+            if record["event"] == "stack_result"
+        ] == [f"{project_name}-producer", f"{project_name}-consumer"]
+
+        # a failed plan cannot be applied
+        env_plan = plan_stacks(
+            [StackSpec(bsm=self.bsm, stack_name=f"{project_name}-4", template="{}")],
+            verbose=False,
+        )
+        assert len(env_plan.failed) == 1
+        with pytest.raises(ValueError):
+            apply_stacks(env_plan, skip_prompt=True, verbose=False)
+
+    def test(self, monkeypatch):
+        self._test_independent_stacks()
+        self._test_dependent_stacks()
+        self._test_remove_stacks(monkeypatch)
+        self._test_remove_nested_stacks(monkeypatch)
+        self._test_plan_apply_stacks()
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.multi_deploy", preview=False)
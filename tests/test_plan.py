@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+from aws_cloudformation.stack import ChangeSet
+from aws_cloudformation.resource_change import ResourceChange
+from aws_cloudformation.change_set_tree import ChangeSetTree
+from aws_cloudformation.plan import Plan, PlanArtifact
+
+
+def make_change_set(change_set_id: str, changes: list) -> ChangeSet:
+    return ChangeSet(
+        change_set_id=change_set_id,
+        change_set_name=change_set_id,
+        stack_id=f"{change_set_id}-stack-id",
+        stack_name=f"{change_set_id}-stack",
+        changes=[{"Type": "Resource", "ResourceChange": dct} for dct in changes],
+    )
+
+
+def make_plan() -> Plan:
+    root = ChangeSetTree.from_change_set(
+        make_change_set(
+            "root",
+            [
+                dict(
+                    Action="Add",
+                    LogicalResourceId="Role",
+                    ResourceType="AWS::IAM::Role",
+                ),
+                dict(
+                    Action="Modify",
+                    LogicalResourceId="Nested",
+                    ResourceType="AWS::CloudFormation::Stack",
+                    ChangeSetId="nested",
+                    Replacement="False",
+                ),
+            ],
+        )
+    )
+    nested = ChangeSetTree.from_change_set(
+        make_change_set(
+            "nested",
+            [
+                dict(
+                    Action="Modify",
+                    LogicalResourceId="Bucket",
+                    ResourceType="AWS::S3::Bucket",
+                    Replacement="True",
+                    Details=[
+                        dict(
+                            Target=dict(
+                                Attribute="Properties",
+                                Name="BucketName",
+                                RequiresRecreation="Always",
+                            ),
+                            Evaluation="Static",
+                            ChangeSource="DirectModification",
+                        )
+                    ],
+                ),
+                dict(
+                    Action="Remove",
+                    LogicalResourceId="Policy",
+                    ResourceType="AWS::IAM::Policy",
+                ),
+            ],
+        )
+    )
+    root.children.append(nested)
+    return Plan.from_change_set_tree(root)
+
+
+def test_resource_change_to_dict():
+    dct = dict(
+        Action="Modify",
+        LogicalResourceId="Bucket",
+        ResourceType="AWS::S3::Bucket",
+        Replacement="Conditional",
+    )
+    resource_change = ResourceChange.from_dict(dct)
+    assert resource_change.to_dict() == dct
+    assert resource_change.is_conditional_replacement() is True
+    assert resource_change.is_replacement() is False
+
+
+def test_plan():
+    plan = make_plan()
+    assert plan.counts["Add"] == 1
+    assert plan.counts["Modify"] == 1
+    assert plan.counts["Remove"] == 0
+    assert plan.total_counts["Modify"] == 2
+    assert plan.total_counts["Remove"] == 1
+    assert [rc.logical_resource_id for rc in plan.replacements] == ["Bucket"]
+    assert plan.has_replacement() is True
+    assert plan.has_removal() is True
+    assert [(depth, p.stack_name) for depth, p in plan.walk()] == [
+        (0, "root-stack"),
+        (1, "nested-stack"),
+    ]
+
+    # round trip
+    s = plan.to_json()
+    assert "\n" not in s
+    assert Plan.from_json(s) == plan
+    assert Plan.from_json(plan.to_json(indent=2)) == plan
+
+
+def test_plan_artifact():
+    plan = make_plan()
+    artifact = PlanArtifact.from_plan(
+        plan=plan,
+        is_create=False,
+        aws_account_id="111122223333",
+        aws_region="us-east-1",
+        template='{"Resources": {}}',
+    )
+    assert artifact.stack_id == "root-stack-id"
+    assert artifact.change_set_id == "root"
+    assert artifact.template_hash is not None
+    assert PlanArtifact.from_json(artifact.to_json()) == artifact
+    assert PlanArtifact.from_json(artifact.to_json(indent=2)) == artifact
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.plan", preview=False)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.rate_limiter import (
+    TokenBucket,
+    RateLimiter,
+    get_rate_limiter,
+)
+
+from aws_cloudformation.tests.mocker import BaseTest
+
+
+def test_token_bucket():
+    bucket = TokenBucket()
+    assert bucket.acquire() == 0.0
+
+    bucket = TokenBucket(rate=50, burst=2)
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        waits = list(executor.map(lambda _: bucket.acquire(), range(6)))
+    # 2 tokens at once, then one every 0.02 seconds
+    assert waits.count(0.0) == 2
+    assert 0.05 < max(waits) <= 0.081
+    assert time.time() - start >= 0.07
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_rate_limiter():
+    rate_limiter = RateLimiter()
+    assert rate_limiter.acquire("111122223333", "us-east-1", "DescribeStacks") == 0
+    rate_limiter.set_rate(rate=20, burst=1)
+    rate_limiter.set_rate(rate=None, operation="DescribeStacks")
+    assert rate_limiter.get_rate("DescribeStacks") == (None, None)
+    assert rate_limiter.get_rate("CreateChangeSet") == (20, 1)
+    for _ in range(3):
+        rate_limiter.acquire("111122223333", "us-east-1", "CreateChangeSet")
+        rate_limiter.acquire("111122223333", "us-east-1", "DescribeStacks")
+
+    stats = rate_limiter.get_stats(operation="CreateChangeSet")[0]
+    assert stats.n_calls == 3
+    assert stats.n_waited == 2
+    assert stats.max_wait > 0
+    assert stats.avg_wait > 0
+    stats = rate_limiter.get_stats(operation="DescribeStacks")[0]
+    assert stats.n_calls == 4
+    assert stats.n_waited == 0
+    assert len(rate_limiter.get_stats(aws_region="us-west-2")) == 0
+
+    rate_limiter.reset_stats()
+    assert rate_limiter.get_stats(operation="CreateChangeSet")[0].n_calls == 0
+
+
+class TestRateLimiter(BaseTest):
+    def test(self):
+        rate_limiter = get_rate_limiter()
+        rate_limiter.reset_stats()
+        rate_limiter.set_rate(rate=5, burst=1, operation="DescribeStacks")
+        try:
+            for _ in range(3):
+                aws_cf.better_boto.describe_stacks(bsm=self.bsm).all()
+        finally:
+            rate_limiter.set_rate(rate=None, operation="DescribeStacks")
+        stats = rate_limiter.get_stats(
+            aws_account_id=self.bsm.aws_account_id,
+            aws_region="us-east-1",
+            operation="DescribeStacks",
+        )[0]
+        assert stats.n_calls == 3
+        assert stats.n_waited == 2
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.rate_limiter", preview=False)
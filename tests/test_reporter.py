@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+from colorama import Fore, Style
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.reporter import (
+    NoOpReporter,
+    ConsoleReporter,
+    JsonLinesReporter,
+    strip_ansi,
+    resolve_reporter,
+)
+from aws_cloudformation.waiter import Waiter
+from aws_cloudformation.deploy import deploy_stack, remove_stack
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1
+
+
+def test_strip_ansi():
+    assert strip_ansi(f"{Fore.CYAN}hello{Style.RESET_ALL}") == "hello"
+
+
+def test_resolve_reporter():
+    assert isinstance(resolve_reporter(verbose=True), ConsoleReporter)
+    assert isinstance(resolve_reporter(verbose=False), NoOpReporter)
+    reporter = JsonLinesReporter()
+    assert resolve_reporter(verbose=False, reporter=reporter) is reporter
+
+
+class TestConsoleReporter:
+    def test_not_tty(self):
+        stream = io.StringIO()
+        reporter = ConsoleReporter(stream=stream)
+        for _ in Waiter(delays=0.01, timeout=1, reporter=reporter):
+            break
+        reporter.on_event("stack_stopped", "\n    reached status")
+        # no progress line, no leading new line
+        assert stream.getvalue() == "    reached status\n"
+
+    def test_show_ticks(self):
+        stream = io.StringIO()
+        reporter = ConsoleReporter(stream=stream, show_ticks=True)
+        for _ in Waiter(delays=0.01, timeout=1, reporter=reporter):
+            break
+        assert "on 1 th attempt" in stream.getvalue()
+
+
+class TestJsonLinesReporter:
+    def test_stream(self):
+        stream = io.StringIO()
+        reporter = JsonLinesReporter(stream=stream, include_ticks=True)
+        for attempt, _ in Waiter(delays=0.01, timeout=1, reporter=reporter):
+            if attempt == 2:
+                break
+        reporter.on_event(
+            "stack_stopped",
+            f"\n    reached status {Fore.CYAN}CREATE_COMPLETE{Style.RESET_ALL}",
+            status="CREATE_COMPLETE",
+        )
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [record["event"] for record in records] == [
+            "tick",
+            "tick",
+            "stack_stopped",
+        ]
+        assert records[-1]["message"] == "reached status CREATE_COMPLETE"
+        assert records[-1]["status"] == "CREATE_COMPLETE"
+
+    def test_path(self, tmp_path):
+        path = tmp_path.joinpath("deploy.jsonl")
+        reporter = JsonLinesReporter(path=path)
+        reporter.on_event("a", "a")
+        reporter.on_event("b", "b")
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["a", "b"]
+
+
+class TestDeploy(BaseTest):
+    def test(self):
+        stream = io.StringIO()
+        reporter = JsonLinesReporter(stream=stream)
+        stack_name = "aws-cf-reporter-test"
+        deploy_stack(
+            bsm=self.bsm,
+            stack_name=stack_name,
+            template=make_tpl_1().to_json(),
+            parameters=[
+                aws_cf.Parameter(key="ProjectName", value=stack_name),
+            ],
+            delays=0.1,
+            skip_prompt=True,
+            include_named_iam=True,
+            reporter=reporter,
+        )
+        remove_stack(
+            bsm=self.bsm,
+            stack_name=stack_name,
+            delays=0.1,
+            skip_prompt=True,
+            reporter=reporter,
+        )
+        events = [
+            json.loads(line)["event"] for line in stream.getvalue().splitlines()
+        ]
+        assert events[0] == "deploy_stack"
+        assert "change_set" in events
+        assert "stack_stopped" in events
+        assert "remove_stack" in events
+        assert events[-1] == "done"
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.reporter", preview=False)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError, EndpointConnectionError
+from func_args import NOTHING
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.waiter import FixedDelay
+from aws_cloudformation.context import get_context, botocore_retry_disabled
+from aws_cloudformation.retry import (
+    ErrorKindEnum,
+    classify_error,
+    RetryPolicy,
+    NO_RETRY,
+    call_with_retry,
+)
+
+from aws_cloudformation.tests.mocker import BaseTest
+
+
+def make_client_error(code: str, status_code: int = 400) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": "..."},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        },
+        "CreateStack",
+    )
+
+
+def test_classify_error():
+    assert classify_error(make_client_error("Throttling")) == ErrorKindEnum.THROTTLING
+    assert classify_error(make_client_error("InternalFailure", 500)) == (
+        ErrorKindEnum.TRANSIENT
+    )
+    assert classify_error(make_client_error("Unknown", 503)) == (
+        ErrorKindEnum.TRANSIENT
+    )
+    assert classify_error(EndpointConnectionError(endpoint_url="https://")) == (
+        ErrorKindEnum.TRANSIENT
+    )
+    assert classify_error(make_client_error("ValidationError")) == (
+        ErrorKindEnum.TERMINAL
+    )
+    assert classify_error(ValueError()) == ErrorKindEnum.TERMINAL
+
+
+class FlakyCall:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.tokens = list()
+
+    def create_stack(self, stack_name: str, client_request_token=NOTHING):
+        self.tokens.append(client_request_token)
+        if self.errors:
+            raise self.errors.pop(0)
+        return stack_name
+
+
+def test_call_with_retry():
+    retry_policy = RetryPolicy(max_attempts=3, delays=FixedDelay(0))
+
+    # retried, and all the attempts use the same generated token
+    call = FlakyCall(
+        [make_client_error("Throttling"), make_client_error("InternalFailure", 500)]
+    )
+    stream = io.StringIO()
+    assert (
+        call_with_retry(
+            call.create_stack,
+            retry_policy=retry_policy,
+            reporter=aws_cf.JsonLinesReporter(stream=stream),
+            stack_name="my-stack",
+        )
+        == "my-stack"
+    )
+    assert len(call.tokens) == 3
+    assert len(set(call.tokens)) == 1
+    assert call.tokens[0].startswith("aws-cf-")
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event["error_kind"] for event in events] == ["THROTTLING", "TRANSIENT"]
+
+    # the given token is kept
+    call = FlakyCall([])
+    call_with_retry(call.create_stack, stack_name="a", client_request_token="t-1")
+    assert call.tokens == ["t-1"]
+
+    # terminal error is not retried
+    call = FlakyCall([make_client_error("ValidationError")])
+    with pytest.raises(ClientError):
+        call_with_retry(call.create_stack, retry_policy=retry_policy, stack_name="a")
+    assert len(call.tokens) == 1
+
+    # give up after max attempts
+    call = FlakyCall([make_client_error("Throttling")] * 5)
+    with pytest.raises(ClientError):
+        call_with_retry(call.create_stack, retry_policy=retry_policy, stack_name="a")
+    assert len(call.tokens) == 3
+
+    call = FlakyCall([make_client_error("Throttling")])
+    with pytest.raises(ClientError):
+        call_with_retry(call.create_stack, retry_policy=NO_RETRY, stack_name="a")
+    assert len(call.tokens) == 1
+
+
+class RawBody:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+THROTTLING_BODY = (
+    b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code>"
+    b"<Message>Rate exceeded</Message></Error><RequestId>1</RequestId>"
+    b"</ErrorResponse>"
+)
+
+
+class TestBotocoreRetry(BaseTest):
+    def test(self):
+        n_sent = []
+
+        def throttle_first_call(request, **kwargs):
+            n_sent.append(1)
+            if len(n_sent) == 1:
+                return AWSResponse(request.url, 400, {}, RawBody(THROTTLING_BODY))
+
+        # the throttled read call is retried by botocore
+        get_context(self.bsm).cf_client.meta.events.register_first(
+            "before-send.cloudformation.DescribeStacks",
+            throttle_first_call,
+        )
+        assert aws_cf.better_boto.describe_live_stack(self.bsm, "not-exists") is None
+        assert len(n_sent) == 2
+
+        # the call wrapped by call_with_retry is not retried by botocore again
+        n_sent.clear()
+        with botocore_retry_disabled():
+            get_context(self.bsm).cf_client.meta.events.register_first(
+                "before-send.cloudformation.DescribeStacks",
+                throttle_first_call,
+            )
+        def describe_stacks():
+            return get_context(self.bsm).cf_client.describe_stacks()
+
+        with pytest.raises(ClientError):
+            call_with_retry(describe_stacks, retry_policy=NO_RETRY)
+        assert len(n_sent) == 1
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.retry", preview=False)
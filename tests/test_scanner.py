@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import aws_cloudformation as aws_cf
+from aws_cloudformation.scanner import ScanTarget, scan_stacks
+
+from aws_cloudformation.tests.mocker import BaseTest
+from aws_cloudformation.tests.stacks.iam_stack import make_tpl_1
+
+
+class BrokenScanTarget(ScanTarget):
+    def get_bsm(self):
+        raise PermissionError("cannot assume role")
+
+
+class TestScanStacks(BaseTest):
+    def test(self):
+        aws_cf.better_boto.create_stack(
+            bsm=self.bsm,
+            stack_name="aws-cf-scanner-test",
+            template_body=make_tpl_1().to_json(),
+            parameters=[
+                aws_cf.Parameter(key="ProjectName", value="aws-cf-scanner-test")
+            ],
+            include_named_iam=True,
+            tags={"team": "data"},
+        )
+        targets = [
+            ScanTarget(bsm=self.bsm),
+            ScanTarget(bsm=self.bsm, aws_region="us-west-2"),
+            BrokenScanTarget(bsm=self.bsm, aws_region="eu-west-1"),
+        ]
+        stream = io.StringIO()
+        scan = scan_stacks(
+            targets,
+            reporter=aws_cf.JsonLinesReporter(stream=stream),
+        )
+        assert scan.is_success() is False
+        assert len(scan.succeeded) == 2
+        assert isinstance(scan.failed[0].error, PermissionError)
+        events = [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+        assert events[0] == "scan_stacks"
+        assert events.count("scan_result") == 3
+        assert events[-1] == "done"
+
+        aws_account_id = self.bsm.aws_account_id
+        assert len(scan.get_inventory(aws_account_id, "us-east-1")) == 1
+        assert len(scan.get_inventory(aws_account_id, "us-west-2")) == 0
+        stacks = scan.find(tags={"team": "data"})
+        assert [stack.name for stack in stacks] == ["aws-cf-scanner-test"]
+        assert stacks[0].aws_region == "us-east-1"
+        assert scan.find(aws_region="us-west-2", tags={"team": "data"}) == []
+
+        # scan again, the inventories are refreshed incrementally
+        scan = scan_stacks(targets[:2], scan=scan, verbose=False)
+        assert scan.is_success() is True
+        assert scan.results[0].refresh_result.full_sweep is False
+        assert scan.results[0].refresh_result.changed == []
+
+
+if __name__ == "__main__":
+    from aws_cloudformation.tests import run_cov_test
+
+    run_cov_test(__file__, "aws_cloudformation.scanner", preview=False)
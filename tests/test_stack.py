@@ -2,7 +2,15 @@
 import pytest
 
 import enum
-from aws_cloudformation.stack import StackStatusEnum, DriftStatusEnum, Parameter
+import pickle
+from aws_cloudformation.stack import (
+    StackStatusEnum,
+    DriftStatusEnum,
+    Parameter,
+    Stack,
+    StackEvent,
+    ChangeSet,
+)
 
 
 class Color(str, enum.Enum):
@@ -78,6 +86,81 @@ class TestParameter:
         }
 
 
+class TestStackEvent:
+    def test(self):
+        def make_event(logical_id: str, type_: str, status: str) -> StackEvent:
+            return StackEvent.from_describe_stack_events_response(
+                {
+                    "StackId": "arn:aws:cloudformation:us-east-1:111122223333:stack/my-stack/1a2b",
+                    "EventId": "1",
+                    "StackName": "my-stack",
+                    "LogicalResourceId": logical_id,
+                    "ResourceType": type_,
+                    "ResourceStatus": status,
+                }
+            )
+
+        event = make_event("my-stack", "AWS::CloudFormation::Stack", "UPDATE_IN_PROGRESS")
+        assert event.is_stack_event() is True
+        assert event.is_stack_operation_start() is True
+        assert event.is_stack_stopped() is False
+        assert event.is_in_progress() is True
+
+        event = make_event("my-stack", "AWS::CloudFormation::Stack", "UPDATE_ROLLBACK_COMPLETE")
+        assert event.is_stack_operation_start() is False
+        assert event.is_stack_stopped() is True
+        assert event.stack_status is StackStatusEnum.UPDATE_ROLLBACK_COMPLETE
+
+        event = make_event("IamRole", "AWS::IAM::Role", "CREATE_FAILED")
+        assert event.is_stack_event() is False
+        assert event.is_failed() is True
+        assert event.stack_status is None
+        assert event.is_stack_stopped() is False
+
+
+class TestSlots:
+    def test(self):
+        stack = Stack(id="arn", name="my-stack", outputs={"Key": "Value"})
+        assert hasattr(stack, "__dict__") is False
+        with pytest.raises(AttributeError):
+            stack.not_a_field = 1
+        assert stack.tags == {}
+        assert pickle.loads(pickle.dumps(stack)) == stack
+
+
+class TestChangeSet:
+    def test_resource_changes(self):
+        def make_change(logical_id: str) -> dict:
+            return {
+                "Type": "Resource",
+                "ResourceChange": {
+                    "Action": "Add",
+                    "LogicalResourceId": logical_id,
+                    "ResourceType": "AWS::IAM::Role",
+                },
+            }
+
+        change_set = ChangeSet(
+            change_set_id="arn",
+            change_set_name="my-change-set",
+            stack_id="arn",
+            stack_name="my-stack",
+            changes=[make_change("Role1")],
+        )
+        resource_changes = change_set.resource_changes
+        assert [rc.logical_resource_id for rc in resource_changes] == ["Role1"]
+        # parsed only once
+        assert change_set.resource_changes is resource_changes
+        # parsed again after the next page is loaded
+        change_set.changes.append(make_change("Role2"))
+        assert [rc.logical_resource_id for rc in change_set.resource_changes] == [
+            "Role1",
+            "Role2",
+        ]
+        change_set.changes = None
+        assert change_set.resource_changes == []
+
+
 if __name__ == "__main__":
     from aws_cloudformation.tests import run_cov_test
 
@@ -11,6 +11,9 @@ from aws_cloudformation.stack_set import (
     StackInstanceDetailedStatusEnum,
     StackInstanceDriftStatusEnum,
     StackInstance,
+    StackSetOperationStatusEnum,
+    StackSetOperation,
+    StackSetOperationResult,
 )
 
 
@@ -24,6 +27,35 @@ class TestStackSetStatusEnum:
         assert (StackSetStatusEnum.ACTIVE == StackSetStatusEnum.DELETED.value) is False
 
 
+class TestStackSetOperation:
+    def test(self):
+        operation = StackSetOperation.from_describe_stack_set_operation_response(
+            {
+                "OperationId": "op-1",
+                "StackSetId": "my-stack-set:1a2b",
+                "Action": "CREATE",
+                "Status": "RUNNING",
+                "StatusDetails": {"FailedStackInstancesCount": 0},
+            }
+        )
+        assert operation.status == StackSetOperationStatusEnum.RUNNING
+        assert operation.failed_stack_instances_count == 0
+        assert operation.is_stopped() is False
+        operation.status = StackSetOperationStatusEnum.FAILED
+        assert operation.is_stopped() is True
+        assert operation.is_succeeded() is False
+
+        result = StackSetOperationResult.from_list_stack_set_operation_results_response(
+            {
+                "Account": "111111111111",
+                "Region": "us-east-1",
+                "Status": "FAILED",
+                "StatusReason": "Resource already exists",
+            }
+        )
+        assert result.is_failed() is True
+        assert result.account_gate_result == {}
+
 
 if __name__ == "__main__":
     from aws_cloudformation.tests import run_cov_test
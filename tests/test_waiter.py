@@ -1,7 +1,74 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+import itertools
+
 import pytest
-from aws_cloudformation.waiter import Waiter
+from aws_cloudformation.waiter import (
+    Waiter,
+    AsyncWaiter,
+    FixedDelay,
+    ExponentialBackoff,
+    DecorrelatedJitter,
+    ExpectedDuration,
+)
+
+
+def take(strategy, n: int):
+    return list(itertools.islice(strategy, n))
+
+
+class TestDelayStrategy:
+    def test_fixed_delay(self):
+        assert take(FixedDelay(3), 3) == [3, 3, 3]
+
+    def test_exponential_backoff(self):
+        strategy = ExponentialBackoff(base=1, factor=2, cap=5)
+        assert take(strategy, 5) == [1, 2, 4, 5, 5]
+        # re-iterable
+        assert take(strategy, 2) == [1, 2]
+
+    def test_decorrelated_jitter(self):
+        for delay in take(DecorrelatedJitter(base=1, cap=5), 20):
+            assert 1 <= delay <= 5
+
+    def test_expected_duration(self, tmp_path):
+        strategy = ExpectedDuration(
+            key="my-stack:update",
+            base=1,
+            cap=30,
+            path=tmp_path.joinpath("expected-duration.json"),
+        )
+        # no history, same as exponential backoff
+        assert strategy.get_expected_duration() is None
+        assert take(strategy, 3) == [1, 2, 4]
+
+        for elapsed in [50, 40, 60]:
+            strategy.record(elapsed)
+        assert strategy.get_history() == [50, 40, 60]
+        assert strategy.get_expected_duration() == 50
+        # long wait first, then poll quicker near the expected duration
+        assert take(strategy, 6) == [25, 12.5, 6.25, 3.125, 1.5625, 1]
+
+        strategy.n_history = 2
+        strategy.record(10)
+        assert strategy.get_history() == [60, 10]
+
+    def test_for_stack(self, tmp_path):
+        strategy = ExponentialBackoff()
+        assert strategy.for_stack("my-stack") is strategy
+
+        # the stateful strategy is copied for each stack, with its own history
+        strategy = ExpectedDuration(
+            key="update",
+            path=tmp_path.joinpath("expected-duration.json"),
+        )
+        stack_strategy = strategy.for_stack("my-stack")
+        assert stack_strategy.key == "my-stack:update"
+        assert stack_strategy.path == strategy.path
+        stack_strategy.record(30)
+        assert strategy.for_stack("another-stack").get_history() == []
+        assert strategy.get_history() == []
 
 
 class TestWaiter:
@@ -15,6 +82,59 @@ class TestWaiter:
             ):
                 pass
 
+    def test_strategy(self, tmp_path):
+        strategy = ExpectedDuration(
+            key="my-stack:update",
+            base=0.01,
+            path=tmp_path.joinpath("expected-duration.json"),
+        )
+        # the caller failed, the duration is not learned
+        with pytest.raises(ValueError):
+            for attempt, _ in Waiter(delays=strategy, timeout=3, verbose=False):
+                if attempt == 2:
+                    raise ValueError
+        assert len(strategy.get_history()) == 0
+
+        # the duration is learned only when the wait succeeded
+        waiter = Waiter(delays=strategy, timeout=3, verbose=False)
+        for attempt, _ in waiter:
+            if attempt == 3:
+                waiter.done()
+                break
+        waiter.done()  # only recorded once
+        assert len(strategy.get_history()) == 1
+
+    def test_notify_throttled(self):
+        waiter = Waiter(delays=0.01, timeout=3, verbose=False)
+        for attempt, _ in waiter:
+            if attempt <= 3:
+                waiter.notify_throttled()
+                assert waiter.throttle_factor == 2**attempt
+            elif attempt == 4:
+                # the last throttled attempt made this wait 8 times longer
+                assert waiter.throttle_factor == 8
+            elif attempt == 5:
+                assert waiter.throttle_factor == 4
+            else:
+                break
+
+
+class TestAsyncWaiter:
+    def test(self):
+        async def wait():
+            async for attempt, _ in AsyncWaiter(delays=0.01, timeout=1, verbose=False):
+                if attempt == 3:
+                    return attempt
+
+        assert asyncio.run(wait()) == 3
+
+        async def timeout():
+            async for _ in AsyncWaiter(delays=0.5, timeout=1, verbose=False):
+                pass
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(timeout())
+
 
 if __name__ == "__main__":
     from aws_cloudformation.tests import run_cov_test